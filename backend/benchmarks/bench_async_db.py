@@ -0,0 +1,106 @@
+"""
+Benchmark: sync vs async database path for top recommendations.
+
+Drives the service layer with concurrent callers on one event loop and
+reports latency percentiles plus event-loop stall for three paths:
+
+- ``sync_inline``: blocking service called directly from the coroutine
+  (the original endpoint behaviour)
+- ``sync_threadpool``: blocking service offloaded with ``run_in_threadpool``
+- ``async``: asyncpg-backed ``TopRecommendationAsyncService``
+
+Requires a reachable PostgreSQL at DATABASE_URL with the
+aws_recommendation_consolidate table populated.
+
+Usage:
+    python -m benchmarks.bench_async_db --concurrency 50 --requests 20
+"""
+import argparse
+import asyncio
+import time
+
+from fastapi.concurrency import run_in_threadpool
+
+from benchmarks.common import add_output_argument, emit, percentile, summarize_latencies
+from src.database.async_session import AsyncSessionLocal, async_engine
+from src.database.session import SessionLocal, engine
+from src.dashboard.overview.service.top_recommendation_async_service import TopRecommendationAsyncService
+from src.dashboard.overview.service.top_recommendation_service import TopRecommendationService
+
+
+def _sync_call(platform: str) -> None:
+    db = SessionLocal()
+    try:
+        TopRecommendationService(db).get_top_recommendations(platform=platform, limit=6)
+    finally:
+        db.close()
+
+
+async def _sync_inline(platform: str) -> None:
+    _sync_call(platform)
+
+
+async def _sync_threadpool(platform: str) -> None:
+    await run_in_threadpool(_sync_call, platform)
+
+
+async def _async(platform: str) -> None:
+    async with AsyncSessionLocal() as db:
+        await TopRecommendationAsyncService(db).get_top_recommendations(platform=platform, limit=6)
+
+
+async def _loop_monitor(stop: asyncio.Event, lags_ms: list, interval: float = 0.005) -> None:
+    """Record how late the event loop wakes up a sleeping coroutine."""
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags_ms.append((time.perf_counter() - started - interval) * 1000)
+
+
+async def run_path(call, concurrency: int, requests: int, platform: str) -> dict:
+    latencies_ms = []
+    lags_ms = []
+    stop = asyncio.Event()
+    monitor = asyncio.create_task(_loop_monitor(stop, lags_ms))
+
+    async def worker() -> None:
+        for _ in range(requests):
+            started = time.perf_counter()
+            await call(platform)
+            latencies_ms.append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await monitor
+
+    summary = summarize_latencies(latencies_ms, elapsed)
+    summary["loop_lag_p99_ms"] = round(percentile(lags_ms, 99), 3)
+    summary["loop_lag_max_ms"] = round(max(lags_ms), 3) if lags_ms else 0.0
+    return summary
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=20, help="Requests per concurrent caller")
+    parser.add_argument("--platform", default="all_platform")
+    add_output_argument(parser)
+    args = parser.parse_args()
+
+    # Warm both pools so the first measured requests do not pay connect cost
+    await _async(args.platform)
+    _sync_call(args.platform)
+
+    results = {"concurrency": args.concurrency, "requests_per_caller": args.requests, "paths": {}}
+    for name, call in (("sync_inline", _sync_inline), ("sync_threadpool", _sync_threadpool), ("async", _async)):
+        results["paths"][name] = await run_path(call, args.concurrency, args.requests, args.platform)
+
+    await async_engine.dispose()
+    engine.dispose()
+    emit(results, args.output)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
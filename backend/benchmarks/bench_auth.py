@@ -0,0 +1,98 @@
+"""
+Benchmark: JWT verification cost with and without the verified-token cache.
+
+Issues --tokens distinct tokens and verifies them round-robin through
+src.auth.dependencies.verify_token, once with signature verification on
+every call and once through a VerifiedTokenCache, for HS256 and RS256
+(or the algorithm in ALGORITHM with --algorithm env). No database needed.
+
+Usage:
+    python -m benchmarks.bench_auth --requests 20000 --tokens 100
+"""
+from typing import Dict, Tuple
+import argparse
+import os
+import time
+
+import jwt
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from benchmarks.common import add_output_argument, emit, summarize_latencies
+from src.auth.dependencies import verify_token
+from src.auth.token_cache import VerifiedTokenCache
+
+
+def _keys(algorithm: str) -> Tuple[object, object]:
+    """Signing and verification keys for an algorithm."""
+    if algorithm.startswith("HS"):
+        secret = os.getenv("SECRET_KEY", "bench-secret-key-of-reasonable-length-0123456789")
+        return secret, secret
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    public_pem = private_key.public_key().public_bytes(
+        serialization.Encoding.PEM,
+        serialization.PublicFormat.SubjectPublicKeyInfo
+    )
+    return private_key, public_pem
+
+
+def _measure(tokens, verify, requests: int) -> Dict:
+    latencies_ms = []
+    started = time.perf_counter()
+    for i in range(requests):
+        call_started = time.perf_counter()
+        verify(tokens[i % len(tokens)])
+        latencies_ms.append((time.perf_counter() - call_started) * 1000)
+    return summarize_latencies(latencies_ms, time.perf_counter() - started)
+
+
+def run(algorithm: str, requests: int, token_count: int) -> Dict:
+    signing_key, verify_key = _keys(algorithm)
+    expires_at = int(time.time()) + 3600
+    tokens = [
+        jwt.encode(
+            {"sub": f"user-{i}", "email": f"user{i}@example.com", "roles": ["viewer"], "exp": expires_at},
+            signing_key,
+            algorithm=algorithm
+        )
+        for i in range(token_count)
+    ]
+
+    cache = VerifiedTokenCache(max_entries=max(token_count, 1), max_ttl_seconds=300)
+    results = {
+        "uncached": _measure(
+            tokens, lambda token: verify_token(token, verify_key, algorithm, cache=None), requests
+        ),
+        "cached": _measure(
+            tokens, lambda token: verify_token(token, verify_key, algorithm, cache=cache), requests
+        )
+    }
+    results["cached"]["cache"] = cache.stats()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="JWT verification with and without the claims cache")
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--tokens", type=int, default=100, help="Distinct tokens, verified round-robin")
+    parser.add_argument(
+        "--algorithm",
+        action="append",
+        help="Algorithm to benchmark (repeatable); 'env' uses ALGORITHM. Default: HS256 and RS256"
+    )
+    add_output_argument(parser)
+    args = parser.parse_args()
+
+    algorithms = [
+        os.getenv("ALGORITHM", "HS256") if algorithm == "env" else algorithm
+        for algorithm in (args.algorithm or ["HS256", "RS256"])
+    ]
+    emit({
+        "requests": args.requests,
+        "tokens": args.tokens,
+        **{algorithm: run(algorithm, args.requests, args.tokens) for algorithm in algorithms}
+    }, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Benchmark: in-memory columnar store used by mock mode.
+
+For each --rows size a ColumnarRecommendationStore is generated, then the
+top-N query of every platform is timed with the argpartition path and with
+a full sort of the same rows (the naive baseline). No database is needed.
+
+Usage:
+    python -m benchmarks.bench_columnar_store --rows 100000 1000000 5000000 --limit 6
+"""
+from typing import Dict
+import argparse
+import time
+
+import numpy as np
+
+from benchmarks.common import add_output_argument, emit, summarize_latencies
+from src.dashboard.overview.dao.top_recommendation_dao_mock import (
+    ColumnarRecommendationStore,
+    TopRecommendationDAOMock
+)
+
+PLATFORMS = ["all_platform", "aws", "databricks", "snowflakes", "google_cloud"]
+
+
+def _full_sort(store: ColumnarRecommendationStore, platform_type, limit: int) -> np.ndarray:
+    mask = store.potential > 0
+    if platform_type is not None:
+        mask &= store.text_codes["type"] == store._type_codes[platform_type]
+    candidates = np.flatnonzero(mask)
+    order = np.lexsort((-store.ids[candidates], -store.potential[candidates]))
+    return candidates[order[:limit]]
+
+
+def run(rows: int, limit: int, iterations: int) -> Dict:
+    started = time.perf_counter()
+    store = ColumnarRecommendationStore.generate(rows)
+    result: Dict = {"load_ms": round((time.perf_counter() - started) * 1000, 1), **store.stats()}
+
+    dao = TopRecommendationDAOMock(store=store)
+    for platform in PLATFORMS:
+        platform_type = dao._platform_type(platform)
+        timings = {}
+        for name, query in (
+            ("argpartition", lambda: dao.get_top_recommendation_rows(platform, limit)),
+            ("full_sort", lambda: store.rows(_full_sort(store, platform_type, limit), ("potential",)))
+        ):
+            latencies_ms = []
+            begun = time.perf_counter()
+            for _ in range(iterations):
+                call_started = time.perf_counter()
+                query()
+                latencies_ms.append((time.perf_counter() - call_started) * 1000)
+            timings[name] = summarize_latencies(latencies_ms, time.perf_counter() - begun)
+        result[platform] = timings
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Columnar top-N latency by dataset size")
+    parser.add_argument("--rows", type=int, nargs="+", default=[100000, 1000000])
+    parser.add_argument("--limit", type=int, default=6)
+    parser.add_argument("--iterations", type=int, default=50)
+    add_output_argument(parser)
+    args = parser.parse_args()
+
+    results = {
+        "limit": args.limit,
+        "sizes": {str(rows): run(rows, args.limit, args.iterations) for rows in args.rows}
+    }
+    emit(results, args.output)
+
+
+if __name__ == "__main__":
+    main()
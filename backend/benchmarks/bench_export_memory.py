@@ -0,0 +1,79 @@
+"""
+Memory-bound check for the streaming recommendation export.
+
+Optionally seeds a multi-million-row dataset, then consumes the export
+stream end to end and reports throughput plus peak Python heap
+(tracemalloc) and peak RSS growth. Exits with code 1 if the heap peak
+exceeds --max-heap-mb, i.e. if memory grew with the table instead of
+staying bounded by the cursor batch size.
+
+Usage:
+    python -m benchmarks.bench_export_memory --seed-rows 3000000 --format ndjson
+    python -m benchmarks.bench_export_memory --format csv --max-heap-mb 64
+"""
+import argparse
+import resource
+import sys
+import time
+import tracemalloc
+
+from benchmarks.common import add_output_argument, emit
+from benchmarks.seed_dataset import copy_rows, generate_rows
+from src.database.session import engine
+from src.dashboard.overview.api.recommendation_export_api import _export_chunks
+
+
+def _rss_mb() -> float:
+    # ru_maxrss is KiB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Streaming export memory check")
+    parser.add_argument("--seed-rows", type=int, default=0, help="Truncate and seed this many rows first")
+    parser.add_argument("--payload-bytes", type=int, default=512)
+    parser.add_argument("--platform", default="all_platform")
+    parser.add_argument("--format", choices=["ndjson", "csv"], default="ndjson")
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument("--max-heap-mb", type=float, default=128.0)
+    add_output_argument(parser)
+    args = parser.parse_args()
+
+    if args.seed_rows:
+        with engine.begin() as conn:
+            conn.exec_driver_sql("TRUNCATE aws_recommendation_consolidate RESTART IDENTITY")
+        copy_rows(generate_rows(args.seed_rows, payload_bytes=args.payload_bytes))
+
+    rss_before = _rss_mb()
+    tracemalloc.start()
+    started = time.perf_counter()
+    total_bytes = 0
+    lines = 0
+    for chunk in _export_chunks(args.platform, args.format, args.batch_size):
+        total_bytes += len(chunk)
+        lines += chunk.count(b"\n")
+    elapsed = time.perf_counter() - started
+    _, heap_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    engine.dispose()
+
+    heap_peak_mb = heap_peak / (1024 * 1024)
+    results = {
+        "platform": args.platform,
+        "format": args.format,
+        "batch_size": args.batch_size,
+        "lines": lines,
+        "bytes": total_bytes,
+        "seconds": round(elapsed, 2),
+        "rows_per_second": round(lines / elapsed) if elapsed else 0,
+        "heap_peak_mb": round(heap_peak_mb, 2),
+        "rss_growth_mb": round(_rss_mb() - rss_before, 2),
+        "max_heap_mb": args.max_heap_mb,
+        "passed": heap_peak_mb <= args.max_heap_mb
+    }
+    emit(results, args.output)
+    return 0 if results["passed"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
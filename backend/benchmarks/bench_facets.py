@@ -0,0 +1,135 @@
+"""
+Benchmark: filtered listing plus facet counts.
+
+Times the combined RecommendationFilterService call (one filtered keyset
+page and one GROUPING SETS facet query) for a set of filters, against the
+same counts taken with one COUNT ... GROUP BY query per facet, and reports
+the indexes each filtered plan used (migration 0008).
+
+Seed a large table and apply the migrations first:
+    python -m benchmarks.seed_dataset --rows 1000000 --truncate
+    alembic upgrade head
+
+Usage:
+    python -m benchmarks.bench_facets --iterations 30
+"""
+from typing import Dict, Iterator, List
+import argparse
+import json
+import time
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects import postgresql
+
+from benchmarks.common import add_output_argument, emit, summarize_latencies
+from src.database.session import SessionLocal, engine
+from src.dashboard.overview.dao.top_recommendation_dao import TopRecommendationDAO
+from src.dashboard.overview.service.recommendation_filter_service import RecommendationFilterService
+
+FACETS = ["account", "region", "service", "sub_service", "risk_level", "actionable", "tag:env", "tag:team"]
+
+# Broad to narrow; the last is "prod-tagged, actionable, low-risk EC2 in us-east-1"
+FILTERS = {
+    "none": {},
+    "region": {"region": ["us-east-1"]},
+    "tag": {"tags": {"env": "prod"}},
+    "drill_down": {
+        "region": ["us-east-1"],
+        "service": ["EC2"],
+        "risk_level": ["Low"],
+        "actionable": True,
+        "tags": {"env": "prod"}
+    }
+}
+
+
+def _walk(plan: Dict) -> Iterator[Dict]:
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from _walk(child)
+
+
+def _plan_indexes(db, statement) -> List[str]:
+    compiled = statement.compile(dialect=postgresql.dialect(), compile_kwargs={"render_postcompile": True})
+    # The driver call skips SQLAlchemy's bind processing, so encode JSONB values here
+    params = {
+        key: json.dumps(value) if isinstance(value, dict) else value
+        for key, value in compiled.params.items()
+    }
+    plan = db.connection().exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}", params).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return sorted({node["Index Name"] for node in _walk(plan[0]["Plan"]) if "Index Name" in node})
+
+
+def _per_facet_counts(db, platform: str, filters: dict) -> None:
+    for facet in FACETS:
+        expression = TopRecommendationDAO._facet_expression(facet)
+        query = select(expression, func.count())
+        query = TopRecommendationDAO._apply_platform_filter(query, platform)
+        query = TopRecommendationDAO._apply_savings_filter(query)
+        query = TopRecommendationDAO._apply_filters(query, filters)
+        db.execute(query.group_by(expression)).all()
+
+
+def _measure(fetch, iterations: int) -> dict:
+    latencies_ms = []
+    started = time.perf_counter()
+    for _ in range(iterations):
+        call_started = time.perf_counter()
+        fetch()
+        latencies_ms.append((time.perf_counter() - call_started) * 1000)
+    return summarize_latencies(latencies_ms, time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Filtered listing plus GROUPING SETS facet counts")
+    parser.add_argument("--iterations", type=int, default=30)
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--platform", default="aws")
+    add_output_argument(parser)
+    args = parser.parse_args()
+
+    results = {"platform": args.platform, "limit": args.limit, "iterations": args.iterations, "cases": {}}
+    db = SessionLocal()
+    try:
+        service = RecommendationFilterService(db)
+        for name, filters in FILTERS.items():
+            def combined():
+                return service.filter_recommendations(
+                    platform=args.platform,
+                    filters=filters,
+                    facets=FACETS,
+                    limit=args.limit
+                )
+
+            page = combined().success_response.data
+            results["cases"][name] = {
+                "filters": filters,
+                "total": page.total,
+                "list_indexes": _plan_indexes(
+                    db, TopRecommendationDAO._list_recommendations_statement(
+                        args.platform, args.limit + 1, None, filters
+                    )
+                ),
+                "page_and_facets": _measure(combined, args.iterations),
+                "page_only": _measure(
+                    lambda: service.filter_recommendations(
+                        platform=args.platform, filters=filters, limit=args.limit
+                    ),
+                    args.iterations
+                ),
+                "query_per_facet": _measure(
+                    lambda: _per_facet_counts(db, args.platform, filters),
+                    args.iterations
+                )
+            }
+    finally:
+        db.close()
+        engine.dispose()
+
+    emit(results, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Micro-benchmarks: TopRecommendationService formatting and schema construction.
+
+Times the pure-Python work done per request once rows are fetched, with
+no database or HTTP involved:
+
+- format_savings / platform_display_name: per-row helpers
+- build_items: rows to item dictionaries
+- build_response: items to TopRecommendationResponse (model_construct)
+- validated_response: the same response built with full validation
+- payload: items serialized once with orjson (TopRecommendationPayload)
+- model_dump_json: pydantic serialization of the constructed response
+
+Usage:
+    python -m benchmarks.bench_formatting --items 6 --repeat 5
+"""
+from decimal import Decimal
+from types import SimpleNamespace
+from typing import Callable, Dict
+import argparse
+import random
+import timeit
+
+from benchmarks.common import add_output_argument, emit
+from src.dashboard.overview.dao.top_recommendation_dao import TopRecommendationDAO
+from src.dashboard.overview.schemas.top_recommendation_schema import TopRecommendationResponse
+from src.dashboard.overview.service.top_recommendation_service import (
+    TopRecommendationPayload,
+    TopRecommendationService
+)
+
+
+def make_rows(count: int, seed: int = 7):
+    """Rows shaped like TopRecommendationDAO.get_top_recommendation_rows results."""
+    rng = random.Random(seed)
+    platforms = list(TopRecommendationDAO.PLATFORM_MAPPING.values())
+    return [
+        SimpleNamespace(
+            type=rng.choice(platforms),
+            description=f"Recommended to right-size resource i-{i:08x} based on 30-day utilization",
+            recommendation="Right-size instance",
+            potential=Decimal(rng.randint(100, 10_000_000)) / 100
+        )
+        for i in range(count)
+    ]
+
+
+def time_call(fn: Callable[[], object], repeat: int) -> Dict[str, float]:
+    """
+    Time a callable with timeit's auto-ranging, keeping the best of several runs.
+
+    Returns:
+        Best and median nanoseconds per call
+    """
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    runs = sorted(t / number * 1e9 for t in timer.repeat(repeat=repeat, number=number))
+    return {
+        "calls_per_run": number,
+        "best_ns": round(runs[0], 1),
+        "median_ns": round(runs[len(runs) // 2], 1)
+    }
+
+
+def run(items: int, repeat: int) -> Dict:
+    service = TopRecommendationService
+    rows = make_rows(items)
+    built_items = service._build_items(rows)
+    response = service._build_response(built_items)
+    validated_payload = response.model_dump()
+
+    return {
+        "format_savings": time_call(lambda: service._format_savings(rows[0].potential), repeat),
+        "platform_display_name": time_call(lambda: service._get_platform_display_name(rows[0].type), repeat),
+        "build_items": time_call(lambda: service._build_items(rows), repeat),
+        "build_response": time_call(lambda: service._build_response(built_items), repeat),
+        "validated_response": time_call(
+            lambda: TopRecommendationResponse.model_validate(validated_payload), repeat
+        ),
+        "payload": time_call(lambda: TopRecommendationPayload(built_items), repeat),
+        "model_dump_json": time_call(response.model_dump_json, repeat)
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Formatting and schema construction micro-benchmarks")
+    parser.add_argument("--items", type=int, default=6, help="Rows per response")
+    parser.add_argument("--repeat", type=int, default=5, help="timeit runs per measurement")
+    add_output_argument(parser)
+    args = parser.parse_args()
+    emit({"items": args.items, "results": run(args.items, args.repeat)}, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""
+Benchmark: DAO queries and platform reloads on the plain vs partitioned table.
+
+For every platform, EXPLAINs (ANALYZE, BUFFERS) the DAO's top-N, keyset
+page, facet count and search statements, recording the relations scanned
+(partition pruning), indexes used, buffers touched and planning/execution
+time, then times each statement through the DAO. Optionally times a full
+reload of one platform: DELETE + bulk upsert, and on the partitioned table
+a partition swap (src.ingestion.partition_swap).
+
+Run once on the unpartitioned layout and once after migration 0009, then
+compare the two result files:
+
+    python -m benchmarks.seed_dataset --rows 1000000 --truncate
+    alembic upgrade 0008
+    python -m benchmarks.bench_partitioning --output before.json
+    alembic upgrade 0009
+    python -m benchmarks.bench_partitioning --output after.json
+    python -m benchmarks.compare before.json after.json
+
+Usage:
+    python -m benchmarks.bench_partitioning --iterations 50 --reload-platform Snowflakes --reload-rows 50000
+"""
+from decimal import Decimal
+from typing import Dict, Iterator, List
+import argparse
+import itertools
+import json
+import time
+
+from sqlalchemy.dialects import postgresql
+
+from benchmarks.common import add_output_argument, emit, summarize_latencies
+from benchmarks.seed_dataset import generate_rows
+from src.database.session import SessionLocal, engine
+from src.dashboard.overview.dao.top_recommendation_dao import (
+    TOP_RECOMMENDATION_COLUMNS,
+    TopRecommendationDAO
+)
+from src.ingestion.partition_swap import PlatformPartitionSwapper
+from src.ingestion.recommendation_ingestion import RecommendationIngestor
+
+PLATFORMS = ["all_platform", "aws", "google_cloud", "databricks", "snowflakes"]
+FACETS = ["account", "region", "risk_level", "actionable"]
+
+
+def _statements(platform: str) -> Dict:
+    return {
+        "top_n": TopRecommendationDAO._top_recommendations_statement(platform, 6, TOP_RECOMMENDATION_COLUMNS),
+        "keyset_page": TopRecommendationDAO._list_recommendations_statement(
+            platform, 51, (Decimal("100.0000"), 1000000)
+        ),
+        "facet_counts": TopRecommendationDAO._facet_counts_statement(platform, FACETS, {"actionable": True}),
+        "search": TopRecommendationDAO._search_statement("reserved instances", platform, 21)
+    }
+
+
+def _walk(plan: Dict) -> Iterator[Dict]:
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from _walk(child)
+
+
+def _explain(db, statement) -> Dict:
+    compiled = statement.compile(dialect=postgresql.dialect(), compile_kwargs={"render_postcompile": True})
+    document = db.connection().exec_driver_sql(
+        f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {compiled}", compiled.params
+    ).scalar()
+    if isinstance(document, str):
+        document = json.loads(document)
+    nodes = list(_walk(document[0]["Plan"]))
+    return {
+        "relations": sorted({node["Relation Name"] for node in nodes if "Relation Name" in node}),
+        "indexes": sorted({node["Index Name"] for node in nodes if "Index Name" in node}),
+        "node_types": sorted({node["Node Type"] for node in nodes}),
+        "shared_buffers": document[0]["Plan"].get("Shared Hit Blocks", 0) + document[0]["Plan"].get("Shared Read Blocks", 0),
+        "planning_ms": round(document[0]["Planning Time"], 3),
+        "execution_ms": round(document[0]["Execution Time"], 3)
+    }
+
+
+def _measure(fetch, iterations: int) -> dict:
+    latencies_ms = []
+    started = time.perf_counter()
+    for _ in range(iterations):
+        call_started = time.perf_counter()
+        fetch()
+        latencies_ms.append((time.perf_counter() - call_started) * 1000)
+    return summarize_latencies(latencies_ms, time.perf_counter() - started)
+
+
+def _platform_rows(platform_type: str, rows: int, seed: int) -> List[Dict]:
+    generated = (row for row in generate_rows(rows * 50, seed=seed, payload_bytes=256) if row["type"] == platform_type)
+    return list(itertools.islice(generated, rows))
+
+
+def _bench_reload(platform_type: str, rows: int, partitioned: bool) -> Dict:
+    records = _platform_rows(platform_type, rows, seed=7)
+    results = {"rows": len(records)}
+
+    started = time.perf_counter()
+    with engine.begin() as connection:
+        connection.exec_driver_sql(
+            "DELETE FROM aws_recommendation_consolidate WHERE type = %(type)s", {"type": platform_type}
+        )
+    RecommendationIngestor(engine).ingest(records)
+    results["delete_and_upsert_ms"] = round((time.perf_counter() - started) * 1000, 1)
+
+    if partitioned:
+        swap = PlatformPartitionSwapper(engine).reload(platform_type, records)
+        results["partition_swap_ms"] = round((swap.load_seconds + swap.swap_seconds) * 1000, 1)
+        results["partition_swap_lock_ms"] = round(swap.swap_seconds * 1000, 1)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="DAO queries and reloads on the plain vs partitioned table")
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--platforms", nargs="+", default=PLATFORMS)
+    parser.add_argument("--reload-platform", default=None,
+                        help="Platform type (e.g. Snowflakes) to time a full reload of; skipped if omitted")
+    parser.add_argument("--reload-rows", type=int, default=50000)
+    add_output_argument(parser)
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        partitioned = bool(db.connection().exec_driver_sql(
+            "SELECT count(*) FROM pg_partitioned_table "
+            "WHERE partrelid = 'aws_recommendation_consolidate'::regclass"
+        ).scalar())
+        results = {"layout": "partitioned" if partitioned else "plain", "iterations": args.iterations, "queries": {}}
+
+        for platform in args.platforms:
+            for name, statement in _statements(platform).items():
+                explained = _explain(db, statement)
+                explained["latency"] = _measure(lambda: db.execute(statement).all(), args.iterations)
+                results["queries"][f"{platform}/{name}"] = explained
+        db.rollback()
+    finally:
+        db.close()
+
+    try:
+        if args.reload_platform:
+            results["reload"] = _bench_reload(args.reload_platform, args.reload_rows, partitioned)
+    finally:
+        engine.dispose()
+
+    emit(results, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Benchmark: first-request and steady-state latency by pool configuration.
+
+For each configuration a fresh sync engine is created against
+DATABASE_URL and the top recommendations query is run through
+TopRecommendationDAO:
+
+- cold_pre_ping: no warm-up, pre-ping on every checkout (previous default)
+- warm_pre_ping: pool warmed first, pre-ping on every checkout
+- warm_idle_ping: pool warmed, ping only connections idle > --idle-seconds
+- warm_no_ping: pool warmed, no liveness check
+
+"first_request_ms" is the latency of the first query after start-up;
+"steady" summarizes --requests queries issued by --concurrency threads.
+
+Usage:
+    python -m benchmarks.bench_pool --requests 2000 --concurrency 8
+"""
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from typing import Dict
+import argparse
+import time
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from benchmarks.common import add_output_argument, emit, summarize_latencies
+from src.database.pool_config import PoolSettings, configure_engine
+from src.database.session import DATABASE_URL
+from src.dashboard.overview.dao.top_recommendation_dao import TopRecommendationDAO
+
+CONFIGURATIONS = {
+    "cold_pre_ping": {"pre_ping": "always", "warmup": False},
+    "warm_pre_ping": {"pre_ping": "always", "warmup": True},
+    "warm_idle_ping": {"pre_ping": "idle", "warmup": True},
+    "warm_no_ping": {"pre_ping": "off", "warmup": True}
+}
+
+
+def _query(session_factory, platform: str) -> float:
+    started = time.perf_counter()
+    db = session_factory()
+    try:
+        TopRecommendationDAO(db).get_top_recommendation_rows(platform=platform, limit=6)
+    finally:
+        db.close()
+    return (time.perf_counter() - started) * 1000
+
+
+def run_configuration(
+    settings: PoolSettings,
+    warmup: bool,
+    requests: int,
+    concurrency: int,
+    platform: str
+) -> Dict:
+    engine = create_engine(DATABASE_URL, **settings.engine_kwargs())
+    configure_engine(engine, settings)
+    session_factory = sessionmaker(bind=engine, autoflush=False)
+    try:
+        result: Dict = {}
+        if warmup:
+            started = time.perf_counter()
+            held = [engine.connect() for _ in range(settings.pool_size)]
+            for connection in held:
+                connection.close()
+            result["warmup_ms"] = round((time.perf_counter() - started) * 1000, 3)
+
+        result["first_request_ms"] = round(_query(session_factory, platform), 3)
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            latencies_ms = list(executor.map(lambda _: _query(session_factory, platform), range(requests)))
+        result["steady"] = summarize_latencies(latencies_ms, time.perf_counter() - started)
+        return result
+    finally:
+        engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Pool warm-up and liveness check latency")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--pool-size", type=int, default=10)
+    parser.add_argument("--idle-seconds", type=float, default=30.0)
+    parser.add_argument("--platform", default="all_platform")
+    add_output_argument(parser)
+    args = parser.parse_args()
+
+    base = PoolSettings(pool_size=args.pool_size, ping_idle_seconds=args.idle_seconds)
+    results = {"requests": args.requests, "concurrency": args.concurrency, "configurations": {}}
+    for name, options in CONFIGURATIONS.items():
+        settings = replace(base, pre_ping=options["pre_ping"])
+        results["configurations"][name] = run_configuration(
+            settings, options["warmup"], args.requests, args.concurrency, args.platform
+        )
+
+    emit(results, args.output)
+
+
+if __name__ == "__main__":
+    main()
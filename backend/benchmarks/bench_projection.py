@@ -0,0 +1,86 @@
+"""
+Benchmark: full ORM entity loads vs column-projected rows.
+
+Compares TopRecommendationDAO.get_top_recommendations (whole entities)
+with get_top_recommendation_rows (only the columns the service reads),
+reporting latency percentiles and the approximate bytes each query
+returns (sum of pg_column_size over the result rows).
+
+Seed a table with large payloads first:
+    python -m benchmarks.seed_dataset --rows 500000 --payload-bytes 4096 --truncate
+
+Usage:
+    python -m benchmarks.bench_projection --iterations 200 --limit 100
+"""
+import argparse
+import time
+
+from sqlalchemy import func, select
+
+from benchmarks.common import add_output_argument, emit, summarize_latencies
+from src.database.session import SessionLocal, engine
+from src.dashboard.overview.dao.top_recommendation_dao import (
+    TOP_RECOMMENDATION_COLUMNS,
+    TopRecommendationDAO
+)
+
+
+def _result_bytes(db, statement) -> int:
+    subquery = statement.subquery()
+    size_query = select(func.coalesce(func.sum(func.pg_column_size(subquery.table_valued())), 0))
+    return int(db.execute(size_query).scalar_one())
+
+
+def _measure(fetch, iterations: int) -> dict:
+    latencies_ms = []
+    started = time.perf_counter()
+    for _ in range(iterations):
+        call_started = time.perf_counter()
+        fetch()
+        latencies_ms.append((time.perf_counter() - call_started) * 1000)
+    return summarize_latencies(latencies_ms, time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Full entity vs projected top recommendation queries")
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--limit", type=int, default=6)
+    parser.add_argument("--platform", default="all_platform")
+    add_output_argument(parser)
+    args = parser.parse_args()
+
+    results = {"platform": args.platform, "limit": args.limit, "iterations": args.iterations}
+    db = SessionLocal()
+    try:
+        dao = TopRecommendationDAO(db)
+
+        def fetch_entities():
+            dao.get_top_recommendations(args.platform, args.limit)
+            # Drop loaded entities so each iteration pays the full identity-map cost
+            db.expunge_all()
+
+        def fetch_rows():
+            dao.get_top_recommendation_rows(args.platform, args.limit)
+
+        fetch_entities()
+        fetch_rows()
+        results["full_entity"] = _measure(fetch_entities, args.iterations)
+        results["projected"] = _measure(fetch_rows, args.iterations)
+
+        results["full_entity"]["approx_bytes"] = _result_bytes(
+            db, TopRecommendationDAO._top_recommendations_statement(args.platform, args.limit)
+        )
+        results["projected"]["approx_bytes"] = _result_bytes(
+            db, TopRecommendationDAO._top_recommendations_statement(
+                args.platform, args.limit, TOP_RECOMMENDATION_COLUMNS
+            )
+        )
+    finally:
+        db.close()
+        engine.dispose()
+
+    emit(results, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+Benchmark: full-text recommendation search vs an ILIKE scan.
+
+Runs TopRecommendationDAO.search_recommendations (GIN index on the
+search_vector column from migration 0007) and an equivalent
+``ILIKE '%term%'`` query over recommendation/description for a set of
+search terms and platforms, reporting latency percentiles for the first
+page, for a follow-up keyset page, and the index the search plan used.
+
+Seed a million-row table and apply the migrations first:
+    python -m benchmarks.seed_dataset --rows 1000000 --truncate
+    alembic upgrade head
+
+Usage:
+    python -m benchmarks.bench_search --iterations 50 --limit 20
+"""
+from typing import Dict, Iterator, List, Optional
+import argparse
+import json
+import time
+
+from sqlalchemy import desc, or_, select
+from sqlalchemy.dialects import postgresql
+
+from benchmarks.common import add_output_argument, emit, summarize_latencies
+from src.database.session import SessionLocal, engine
+from src.dashboard.overview.dao.top_recommendation_dao import (
+    RECOMMENDATION_LIST_COLUMNS,
+    TopRecommendationDAO
+)
+from src.dashboard.overview.models.recommendation import AWSRecommendationConsolidate
+
+TERMS = ["EBS", "auto-termination", "Reserved Instances", "warehouse size"]
+PLATFORMS = ["all_platform", "aws", "databricks"]
+
+
+def _ilike_statement(term: str, platform: str, limit: int):
+    pattern = f"%{term}%"
+    query = TopRecommendationDAO._apply_platform_filter(select(*RECOMMENDATION_LIST_COLUMNS), platform)
+    return query.where(
+        or_(
+            AWSRecommendationConsolidate.recommendation.ilike(pattern),
+            AWSRecommendationConsolidate.description.ilike(pattern)
+        )
+    ).order_by(
+        desc(AWSRecommendationConsolidate.potential),
+        desc(AWSRecommendationConsolidate.id)
+    ).limit(limit)
+
+
+def _walk(plan: Dict) -> Iterator[Dict]:
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from _walk(child)
+
+
+def _plan_indexes(db, statement) -> List[str]:
+    compiled = statement.compile(dialect=postgresql.dialect())
+    plan = db.connection().exec_driver_sql(
+        f"EXPLAIN (FORMAT JSON) {compiled}", compiled.params
+    ).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return sorted({node["Index Name"] for node in _walk(plan[0]["Plan"]) if "Index Name" in node})
+
+
+def _measure(fetch, iterations: int) -> dict:
+    latencies_ms = []
+    started = time.perf_counter()
+    for _ in range(iterations):
+        call_started = time.perf_counter()
+        fetch()
+        latencies_ms.append((time.perf_counter() - call_started) * 1000)
+    return summarize_latencies(latencies_ms, time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Full-text search vs ILIKE recommendation search")
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--terms", nargs="+", default=TERMS)
+    parser.add_argument("--platforms", nargs="+", default=PLATFORMS)
+    add_output_argument(parser)
+    args = parser.parse_args()
+
+    results = {"limit": args.limit, "iterations": args.iterations, "cases": []}
+    db = SessionLocal()
+    try:
+        dao = TopRecommendationDAO(db)
+        rows = db.execute(select(AWSRecommendationConsolidate.id).limit(1)).all()
+        results["table_has_rows"] = bool(rows)
+
+        for term in args.terms:
+            for platform in args.platforms:
+                first_page = dao.search_recommendations(term, platform, args.limit)
+                after: Optional[tuple] = None
+                if len(first_page) == args.limit:
+                    after = (first_page[-1].rank, first_page[-1].id)
+
+                case = {
+                    "term": term,
+                    "platform": platform,
+                    "first_page_rows": len(first_page),
+                    "search_indexes": _plan_indexes(
+                        db, TopRecommendationDAO._search_statement(term, platform, args.limit)
+                    ),
+                    "fts_first_page": _measure(
+                        lambda: dao.search_recommendations(term, platform, args.limit),
+                        args.iterations
+                    ),
+                    "ilike": _measure(
+                        lambda: db.execute(_ilike_statement(term, platform, args.limit)).all(),
+                        args.iterations
+                    )
+                }
+                if after is not None:
+                    case["fts_next_page"] = _measure(
+                        lambda: dao.search_recommendations(term, platform, args.limit, after),
+                        args.iterations
+                    )
+                results["cases"].append(case)
+    finally:
+        db.close()
+        engine.dispose()
+
+    emit(results, args.output)
+
+
+if __name__ == "__main__":
+    main()
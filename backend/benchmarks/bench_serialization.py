@@ -0,0 +1,122 @@
+"""
+Benchmark: validated response_model serialization vs pre-serialized bytes.
+
+Mounts two in-process endpoints returning the same top recommendations
+response and drives them through httpx's ASGI transport, so no database
+or network is involved:
+
+- validated: builds RecommendationItem/TopRecommendationResponse with
+  validation and lets FastAPI re-validate and serialize via response_model
+  (the previous path)
+- fast: returns TopRecommendationPayload.body, serialized once with orjson
+
+Both bodies are checked to decode to the same JSON before timing.
+
+Usage:
+    python -m benchmarks.bench_serialization --requests 5000 --items 6
+"""
+from decimal import Decimal
+from types import SimpleNamespace
+import argparse
+import asyncio
+import json
+import random
+import time
+
+import httpx
+from fastapi import FastAPI, Response
+
+from benchmarks.common import add_output_argument, emit, summarize_latencies
+from src.dashboard.overview.dao.top_recommendation_dao import TopRecommendationDAO
+from src.dashboard.overview.schemas.top_recommendation_schema import (
+    RecommendationItem,
+    SuccessResponse,
+    TopRecommendationResponse
+)
+from src.dashboard.overview.service.top_recommendation_service import (
+    SUCCESS_MESSAGE,
+    TopRecommendationPayload,
+    TopRecommendationService
+)
+
+
+def _rows(count: int):
+    rng = random.Random(7)
+    platforms = list(TopRecommendationDAO.PLATFORM_MAPPING)
+    return [
+        SimpleNamespace(
+            type=rng.choice(platforms),
+            description=f"Right-size resource {i} to a smaller instance class",
+            recommendation=f"Downsize resource {i}",
+            potential=Decimal(rng.randint(100, 10_000_000)) / 100
+        )
+        for i in range(count)
+    ]
+
+
+def _build_app(rows) -> FastAPI:
+    app = FastAPI()
+    payload = TopRecommendationPayload(TopRecommendationService._build_items(rows))
+
+    @app.get("/validated", response_model=TopRecommendationResponse)
+    async def validated() -> TopRecommendationResponse:
+        items = [
+            RecommendationItem(
+                platform_name=TopRecommendationService._get_platform_display_name(rec.type),
+                description=rec.description or rec.recommendation or "Recommended optimization",
+                value=TopRecommendationService._format_savings(rec.potential)
+            )
+            for rec in rows
+        ]
+        return TopRecommendationResponse(
+            success_response=SuccessResponse(
+                status_code=200, message=SUCCESS_MESSAGE, status=True, data=items
+            )
+        )
+
+    @app.get("/fast", response_model=TopRecommendationResponse)
+    async def fast() -> Response:
+        return Response(content=payload.body, media_type="application/json")
+
+    return app
+
+
+async def _measure(client: httpx.AsyncClient, path: str, requests: int) -> dict:
+    latencies_ms = []
+    started = time.perf_counter()
+    for _ in range(requests):
+        call_started = time.perf_counter()
+        response = await client.get(path)
+        response.raise_for_status()
+        latencies_ms.append((time.perf_counter() - call_started) * 1000)
+    return summarize_latencies(latencies_ms, time.perf_counter() - started)
+
+
+async def _run(args: argparse.Namespace) -> dict:
+    app = _build_app(_rows(args.items))
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        validated_body = (await client.get("/validated")).content
+        fast_body = (await client.get("/fast")).content
+        if json.loads(validated_body) != json.loads(fast_body):
+            raise SystemExit("validated and fast responses differ")
+
+        return {
+            "items": args.items,
+            "body_bytes": {"validated": len(validated_body), "fast": len(fast_body)},
+            "validated": await _measure(client, "/validated", args.requests),
+            "fast": await _measure(client, "/fast", args.requests)
+        }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Response serialization benchmark")
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--items", type=int, default=6)
+    add_output_argument(parser)
+    args = parser.parse_args()
+    emit(asyncio.run(_run(args)), args.output)
+
+
+if __name__ == "__main__":
+    main()
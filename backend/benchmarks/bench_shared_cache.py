@@ -0,0 +1,127 @@
+"""
+Benchmark: DB queries per data refresh as worker processes scale.
+
+Each worker process mimics an API worker serving top recommendations:
+an in-process TTLCache in front of a loader that stands in for the DB
+query (it sleeps --query-ms and counts itself in a counter shared by all
+processes). The data version advances every --refresh-seconds, retiring
+every cached entry, as a real ingestion run would.
+
+- per_process: in-process cache only; every worker queries every key
+  after every refresh, so queries grow with the worker count
+- shared: in-process cache plus SharedFileCache; one worker per host
+  queries each key per refresh, so queries stay constant
+
+Usage:
+    python -m benchmarks.bench_shared_cache --workers 1 2 4 8 --duration 5
+"""
+from typing import Dict, List
+import argparse
+import multiprocessing
+import shutil
+import tempfile
+import time
+
+from benchmarks.common import add_output_argument, emit, summarize_latencies
+from src.cache.shared_file_cache import SharedFileCache
+from src.cache.ttl_cache import TTLCache
+
+PLATFORMS = ["all_platform", "aws", "databricks", "snowflakes", "google_cloud"]
+
+
+def _worker(
+    mode: str,
+    directory: str,
+    started_at: float,
+    duration: float,
+    refresh_seconds: float,
+    query_ms: float,
+    queries,
+    latencies_out
+) -> None:
+    local_cache = TTLCache(max_entries=128, ttl_seconds=3600)
+    shared_cache = SharedFileCache(directory, ttl_seconds=3600)
+
+    def load() -> bytes:
+        with queries.get_lock():
+            queries.value += 1
+        time.sleep(query_ms / 1000)
+        return b"{}"
+
+    latencies_ms: List[float] = []
+    request = 0
+    while time.time() - started_at < duration:
+        version = int((time.time() - started_at) / refresh_seconds)
+        key = (version, PLATFORMS[request % len(PLATFORMS)])
+        request += 1
+
+        begun = time.perf_counter()
+        if local_cache.get(key) is None:
+            if mode == "shared":
+                body = shared_cache.get_or_load(f"bench:{key[0]}:{key[1]}", load)
+            else:
+                body = load()
+            local_cache.set(key, body)
+        latencies_ms.append((time.perf_counter() - begun) * 1000)
+
+    latencies_out.put(latencies_ms)
+
+
+def run(mode: str, workers: int, duration: float, refresh_seconds: float, query_ms: float) -> Dict:
+    directory = tempfile.mkdtemp(prefix="bench-shared-cache-")
+    queries = multiprocessing.Value("i", 0)
+    latencies_out = multiprocessing.Queue()
+    started_at = time.time() + 0.5  # let every process start before the clock runs
+    processes = [
+        multiprocessing.Process(
+            target=_worker,
+            args=(mode, directory, started_at, duration + 0.5, refresh_seconds,
+                  query_ms, queries, latencies_out)
+        )
+        for _ in range(workers)
+    ]
+    try:
+        for process in processes:
+            process.start()
+        latencies_ms: List[float] = []
+        for _ in processes:
+            latencies_ms.extend(latencies_out.get())
+        for process in processes:
+            process.join()
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+    refreshes = int(duration / refresh_seconds) + 1
+    return {
+        "db_queries": queries.value,
+        "db_queries_per_refresh": round(queries.value / refreshes, 2),
+        "latency": summarize_latencies(latencies_ms, duration)
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="DB queries per refresh, per-process vs shared cache")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--refresh-seconds", type=float, default=1.0)
+    parser.add_argument("--query-ms", type=float, default=20.0)
+    add_output_argument(parser)
+    args = parser.parse_args()
+
+    results = {
+        "platforms": len(PLATFORMS),
+        "refresh_seconds": args.refresh_seconds,
+        "query_ms": args.query_ms,
+        "workers": {}
+    }
+    for workers in args.workers:
+        results["workers"][str(workers)] = {
+            mode: run(mode, workers, args.duration, args.refresh_seconds, args.query_ms)
+            for mode in ("per_process", "shared")
+        }
+
+    emit(results, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Benchmark: worker cold start, from a fresh interpreter to the first response.
+
+Each run starts a new Python process that imports the app module, builds
+the app (attribute or factory), runs the lifespan start-up and serves one
+request in-process, timing every phase:
+
+- import_ms: importing the module named by --app
+- build_ms: resolving the attribute or calling the factory
+- startup_ms: lifespan start-up (engine creation, pool warm-up)
+- first_request_ms: the first request to --path
+- total_ms: process start of the measurement to the first response
+
+Use --cwd to measure another checkout of the backend (e.g. a git worktree of
+an older commit) with the same script.
+
+Usage:
+    python -m benchmarks.bench_startup --app main:create_app --factory --runs 10
+    python -m benchmarks.bench_startup --app main:app --cwd /tmp/old-backend --runs 10
+"""
+from typing import Dict, List
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+from benchmarks.common import add_output_argument, emit
+
+CHILD = r"""
+import asyncio, json, sys, time
+import httpx  # client side of the measurement, not part of the app
+started = time.perf_counter()
+import importlib
+module_name, attribute, factory, method, path, body = sys.argv[1:7]
+module = importlib.import_module(module_name)
+imported = time.perf_counter()
+app = getattr(module, attribute)
+if factory == "1":
+    app = app()
+built = time.perf_counter()
+
+async def serve():
+    async with app.router.lifespan_context(app):
+        ready = time.perf_counter()
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            response = await client.request(method, path, content=body or None,
+                                            headers={"content-type": "application/json"})
+        return ready, time.perf_counter(), response.status_code
+
+ready, answered, status = asyncio.run(serve())
+print(json.dumps({
+    "import_ms": (imported - started) * 1000,
+    "build_ms": (built - imported) * 1000,
+    "startup_ms": (ready - built) * 1000,
+    "first_request_ms": (answered - ready) * 1000,
+    "total_ms": (answered - started) * 1000,
+    "status": status
+}))
+"""
+
+PHASES = ("import_ms", "build_ms", "startup_ms", "first_request_ms", "total_ms")
+
+
+def run_once(args: argparse.Namespace) -> Dict:
+    module_name, attribute = args.app.split(":")
+    completed = subprocess.run(
+        [sys.executable, "-c", CHILD, module_name, attribute, "1" if args.factory else "0",
+         args.method, args.path, args.body or ""],
+        cwd=args.cwd,
+        env=dict(os.environ, PYTHONPATH=args.cwd),
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Cold start: import, build, start-up and first request time")
+    parser.add_argument("--app", default="main:create_app", help="module:attribute of the app or factory")
+    parser.add_argument("--factory", action="store_true", help="Call the attribute to build the app")
+    parser.add_argument("--cwd", default=os.getcwd(), help="Backend directory to import the app from")
+    parser.add_argument("--method", default="GET")
+    parser.add_argument("--path", default="/health")
+    parser.add_argument("--body", default=None, help="JSON request body")
+    parser.add_argument("--runs", type=int, default=10)
+    add_output_argument(parser)
+    args = parser.parse_args()
+
+    runs: List[Dict] = [run_once(args) for _ in range(args.runs)]
+    results = {
+        "app": args.app,
+        "factory": args.factory,
+        "path": args.path,
+        "runs": args.runs,
+        "statuses": sorted({run["status"] for run in runs}),
+        "median": {phase: round(statistics.median(run[phase] for run in runs), 1) for phase in PHASES},
+        "min": {phase: round(min(run[phase] for run in runs), 1) for phase in PHASES}
+    }
+    emit(results, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Shared helpers for benchmark scripts.
+"""
+from typing import Dict, List, Optional
+import argparse
+import datetime
+import json
+import math
+import platform
+import subprocess
+import sys
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """
+    Nearest-rank percentile of a list of samples.
+
+    Args:
+        samples: Measured values
+        pct: Percentile between 0 and 100
+
+    Returns:
+        The percentile value, or 0.0 for an empty list
+    """
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(pct / 100.0 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarize_latencies(latencies_ms: List[float], elapsed_s: float) -> Dict[str, float]:
+    """
+    Summarize request latencies as throughput and p50/p95/p99.
+
+    Args:
+        latencies_ms: Per-request latencies in milliseconds
+        elapsed_s: Wall-clock duration of the run in seconds
+
+    Returns:
+        Dictionary of summary statistics
+    """
+    return {
+        "requests": len(latencies_ms),
+        "throughput_rps": round(len(latencies_ms) / elapsed_s, 2) if elapsed_s else 0.0,
+        "p50_ms": round(percentile(latencies_ms, 50), 3),
+        "p95_ms": round(percentile(latencies_ms, 95), 3),
+        "p99_ms": round(percentile(latencies_ms, 99), 3),
+        "max_ms": round(max(latencies_ms), 3) if latencies_ms else 0.0
+    }
+
+
+def run_metadata() -> Dict[str, str]:
+    """
+    Describe the environment a benchmark ran in, for comparing runs.
+
+    Returns:
+        Dictionary with timestamp, git commit, Python version and host
+    """
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, timeout=5
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        commit = ""
+    return {
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "git_commit": commit or "unknown",
+        "python": platform.python_version(),
+        "host": platform.node(),
+        "command": " ".join(sys.argv)
+    }
+
+
+def add_output_argument(parser: argparse.ArgumentParser) -> None:
+    """Add the shared --output option (JSON results file) to a benchmark CLI."""
+    parser.add_argument("--output", help="Also write the JSON results to this file")
+
+
+def emit(results: Dict, output: Optional[str] = None) -> None:
+    """
+    Print benchmark results as JSON, optionally writing them to a file.
+
+    Args:
+        results: Benchmark results
+        output: Path of a JSON file to write (for benchmarks.compare)
+    """
+    document = {"meta": run_metadata(), **results}
+    text = json.dumps(document, indent=2, default=str)
+    print(text)
+    if output:
+        with open(output, "w") as handle:
+            handle.write(text + "\n")
@@ -0,0 +1,98 @@
+"""
+Compare two benchmark JSON results and flag regressions.
+
+Walks both documents, pairs numeric metrics by path and reports the
+relative change of latency metrics (``*_ms``, ``*_ns``; lower is better)
+and throughput metrics (``throughput_rps``; higher is better). Exits with
+status 1 if any metric regressed by more than --threshold percent.
+
+Usage:
+    python -m benchmarks.load_test --app main:app --output baseline.json
+    python -m benchmarks.load_test --app main:app --output candidate.json
+    python -m benchmarks.compare baseline.json candidate.json --threshold 10
+"""
+from typing import Dict, Iterator, Tuple
+import argparse
+import json
+import sys
+
+LOWER_IS_BETTER_SUFFIXES = ("_ms", "_ns")
+HIGHER_IS_BETTER_KEYS = ("throughput_rps",)
+
+
+def iter_metrics(document: Dict, prefix: str = "") -> Iterator[Tuple[str, float, bool]]:
+    """
+    Yield (path, value, higher_is_better) for every comparable metric.
+
+    Args:
+        document: Parsed benchmark results
+        prefix: Path of the enclosing object
+
+    Yields:
+        Metric path such as 'result.p99_ms', its value and its direction
+    """
+    for key, value in document.items():
+        if key == "meta":
+            continue
+        path = f"{prefix}.{key}" if prefix else key
+        if isinstance(value, dict):
+            yield from iter_metrics(value, path)
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            if key in HIGHER_IS_BETTER_KEYS:
+                yield path, float(value), True
+            elif key.endswith(LOWER_IS_BETTER_SUFFIXES):
+                yield path, float(value), False
+
+
+def compare(baseline: Dict, candidate: Dict, threshold: float) -> Dict:
+    """
+    Compare matching metrics of two result documents.
+
+    Args:
+        baseline: Earlier results
+        candidate: New results
+        threshold: Regression threshold in percent
+
+    Returns:
+        Dictionary with per-metric changes and the list of regressions
+    """
+    baseline_metrics = {path: (value, higher) for path, value, higher in iter_metrics(baseline)}
+    changes = {}
+    regressions = []
+
+    for path, value, higher in iter_metrics(candidate):
+        if path not in baseline_metrics:
+            continue
+        before = baseline_metrics[path][0]
+        if before == 0:
+            continue
+        change_pct = (value - before) / before * 100
+        worse_pct = -change_pct if higher else change_pct
+        changes[path] = {"baseline": before, "candidate": value, "change_pct": round(change_pct, 2)}
+        if worse_pct > threshold:
+            regressions.append(path)
+
+    return {"threshold_pct": threshold, "changes": changes, "regressions": regressions}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Flag regressions between two benchmark results")
+    parser.add_argument("baseline")
+    parser.add_argument("candidate")
+    parser.add_argument("--threshold", type=float, default=10.0, help="Allowed regression in percent")
+    args = parser.parse_args()
+
+    with open(args.baseline) as handle:
+        baseline = json.load(handle)
+    with open(args.candidate) as handle:
+        candidate = json.load(handle)
+
+    report = compare(baseline, candidate, args.threshold)
+    report["baseline_meta"] = baseline.get("meta", {})
+    report["candidate_meta"] = candidate.get("meta", {})
+    print(json.dumps(report, indent=2))
+    sys.exit(1 if report["regressions"] else 0)
+
+
+if __name__ == "__main__":
+    main()
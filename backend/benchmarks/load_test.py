@@ -0,0 +1,173 @@
+"""
+End-to-end load harness for the FastAPI apps.
+
+Drives an app with a fixed number of concurrent clients and reports
+throughput, p50/p95/p99 latency and status counts as JSON. Targets:
+
+- in-process (default): imports --app (``main:app`` or ``main_mock:app``)
+  and calls it through httpx's ASGI transport, running its lifespan
+- over HTTP: --base-url of a running server, e.g. uvicorn with workers
+
+Requests rotate through --platforms on the top recommendation endpoint
+unless --path/--body select another one.
+
+Usage:
+    python -m benchmarks.load_test --app main:app --concurrency 64 --duration 30
+    python -m benchmarks.load_test --app main_mock:app --concurrency 64 --requests 20000
+    python -m benchmarks.load_test --base-url http://localhost:8000 --concurrency 128 --duration 60
+"""
+from collections import Counter
+from typing import Dict, List, Optional
+import argparse
+import asyncio
+import contextlib
+import importlib
+import itertools
+import json
+import time
+
+import httpx
+
+from benchmarks.common import add_output_argument, emit, summarize_latencies
+
+PLATFORMS = ["all_platform", "aws", "google_cloud", "databricks", "snowflakes"]
+TOP_RECOMMENDATION_SUFFIX = "/top-updates/top-recommendation"
+
+
+def load_app(spec: str):
+    """Import an ASGI app given as 'module:attribute'."""
+    module_name, _, attribute = spec.partition(":")
+    return getattr(importlib.import_module(module_name), attribute or "app")
+
+
+def find_route(app, suffix: str) -> str:
+    """Find the full path of the app route ending with suffix (prefixes differ per app)."""
+    for route in app.routes:
+        if getattr(route, "path", "").endswith(suffix):
+            return route.path
+    raise SystemExit(f"No route ending with {suffix} in the app")
+
+
+async def _client_loop(
+    client: httpx.AsyncClient,
+    method: str,
+    path: str,
+    bodies,
+    deadline: float,
+    remaining: Optional[itertools.count],
+    total: Optional[int],
+    latencies_ms: List[float],
+    statuses: Counter
+) -> None:
+    while time.perf_counter() < deadline:
+        if remaining is not None and next(remaining) >= total:
+            return
+        body = next(bodies)
+        started = time.perf_counter()
+        try:
+            response = await client.request(method, path, json=body)
+            statuses[str(response.status_code)] += 1
+        except httpx.HTTPError as e:
+            statuses[type(e).__name__] += 1
+            continue
+        latencies_ms.append((time.perf_counter() - started) * 1000)
+
+
+async def run_load(
+    client: httpx.AsyncClient,
+    method: str,
+    path: str,
+    bodies: List[Optional[Dict]],
+    concurrency: int,
+    duration: float,
+    total: Optional[int]
+) -> Dict:
+    """
+    Run concurrent clients until the duration elapses or total requests are sent.
+
+    Returns:
+        Latency summary with status counts
+    """
+    latencies_ms: List[float] = []
+    statuses: Counter = Counter()
+    body_cycle = itertools.cycle(bodies)
+    remaining = itertools.count() if total else None
+    deadline = time.perf_counter() + duration if duration else float("inf")
+
+    started = time.perf_counter()
+    await asyncio.gather(*(
+        _client_loop(client, method, path, body_cycle, deadline, remaining, total, latencies_ms, statuses)
+        for _ in range(concurrency)
+    ))
+    elapsed = time.perf_counter() - started
+
+    summary = summarize_latencies(latencies_ms, elapsed)
+    summary["statuses"] = dict(statuses)
+    summary["seconds"] = round(elapsed, 3)
+    return summary
+
+
+@contextlib.asynccontextmanager
+async def open_client(args: argparse.Namespace):
+    """Yield (client, path) for an in-process app or a remote server."""
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    if args.base_url:
+        async with httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=args.timeout) as client:
+            yield client, args.path or TOP_RECOMMENDATION_SUFFIX
+        return
+
+    app = load_app(args.app)
+    path = args.path or find_route(app, TOP_RECOMMENDATION_SUFFIX)
+    transport = httpx.ASGITransport(app=app)
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://load-test", limits=limits, timeout=args.timeout
+        ) as client:
+            yield client, path
+
+
+async def main_async(args: argparse.Namespace) -> Dict:
+    if args.body:
+        bodies = [json.loads(args.body)]
+    else:
+        bodies = [{"platform": platform} for platform in args.platforms.split(",")]
+
+    async with open_client(args) as (client, path):
+        if args.warmup:
+            await run_load(client, args.method, path, bodies, min(args.concurrency, args.warmup), 0, args.warmup)
+        result = await run_load(
+            client, args.method, path, bodies, args.concurrency, args.duration, args.requests
+        )
+
+    return {
+        "target": args.base_url or args.app,
+        "path": path,
+        "method": args.method,
+        "concurrency": args.concurrency,
+        "result": result
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Concurrent load against the FastAPI app")
+    parser.add_argument("--app", default="main:app", help="module:attribute of the ASGI app (in-process)")
+    parser.add_argument("--base-url", help="Load a running server instead of an in-process app")
+    parser.add_argument("--path", help="Request path (default: the top recommendation route)")
+    parser.add_argument("--method", default="POST")
+    parser.add_argument("--body", help="JSON request body (default: rotate --platforms)")
+    parser.add_argument("--platforms", default=",".join(PLATFORMS))
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds to run (0: until --requests)")
+    parser.add_argument("--requests", type=int, help="Stop after this many requests")
+    parser.add_argument("--warmup", type=int, default=100, help="Unmeasured requests sent first")
+    parser.add_argument("--timeout", type=float, default=30.0)
+    add_output_argument(parser)
+    args = parser.parse_args()
+
+    if not args.duration and not args.requests:
+        parser.error("--duration 0 needs --requests")
+    emit(asyncio.run(main_async(args)), args.output)
+
+
+if __name__ == "__main__":
+    main()
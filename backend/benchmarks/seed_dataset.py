@@ -0,0 +1,188 @@
+"""
+Seeded dataset generator for aws_recommendation_consolidate.
+
+Streams realistic rows into a local PostgreSQL through COPY, so millions
+of rows load in minutes. The same seed always produces the same data.
+
+Usage:
+    python -m benchmarks.seed_dataset --rows 1000000 --payload-bytes 2048 --truncate
+"""
+from typing import Dict, Iterator, List
+import argparse
+import csv
+import io
+import json
+import random
+import time
+
+from src.database.session import engine
+
+PLATFORM_WEIGHTS = (
+    ("AWS", 0.80),
+    ("Google Cloud", 0.08),
+    ("Databricks", 0.07),
+    ("Snowflakes", 0.05)
+)
+
+SERVICES = {
+    "AWS": [("EC2", "Instance"), ("EBS", "Volume"), ("RDS", "Database"), ("S3", "Bucket"), ("Lambda", "Function")],
+    "Google Cloud": [("Compute Engine", "VM"), ("Compute Engine", "Persistent Disk"), ("Cloud SQL", "Instance")],
+    "Databricks": [("Databricks Cluster", "All-Purpose"), ("Databricks Cluster", "Jobs"), ("SQL Warehouse", "Serverless")],
+    "Snowflakes": [("Warehouse", "Compute"), ("Storage", "Time Travel")]
+}
+
+REGIONS = {
+    "AWS": ["us-east-1", "us-east-2", "us-west-2", "eu-west-1", "ap-south-1"],
+    "Google Cloud": ["us-central1", "europe-west1", "asia-east1"],
+    "Databricks": ["us-east-1", "us-west-2", "westeurope"],
+    "Snowflakes": ["aws-us-east-1", "aws-eu-west-1"]
+}
+
+RECOMMENDATIONS = [
+    ("Right-size instance", "Recommended to right-size {service} resource {resource} in {region} based on 30-day utilization"),
+    ("Delete unused volume", "Delete unused EBS volume {resource} in {region} - no attachments found"),
+    ("Purchase Reserved Instances", "Convert On-Demand capacity to Reserved Instances for long-running {service} workloads"),
+    ("Configure auto-termination", "Schedule cluster auto-termination for {resource} during non-business hours"),
+    ("Reduce warehouse size", "Reduce warehouse size for {resource} based on usage patterns"),
+    ("Migrate generation", "Migrate {resource} to a newer generation {service} instance for better price-performance")
+]
+
+COLUMNS = [
+    "type", "account", "region", "resource_name", "resource_id", "service", "sub_service",
+    "recommendation", "description", "potential", "actual_cost", "target_cost",
+    "current_configuration", "expected_configuration", "justifications", "tags_json",
+    "actionable", "risk_level", "impact"
+]
+
+
+def _blob(rng: random.Random, size: int) -> str:
+    words = ("cpu", "memory", "iops", "throughput", "utilization", "p95", "idle", "baseline", "burst", "network")
+    out: List[str] = []
+    length = 0
+    while length < size:
+        word = rng.choice(words)
+        out.append(word)
+        length += len(word) + 1
+    return " ".join(out)[:size]
+
+
+def generate_rows(rows: int, seed: int = 42, payload_bytes: int = 1024) -> Iterator[Dict]:
+    """
+    Generate deterministic recommendation rows.
+
+    Args:
+        rows: Number of rows to generate
+        seed: Random seed
+        payload_bytes: Approximate size of each large text column and of tags_json
+
+    Yields:
+        Dictionaries keyed by aws_recommendation_consolidate column names
+    """
+    rng = random.Random(seed)
+    platforms = [name for name, _ in PLATFORM_WEIGHTS]
+    weights = [weight for _, weight in PLATFORM_WEIGHTS]
+    accounts = [f"{rng.randrange(10 ** 11, 10 ** 12)}" for _ in range(200)]
+
+    for i in range(rows):
+        platform = rng.choices(platforms, weights)[0]
+        service, sub_service = rng.choice(SERVICES[platform])
+        region = rng.choice(REGIONS[platform])
+        resource = f"{service.split()[0].lower()}-{i:09d}"
+        title, template = rng.choice(RECOMMENDATIONS)
+        actual = round(rng.lognormvariate(5, 1.2), 4)
+        target = round(actual * rng.uniform(0.0, 0.95), 4)
+        tags = {
+            "env": rng.choice(["prod", "staging", "dev"]),
+            "team": rng.choice(["data", "platform", "web", "ml"]),
+            "cost_center": f"cc-{rng.randrange(100, 999)}",
+            "notes": _blob(rng, max(payload_bytes - 80, 0))
+        }
+        yield {
+            "type": platform,
+            "account": rng.choice(accounts),
+            "region": region,
+            "resource_name": resource,
+            "resource_id": f"{resource}-{rng.randrange(16 ** 8):08x}",
+            "service": service,
+            "sub_service": sub_service,
+            "recommendation": title,
+            "description": template.format(service=service, resource=resource, region=region),
+            "potential": round(actual - target, 4),
+            "actual_cost": actual,
+            "target_cost": target,
+            "current_configuration": _blob(rng, payload_bytes),
+            "expected_configuration": _blob(rng, payload_bytes),
+            "justifications": _blob(rng, payload_bytes),
+            "tags_json": tags,
+            "actionable": rng.random() < 0.7,
+            "risk_level": rng.choice(["Low", "Medium", "High"]),
+            "impact": rng.choice(["Low", "Medium", "High"])
+        }
+
+
+def copy_rows(rows: Iterator[Dict], batch_size: int = 50000) -> int:
+    """
+    Load rows into aws_recommendation_consolidate with COPY.
+
+    Args:
+        rows: Row dictionaries from generate_rows
+        batch_size: Rows per COPY round trip
+
+    Returns:
+        Number of rows loaded
+    """
+    copy_sql = (
+        f"COPY aws_recommendation_consolidate ({', '.join(COLUMNS)}) "
+        "FROM STDIN WITH (FORMAT csv)"
+    )
+    loaded = 0
+    connection = engine.raw_connection()
+    try:
+        cursor = connection.cursor()
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        pending = 0
+        for row in rows:
+            values = dict(row, tags_json=json.dumps(row["tags_json"]))
+            writer.writerow([values[column] for column in COLUMNS])
+            pending += 1
+            if pending == batch_size:
+                buffer.seek(0)
+                cursor.copy_expert(copy_sql, buffer)
+                loaded += pending
+                buffer = io.StringIO()
+                writer = csv.writer(buffer)
+                pending = 0
+        if pending:
+            buffer.seek(0)
+            cursor.copy_expert(copy_sql, buffer)
+            loaded += pending
+        connection.commit()
+    finally:
+        connection.close()
+    return loaded
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Seed aws_recommendation_consolidate with generated rows")
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--payload-bytes", type=int, default=1024,
+                        help="Approximate size of each text blob and tags_json document")
+    parser.add_argument("--truncate", action="store_true", help="Empty the table before loading")
+    args = parser.parse_args()
+
+    if args.truncate:
+        with engine.begin() as conn:
+            conn.exec_driver_sql("TRUNCATE aws_recommendation_consolidate RESTART IDENTITY")
+
+    started = time.perf_counter()
+    loaded = copy_rows(generate_rows(args.rows, args.seed, args.payload_bytes))
+    with engine.begin() as conn:
+        conn.exec_driver_sql("ANALYZE aws_recommendation_consolidate")
+    elapsed = time.perf_counter() - started
+    print(json.dumps({"rows": loaded, "seconds": round(elapsed, 2), "rows_per_second": round(loaded / elapsed)}))
+
+
+if __name__ == "__main__":
+    main()
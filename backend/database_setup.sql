@@ -1,5 +1,8 @@
 -- PRISM Web Database Setup
 -- PostgreSQL Database and Table Creation
+--
+-- After running this script, apply the remaining schema objects (rollup
+-- tables, triggers) with: alembic upgrade head
 
 -- Create database (run this as postgres superuser)
 -- If database already exists, skip this step
@@ -41,6 +44,17 @@ CREATE TABLE aws_recommendation_consolidate (
 CREATE INDEX idx_potential ON aws_recommendation_consolidate(potential DESC);
 CREATE INDEX idx_type ON aws_recommendation_consolidate(type);
 
+-- Partial indexes for the top recommendation and listing queries
+-- (kept in sync with migrations/versions/0003_keyset_recommendation_indexes.py)
+CREATE INDEX idx_rec_type_potential_id ON aws_recommendation_consolidate(type, potential DESC, id DESC) WHERE potential > 0;
+CREATE INDEX idx_rec_potential_id ON aws_recommendation_consolidate(potential DESC, id DESC) WHERE potential > 0;
+
+-- Natural key used by bulk ingestion upserts (NULLs compare equal)
+-- (kept in sync with migrations/versions/0004_recommendation_natural_key.py)
+CREATE UNIQUE INDEX uq_rec_natural_key ON aws_recommendation_consolidate(
+    COALESCE(type, ''), COALESCE(account, ''), COALESCE(resource_id, ''), COALESCE(recommendation, '')
+);
+
 -- Insert sample data for testing
 INSERT INTO aws_recommendation_consolidate 
 (type, description, potential, actual_cost, target_cost, recommendation, resource_name, region, service, actionable) 
@@ -1,13 +1,23 @@
 """
 PRISM Web Backend - Main Application Entry Point.
+
+The application is built by create_app(). Importing this module is cheap:
+feature routers are imported when the app is built and database engines
+are created in the lifespan, so new workers start serving sooner.
+
+    uvicorn main:create_app --factory   # or main:app, built on first access
 """
-from fastapi import FastAPI, Request
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from importlib import import_module
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 import logging
 import uvicorn
 
-from src.dashboard import dashboard_router
+from src.config import get_settings
+from src.observability import MetricsMiddleware, render_metrics
 
 # Configure logging
 logging.basicConfig(
@@ -16,27 +26,28 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Create FastAPI application
-app = FastAPI(
-    title="PRISM Web API",
-    description="Backend API for PRISM Web Dashboard - Cost Optimization Platform",
-    version="1.0.0",
-    docs_url="/docs",
-    redoc_url="/redoc"
+# Feature routers as (module, attribute, prefix), imported by create_app
+FEATURE_ROUTERS = (
+    ("src.dashboard", "dashboard_router", "/api/v1"),
 )
 
-# Configure CORS
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # Configure appropriately for production
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# Routes behind rate limiting, load shedding and the database circuit breaker
+ADMISSION_CONTROLLED_PREFIXES = ("/api/v1/dashboard",)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create and warm the connection pool and start background refreshes before serving; stop both on shutdown."""
+    from src.database.lifecycle import dispose_engines, warm_up_pools
+    from src.dashboard.overview.service.top_recommendation_refresher import top_recommendation_refresher
+
+    await warm_up_pools()
+    top_recommendation_refresher.start()
+    yield
+    await top_recommendation_refresher.stop()
+    await dispose_engines()
 
 
-# Global exception handler
-@app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
     """Handle uncaught exceptions globally."""
     logger.error(f"Unhandled exception: {str(exc)}")
@@ -51,23 +62,88 @@ async def global_exception_handler(request: Request, exc: Exception):
     )
 
 
-# Health check endpoint
-@app.get("/health", tags=["Health"])
 async def health_check():
     """Health check endpoint."""
     return {"status": "healthy", "service": "prism-web-backend"}
 
 
-# Include routers
-app.include_router(
-    dashboard_router,
-    prefix="/api/v1"
-)
+async def metrics() -> Response:
+    """Request, DB query and connection pool metrics in the Prometheus text format."""
+    body, content_type = render_metrics()
+    return Response(content=body, media_type=content_type)
+
+
+def create_app() -> FastAPI:
+    """
+    Build the FastAPI application.
+    
+    Configuration is parsed once here (get_settings is cached for the
+    process); engines are created later, by the lifespan.
+    
+    Returns:
+        The application
+    """
+    settings = get_settings()
+
+    app = FastAPI(
+        title="PRISM Web API",
+        description="Backend API for PRISM Web Dashboard - Cost Optimization Platform",
+        version="1.0.0",
+        docs_url="/docs",
+        redoc_url="/redoc",
+        lifespan=lifespan
+    )
+    app.state.settings = settings
+
+    # Answer 429 / 503 with Retry-After before queueing on a saturated pool;
+    # added first so CORS headers and metrics still apply to the rejections
+    from src.admission import AdmissionMiddleware
+
+    app.add_middleware(AdmissionMiddleware, path_prefixes=ADMISSION_CONTROLLED_PREFIXES)
+
+    # Configure CORS
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=["*"],  # Configure appropriately for production
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+
+    # Per-route latency histograms and status counts, exported on /metrics
+    app.add_middleware(MetricsMiddleware)
+
+    app.add_exception_handler(Exception, global_exception_handler)
+
+    app.add_api_route("/health", health_check, methods=["GET"], tags=["Health"])
+    app.add_api_route(
+        "/metrics", metrics, methods=["GET"], tags=["Health"], include_in_schema=False
+    )
+
+    # Include routers
+    for module_name, attribute, prefix in FEATURE_ROUTERS:
+        router = getattr(import_module(module_name), attribute)
+        app.include_router(router, prefix=prefix)
+
+    return app
+
+
+@lru_cache(maxsize=1)
+def _default_app() -> FastAPI:
+    return create_app()
+
+
+def __getattr__(name: str):
+    """Build ``main:app`` on first access, for existing ``uvicorn main:app`` setups."""
+    if name == "app":
+        return _default_app()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 if __name__ == "__main__":
     uvicorn.run(
-        "main:app",
+        "main:create_app",
+        factory=True,
         host="0.0.0.0",
         port=8000,
         reload=True
@@ -2,9 +2,10 @@
 PRISM Web Backend - Main Application (Mock Version for Testing).
 This version uses mock data instead of a real database.
 """
-from fastapi import FastAPI, Request
+from contextlib import asynccontextmanager
+from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
 import logging
 import uvicorn
 
@@ -15,13 +16,26 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Import mock router
+from src.dashboard.overview.api.top_recommendation_api_mock import router as mock_router
+from src.dashboard.overview.dao.top_recommendation_dao_mock import get_mock_store
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Build the in-memory dataset before the first request."""
+    await run_in_threadpool(get_mock_store)
+    yield
+
+
 # Create FastAPI application
 app = FastAPI(
     title="PRISM Web API (Mock Mode)",
     description="Backend API for PRISM Web Dashboard - Cost Optimization Platform (Running with Mock Data)",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan
 )
 
 # Configure CORS
@@ -33,10 +47,6 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-
-# Import mock router
-from src.dashboard.overview.api.top_recommendation_api_mock import router as mock_router
-
 # Health check endpoint
 @app.get("/health", tags=["Health"])
 async def health_check():
@@ -45,7 +55,8 @@ async def health_check():
         "status": "healthy",
         "service": "prism-web-backend",
         "mode": "MOCK (No Database Required)",
-        "message": "Using mock data for testing. Install PostgreSQL for production use."
+        "message": "Using mock data for testing. Install PostgreSQL for production use.",
+        "store": get_mock_store().stats()
     }
 
 
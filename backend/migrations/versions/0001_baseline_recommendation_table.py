@@ -0,0 +1,63 @@
+"""Baseline aws_recommendation_consolidate table
+
+Matches database_setup.sql. Uses IF NOT EXISTS so databases created from
+that script can be stamped forward by running the upgrade.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17 09:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0001"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE TABLE IF NOT EXISTS aws_recommendation_consolidate (
+            id BIGSERIAL PRIMARY KEY,
+            type TEXT,
+            account TEXT,
+            region TEXT,
+            resource_name TEXT,
+            resource_id TEXT,
+            service TEXT,
+            sub_service TEXT,
+            recommendation TEXT,
+            description TEXT,
+            potential NUMERIC(18, 4),
+            actual_cost NUMERIC(18, 4),
+            target_cost NUMERIC(18, 4),
+            current_configuration TEXT,
+            expected_configuration TEXT,
+            justifications TEXT,
+            tags_json JSONB,
+            actionable BOOLEAN,
+            risk_level TEXT,
+            impact TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        """
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_potential "
+        "ON aws_recommendation_consolidate (potential DESC)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_type "
+        "ON aws_recommendation_consolidate (type)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE IF EXISTS aws_recommendation_consolidate")
@@ -0,0 +1,52 @@
+"""Partial indexes for the top recommendation queries
+
+The hot query filters on type and potential > 0 and orders by
+potential DESC with a small LIMIT. These partial indexes serve it (and the
+all_platform variant) as a top-N index scan that stops after LIMIT entries,
+so only those rows are fetched from the heap.
+
+The TEXT columns the service reads are deliberately not in INCLUDE: they
+are unbounded, and an index tuple over the btree limit (~2.7kB) would make
+the insert or update of a row with a long description fail.
+
+Built CONCURRENTLY so the table stays writable during the migration.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17 09:30:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            """
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_rec_type_potential_top
+            ON aws_recommendation_consolidate (type, potential DESC)
+            WHERE potential > 0
+            """
+        )
+        op.execute(
+            """
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_rec_potential_top
+            ON aws_recommendation_consolidate (potential DESC)
+            WHERE potential > 0
+            """
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_rec_potential_top")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_rec_type_potential_top")
@@ -0,0 +1,63 @@
+"""Add id tie-breaker to the top recommendation indexes
+
+Keyset pagination orders by (potential DESC, id DESC) and seeks with
+(potential, id) < (:potential, :id). Appending id to the partial indexes
+from 0002 lets both the top-N query and every listing page run as a
+bounded index scan without a Sort; the 0002 indexes are then redundant.
+As in 0002, no TEXT column is put in INCLUDE.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17 10:30:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            """
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_rec_type_potential_id
+            ON aws_recommendation_consolidate (type, potential DESC, id DESC)
+            WHERE potential > 0
+            """
+        )
+        op.execute(
+            """
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_rec_potential_id
+            ON aws_recommendation_consolidate (potential DESC, id DESC)
+            WHERE potential > 0
+            """
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_rec_type_potential_top")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_rec_potential_top")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            """
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_rec_type_potential_top
+            ON aws_recommendation_consolidate (type, potential DESC)
+            WHERE potential > 0
+            """
+        )
+        op.execute(
+            """
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_rec_potential_top
+            ON aws_recommendation_consolidate (potential DESC)
+            WHERE potential > 0
+            """
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_rec_potential_id")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_rec_type_potential_id")
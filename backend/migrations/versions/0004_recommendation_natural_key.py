@@ -0,0 +1,57 @@
+"""Natural key and timestamps for recommendation upserts
+
+Bulk ingestion upserts on (type, account, resource_id, recommendation).
+Those columns are nullable, so the unique index is built over
+COALESCE(col, '') to make NULLs compare equal. The timestamp columns are
+added for databases created without them (the README's CREATE TABLE).
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17 12:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+NATURAL_KEY = (
+    "COALESCE(type, ''), COALESCE(account, ''), "
+    "COALESCE(resource_id, ''), COALESCE(recommendation, '')"
+)
+
+
+def upgrade() -> None:
+    op.execute(
+        "ALTER TABLE aws_recommendation_consolidate "
+        "ADD COLUMN IF NOT EXISTS created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP, "
+        "ADD COLUMN IF NOT EXISTS updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP"
+    )
+
+    duplicates = op.get_bind().execute(sa.text(
+        f"SELECT count(*) FROM (SELECT 1 FROM aws_recommendation_consolidate "
+        f"GROUP BY {NATURAL_KEY} HAVING count(*) > 1) d"
+    )).scalar()
+    if duplicates:
+        raise RuntimeError(
+            f"{duplicates} duplicate (type, account, resource_id, recommendation) groups exist in "
+            "aws_recommendation_consolidate; remove them before creating uq_rec_natural_key"
+        )
+
+    with op.get_context().autocommit_block():
+        op.execute(
+            f"CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS uq_rec_natural_key "
+            f"ON aws_recommendation_consolidate ({NATURAL_KEY})"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS uq_rec_natural_key")
@@ -0,0 +1,155 @@
+"""Incrementally maintained per-platform savings rollup
+
+recommendation_platform_summary holds COUNT(*), COUNT(potential) and
+SUM(potential) per type, so the overview summary reads one row per
+platform instead of aggregating the whole table.
+
+Statement-level triggers with transition tables apply the delta of every
+INSERT / UPDATE / DELETE (including the ingestion upsert) in the writing
+transaction, so the rollup is always consistent with committed data.
+TRUNCATE clears it. recommendation_summary_rebuild() recomputes it from
+scratch for repairs or partition swaps. NULL types are stored under ''.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-17 13:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0005"
+down_revision: Union[str, None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Per-type deltas contributed by the rows a statement inserted / removed
+_NEW_ROWS_DELTA = (
+    "SELECT COALESCE(type, '') AS type, count(*) AS n, count(potential) AS pn, "
+    "COALESCE(sum(potential), 0) AS p FROM new_rows GROUP BY 1"
+)
+_OLD_ROWS_DELTA = (
+    "SELECT COALESCE(type, '') AS type, -count(*) AS n, -count(potential) AS pn, "
+    "-COALESCE(sum(potential), 0) AS p FROM old_rows GROUP BY 1"
+)
+
+_APPLY_DELTA = """
+                INSERT INTO recommendation_platform_summary AS s
+                    (type, recommendation_count, potential_count, total_potential, updated_at)
+                SELECT type, sum(n), sum(pn), sum(p), now()
+                FROM ({delta}) d
+                GROUP BY type
+                HAVING sum(n) <> 0 OR sum(pn) <> 0 OR sum(p) <> 0
+                ORDER BY type
+                ON CONFLICT (type) DO UPDATE SET
+                    recommendation_count = s.recommendation_count + EXCLUDED.recommendation_count,
+                    potential_count = s.potential_count + EXCLUDED.potential_count,
+                    total_potential = s.total_potential + EXCLUDED.total_potential,
+                    updated_at = EXCLUDED.updated_at;"""
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE TABLE recommendation_platform_summary (
+            type TEXT PRIMARY KEY,
+            recommendation_count BIGINT NOT NULL DEFAULT 0,
+            potential_count BIGINT NOT NULL DEFAULT 0,
+            total_potential NUMERIC(24, 4) NOT NULL DEFAULT 0,
+            updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+        )
+        """
+    )
+
+    # Deltas are applied in type order so concurrent writers lock summary rows consistently
+    op.execute(
+        f"""
+        CREATE FUNCTION recommendation_summary_apply_delta() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                {_APPLY_DELTA.format(delta=_NEW_ROWS_DELTA)}
+            ELSIF TG_OP = 'DELETE' THEN
+                {_APPLY_DELTA.format(delta=_OLD_ROWS_DELTA)}
+            ELSE
+                {_APPLY_DELTA.format(delta=_NEW_ROWS_DELTA + " UNION ALL " + _OLD_ROWS_DELTA)}
+            END IF;
+            RETURN NULL;
+        END;
+        $$
+        """
+    )
+    op.execute(
+        """
+        CREATE FUNCTION recommendation_summary_truncate() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            DELETE FROM recommendation_platform_summary;
+            RETURN NULL;
+        END;
+        $$
+        """
+    )
+    op.execute(
+        """
+        CREATE FUNCTION recommendation_summary_rebuild() RETURNS void
+        LANGUAGE sql AS $$
+            DELETE FROM recommendation_platform_summary;
+            INSERT INTO recommendation_platform_summary
+                (type, recommendation_count, potential_count, total_potential, updated_at)
+            SELECT COALESCE(type, ''), count(*), count(potential), COALESCE(sum(potential), 0), now()
+            FROM aws_recommendation_consolidate
+            GROUP BY 1;
+        $$
+        """
+    )
+
+    op.execute(
+        """
+        CREATE TRIGGER trg_recommendation_summary_insert
+        AFTER INSERT ON aws_recommendation_consolidate
+        REFERENCING NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION recommendation_summary_apply_delta()
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER trg_recommendation_summary_update
+        AFTER UPDATE ON aws_recommendation_consolidate
+        REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION recommendation_summary_apply_delta()
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER trg_recommendation_summary_delete
+        AFTER DELETE ON aws_recommendation_consolidate
+        REFERENCING OLD TABLE AS old_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION recommendation_summary_apply_delta()
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER trg_recommendation_summary_truncate
+        AFTER TRUNCATE ON aws_recommendation_consolidate
+        FOR EACH STATEMENT EXECUTE FUNCTION recommendation_summary_truncate()
+        """
+    )
+
+    # Backfill while writers are blocked so no delta is missed or double counted
+    op.execute("LOCK TABLE aws_recommendation_consolidate IN SHARE ROW EXCLUSIVE MODE")
+    op.execute("SELECT recommendation_summary_rebuild()")
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS trg_recommendation_summary_truncate ON aws_recommendation_consolidate")
+    op.execute("DROP TRIGGER IF EXISTS trg_recommendation_summary_delete ON aws_recommendation_consolidate")
+    op.execute("DROP TRIGGER IF EXISTS trg_recommendation_summary_update ON aws_recommendation_consolidate")
+    op.execute("DROP TRIGGER IF EXISTS trg_recommendation_summary_insert ON aws_recommendation_consolidate")
+    op.execute("DROP FUNCTION IF EXISTS recommendation_summary_rebuild()")
+    op.execute("DROP FUNCTION IF EXISTS recommendation_summary_truncate()")
+    op.execute("DROP FUNCTION IF EXISTS recommendation_summary_apply_delta()")
+    op.execute("DROP TABLE IF EXISTS recommendation_platform_summary")
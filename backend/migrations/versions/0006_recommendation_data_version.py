@@ -0,0 +1,103 @@
+"""Data version counter for aws_recommendation_consolidate
+
+recommendation_data_version holds a single row whose version is bumped by
+statement-level triggers whenever a statement actually changes rows of
+aws_recommendation_consolidate (or truncates it). The bump happens in the
+writing transaction, so a reader never sees the new version before the
+data it describes. APIs derive ETags and cache keys from it.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-17 14:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0006"
+down_revision: Union[str, None] = "0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_BUMP_VERSION = """
+                UPDATE recommendation_data_version
+                SET version = version + 1, updated_at = now()
+                WHERE id = 1;"""
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE TABLE recommendation_data_version (
+            id SMALLINT PRIMARY KEY DEFAULT 1 CHECK (id = 1),
+            version BIGINT NOT NULL DEFAULT 1,
+            updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+        )
+        """
+    )
+    op.execute("INSERT INTO recommendation_data_version (id, version) VALUES (1, 1)")
+
+    # Transition tables are checked per operation: each trigger only defines its own
+    op.execute(
+        f"""
+        CREATE FUNCTION recommendation_data_version_bump() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            IF TG_OP = 'TRUNCATE' THEN
+                {_BUMP_VERSION}
+            ELSIF TG_OP = 'DELETE' THEN
+                IF EXISTS (SELECT 1 FROM old_rows) THEN
+                    {_BUMP_VERSION}
+                END IF;
+            ELSIF EXISTS (SELECT 1 FROM new_rows) THEN
+                {_BUMP_VERSION}
+            END IF;
+            RETURN NULL;
+        END;
+        $$
+        """
+    )
+
+    op.execute(
+        """
+        CREATE TRIGGER trg_recommendation_data_version_insert
+        AFTER INSERT ON aws_recommendation_consolidate
+        REFERENCING NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION recommendation_data_version_bump()
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER trg_recommendation_data_version_update
+        AFTER UPDATE ON aws_recommendation_consolidate
+        REFERENCING NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION recommendation_data_version_bump()
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER trg_recommendation_data_version_delete
+        AFTER DELETE ON aws_recommendation_consolidate
+        REFERENCING OLD TABLE AS old_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION recommendation_data_version_bump()
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER trg_recommendation_data_version_truncate
+        AFTER TRUNCATE ON aws_recommendation_consolidate
+        FOR EACH STATEMENT EXECUTE FUNCTION recommendation_data_version_bump()
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS trg_recommendation_data_version_truncate ON aws_recommendation_consolidate")
+    op.execute("DROP TRIGGER IF EXISTS trg_recommendation_data_version_delete ON aws_recommendation_consolidate")
+    op.execute("DROP TRIGGER IF EXISTS trg_recommendation_data_version_update ON aws_recommendation_consolidate")
+    op.execute("DROP TRIGGER IF EXISTS trg_recommendation_data_version_insert ON aws_recommendation_consolidate")
+    op.execute("DROP FUNCTION IF EXISTS recommendation_data_version_bump()")
+    op.execute("DROP TABLE IF EXISTS recommendation_data_version")
@@ -0,0 +1,52 @@
+"""Full-text search over recommendation text
+
+Adds search_vector, a stored generated tsvector over recommendation
+(weight A), description (B) and justifications (C), and a GIN index on it,
+so keyword search is an index lookup instead of an ILIKE sequential scan.
+PostgreSQL keeps the column current on every INSERT and UPDATE.
+
+Adding a stored generated column rewrites the table under an ACCESS
+EXCLUSIVE lock; run it in a maintenance window on large tables. The index
+is then built CONCURRENTLY.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-17 18:30:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0007"
+down_revision: Union[str, None] = "0006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        ALTER TABLE aws_recommendation_consolidate
+        ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS (
+            setweight(to_tsvector('english'::regconfig, coalesce(recommendation, '')), 'A')
+            || setweight(to_tsvector('english'::regconfig, coalesce(description, '')), 'B')
+            || setweight(to_tsvector('english'::regconfig, coalesce(justifications, '')), 'C')
+        ) STORED
+        """
+    )
+    with op.get_context().autocommit_block():
+        op.execute(
+            """
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_rec_search_vector
+            ON aws_recommendation_consolidate USING GIN (search_vector)
+            """
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_rec_search_vector")
+    op.execute("ALTER TABLE aws_recommendation_consolidate DROP COLUMN IF EXISTS search_vector")
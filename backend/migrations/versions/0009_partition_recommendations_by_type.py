@@ -0,0 +1,210 @@
+"""LIST-partition aws_recommendation_consolidate by type
+
+Every query filters or groups by type, and the AWS slice dwarfs the others.
+The table is rebuilt as a partitioned table with one partition per
+platform (plus a DEFAULT partition for any other type), so:
+
+- platform-filtered queries are pruned to one partition at plan time;
+- all_platform top-N / keyset pages become a Merge Append over the
+  per-partition (potential DESC, id DESC) indexes;
+- a platform reload is a partition swap (src.ingestion.partition_swap)
+  instead of a mass DELETE + INSERT.
+
+Unique indexes on a partitioned table must contain the partition key as a
+plain column, so:
+
+- type becomes NOT NULL DEFAULT '' (NULL was already treated as '' by the
+  natural key and the summary rollup) and existing NULLs are rewritten;
+- the primary key becomes (id, type); ids still come from the same
+  sequence, so id alone stays unique and remains the ORM identity;
+- uq_rec_natural_key indexes type itself instead of COALESCE(type, '').
+
+Per-partition indexes replace the type-leading ones: inside a partition
+type is constant, so idx_rec_potential_id serves both per-platform and
+all_platform queries and idx_rec_type_potential_id, idx_type and
+idx_potential are not recreated. The summary and data version triggers are
+recreated on the new table.
+
+The data is copied under a SHARE ROW EXCLUSIVE lock (reads continue,
+writes wait) and the table is swapped in the same transaction; allow for a
+full copy of the table.
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-17 20:30:00
+
+"""
+from typing import Dict, Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0009"
+down_revision: Union[str, None] = "0008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLE = "aws_recommendation_consolidate"
+SEQUENCE = "aws_recommendation_consolidate_id_seq"
+
+# Partition per platform type; kept in sync with src.ingestion.partition_swap.PLATFORM_PARTITIONS
+PARTITIONS: Dict[str, str] = {
+    "AWS": f"{TABLE}_aws",
+    "Google Cloud": f"{TABLE}_google_cloud",
+    "Databricks": f"{TABLE}_databricks",
+    "Snowflakes": f"{TABLE}_snowflakes"
+}
+DEFAULT_PARTITION = f"{TABLE}_other"
+
+COLUMNS = """
+    account TEXT,
+    region TEXT,
+    resource_name TEXT,
+    resource_id TEXT,
+    service TEXT,
+    sub_service TEXT,
+    recommendation TEXT,
+    description TEXT,
+    potential NUMERIC(18, 4),
+    actual_cost NUMERIC(18, 4),
+    target_cost NUMERIC(18, 4),
+    current_configuration TEXT,
+    expected_configuration TEXT,
+    justifications TEXT,
+    tags_json JSONB,
+    actionable BOOLEAN,
+    risk_level TEXT,
+    impact TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    search_vector tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('english'::regconfig, coalesce(recommendation, '')), 'A')
+        || setweight(to_tsvector('english'::regconfig, coalesce(description, '')), 'B')
+        || setweight(to_tsvector('english'::regconfig, coalesce(justifications, '')), 'C')
+    ) STORED"""
+
+# Every column but search_vector (generated), in table order
+COPY_COLUMNS = (
+    "id, type, account, region, resource_name, resource_id, service, sub_service, "
+    "recommendation, description, potential, actual_cost, target_cost, "
+    "current_configuration, expected_configuration, justifications, tags_json, "
+    "actionable, risk_level, impact, created_at, updated_at"
+)
+
+# Indexes shared by both layouts (definitions from 0003, 0007 and 0008)
+COMMON_INDEXES = {
+    "idx_rec_potential_id": "(potential DESC, id DESC) WHERE potential > 0",
+    "idx_rec_search_vector": "USING GIN (search_vector)",
+    "idx_rec_tags_json_path": "USING GIN (tags_json jsonb_path_ops) WHERE potential > 0",
+    "idx_rec_account": "(account) WHERE potential > 0"
+}
+
+PARTITIONED_INDEXES = {
+    **COMMON_INDEXES,
+    "idx_rec_service_region": "(service, sub_service, region) WHERE potential > 0",
+    "idx_rec_region": "(region) WHERE potential > 0"
+}
+PARTITIONED_NATURAL_KEY = (
+    "type, COALESCE(account, ''), COALESCE(resource_id, ''), COALESCE(recommendation, '')"
+)
+
+UNPARTITIONED_INDEXES = {
+    **COMMON_INDEXES,
+    "idx_rec_type_potential_id": "(type, potential DESC, id DESC) WHERE potential > 0",
+    "idx_rec_type_service_region": "(type, service, sub_service, region) WHERE potential > 0",
+    "idx_rec_type_region": "(type, region) WHERE potential > 0",
+    "idx_potential": "(potential DESC)",
+    "idx_type": "(type)"
+}
+UNPARTITIONED_NATURAL_KEY = (
+    "COALESCE(type, ''), COALESCE(account, ''), COALESCE(resource_id, ''), COALESCE(recommendation, '')"
+)
+
+# Trigger name -> (event, REFERENCING clause, function) from 0005 and 0006
+TRIGGERS = {
+    "trg_recommendation_summary_insert": ("INSERT", "REFERENCING NEW TABLE AS new_rows", "recommendation_summary_apply_delta"),
+    "trg_recommendation_summary_update": ("UPDATE", "REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows", "recommendation_summary_apply_delta"),
+    "trg_recommendation_summary_delete": ("DELETE", "REFERENCING OLD TABLE AS old_rows", "recommendation_summary_apply_delta"),
+    "trg_recommendation_summary_truncate": ("TRUNCATE", "", "recommendation_summary_truncate"),
+    "trg_recommendation_data_version_insert": ("INSERT", "REFERENCING NEW TABLE AS new_rows", "recommendation_data_version_bump"),
+    "trg_recommendation_data_version_update": ("UPDATE", "REFERENCING NEW TABLE AS new_rows", "recommendation_data_version_bump"),
+    "trg_recommendation_data_version_delete": ("DELETE", "REFERENCING OLD TABLE AS old_rows", "recommendation_data_version_bump"),
+    "trg_recommendation_data_version_truncate": ("TRUNCATE", "", "recommendation_data_version_bump")
+}
+
+
+def _replace_table(new_table: str, type_expression: str) -> None:
+    """Copy every row into new_table, then drop the old table and take over its name and sequence."""
+    op.execute(f"LOCK TABLE {TABLE} IN SHARE ROW EXCLUSIVE MODE")
+    op.execute(
+        f"INSERT INTO {new_table} ({COPY_COLUMNS}) "
+        f"SELECT {COPY_COLUMNS.replace('type,', f'{type_expression},', 1)} FROM {TABLE}"
+    )
+    op.execute(f"ALTER SEQUENCE {SEQUENCE} OWNED BY {new_table}.id")
+    op.execute(f"DROP TABLE {TABLE}")
+    op.execute(f"ALTER TABLE {new_table} RENAME TO {TABLE}")
+    op.execute(f"ALTER TABLE {TABLE} RENAME CONSTRAINT {new_table}_pkey TO {TABLE}_pkey")
+
+
+def _create_indexes(indexes: Dict[str, str], natural_key: str) -> None:
+    for name, definition in indexes.items():
+        op.execute(f"CREATE INDEX {name} ON {TABLE} {definition}")
+    op.execute(f"CREATE UNIQUE INDEX uq_rec_natural_key ON {TABLE} ({natural_key})")
+
+
+def _create_triggers() -> None:
+    for name, (event, referencing, function) in TRIGGERS.items():
+        op.execute(
+            f"CREATE TRIGGER {name} AFTER {event} ON {TABLE} {referencing} "
+            f"FOR EACH STATEMENT EXECUTE FUNCTION {function}()"
+        )
+
+
+def _refresh_derived_data() -> None:
+    # The copy ran without triggers; recompute the rollup and publish a new version
+    op.execute("SELECT recommendation_summary_rebuild()")
+    op.execute(
+        "UPDATE recommendation_data_version SET version = version + 1, updated_at = now() WHERE id = 1"
+    )
+
+
+def upgrade() -> None:
+    new_table = f"{TABLE}_partitioned"
+    op.execute(
+        f"""
+        CREATE TABLE {new_table} (
+            id BIGINT NOT NULL DEFAULT nextval('{SEQUENCE}'::regclass),
+            type TEXT NOT NULL DEFAULT '',{COLUMNS},
+            PRIMARY KEY (id, type)
+        ) PARTITION BY LIST (type)
+        """
+    )
+    for platform_type, partition in PARTITIONS.items():
+        op.execute(f"CREATE TABLE {partition} PARTITION OF {new_table} FOR VALUES IN ('{platform_type}')")
+    op.execute(f"CREATE TABLE {DEFAULT_PARTITION} PARTITION OF {new_table} DEFAULT")
+
+    _replace_table(new_table, "COALESCE(type, '')")
+    _create_indexes(PARTITIONED_INDEXES, PARTITIONED_NATURAL_KEY)
+    _create_triggers()
+    _refresh_derived_data()
+    op.execute(f"ANALYZE {TABLE}")
+
+
+def downgrade() -> None:
+    new_table = f"{TABLE}_unpartitioned"
+    op.execute(
+        f"""
+        CREATE TABLE {new_table} (
+            id BIGINT NOT NULL DEFAULT nextval('{SEQUENCE}'::regclass),
+            type TEXT,{COLUMNS},
+            PRIMARY KEY (id)
+        )
+        """
+    )
+
+    _replace_table(new_table, "type")
+    _create_indexes(UNPARTITIONED_INDEXES, UNPARTITIONED_NATURAL_KEY)
+    _create_triggers()
+    _refresh_derived_data()
+    op.execute(f"ANALYZE {TABLE}")
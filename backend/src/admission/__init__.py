@@ -0,0 +1,15 @@
+from .circuit_breaker import CircuitBreaker, db_circuit_breaker
+from .load_shedding import AdmissionController, Rejection, admission_controller
+from .rate_limit import TokenBucketLimiter, client_rate_limiter
+from .middleware import AdmissionMiddleware
+
+__all__ = [
+    "CircuitBreaker",
+    "db_circuit_breaker",
+    "AdmissionController",
+    "Rejection",
+    "admission_controller",
+    "TokenBucketLimiter",
+    "client_rate_limiter",
+    "AdmissionMiddleware"
+]
@@ -0,0 +1,159 @@
+"""
+Database circuit breaker.
+
+Trips open when the share of failed database operations (connection
+errors, timeouts, pool exhaustion; see src.observability.db_health) over
+the last DB_BREAKER_WINDOW_SECONDS reaches DB_BREAKER_ERROR_RATE. While
+open, requests are refused without touching the database. After
+DB_BREAKER_OPEN_SECONDS one probe request at a time is let through
+(half-open): a probe whose database operations succeed closes the breaker,
+one with a failed operation opens it again, and one that never used the
+database leaves it half-open for the next probe.
+"""
+from typing import Callable, NamedTuple, Optional
+import logging
+import os
+import threading
+import time
+
+from src.config import load_environment
+from src.observability.db_health import OutcomeWindow, db_outcomes
+from src.observability.metrics import DB_CIRCUIT_BREAKER_STATE
+
+load_environment()
+
+logger = logging.getLogger(__name__)
+
+# Failed share of database operations that opens the breaker (0 disables it)
+DB_BREAKER_ERROR_RATE = float(os.getenv("DB_BREAKER_ERROR_RATE", "0.5"))
+# Fewer operations than this in the window never open it
+DB_BREAKER_MIN_CALLS = int(os.getenv("DB_BREAKER_MIN_CALLS", "20"))
+DB_BREAKER_WINDOW_SECONDS = int(os.getenv("DB_BREAKER_WINDOW_SECONDS", "10"))
+# How long the breaker stays open before letting a probe through
+DB_BREAKER_OPEN_SECONDS = float(os.getenv("DB_BREAKER_OPEN_SECONDS", "15"))
+
+CLOSED = "closed"
+HALF_OPEN = "half_open"
+OPEN = "open"
+
+_STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+
+class BreakerDecision(NamedTuple):
+    """Whether a request may proceed, and if not, when to retry."""
+    allowed: bool
+    probe: bool = False
+    retry_after_seconds: float = 0.0
+
+
+class CircuitBreaker:
+    """Closed / open / half-open breaker driven by database operation outcomes."""
+
+    def __init__(
+        self,
+        outcomes: OutcomeWindow,
+        error_rate: float,
+        min_calls: int,
+        window_seconds: int,
+        open_seconds: float,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """Initialize the breaker.
+
+        Args:
+            outcomes: Rolling success / failure counts to watch
+            error_rate: Failed share that opens the breaker; 0 disables it
+            min_calls: Minimum operations in the window before it can open
+            window_seconds: Seconds of outcomes considered
+            open_seconds: Time spent open before a probe is let through
+            clock: Monotonic time source (overridable for testing)
+        """
+        self.outcomes = outcomes
+        self.error_rate = error_rate
+        self.min_calls = min_calls
+        self.window_seconds = window_seconds
+        self.open_seconds = open_seconds
+        self._clock = clock
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._closed_at: Optional[float] = None
+        self._probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """Current state: closed, half_open or open."""
+        return self._state
+
+    def _set_state(self, state: str, now: float) -> None:
+        if state == OPEN:
+            self._opened_at = now
+        elif state == CLOSED:
+            # Failures from before the breaker closed must not reopen it
+            self._closed_at = now
+        self._state = state
+        self._probing = False
+        DB_CIRCUIT_BREAKER_STATE.set(_STATE_VALUES[state])
+
+    def allow(self) -> BreakerDecision:
+        """
+        Decide whether a request may use the database.
+
+        Returns:
+            BreakerDecision; when probe is set, report the request's outcome
+            with probe_finished
+        """
+        if self.error_rate <= 0:
+            return BreakerDecision(True)
+
+        with self._lock:
+            now = self._clock()
+            if self._state == CLOSED:
+                successes, failures = self.outcomes.counts(self.window_seconds, since=self._closed_at)
+                calls = successes + failures
+                if calls < self.min_calls or failures / calls < self.error_rate:
+                    return BreakerDecision(True)
+                logger.warning(
+                    f"Database circuit breaker opened: {failures} of {calls} operations failed "
+                    f"in the last {self.window_seconds}s"
+                )
+                self._set_state(OPEN, now)
+
+            if self._state == OPEN:
+                remaining = self._opened_at + self.open_seconds - now
+                if remaining > 0:
+                    return BreakerDecision(False, retry_after_seconds=remaining)
+                self._set_state(HALF_OPEN, now)
+
+            if self._probing:
+                return BreakerDecision(False, retry_after_seconds=1.0)
+            self._probing = True
+            return BreakerDecision(True, probe=True)
+
+    def probe_finished(self, ok: Optional[bool]) -> None:
+        """
+        Report the outcome of a probe request let through while half-open.
+
+        Args:
+            ok: Whether the probe's database operations succeeded; None if it
+                used no database connection, which frees the probe slot
+        """
+        with self._lock:
+            if self._state != HALF_OPEN:
+                return
+            if ok is None:
+                self._probing = False
+            elif ok:
+                logger.info("Database circuit breaker closed after a successful probe")
+                self._set_state(CLOSED, self._clock())
+            else:
+                self._set_state(OPEN, self._clock())
+
+
+db_circuit_breaker = CircuitBreaker(
+    db_outcomes,
+    DB_BREAKER_ERROR_RATE,
+    DB_BREAKER_MIN_CALLS,
+    DB_BREAKER_WINDOW_SECONDS,
+    DB_BREAKER_OPEN_SECONDS
+)
@@ -0,0 +1,115 @@
+"""
+Admission control: refuse requests early instead of queueing them on a
+saturated connection pool until they time out.
+
+A request is refused (503 with Retry-After) when:
+
+- ADMISSION_MAX_IN_FLIGHT requests are already being served by this worker;
+- pool checkouts are slow: above ADMISSION_MAX_POOL_WAIT_MS of recent average
+  wait, a growing share of requests is shed, all of them at twice the limit;
+- the database circuit breaker is open (src.admission.circuit_breaker).
+"""
+from typing import Callable, NamedTuple, Optional, Tuple
+import math
+import os
+import random
+
+from src.admission.circuit_breaker import CircuitBreaker, db_circuit_breaker
+from src.config import load_environment
+from src.observability.db_health import POOL_WAIT_HALF_LIFE_SECONDS, DecayingAverage, pool_checkout_wait
+
+load_environment()
+
+# Concurrent requests per worker on admission-controlled routes (0 disables the limit)
+ADMISSION_MAX_IN_FLIGHT = int(os.getenv("ADMISSION_MAX_IN_FLIGHT", "64"))
+# Recent average pool checkout wait above which requests are shed (0 disables)
+ADMISSION_MAX_POOL_WAIT_MS = float(os.getenv("ADMISSION_MAX_POOL_WAIT_MS", "250"))
+
+
+class Rejection(NamedTuple):
+    """Why a request was refused and when the client should retry."""
+    reason: str
+    retry_after_seconds: int
+    details: str
+
+
+class AdmissionController:
+    """Per-worker admission decisions from in-flight count, pool wait and breaker state."""
+
+    def __init__(
+        self,
+        max_in_flight: int,
+        max_pool_wait_seconds: float,
+        breaker: CircuitBreaker,
+        pool_wait: DecayingAverage = pool_checkout_wait,
+        chance: Callable[[], float] = random.random
+    ):
+        """Initialize the controller.
+
+        Args:
+            max_in_flight: Concurrent admitted requests; 0 disables the limit
+            max_pool_wait_seconds: Average checkout wait where shedding starts; 0 disables
+            breaker: Database circuit breaker consulted for every request
+            pool_wait: Average of recent pool checkout waits
+            chance: Source of uniform [0, 1) numbers (overridable for testing)
+        """
+        self.max_in_flight = max_in_flight
+        self.max_pool_wait_seconds = max_pool_wait_seconds
+        self.breaker = breaker
+        self.pool_wait = pool_wait
+        self._chance = chance
+        self.in_flight = 0
+
+    def _shed_for_pool_wait(self) -> bool:
+        if self.max_pool_wait_seconds <= 0:
+            return False
+        overload = self.pool_wait.value() / self.max_pool_wait_seconds - 1.0
+        return overload > 0 and self._chance() < overload
+
+    def admit(self) -> Tuple[Optional[Rejection], bool]:
+        """
+        Decide whether to serve a request; call release when an admitted one ends.
+
+        Returns:
+            (Rejection or None if admitted, whether the request is a circuit breaker probe)
+        """
+        if self.max_in_flight and self.in_flight >= self.max_in_flight:
+            return Rejection("in_flight", 1, "Too many requests in progress"), False
+
+        if self._shed_for_pool_wait():
+            return Rejection(
+                "pool_wait",
+                math.ceil(POOL_WAIT_HALF_LIFE_SECONDS),
+                "Database connections are saturated"
+            ), False
+
+        decision = self.breaker.allow()
+        if not decision.allowed:
+            return Rejection(
+                "circuit_open",
+                max(1, math.ceil(decision.retry_after_seconds)),
+                "Database is failing; requests are paused"
+            ), False
+
+        self.in_flight += 1
+        return None, decision.probe
+
+    def release(self, probe: bool, ok: Optional[bool]) -> None:
+        """
+        Mark an admitted request as finished.
+
+        Args:
+            probe: Whether admit flagged the request as a breaker probe
+            ok: Whether its database operations succeeded, None if it used none
+                (see RequestOutcomes.result)
+        """
+        self.in_flight -= 1
+        if probe:
+            self.breaker.probe_finished(ok)
+
+
+admission_controller = AdmissionController(
+    ADMISSION_MAX_IN_FLIGHT,
+    ADMISSION_MAX_POOL_WAIT_MS / 1000,
+    db_circuit_breaker
+)
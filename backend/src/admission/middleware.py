@@ -0,0 +1,117 @@
+"""
+ASGI middleware applying rate limiting and admission control to API routes.
+"""
+from typing import Optional, Sequence
+import logging
+import math
+import os
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.admission.load_shedding import AdmissionController, Rejection, admission_controller
+from src.admission.rate_limit import TokenBucketLimiter, client_rate_limiter
+from src.config import load_environment
+from src.dashboard.overview.schemas.top_recommendation_schema import (
+    ServiceUnavailableError,
+    TooManyRequestsError
+)
+from src.observability.db_health import stop_tracking_request_outcomes, track_request_outcomes
+from src.observability.metrics import ADMISSION_REJECTIONS
+
+load_environment()
+
+logger = logging.getLogger(__name__)
+
+# Header identifying the client for rate limiting, e.g. X-Forwarded-For behind a
+# trusted proxy (first address wins); unset uses the connection's address
+RATE_LIMIT_CLIENT_HEADER = os.getenv("RATE_LIMIT_CLIENT_HEADER", "").lower()
+
+
+class AdmissionMiddleware:
+    """Pure ASGI middleware answering 429 / 503 before a route runs."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        path_prefixes: Sequence[str],
+        controller: AdmissionController = admission_controller,
+        limiter: TokenBucketLimiter = client_rate_limiter
+    ):
+        """Wrap an ASGI app.
+
+        Args:
+            app: Next ASGI application in the stack
+            path_prefixes: Only requests under these paths are controlled
+            controller: Admission decisions (in-flight, pool wait, circuit breaker)
+            limiter: Per-client token buckets
+        """
+        self.app = app
+        self.path_prefixes = tuple(path_prefixes)
+        self.controller = controller
+        self.limiter = limiter
+
+    @staticmethod
+    def _client_key(scope: Scope) -> str:
+        if RATE_LIMIT_CLIENT_HEADER:
+            header = RATE_LIMIT_CLIENT_HEADER.encode("latin-1")
+            for name, value in scope.get("headers", ()):
+                if name == header:
+                    return value.decode("latin-1").split(",", 1)[0].strip()
+        client = scope.get("client")
+        return client[0] if client else "-"
+
+    @staticmethod
+    def _reject(status_code: int, detail: dict, retry_after_seconds: int, reason: str) -> JSONResponse:
+        ADMISSION_REJECTIONS.labels(reason).inc()
+        return JSONResponse(
+            status_code=status_code,
+            content={"detail": detail},
+            headers={"Retry-After": str(retry_after_seconds)}
+        )
+
+    def _rate_limited(self, scope: Scope) -> Optional[JSONResponse]:
+        if not self.limiter.enabled:
+            return None
+        wait_seconds = self.limiter.acquire(self._client_key(scope))
+        if not wait_seconds:
+            return None
+        retry_after = max(1, math.ceil(wait_seconds))
+        detail = TooManyRequestsError(
+            message="Rate limit exceeded",
+            details=f"At most {self.limiter.rate_per_second:g} requests per second are allowed per client",
+            retry_after_seconds=retry_after
+        ).model_dump()
+        return self._reject(429, detail, retry_after, "rate_limited")
+
+    def _unavailable(self, rejection: Rejection) -> JSONResponse:
+        logger.debug(f"Shedding request: {rejection.reason}")
+        detail = ServiceUnavailableError(
+            details=rejection.details,
+            retry_after_seconds=rejection.retry_after_seconds
+        ).model_dump()
+        return self._reject(503, detail, rejection.retry_after_seconds, rejection.reason)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not scope["path"].startswith(self.path_prefixes):
+            await self.app(scope, receive, send)
+            return
+
+        response = self._rate_limited(scope)
+        if response is not None:
+            await response(scope, receive, send)
+            return
+
+        rejection, probe = self.controller.admit()
+        if rejection is not None:
+            await self._unavailable(rejection)(scope, receive, send)
+            return
+
+        # A probe is judged by the database operations it ran, not its status:
+        # a request served from a cache says nothing about the database
+        outcomes, token = track_request_outcomes()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            stop_tracking_request_outcomes(token)
+            self.controller.release(probe, outcomes.result())
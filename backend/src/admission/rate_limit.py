@@ -0,0 +1,88 @@
+"""
+Per-client token bucket rate limiting.
+
+Each client gets a bucket of RATE_LIMIT_BURST tokens refilled at
+RATE_LIMIT_PER_SECOND; a request takes one token, and a client with an
+empty bucket is answered 429 with the time until its next token. Buckets
+live in the worker process and the least recently seen clients are dropped
+beyond RATE_LIMIT_MAX_CLIENTS, so with several workers the effective limit
+is per worker.
+"""
+from collections import OrderedDict
+from typing import Callable, List
+import os
+import threading
+import time
+
+from src.config import load_environment
+
+load_environment()
+
+# Sustained requests per second per client (0 disables rate limiting)
+RATE_LIMIT_PER_SECOND = float(os.getenv("RATE_LIMIT_PER_SECOND", "0"))
+# Requests a client may make in a burst after being idle
+RATE_LIMIT_BURST = float(os.getenv("RATE_LIMIT_BURST", "40"))
+RATE_LIMIT_MAX_CLIENTS = int(os.getenv("RATE_LIMIT_MAX_CLIENTS", "10000"))
+
+
+class TokenBucketLimiter:
+    """Thread-safe token buckets keyed by client."""
+
+    def __init__(
+        self,
+        rate_per_second: float,
+        burst: float,
+        max_clients: int,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """Initialize the limiter.
+
+        Args:
+            rate_per_second: Tokens added to each bucket per second; 0 disables limiting
+            burst: Bucket capacity
+            max_clients: Buckets kept before the least recently used is dropped
+            clock: Monotonic time source (overridable for testing)
+        """
+        self.rate_per_second = rate_per_second
+        self.burst = max(burst, 1.0)
+        self.max_clients = max_clients
+        self._clock = clock
+        # Client -> [tokens, refilled_at]
+        self._buckets: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether any request can be limited at all."""
+        return self.rate_per_second > 0
+
+    def acquire(self, client: str) -> float:
+        """
+        Take a token from a client's bucket.
+
+        Args:
+            client: Client key, e.g. its address
+
+        Returns:
+            0.0 if the request may proceed, otherwise seconds until a token is available
+        """
+        with self._lock:
+            now = self._clock()
+            bucket = self._buckets.get(client)
+            if bucket is None:
+                bucket = [self.burst, now]
+                self._buckets[client] = bucket
+                if len(self._buckets) > self.max_clients:
+                    self._buckets.popitem(last=False)
+            else:
+                self._buckets.move_to_end(client)
+                bucket[0] = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate_per_second)
+                bucket[1] = now
+
+            if bucket[0] >= 1.0:
+                bucket[0] -= 1.0
+                return 0.0
+            return (1.0 - bucket[0]) / self.rate_per_second
+
+
+client_rate_limiter = TokenBucketLimiter(RATE_LIMIT_PER_SECOND, RATE_LIMIT_BURST, RATE_LIMIT_MAX_CLIENTS)
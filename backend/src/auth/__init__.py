@@ -1,3 +1,11 @@
-from .dependencies import get_current_user
+from .dependencies import get_current_user, verify_token, revoke_token, get_token_cache_stats
+from .token_cache import VerifiedTokenCache, verified_token_cache
 
-__all__ = ["get_current_user"]
+__all__ = [
+    "get_current_user",
+    "verify_token",
+    "revoke_token",
+    "get_token_cache_stats",
+    "VerifiedTokenCache",
+    "verified_token_cache"
+]
@@ -3,17 +3,95 @@ Authentication dependencies.
 """
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from typing import Optional
+from typing import Any, Dict, Optional
 import os
 import jwt
-from dotenv import load_dotenv
 
-load_dotenv()
+from src.config import load_environment
+from src.auth.token_cache import VerifiedTokenCache, token_digest, verified_token_cache
+
+load_environment()
 
 security = HTTPBearer()
 
 SECRET_KEY = os.getenv("SECRET_KEY", "your-secret-key-here")
 ALGORITHM = os.getenv("ALGORITHM", "HS256")
+# PEM public key used to verify RS*/PS*/ES* tokens
+PUBLIC_KEY = os.getenv("PUBLIC_KEY")
+
+VERIFY_KEY = PUBLIC_KEY if PUBLIC_KEY and ALGORITHM[:2] in ("RS", "PS", "ES") else SECRET_KEY
+
+
+class RevokedTokenError(jwt.InvalidTokenError):
+    """Raised when a token with a valid signature has been revoked."""
+
+
+def verify_token(
+    token: str,
+    key: Any = None,
+    algorithm: Optional[str] = None,
+    cache: Optional[VerifiedTokenCache] = verified_token_cache
+) -> Dict[str, Any]:
+    """
+    Verify a JWT and return its claims, reusing earlier verifications.
+    
+    Args:
+        token: Encoded JWT
+        key: Verification key (default: VERIFY_KEY)
+        algorithm: Expected algorithm (default: ALGORITHM)
+        cache: Verified-claims cache; None verifies every time
+        
+    Returns:
+        Decoded claims
+        
+    Raises:
+        jwt.ExpiredSignatureError: If the token has expired
+        RevokedTokenError: If the token has been revoked
+        jwt.InvalidTokenError: If the token is otherwise invalid
+    """
+    if cache is None:
+        return jwt.decode(token, key or VERIFY_KEY, algorithms=[algorithm or ALGORITHM])
+
+    digest = token_digest(token)
+    if cache.is_revoked(digest):
+        raise RevokedTokenError("Token has been revoked")
+
+    claims = cache.get(digest)
+    if claims is None:
+        claims = jwt.decode(token, key or VERIFY_KEY, algorithms=[algorithm or ALGORITHM])
+        cache.put(digest, claims)
+
+    return claims
+
+
+def revoke_token(token: str) -> None:
+    """
+    Revoke a token (e.g. on logout) in this process.
+    
+    The entry is kept until the token's exp, read without verification
+    since only the revocation lifetime depends on it.
+    
+    Args:
+        token: Encoded JWT
+    """
+    try:
+        expires_at = jwt.decode(token, options={"verify_signature": False}).get("exp")
+    except jwt.InvalidTokenError:
+        expires_at = None
+    verified_token_cache.revoke(
+        token_digest(token),
+        expires_at if isinstance(expires_at, (int, float)) else None
+    )
+
+
+def get_token_cache_stats() -> Dict[str, Any]:
+    """
+    Get hit-rate and revocation counters of the verified-token cache.
+    
+    Returns:
+        Dictionary of cache counters
+    """
+    return verified_token_cache.stats()
 
 
 async def get_current_user(
@@ -34,7 +112,7 @@ async def get_current_user(
     token = credentials.credentials
     
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = verify_token(token)
         user_id: Optional[str] = payload.get("sub")
         
         if user_id is None:
@@ -54,6 +132,16 @@ async def get_current_user(
             "roles": payload.get("roles", [])
         }
         
+    except RevokedTokenError:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail={
+                "status_code": 401,
+                "error": "UNAUTHORIZED",
+                "message": "Authentication failed",
+                "details": "Token has been revoked"
+            }
+        )
     except jwt.ExpiredSignatureError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -0,0 +1,150 @@
+"""
+Cache of verified JWT claims and the token revocation list.
+
+Signature verification (HMAC or RSA) is the per-request cost of
+get_current_user. Verified claims are cached by SHA-256 digest of the
+token, so the raw token is never kept, and each entry expires no later
+than the token's own exp claim.
+"""
+from typing import Any, Dict, Hashable, Optional
+import hashlib
+import math
+import os
+import threading
+import time
+
+from src.cache.ttl_cache import TTLCache
+from src.config import load_environment
+
+load_environment()
+
+AUTH_TOKEN_CACHE_MAX_ENTRIES = int(os.getenv("AUTH_TOKEN_CACHE_MAX_ENTRIES", "10000"))
+# Upper bound on how long verified claims are reused, even for long-lived tokens
+AUTH_TOKEN_CACHE_TTL_SECONDS = float(os.getenv("AUTH_TOKEN_CACHE_TTL_SECONDS", "300"))
+
+
+def token_digest(token: str) -> bytes:
+    """
+    Digest a raw token for use as a cache or revocation key.
+    
+    Args:
+        token: Encoded JWT
+        
+    Returns:
+        SHA-256 digest of the token
+    """
+    return hashlib.sha256(token.encode()).digest()
+
+
+class VerifiedTokenCache:
+    """Bounded cache of verified token claims with a revocation list."""
+
+    def __init__(
+        self,
+        max_entries: int,
+        max_ttl_seconds: float,
+        clock=time.time
+    ):
+        """Initialize the cache.
+        
+        Args:
+            max_entries: Maximum number of cached tokens before LRU eviction
+            max_ttl_seconds: Longest time claims are reused; 0 disables caching
+            clock: Wall-clock time source, comparable with exp claims
+        """
+        self.max_ttl_seconds = max_ttl_seconds
+        self._clock = clock
+        self._claims = TTLCache(max_entries=max_entries, ttl_seconds=max_ttl_seconds, clock=clock)
+        # Revocations are never evicted early: digest -> wall-clock expiry
+        self._revoked: Dict[Hashable, float] = {}
+        self._revoked_lock = threading.Lock()
+        self._revoked_rejections = 0
+
+    def get(self, digest: bytes) -> Optional[Dict[str, Any]]:
+        """
+        Look up the verified claims of a token.
+        
+        Args:
+            digest: token_digest of the token
+            
+        Returns:
+            Cached claims, or None if the token has to be verified
+        """
+        return self._claims.get(digest)
+
+    def put(self, digest: bytes, claims: Dict[str, Any]) -> None:
+        """
+        Cache claims that just passed signature verification.
+        
+        Args:
+            digest: token_digest of the token
+            claims: Decoded claims; their exp bounds the entry lifetime
+        """
+        ttl = self.max_ttl_seconds
+        expires_at = claims.get("exp")
+        if isinstance(expires_at, (int, float)):
+            ttl = min(ttl, expires_at - self._clock())
+        self._claims.set(digest, claims, ttl_seconds=ttl)
+
+    def revoke(self, digest: bytes, expires_at: Optional[float] = None) -> None:
+        """
+        Reject a token from now on, even though its signature is valid.
+        
+        Args:
+            digest: token_digest of the token
+            expires_at: Token exp (epoch seconds); the entry is dropped after
+                it, when the token would be rejected anyway. None keeps it forever.
+        """
+        now = self._clock()
+        with self._revoked_lock:
+            self._revoked[digest] = math.inf if expires_at is None else float(expires_at)
+            for key in [key for key, until in self._revoked.items() if until <= now]:
+                del self._revoked[key]
+        self._claims.invalidate(digest)
+
+    def is_revoked(self, digest: bytes) -> bool:
+        """
+        Check a token against the revocation list.
+        
+        Args:
+            digest: token_digest of the token
+            
+        Returns:
+            True if the token was revoked and has not expired yet
+        """
+        if not self._revoked:
+            return False
+        with self._revoked_lock:
+            until = self._revoked.get(digest)
+            if until is None:
+                return False
+            if until <= self._clock():
+                del self._revoked[digest]
+                return False
+            self._revoked_rejections += 1
+            return True
+
+    def clear(self) -> None:
+        """Drop all cached claims (revocations are kept)."""
+        self._claims.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Snapshot of cache counters.
+        
+        Returns:
+            TTLCache counters plus hit_rate, revoked and revoked_rejections
+        """
+        stats: Dict[str, Any] = self._claims.stats()
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / lookups, 4) if lookups else 0.0
+        with self._revoked_lock:
+            stats["revoked"] = len(self._revoked)
+            stats["revoked_rejections"] = self._revoked_rejections
+        return stats
+
+
+verified_token_cache = VerifiedTokenCache(
+    max_entries=AUTH_TOKEN_CACHE_MAX_ENTRIES,
+    max_ttl_seconds=AUTH_TOKEN_CACHE_TTL_SECONDS
+)
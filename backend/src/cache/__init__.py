@@ -0,0 +1,11 @@
+from .ttl_cache import TTLCache
+from .single_flight import SingleFlight, AsyncSingleFlight
+from .shared_file_cache import SharedFileCache, default_shared_directory
+
+__all__ = [
+    "TTLCache",
+    "SingleFlight",
+    "AsyncSingleFlight",
+    "SharedFileCache",
+    "default_shared_directory"
+]
@@ -0,0 +1,348 @@
+"""
+Cross-process cache of serialized payloads in a shared directory.
+
+Worker processes on one host share entries through files in a tmpfs
+directory (/dev/shm by default), so a payload computed by one worker is
+served by all of them. Writes are atomic renames; a per-key flock makes
+exactly one process compute a missing entry while the others wait for it.
+"""
+from contextlib import suppress
+from typing import Awaitable, Callable, Dict, List, Optional
+import asyncio
+import fcntl
+import hashlib
+import logging
+import os
+import struct
+import tempfile
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# Entry file layout: expiry (epoch seconds, float64) followed by the payload
+_HEADER = struct.Struct("<d")
+_ENTRY_SUFFIX = ".entry"
+_LOCK_SUFFIX = ".lock"
+# Expired entry files are swept after this many writes by a process
+_SWEEP_EVERY_WRITES = 256
+# How often a process waiting for another one's load re-checks the lock
+_LOCK_POLL_SECONDS = 0.002
+
+
+def default_shared_directory(name: str) -> str:
+    """
+    Pick a host-local directory for shared entries.
+    
+    Args:
+        name: Subdirectory name
+        
+    Returns:
+        Path under /dev/shm (memory-backed) if available, else the temp directory
+    """
+    base = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+    return os.path.join(base, name)
+
+
+class SharedFileCache:
+    """Host-wide byte cache with TTL expiry and cross-process miss coalescing."""
+
+    def __init__(
+        self,
+        directory: str,
+        ttl_seconds: float,
+        lock_timeout_seconds: float = 10.0,
+        clock: Callable[[], float] = time.time
+    ):
+        """Initialize the cache.
+        
+        Args:
+            directory: Directory shared by all worker processes (created if missing)
+            ttl_seconds: Time-to-live of an entry; 0 disables the cache
+            lock_timeout_seconds: How long a process waits for another one
+                computing the same entry before computing it itself
+            clock: Wall-clock time source (entries are shared across processes)
+        """
+        self.directory = directory
+        self.ttl_seconds = ttl_seconds
+        self.lock_timeout_seconds = lock_timeout_seconds
+        self._clock = clock
+        self._counter_lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._loads = 0
+        self._lock_waits = 0
+        self._writes = 0
+        if self.enabled:
+            os.makedirs(directory, exist_ok=True)
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache stores anything at all."""
+        return self.ttl_seconds > 0
+
+    def _path(self, key: str, suffix: str) -> str:
+        digest = hashlib.sha256(key.encode()).hexdigest()[:40]
+        return os.path.join(self.directory, digest + suffix)
+
+    def _count(self, counter: str) -> None:
+        with self._counter_lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Read a live entry.
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            The cached bytes, or None if absent or expired
+        """
+        try:
+            with open(self._path(key, _ENTRY_SUFFIX), "rb") as handle:
+                data = handle.read()
+        except FileNotFoundError:
+            self._count("_misses")
+            return None
+
+        if len(data) < _HEADER.size or _HEADER.unpack_from(data)[0] <= self._clock():
+            self._count("_misses")
+            return None
+
+        self._count("_hits")
+        return data[_HEADER.size:]
+
+    def set(self, key: str, value: bytes, ttl_seconds: Optional[float] = None) -> None:
+        """
+        Store an entry atomically (readers see the old or the new file, never a mix).
+        
+        Args:
+            key: Cache key
+            value: Bytes to store
+            ttl_seconds: Per-entry TTL overriding the default
+        """
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        if ttl <= 0:
+            return
+
+        descriptor, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, "wb") as handle:
+                handle.write(_HEADER.pack(self._clock() + ttl))
+                handle.write(value)
+            os.replace(temp_path, self._path(key, _ENTRY_SUFFIX))
+        except BaseException:
+            with suppress(OSError):
+                os.unlink(temp_path)
+            raise
+
+        with self._counter_lock:
+            self._writes += 1
+            sweep = self._writes % _SWEEP_EVERY_WRITES == 0
+        if sweep:
+            self.sweep()
+
+    @staticmethod
+    def _try_lock(handle) -> bool:
+        """Take the exclusive lock of an open lock file without blocking."""
+        try:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return True
+        except BlockingIOError:
+            return False
+
+    @staticmethod
+    def _is_current(handle, path: str) -> bool:
+        """Whether an open lock file is still the one at its path (not swept and recreated)."""
+        try:
+            return os.fstat(handle.fileno()).st_ino == os.stat(path).st_ino
+        except FileNotFoundError:
+            return False
+
+    def _sweep_lock(self, path: str) -> bool:
+        """Delete a lock file unless a process holds it; the caller checked its entry is gone."""
+        try:
+            with open(path, "rb") as handle:
+                if not self._try_lock(handle):
+                    return False
+                if self._is_current(handle, path):
+                    os.unlink(path)
+                    return True
+        except FileNotFoundError:
+            pass
+        return False
+
+    def _store_loaded(self, key: str, value: bytes, acquired: bool) -> None:
+        """Record and store a value computed by this process."""
+        self._count("_loads")
+        if not acquired:
+            self._count("_lock_waits")
+        self.set(key, value)
+
+    def get_or_load(self, key: str, loader: Callable[[], bytes]) -> bytes:
+        """
+        Return an entry, computing it in exactly one process on a miss.
+        
+        Other processes missing the same key wait for the lock holder and
+        then read its entry. A process that waits longer than the lock
+        timeout computes the value itself rather than failing the request.
+        
+        Args:
+            key: Cache key
+            loader: Computes the bytes (e.g. runs the DB query)
+            
+        Returns:
+            Cached or freshly loaded bytes
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        path = self._path(key, _LOCK_SUFFIX)
+        deadline = time.monotonic() + self.lock_timeout_seconds
+        handle = open(path, "a+b")
+        acquired = self._try_lock(handle)
+        while not acquired or not self._is_current(handle, path):
+            if acquired:
+                # Swept while this process waited: lock the file that replaced it
+                handle.close()
+                handle = open(path, "a+b")
+            elif time.monotonic() >= deadline:
+                break
+            else:
+                time.sleep(_LOCK_POLL_SECONDS)
+            acquired = self._try_lock(handle)
+        with handle:
+            try:
+                value = self.get(key)
+                if value is not None:
+                    return value
+                value = loader()
+                self._store_loaded(key, value, acquired)
+                return value
+            finally:
+                if acquired:
+                    fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+    async def get_or_load_async(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[bytes]]
+    ) -> bytes:
+        """
+        Async variant of get_or_load that never blocks the event loop on the lock.
+        
+        Args:
+            key: Cache key
+            loader: Coroutine function computing the bytes
+            
+        Returns:
+            Cached or freshly loaded bytes
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        path = self._path(key, _LOCK_SUFFIX)
+        deadline = time.monotonic() + self.lock_timeout_seconds
+        handle = open(path, "a+b")
+        acquired = self._try_lock(handle)
+        while not acquired or not self._is_current(handle, path):
+            if acquired:
+                # Swept while this process waited: lock the file that replaced it
+                handle.close()
+                handle = open(path, "a+b")
+            elif time.monotonic() >= deadline:
+                break
+            else:
+                await asyncio.sleep(_LOCK_POLL_SECONDS)
+            acquired = self._try_lock(handle)
+        with handle:
+            try:
+                value = self.get(key)
+                if value is not None:
+                    return value
+                value = await loader()
+                self._store_loaded(key, value, acquired)
+                return value
+            finally:
+                if acquired:
+                    fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+    def sweep(self) -> int:
+        """
+        Delete expired entry files, and lock files whose entry is gone.
+        
+        Cache keys embed the data version, so without this every refresh
+        would leave new lock files behind. A lock file held by a process
+        computing its entry is kept.
+        
+        Returns:
+            Number of files removed
+        """
+        removed = 0
+        now = self._clock()
+        names = os.listdir(self.directory)
+        for name in names:
+            if not name.endswith(_ENTRY_SUFFIX):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                with open(path, "rb") as handle:
+                    header = handle.read(_HEADER.size)
+                if len(header) < _HEADER.size or _HEADER.unpack(header)[0] <= now:
+                    os.unlink(path)
+                    removed += 1
+            except FileNotFoundError:
+                continue
+        return removed + self._sweep_locks(names)
+
+    def _sweep_locks(self, names: List[str]) -> int:
+        """Delete the listed lock files whose entry no longer exists."""
+        removed = 0
+        for name in names:
+            if not name.endswith(_LOCK_SUFFIX):
+                continue
+            entry = os.path.join(self.directory, name[:-len(_LOCK_SUFFIX)] + _ENTRY_SUFFIX)
+            if not os.path.exists(entry) and self._sweep_lock(os.path.join(self.directory, name)):
+                removed += 1
+        return removed
+
+    def clear(self) -> int:
+        """
+        Delete every entry, for all processes, and the lock files nobody holds.
+        
+        Returns:
+            Number of entries removed
+        """
+        removed = 0
+        if not os.path.isdir(self.directory):
+            return removed
+        names = os.listdir(self.directory)
+        for name in names:
+            if name.endswith(_ENTRY_SUFFIX):
+                try:
+                    os.unlink(os.path.join(self.directory, name))
+                    removed += 1
+                except FileNotFoundError:
+                    continue
+        self._sweep_locks(names)
+        return removed
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Snapshot of this process's counters.
+        
+        Returns:
+            Dictionary with hits, misses, loads (computed by this process),
+            lock_waits (gave up waiting for another process) and writes
+        """
+        with self._counter_lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "loads": self._loads,
+                "lock_waits": self._lock_waits,
+                "writes": self._writes
+            }
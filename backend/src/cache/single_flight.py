@@ -0,0 +1,132 @@
+"""
+Single-flight request coalescing.
+
+Concurrent callers asking for the same key share one execution of the
+underlying function and receive its result (or its exception).
+"""
+from typing import Any, Awaitable, Callable, Dict, Hashable
+import asyncio
+import threading
+
+
+class _Call:
+    """An in-flight call that followers wait on."""
+
+    __slots__ = ("event", "result", "error")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result: Any = None
+        self.error: BaseException = None
+
+
+class SingleFlight:
+    """Coalesces concurrent calls from threads (e.g. the FastAPI threadpool)."""
+
+    def __init__(self):
+        """Initialize an empty set of in-flight calls."""
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+        self._executions = 0
+        self._coalesced = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        Run fn once for all concurrent callers of the same key.
+        
+        Args:
+            key: Identity of the call
+            fn: Function executed by the first caller
+            
+        Returns:
+            The result of fn, shared by every caller of this flight
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                self._coalesced += 1
+                leader = False
+            else:
+                call = _Call()
+                self._calls[key] = call
+                self._executions += 1
+                leader = True
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Snapshot of coalescing counters.
+        
+        Returns:
+            Dictionary with executions, coalesced callers and in-flight keys
+        """
+        with self._lock:
+            return {
+                "executions": self._executions,
+                "coalesced": self._coalesced,
+                "in_flight": len(self._calls)
+            }
+
+
+class AsyncSingleFlight:
+    """Coalesces concurrent coroutines running on one event loop."""
+
+    def __init__(self):
+        """Initialize an empty set of in-flight calls."""
+        self._calls: Dict[Hashable, "asyncio.Task"] = {}
+        self._executions = 0
+        self._coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Await fn once for all concurrent callers of the same key.
+        
+        The shared call runs as its own task, so a cancelled caller (for
+        example a disconnected client) does not cancel it for the others.
+        
+        Args:
+            key: Identity of the call
+            fn: Coroutine function executed for the first caller
+            
+        Returns:
+            The result of fn, shared by every caller of this flight
+        """
+        task = self._calls.get(key)
+        if task is not None:
+            self._coalesced += 1
+        else:
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+            self._executions += 1
+            task.add_done_callback(lambda _: self._calls.pop(key, None))
+
+        return await asyncio.shield(task)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Snapshot of coalescing counters.
+        
+        Returns:
+            Dictionary with executions, coalesced callers and in-flight keys
+        """
+        return {
+            "executions": self._executions,
+            "coalesced": self._coalesced,
+            "in_flight": len(self._calls)
+        }
@@ -0,0 +1,149 @@
+"""
+In-process TTL cache with LRU eviction.
+"""
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+import threading
+import time
+
+
+class TTLCache:
+    """Thread-safe, size-bounded cache whose entries expire after a TTL."""
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """Initialize the cache.
+        
+        Args:
+            max_entries: Maximum number of entries before LRU eviction
+            ttl_seconds: Default time-to-live of an entry; 0 disables caching
+            clock: Monotonic time source (overridable for testing)
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache stores anything at all."""
+        return self.max_entries > 0 and self.ttl_seconds > 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Look up a live entry and mark it as most recently used.
+        
+        Args:
+            key: Cache key
+            default: Value returned on a miss
+            
+        Returns:
+            The cached value, or default if absent or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return default
+
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                self._expirations += 1
+                self._misses += 1
+                return default
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        """
+        Store a value, evicting the least recently used entries if full.
+        
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl_seconds: Per-entry TTL overriding the default
+        """
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        if self.max_entries <= 0 or ttl <= 0:
+            return
+
+        with self._lock:
+            self._entries[key] = (self._clock() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self, key: Hashable) -> bool:
+        """
+        Remove a single entry.
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            True if an entry was removed
+        """
+        with self._lock:
+            if self._entries.pop(key, None) is None:
+                return False
+            self._invalidations += 1
+            return True
+
+    def invalidate_where(self, predicate: Callable[[Hashable], bool]) -> int:
+        """
+        Remove every entry whose key matches a predicate.
+        
+        Args:
+            predicate: Function called with each key
+            
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            keys = [key for key in self._entries if predicate(key)]
+            for key in keys:
+                del self._entries[key]
+            self._invalidations += len(keys)
+            return len(keys)
+
+    def clear(self) -> int:
+        """
+        Remove all entries.
+        
+        Returns:
+            Number of entries removed
+        """
+        return self.invalidate_where(lambda key: True)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Snapshot of cache counters for sizing and monitoring.
+        
+        Returns:
+            Dictionary with hits, misses, evictions, expirations,
+            invalidations, current size and max_entries
+        """
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "invalidations": self._invalidations,
+                "size": len(self._entries),
+                "max_entries": self.max_entries
+            }
@@ -1,3 +1,15 @@
 from .top_recommendation_api import router as top_recommendation_router
+from .recommendation_list_api import router as recommendation_list_router
+from .recommendation_search_api import router as recommendation_search_router
+from .recommendation_filter_api import router as recommendation_filter_router
+from .recommendation_export_api import router as recommendation_export_router
+from .platform_summary_api import router as platform_summary_router
 
-__all__ = ["top_recommendation_router"]
+__all__ = [
+    "top_recommendation_router",
+    "recommendation_list_router",
+    "recommendation_search_router",
+    "recommendation_filter_router",
+    "recommendation_export_router",
+    "platform_summary_router"
+]
@@ -0,0 +1,102 @@
+"""
+Conditional request helpers (ETag / If-None-Match) for the Overview APIs.
+
+ETags are derived from the recommendation data version plus the request
+parameters that shape the body, so a matching If-None-Match is answered
+with 304 before any query runs or any body is serialized.
+"""
+from typing import Optional, Union
+import hashlib
+
+from fastapi import Response, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from src.database.session import USE_ASYNC_DB
+from src.dashboard.overview.service.data_version_service import DataVersionService
+from src.dashboard.overview.service.data_version_async_service import DataVersionAsyncService
+
+# Clients may keep responses but must revalidate them on every use
+CACHE_CONTROL = "private, no-cache"
+
+NOT_MODIFIED_RESPONSE_DOC = {"description": "Data unchanged since the ETag sent in If-None-Match"}
+
+
+async def read_data_version(db: Union[Session, AsyncSession]) -> int:
+    """
+    Read the recommendation data version without blocking the event loop.
+    
+    Args:
+        db: Request session from get_request_read_db
+        
+    Returns:
+        Current data version of aws_recommendation_consolidate
+    """
+    if USE_ASYNC_DB:
+        return await DataVersionAsyncService(db).get_version()
+    return await run_in_threadpool(DataVersionService(db).get_version)
+
+
+def build_etag(data_version: int, *parts: object) -> str:
+    """
+    Build a strong ETag for a response.
+    
+    Args:
+        data_version: Data version the response body is derived from
+        *parts: Endpoint name and every request parameter that shapes the body
+        
+    Returns:
+        Quoted ETag value, e.g. '"42-9f86d081884c7d65"'
+    """
+    digest = hashlib.blake2b(repr(parts).encode(), digest_size=8).hexdigest()
+    return f'"{data_version}-{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check an If-None-Match header against an ETag (weak comparison, RFC 9110).
+    
+    Args:
+        if_none_match: Raw header value, possibly a comma-separated list or '*'
+        etag: Current ETag of the resource
+        
+    Returns:
+        True if the client's copy is current
+    """
+    if not if_none_match:
+        return False
+
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+
+    return False
+
+
+def set_etag_headers(response: Response, etag: str) -> None:
+    """
+    Attach the ETag and revalidation headers to a response.
+    
+    Args:
+        response: Response (or FastAPI's injected response) to decorate
+        etag: ETag of the body being sent
+    """
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+
+
+def not_modified_response(etag: str) -> Response:
+    """
+    Build an empty 304 response for a matching If-None-Match.
+    
+    Args:
+        etag: Current ETag of the resource
+        
+    Returns:
+        304 Not Modified response with the ETag headers
+    """
+    response = Response(status_code=status.HTTP_304_NOT_MODIFIED)
+    set_etag_headers(response, etag)
+    return response
@@ -0,0 +1,134 @@
+"""
+API routes for the Platform Savings Summary in the Overview module.
+"""
+from typing import Optional, Union
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+import logging
+
+from src.database.session import USE_ASYNC_DB
+from src.database.dependencies import get_request_read_db
+from src.dashboard.overview.api.conditional import (
+    NOT_MODIFIED_RESPONSE_DOC,
+    build_etag,
+    etag_matches,
+    not_modified_response,
+    read_data_version,
+    set_etag_headers
+)
+from src.dashboard.overview.service.platform_summary_service import PlatformSummaryService
+from src.dashboard.overview.service.platform_summary_async_service import PlatformSummaryAsyncService
+from src.dashboard.overview.schemas.platform_summary_schema import (
+    PlatformSummaryRequest,
+    PlatformSummaryResponse
+)
+from src.dashboard.overview.schemas.top_recommendation_schema import (
+    InvalidRequestError,
+    UnauthorizedError,
+    InternalServerError,
+    ServiceUnavailableError
+)
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(
+    prefix="/summary",
+    tags=["Summary"]
+)
+
+
+@router.post(
+    "/platform-savings",
+    response_model=PlatformSummaryResponse,
+    summary="Get Platform Savings Summary",
+    description="Recommendation count, total and average potential savings per platform",
+    responses={
+        200: {
+            "description": "Successful response with the savings summary",
+            "model": PlatformSummaryResponse
+        },
+        304: NOT_MODIFIED_RESPONSE_DOC,
+        400: {
+            "description": "Invalid request parameters",
+            "model": InvalidRequestError
+        },
+        401: {
+            "description": "Authentication failed",
+            "model": UnauthorizedError
+        },
+        500: {
+            "description": "Internal server error",
+            "model": InternalServerError
+        },
+        503: {
+            "description": "Service temporarily unavailable",
+            "model": ServiceUnavailableError
+        }
+    }
+)
+async def get_platform_savings_summary(
+    request: PlatformSummaryRequest,
+    db: Union[Session, AsyncSession] = Depends(get_request_read_db),
+    if_none_match: Optional[str] = Header(None)
+) -> Response:
+    """
+    Get the savings summary for the overview tiles.
+    
+    Served from the recommendation_platform_summary rollup, which triggers
+    keep current on every write, so the cost is one row per platform.
+    With the host-wide payload cache enabled, the body is built once per
+    data version for all worker processes.
+    
+    **Request Body:**
+    - `platform`: Filter by platform - one of: all_platform, google_cloud, aws, databricks, snowflakes
+    
+    **Conditional requests:**
+    - Send the `ETag` of a previous response in `If-None-Match` to get
+      `304 Not Modified` while the data is unchanged
+    
+    **Returns:**
+    - One item per platform with recommendation count, total and average savings
+    """
+    try:
+        data_version = await read_data_version(db)
+        etag = build_etag(data_version, "platform-savings", request.platform)
+        if etag_matches(if_none_match, etag):
+            return not_modified_response(etag)
+
+        if USE_ASYNC_DB:
+            service = PlatformSummaryAsyncService(db)
+            body = await service.get_platform_summary_body(
+                platform=request.platform,
+                data_version=data_version
+            )
+        else:
+            service = PlatformSummaryService(db)
+            body = await run_in_threadpool(
+                service.get_platform_summary_body,
+                platform=request.platform,
+                data_version=data_version
+            )
+
+        logger.info(
+            f"Successfully fetched platform savings summary for platform: {request.platform}"
+        )
+
+        response = Response(content=body, media_type="application/json")
+        set_etag_headers(response, etag)
+        return response
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error fetching platform savings summary: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "status_code": 500,
+                "error": "INTERNAL_SERVER_ERROR",
+                "message": "An unexpected error occurred",
+                "details": "Please try again later or contact support"
+            }
+        )
@@ -0,0 +1,124 @@
+"""
+API routes for the streaming Recommendation Export in the Overview module.
+"""
+from typing import AsyncIterator, Iterator, Literal
+from fastapi import APIRouter, Query
+from fastapi.responses import StreamingResponse
+import logging
+
+from src.database.session import USE_ASYNC_DB
+from src.database.replicas import get_async_read_session_factory, get_read_session_factory
+from src.dashboard.overview.service.recommendation_export_service import (
+    EXPORT_MEDIA_TYPES,
+    RecommendationExportService
+)
+from src.dashboard.overview.service.recommendation_export_async_service import RecommendationExportAsyncService
+from src.dashboard.overview.schemas.top_recommendation_schema import (
+    InvalidRequestError,
+    UnauthorizedError,
+    InternalServerError
+)
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(
+    prefix="/recommendations",
+    tags=["Recommendations"]
+)
+
+
+def _export_chunks(platform: str, export_format: str, batch_size: int) -> Iterator[bytes]:
+    """
+    Stream export chunks with a session owned by the generator.
+    
+    Dependencies with yield are torn down before a StreamingResponse body is
+    sent, so the session must live inside the generator for the whole stream.
+    """
+    db = get_read_session_factory()()
+    try:
+        yield from RecommendationExportService(db).iter_export(platform, export_format, batch_size)
+        logger.info(f"Completed recommendation export for platform: {platform} ({export_format})")
+    except Exception as e:
+        logger.error(f"Error streaming recommendation export: {str(e)}")
+        raise
+    finally:
+        db.close()
+
+
+async def _export_chunks_async(platform: str, export_format: str, batch_size: int) -> AsyncIterator[bytes]:
+    """Async counterpart of _export_chunks."""
+    async with (await get_async_read_session_factory())() as db:
+        try:
+            async for chunk in RecommendationExportAsyncService(db).iter_export(platform, export_format, batch_size):
+                yield chunk
+            logger.info(f"Completed recommendation export for platform: {platform} ({export_format})")
+        except Exception as e:
+            logger.error(f"Error streaming recommendation export: {str(e)}")
+            raise
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    summary="Export Recommendations",
+    description="Stream every recommendation for a platform as NDJSON or CSV",
+    responses={
+        200: {
+            "description": "Streamed export",
+            "content": {media_type: {} for media_type in EXPORT_MEDIA_TYPES.values()}
+        },
+        400: {
+            "description": "Invalid request parameters",
+            "model": InvalidRequestError
+        },
+        401: {
+            "description": "Authentication failed",
+            "model": UnauthorizedError
+        },
+        500: {
+            "description": "Internal server error",
+            "model": InternalServerError
+        }
+    }
+)
+async def export_recommendations(
+    platform: Literal["all_platform", "google_cloud", "aws", "databricks", "snowflakes"] = Query(
+        "all_platform",
+        description="Platform filter for recommendations"
+    ),
+    format: Literal["ndjson", "csv"] = Query(
+        "ndjson",
+        description="Export format"
+    ),
+    batch_size: int = Query(
+        5000,
+        ge=100,
+        le=50000,
+        description="Rows fetched from the database cursor per round trip"
+    )
+) -> StreamingResponse:
+    """
+    Stream all recommendations for a platform.
+    
+    Rows are read through a server-side cursor and written as they arrive,
+    so memory use does not grow with table size.
+    
+    **Query Parameters:**
+    - `platform`: Filter by platform - one of: all_platform, google_cloud, aws, databricks, snowflakes
+    - `format`: `ndjson` (one JSON object per line) or `csv` (with header row)
+    - `batch_size`: Cursor fetch size
+    """
+    if USE_ASYNC_DB:
+        chunks = _export_chunks_async(platform, format, batch_size)
+    else:
+        chunks = _export_chunks(platform, format, batch_size)
+
+    logger.info(f"Starting recommendation export for platform: {platform} ({format})")
+
+    return StreamingResponse(
+        chunks,
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={
+            "Content-Disposition": f'attachment; filename="recommendations_{platform}.{format}"'
+        }
+    )
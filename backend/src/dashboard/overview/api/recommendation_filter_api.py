@@ -0,0 +1,163 @@
+"""
+API routes for the faceted Recommendation Filter in the Overview module.
+"""
+from typing import Optional, Union
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+import logging
+
+from src.database.session import USE_ASYNC_DB
+from src.database.dependencies import get_request_read_db
+from src.dashboard.overview.api.conditional import (
+    NOT_MODIFIED_RESPONSE_DOC,
+    build_etag,
+    etag_matches,
+    not_modified_response,
+    read_data_version,
+    set_etag_headers
+)
+from src.dashboard.overview.service.recommendation_list_service import InvalidCursorError
+from src.dashboard.overview.service.recommendation_filter_service import RecommendationFilterService
+from src.dashboard.overview.service.recommendation_filter_async_service import RecommendationFilterAsyncService
+from src.dashboard.overview.schemas.recommendation_filter_schema import (
+    RecommendationFilterRequest,
+    RecommendationFilterResponse
+)
+from src.dashboard.overview.schemas.top_recommendation_schema import (
+    InvalidRequestError,
+    UnauthorizedError,
+    InternalServerError,
+    ServiceUnavailableError
+)
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(
+    prefix="/recommendations",
+    tags=["Recommendations"]
+)
+
+
+@router.post(
+    "/filter",
+    response_model=RecommendationFilterResponse,
+    summary="Filter Recommendations with Facet Counts",
+    description="Page through recommendations matching a filter and count them by account, region, service, risk, actionable and tags",
+    responses={
+        200: {
+            "description": "Successful response with one filtered page and facet counts",
+            "model": RecommendationFilterResponse
+        },
+        304: NOT_MODIFIED_RESPONSE_DOC,
+        400: {
+            "description": "Invalid request parameters or cursor",
+            "model": InvalidRequestError
+        },
+        401: {
+            "description": "Authentication failed",
+            "model": UnauthorizedError
+        },
+        500: {
+            "description": "Internal server error",
+            "model": InternalServerError
+        },
+        503: {
+            "description": "Service temporarily unavailable",
+            "model": ServiceUnavailableError
+        }
+    }
+)
+async def filter_recommendations(
+    request: RecommendationFilterRequest,
+    response: Response,
+    db: Union[Session, AsyncSession] = Depends(get_request_read_db),
+    if_none_match: Optional[str] = Header(None)
+) -> RecommendationFilterResponse:
+    """
+    Get one page of recommendations matching a filter, with facet counts.
+    
+    Filters combine with AND; list values match any listed value. Facet
+    counts cover every matching recommendation and are computed in a single
+    GROUPING SETS query. Pages are ordered by potential savings and addressed
+    with a keyset cursor on (potential, id).
+    
+    **Request Body:**
+    - `platform`: Filter by platform - one of: all_platform, google_cloud, aws, databricks, snowflakes
+    - `filters`: `account`, `region`, `service`, `sub_service`, `risk_level` (lists),
+      `actionable` (bool) and `tags` (`{"env": "prod"}`, all pairs must be present)
+    - `facets`: Facets to count, including `tag:<key>`; `[]` skips counting (e.g. on later pages)
+    - `facet_limit`: Values returned per facet (1-200, default 20)
+    - `limit`: Page size (1-500, default 50)
+    - `cursor`: `next_cursor` from the previous page; omit for the first page
+    
+    **Conditional requests:**
+    - Send the `ETag` of a previous response in `If-None-Match` to get
+      `304 Not Modified` while the data is unchanged
+    
+    **Returns:**
+    - Page of recommendations with `next_cursor`, `has_more`, `total` and `facets`
+    """
+    try:
+        filters = request.filters.model_dump(exclude_none=True)
+        data_version = await read_data_version(db)
+        etag = build_etag(
+            data_version, "recommendation-filter", request.platform, sorted(filters.items()),
+            request.facets, request.facet_limit, request.limit, request.cursor
+        )
+        if etag_matches(if_none_match, etag):
+            return not_modified_response(etag)
+
+        if USE_ASYNC_DB:
+            service = RecommendationFilterAsyncService(db)
+            result = await service.filter_recommendations(
+                platform=request.platform,
+                filters=filters,
+                facets=request.facets,
+                facet_limit=request.facet_limit,
+                limit=request.limit,
+                cursor=request.cursor
+            )
+        else:
+            service = RecommendationFilterService(db)
+            result = await run_in_threadpool(
+                service.filter_recommendations,
+                platform=request.platform,
+                filters=filters,
+                facets=request.facets,
+                facet_limit=request.facet_limit,
+                limit=request.limit,
+                cursor=request.cursor
+            )
+
+        logger.info(
+            f"Successfully filtered recommendations for platform: {request.platform}"
+        )
+
+        set_etag_headers(response, etag)
+        return result
+
+    except InvalidCursorError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "status_code": 400,
+                "error": "INVALID_REQUEST",
+                "message": "Invalid request parameters",
+                "details": "cursor is not a valid pagination cursor"
+            }
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error filtering recommendations: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "status_code": 500,
+                "error": "INTERNAL_SERVER_ERROR",
+                "message": "An unexpected error occurred",
+                "details": "Please try again later or contact support"
+            }
+        )
@@ -0,0 +1,151 @@
+"""
+API routes for the keyset-paginated Recommendation Listing in the Overview module.
+"""
+from typing import Optional, Union
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+import logging
+
+from src.database.session import USE_ASYNC_DB
+from src.database.dependencies import get_request_read_db
+from src.dashboard.overview.api.conditional import (
+    NOT_MODIFIED_RESPONSE_DOC,
+    build_etag,
+    etag_matches,
+    not_modified_response,
+    read_data_version,
+    set_etag_headers
+)
+from src.dashboard.overview.service.recommendation_list_service import (
+    InvalidCursorError,
+    RecommendationListService
+)
+from src.dashboard.overview.service.recommendation_list_async_service import RecommendationListAsyncService
+from src.dashboard.overview.schemas.recommendation_list_schema import (
+    RecommendationListRequest,
+    RecommendationListResponse
+)
+from src.dashboard.overview.schemas.top_recommendation_schema import (
+    InvalidRequestError,
+    UnauthorizedError,
+    InternalServerError,
+    ServiceUnavailableError
+)
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(
+    prefix="/recommendations",
+    tags=["Recommendations"]
+)
+
+
+@router.post(
+    "/list",
+    response_model=RecommendationListResponse,
+    summary="List Recommendations",
+    description="Page through all recommendations ordered by potential savings using an opaque keyset cursor",
+    responses={
+        200: {
+            "description": "Successful response with one page of recommendations",
+            "model": RecommendationListResponse
+        },
+        304: NOT_MODIFIED_RESPONSE_DOC,
+        400: {
+            "description": "Invalid request parameters or cursor",
+            "model": InvalidRequestError
+        },
+        401: {
+            "description": "Authentication failed",
+            "model": UnauthorizedError
+        },
+        500: {
+            "description": "Internal server error",
+            "model": InternalServerError
+        },
+        503: {
+            "description": "Service temporarily unavailable",
+            "model": ServiceUnavailableError
+        }
+    }
+)
+async def list_recommendations(
+    request: RecommendationListRequest,
+    response: Response,
+    db: Union[Session, AsyncSession] = Depends(get_request_read_db),
+    if_none_match: Optional[str] = Header(None)
+) -> RecommendationListResponse:
+    """
+    Get one page of recommendations ordered by potential savings.
+    
+    Pages are addressed with a keyset cursor on (potential, id) rather than
+    OFFSET, so deep pages cost the same as the first one.
+    
+    **Request Body:**
+    - `platform`: Filter by platform - one of: all_platform, google_cloud, aws, databricks, snowflakes
+    - `limit`: Page size (1-500, default 50)
+    - `cursor`: `next_cursor` from the previous page; omit for the first page
+    
+    **Conditional requests:**
+    - Send the `ETag` of a previous response in `If-None-Match` to get
+      `304 Not Modified` while the data is unchanged
+    
+    **Returns:**
+    - Page of recommendations with `next_cursor` and `has_more`
+    """
+    try:
+        data_version = await read_data_version(db)
+        etag = build_etag(
+            data_version, "recommendation-list", request.platform, request.limit, request.cursor
+        )
+        if etag_matches(if_none_match, etag):
+            return not_modified_response(etag)
+
+        if USE_ASYNC_DB:
+            service = RecommendationListAsyncService(db)
+            result = await service.list_recommendations(
+                platform=request.platform,
+                limit=request.limit,
+                cursor=request.cursor
+            )
+        else:
+            service = RecommendationListService(db)
+            result = await run_in_threadpool(
+                service.list_recommendations,
+                platform=request.platform,
+                limit=request.limit,
+                cursor=request.cursor
+            )
+
+        logger.info(
+            f"Successfully listed recommendations for platform: {request.platform}"
+        )
+
+        set_etag_headers(response, etag)
+        return result
+
+    except InvalidCursorError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "status_code": 400,
+                "error": "INVALID_REQUEST",
+                "message": "Invalid request parameters",
+                "details": "cursor is not a valid pagination cursor"
+            }
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error listing recommendations: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "status_code": 500,
+                "error": "INTERNAL_SERVER_ERROR",
+                "message": "An unexpected error occurred",
+                "details": "Please try again later or contact support"
+            }
+        )
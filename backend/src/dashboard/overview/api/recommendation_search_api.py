@@ -0,0 +1,155 @@
+"""
+API routes for the ranked Recommendation Search in the Overview module.
+"""
+from typing import Optional, Union
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+import logging
+
+from src.database.session import USE_ASYNC_DB
+from src.database.dependencies import get_request_read_db
+from src.dashboard.overview.api.conditional import (
+    NOT_MODIFIED_RESPONSE_DOC,
+    build_etag,
+    etag_matches,
+    not_modified_response,
+    read_data_version,
+    set_etag_headers
+)
+from src.dashboard.overview.service.recommendation_list_service import InvalidCursorError
+from src.dashboard.overview.service.recommendation_search_service import RecommendationSearchService
+from src.dashboard.overview.service.recommendation_search_async_service import RecommendationSearchAsyncService
+from src.dashboard.overview.schemas.recommendation_search_schema import (
+    RecommendationSearchRequest,
+    RecommendationSearchResponse
+)
+from src.dashboard.overview.schemas.top_recommendation_schema import (
+    InvalidRequestError,
+    UnauthorizedError,
+    InternalServerError,
+    ServiceUnavailableError
+)
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(
+    prefix="/recommendations",
+    tags=["Recommendations"]
+)
+
+
+@router.post(
+    "/search",
+    response_model=RecommendationSearchResponse,
+    summary="Search Recommendations",
+    description="Full-text search over recommendations, ranked by relevance and paged with an opaque keyset cursor",
+    responses={
+        200: {
+            "description": "Successful response with one page of search results",
+            "model": RecommendationSearchResponse
+        },
+        304: NOT_MODIFIED_RESPONSE_DOC,
+        400: {
+            "description": "Invalid request parameters or cursor",
+            "model": InvalidRequestError
+        },
+        401: {
+            "description": "Authentication failed",
+            "model": UnauthorizedError
+        },
+        500: {
+            "description": "Internal server error",
+            "model": InternalServerError
+        },
+        503: {
+            "description": "Service temporarily unavailable",
+            "model": ServiceUnavailableError
+        }
+    }
+)
+async def search_recommendations(
+    request: RecommendationSearchRequest,
+    response: Response,
+    db: Union[Session, AsyncSession] = Depends(get_request_read_db),
+    if_none_match: Optional[str] = Header(None)
+) -> RecommendationSearchResponse:
+    """
+    Search recommendations by keyword, most relevant first.
+    
+    Matches the recommendation title, description and justifications through
+    the GIN-indexed `search_vector` column; title matches rank above
+    description matches, which rank above justification matches. Pages are
+    addressed with a keyset cursor on (rank, id).
+    
+    **Request Body:**
+    - `query`: Search text (1-200 characters); supports `"quoted phrases"`, `OR` and `-excluded` words
+    - `platform`: Filter by platform - one of: all_platform, google_cloud, aws, databricks, snowflakes
+    - `limit`: Page size (1-100, default 20)
+    - `cursor`: `next_cursor` from the previous page of the same search; omit for the first page
+    
+    **Conditional requests:**
+    - Send the `ETag` of a previous response in `If-None-Match` to get
+      `304 Not Modified` while the data is unchanged
+    
+    **Returns:**
+    - Page of matching recommendations with `rank`, `next_cursor` and `has_more`
+    """
+    try:
+        data_version = await read_data_version(db)
+        etag = build_etag(
+            data_version, "recommendation-search",
+            request.query, request.platform, request.limit, request.cursor
+        )
+        if etag_matches(if_none_match, etag):
+            return not_modified_response(etag)
+
+        if USE_ASYNC_DB:
+            service = RecommendationSearchAsyncService(db)
+            result = await service.search_recommendations(
+                query_text=request.query,
+                platform=request.platform,
+                limit=request.limit,
+                cursor=request.cursor
+            )
+        else:
+            service = RecommendationSearchService(db)
+            result = await run_in_threadpool(
+                service.search_recommendations,
+                query_text=request.query,
+                platform=request.platform,
+                limit=request.limit,
+                cursor=request.cursor
+            )
+
+        logger.info(
+            f"Successfully searched recommendations for platform: {request.platform}"
+        )
+
+        set_etag_headers(response, etag)
+        return result
+
+    except InvalidCursorError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "status_code": 400,
+                "error": "INVALID_REQUEST",
+                "message": "Invalid request parameters",
+                "details": "cursor is not a valid pagination cursor for this search"
+            }
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error searching recommendations: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "status_code": 500,
+                "error": "INTERNAL_SERVER_ERROR",
+                "message": "An unexpected error occurred",
+                "details": "Please try again later or contact support"
+            }
+        )
@@ -1,16 +1,38 @@
 """
 API routes for Top Recommendations in the Overview/Top Updates module.
 """
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Optional, Union
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 import logging
 
-from src.database.session import get_db
-from src.auth.dependencies import get_current_user
-from src.dashboard.overview.service.top_recommendation_service import TopRecommendationService
+from src.database.session import USE_ASYNC_DB
+from src.database.dependencies import get_request_read_db
+from src.dashboard.overview.api.conditional import (
+    NOT_MODIFIED_RESPONSE_DOC,
+    build_etag,
+    etag_matches,
+    not_modified_response,
+    read_data_version,
+    set_etag_headers
+)
+from src.dashboard.overview.service.top_recommendation_service import (
+    TopRecommendationService,
+    build_batch_body
+)
+from src.dashboard.overview.service.top_recommendation_async_service import TopRecommendationAsyncService
+from src.dashboard.overview.service.top_recommendation_cache import get_top_recommendation_cache_stats
+from src.dashboard.overview.service.top_recommendation_refresher import (
+    TOP_RECOMMENDATION_LIMIT,
+    top_recommendation_refresher
+)
 from src.dashboard.overview.schemas.top_recommendation_schema import (
     TopRecommendationRequest,
     TopRecommendationResponse,
+    TopRecommendationBatchRequest,
+    TopRecommendationBatchResponse,
     InvalidRequestError,
     UnauthorizedError,
     InternalServerError,
@@ -35,6 +57,7 @@ router = APIRouter(
             "description": "Successful response with top recommendations",
             "model": TopRecommendationResponse
         },
+        304: NOT_MODIFIED_RESPONSE_DOC,
         400: {
             "description": "Invalid request parameters",
             "model": InvalidRequestError
@@ -55,9 +78,11 @@ router = APIRouter(
 )
 async def get_top_recommendations(
     request: TopRecommendationRequest,
-    db: Session = Depends(get_db)
+    db: Union[Session, AsyncSession] = Depends(get_request_read_db),
+    if_none_match: Optional[str] = Header(None)
     # current_user: dict = Depends(get_current_user)  # Commented for testing without auth
-) -> TopRecommendationResponse:
+    # (re-enable with: from src.auth.dependencies import get_current_user)
+) -> Response:
     """
     Get top 6 recommendations based on potential cost savings.
     
@@ -67,6 +92,10 @@ async def get_top_recommendations(
     **Request Body:**
     - `platform`: Filter by platform - one of: all_platform, google_cloud, aws, databricks, snowflakes
     
+    **Conditional requests:**
+    - Responses carry an `ETag` derived from the data version; send it back in
+      `If-None-Match` to get `304 Not Modified` while the data is unchanged
+    
     **Returns:**
     - List of top 6 recommendations with platform_name, description, and formatted savings value
     
@@ -102,17 +131,47 @@ async def get_top_recommendations(
                 }
             )
 
-        # Get recommendations from service
-        service = TopRecommendationService(db)
-        response = service.get_top_recommendations(
-            platform=request.platform,
-            limit=6  # Top 6 recommendations as per requirement
-        )
+        # Answer unchanged data from the version alone, before the top-N query
+        data_version = await read_data_version(db)
+        etag = build_etag(data_version, "top-recommendation", request.platform, TOP_RECOMMENDATION_LIMIT)
+        if etag_matches(if_none_match, etag):
+            return not_modified_response(etag)
+
+        # Latest payload kept by the background refresher; one from an older data
+        # version is served with that version's ETag while it is being refreshed
+        latest = top_recommendation_refresher.serve(request.platform, TOP_RECOMMENDATION_LIMIT, data_version)
+        if latest is not None:
+            served_version, payload = latest
+            if served_version != data_version:
+                etag = build_etag(served_version, "top-recommendation", request.platform, TOP_RECOMMENDATION_LIMIT)
+                if etag_matches(if_none_match, etag):
+                    return not_modified_response(etag)
+        else:
+            # Get recommendations from service without blocking the event loop
+            if USE_ASYNC_DB:
+                service = TopRecommendationAsyncService(db)
+                payload = await service.get_top_recommendations_payload(
+                    platform=request.platform,
+                    limit=TOP_RECOMMENDATION_LIMIT,  # Top 6 recommendations as per requirement
+                    data_version=data_version
+                )
+            else:
+                service = TopRecommendationService(db)
+                payload = await run_in_threadpool(
+                    service.get_top_recommendations_payload,
+                    platform=request.platform,
+                    limit=TOP_RECOMMENDATION_LIMIT,
+                    data_version=data_version
+                )
+            top_recommendation_refresher.remember(request.platform, TOP_RECOMMENDATION_LIMIT, data_version, payload)
         
         logger.info(
             f"Successfully fetched top recommendations for platform: {request.platform}"
         )
         
+        # Body is serialized once per cache entry; response_model stays for the docs
+        response = Response(content=payload.body, media_type="application/json")
+        set_etag_headers(response, etag)
         return response
 
     except HTTPException:
@@ -128,3 +187,116 @@ async def get_top_recommendations(
                 "details": "Please try again later or contact support"
             }
         )
+
+
+@router.post(
+    "/top-recommendation/batch",
+    response_model=TopRecommendationBatchResponse,
+    summary="Get Top Recommendations for Several Platforms",
+    description="Fetch the top N recommendations of each requested platform in one call and one query",
+    responses={
+        200: {
+            "description": "Successful response with one group per requested platform",
+            "model": TopRecommendationBatchResponse
+        },
+        304: NOT_MODIFIED_RESPONSE_DOC,
+        400: {
+            "description": "Invalid request parameters",
+            "model": InvalidRequestError
+        },
+        401: {
+            "description": "Authentication failed",
+            "model": UnauthorizedError
+        },
+        500: {
+            "description": "Internal server error",
+            "model": InternalServerError
+        },
+        503: {
+            "description": "Service temporarily unavailable",
+            "model": ServiceUnavailableError
+        }
+    }
+)
+async def get_top_recommendations_batch(
+    request: TopRecommendationBatchRequest,
+    db: Union[Session, AsyncSession] = Depends(get_request_read_db),
+    if_none_match: Optional[str] = Header(None)
+) -> Response:
+    """
+    Get the top recommendations of several platforms, e.g. every overview tab.
+    
+    Platforms missing from the cache are fetched together with a single
+    query (one index-ordered top-N branch per platform), over one session.
+    
+    **Request Body:**
+    - `requests`: 1-10 entries of `platform` and `limit` (1-50, default 6)
+    
+    **Conditional requests:**
+    - Send the `ETag` of a previous response in `If-None-Match` to get
+      `304 Not Modified` while the data is unchanged
+    
+    **Returns:**
+    - One group per entry, in request order, with platform, limit and data
+    """
+    try:
+        requests = [(entry.platform, entry.limit) for entry in request.requests]
+
+        data_version = await read_data_version(db)
+        etag = build_etag(data_version, "top-recommendation-batch", tuple(requests))
+        if etag_matches(if_none_match, etag):
+            return not_modified_response(etag)
+
+        if USE_ASYNC_DB:
+            service = TopRecommendationAsyncService(db)
+            payloads = await service.get_top_recommendations_batch(
+                requests,
+                data_version=data_version
+            )
+        else:
+            service = TopRecommendationService(db)
+            payloads = await run_in_threadpool(
+                service.get_top_recommendations_batch,
+                requests,
+                data_version=data_version
+            )
+
+        logger.info(
+            f"Successfully fetched top recommendations for platforms: "
+            f"{', '.join(platform for platform, _ in requests)}"
+        )
+
+        response = Response(
+            content=build_batch_body(requests, payloads),
+            media_type="application/json"
+        )
+        set_etag_headers(response, etag)
+        return response
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error fetching batch top recommendations: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "status_code": 500,
+                "error": "INTERNAL_SERVER_ERROR",
+                "message": "An unexpected error occurred",
+                "details": "Please try again later or contact support"
+            }
+        )
+
+
+@router.get(
+    "/top-recommendation/cache-stats",
+    summary="Top Recommendations Cache Statistics",
+    description="Hit, miss and eviction counters of the in-process top recommendations cache"
+)
+async def get_top_recommendation_cache_statistics() -> dict:
+    """
+    Get counters of the in-process top recommendations cache and its background refresher.
+    
+    Counters are per worker process and reset on restart.
+    """
+    return {**get_top_recommendation_cache_stats(), "refresher": top_recommendation_refresher.stats()}
@@ -1,18 +1,20 @@
 """
 Mock API routes for Top Recommendations (no database required).
 """
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Response, status
+from fastapi.concurrency import run_in_threadpool
 import logging
 
 from src.dashboard.overview.dao.top_recommendation_dao_mock import TopRecommendationDAOMock
-from src.dashboard.overview.service.top_recommendation_service import TopRecommendationService
+from src.dashboard.overview.service.top_recommendation_service import (
+    TopRecommendationPayload,
+    TopRecommendationService
+)
 from src.dashboard.overview.schemas.top_recommendation_schema import (
     TopRecommendationRequest,
     TopRecommendationResponse,
     InvalidRequestError,
-    UnauthorizedError,
-    InternalServerError,
-    ServiceUnavailableError
+    InternalServerError
 )
 
 logger = logging.getLogger(__name__)
@@ -51,12 +53,15 @@ class MockDB:
 )
 async def get_top_recommendations(
     request: TopRecommendationRequest
-) -> TopRecommendationResponse:
+) -> Response:
     """
     Get top 6 recommendations based on potential cost savings (MOCK DATA).
     
     **This endpoint uses mock data and does not require a database.**
     
+    Rows come from an in-memory columnar store, generated at start-up
+    (MOCK_RECOMMENDATION_ROWS) or loaded from MOCK_RECOMMENDATION_CSV.
+    
     **Request Body:**
     - `platform`: Filter by platform - one of: all_platform, google_cloud, aws, databricks, snowflakes
     
@@ -77,43 +82,21 @@ async def get_top_recommendations(
                 }
             )
 
-        # Use mock DAO
-        mock_db = MockDB()
-        dao = TopRecommendationDAOMock(mock_db)
-        
-        # Get recommendations
-        recommendations = dao.get_top_recommendations(
+        # Query the in-memory columnar store on every request (no response cache),
+        # so load tests exercise the top-N and formatting path
+        dao = TopRecommendationDAOMock(MockDB())
+        recommendations = await run_in_threadpool(
+            dao.get_top_recommendation_rows,
             platform=request.platform,
             limit=6
         )
-        
-        # Use service to format response
-        from src.dashboard.overview.schemas.top_recommendation_schema import (
-            RecommendationItem,
-            SuccessResponse
-        )
-        
-        recommendation_items = []
-        for rec in recommendations:
-            item = RecommendationItem(
-                platform_name=rec.type,
-                description=rec.description or rec.recommendation,
-                value=f"Save ${rec.potential:,.2f}"
-            )
-            recommendation_items.append(item)
-        
-        success_response = SuccessResponse(
-            status_code=200,
-            message="Data Received Successfully",
-            status=True,
-            data=recommendation_items
-        )
+        payload = TopRecommendationPayload(TopRecommendationService._build_items(recommendations))
         
         logger.info(
             f"Successfully fetched top recommendations for platform: {request.platform} (MOCK MODE)"
         )
         
-        return TopRecommendationResponse(success_response=success_response)
+        return Response(content=payload.body, media_type="application/json")
 
     except HTTPException:
         raise
@@ -1,3 +1,23 @@
-from .top_recommendation_dao import TopRecommendationDAO
+from .top_recommendation_dao import (
+    TopRecommendationDAO,
+    TOP_RECOMMENDATION_COLUMNS,
+    RECOMMENDATION_LIST_COLUMNS,
+    EXPORT_COLUMNS
+)
+from .top_recommendation_async_dao import TopRecommendationAsyncDAO
+from .platform_summary_dao import PlatformSummaryDAO
+from .platform_summary_async_dao import PlatformSummaryAsyncDAO
+from .data_version_dao import DataVersionDAO
+from .data_version_async_dao import DataVersionAsyncDAO
 
-__all__ = ["TopRecommendationDAO"]
+__all__ = [
+    "TopRecommendationDAO",
+    "TopRecommendationAsyncDAO",
+    "PlatformSummaryDAO",
+    "PlatformSummaryAsyncDAO",
+    "DataVersionDAO",
+    "DataVersionAsyncDAO",
+    "TOP_RECOMMENDATION_COLUMNS",
+    "RECOMMENDATION_LIST_COLUMNS",
+    "EXPORT_COLUMNS"
+]
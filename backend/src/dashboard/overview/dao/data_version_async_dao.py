@@ -0,0 +1,28 @@
+"""
+Async Data Access Object for the recommendation data version.
+Runs the same lookup as DataVersionDAO through an AsyncSession.
+"""
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.dashboard.overview.dao.data_version_dao import DataVersionDAO
+
+
+class DataVersionAsyncDAO:
+    """Async DAO class for the recommendation data version."""
+
+    def __init__(self, db: AsyncSession):
+        """Initialize the DAO with an async database session.
+        
+        Args:
+            db: SQLAlchemy async database session
+        """
+        self.db = db
+
+    async def get_version(self) -> int:
+        """
+        Fetch the current data version of aws_recommendation_consolidate.
+        
+        Returns:
+            Version number, bumped by every statement that changes rows
+        """
+        result = await self.db.execute(DataVersionDAO._version_statement())
+        return int(result.scalar_one())
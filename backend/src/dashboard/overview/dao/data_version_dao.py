@@ -0,0 +1,40 @@
+"""
+Data Access Object for the recommendation data version.
+Reads the trigger-maintained recommendation_data_version counter.
+"""
+from sqlalchemy import Select, select
+from sqlalchemy.orm import Session
+from src.dashboard.overview.models.data_version import RecommendationDataVersion
+
+
+class DataVersionDAO:
+    """DAO class for the recommendation data version."""
+
+    def __init__(self, db: Session):
+        """Initialize the DAO with a database session.
+        
+        Args:
+            db: SQLAlchemy database session
+        """
+        self.db = db
+
+    @staticmethod
+    def _version_statement() -> Select:
+        """
+        Build the version lookup shared by the sync and async DAOs.
+        
+        Returns:
+            SELECT of the counter by primary key
+        """
+        return select(RecommendationDataVersion.version).where(
+            RecommendationDataVersion.id == 1
+        )
+
+    def get_version(self) -> int:
+        """
+        Fetch the current data version of aws_recommendation_consolidate.
+        
+        Returns:
+            Version number, bumped by every statement that changes rows
+        """
+        return int(self.db.execute(self._version_statement()).scalar_one())
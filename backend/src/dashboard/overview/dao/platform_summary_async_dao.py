@@ -0,0 +1,33 @@
+"""
+Async Data Access Object for the Platform Savings Summary.
+Runs the same rollup query as PlatformSummaryDAO through an AsyncSession.
+"""
+from typing import Sequence
+from sqlalchemy import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.dashboard.overview.dao.platform_summary_dao import PlatformSummaryDAO
+
+
+class PlatformSummaryAsyncDAO:
+    """Async DAO class for Platform Savings Summary operations."""
+
+    def __init__(self, db: AsyncSession):
+        """Initialize the DAO with an async database session.
+        
+        Args:
+            db: SQLAlchemy async database session
+        """
+        self.db = db
+
+    async def get_platform_summaries(self, platform: str) -> Sequence[Row]:
+        """
+        Fetch count, total and average potential savings per platform.
+        
+        Args:
+            platform: The platform filter (aws, databricks, snowflakes, google_cloud, all_platform)
+            
+        Returns:
+            Rows with type, recommendation_count, total_potential and avg_potential
+        """
+        result = await self.db.execute(PlatformSummaryDAO._platform_summaries_statement(platform))
+        return result.all()
@@ -0,0 +1,77 @@
+"""
+Data Access Object for the Platform Savings Summary.
+Reads the trigger-maintained recommendation_platform_summary rollup.
+"""
+from typing import Sequence
+from sqlalchemy import Row, Select, desc, func, select, text
+from sqlalchemy.orm import Session
+from src.dashboard.overview.dao.top_recommendation_dao import TopRecommendationDAO
+from src.dashboard.overview.models.platform_summary import RecommendationPlatformSummary
+
+
+class PlatformSummaryDAO:
+    """DAO class for Platform Savings Summary operations."""
+
+    def __init__(self, db: Session):
+        """Initialize the DAO with a database session.
+        
+        Args:
+            db: SQLAlchemy database session
+        """
+        self.db = db
+
+    @staticmethod
+    def _platform_summaries_statement(platform: str) -> Select:
+        """
+        Build the rollup query shared by the sync and async DAOs.
+        
+        Args:
+            platform: The platform filter (aws, databricks, snowflakes, google_cloud, all_platform)
+            
+        Returns:
+            SELECT over the rollup, one row per platform, largest savings first
+        """
+        query = select(
+            RecommendationPlatformSummary.type,
+            RecommendationPlatformSummary.recommendation_count,
+            RecommendationPlatformSummary.total_potential,
+            (
+                RecommendationPlatformSummary.total_potential
+                / func.nullif(RecommendationPlatformSummary.potential_count, 0)
+            ).label("avg_potential")
+        ).where(RecommendationPlatformSummary.recommendation_count > 0)
+
+        if platform and platform.lower() != "all_platform":
+            platform_type = TopRecommendationDAO.PLATFORM_MAPPING.get(platform.lower())
+            if platform_type:
+                query = query.where(RecommendationPlatformSummary.type == platform_type)
+
+        return query.order_by(
+            desc(RecommendationPlatformSummary.total_potential),
+            RecommendationPlatformSummary.type
+        )
+
+    def get_platform_summaries(self, platform: str) -> Sequence[Row]:
+        """
+        Fetch count, total and average potential savings per platform.
+        
+        Cost is O(platforms): the rollup is kept current by triggers on
+        aws_recommendation_consolidate.
+        
+        Args:
+            platform: The platform filter (aws, databricks, snowflakes, google_cloud, all_platform)
+            
+        Returns:
+            Rows with type, recommendation_count, total_potential and avg_potential
+        """
+        return self.db.execute(self._platform_summaries_statement(platform)).all()
+
+    def rebuild(self) -> None:
+        """
+        Recompute the rollup from aws_recommendation_consolidate.
+        
+        Only needed for repairs or bulk operations that bypass row triggers
+        (e.g. partition attach/detach). Commits the session.
+        """
+        self.db.execute(text("SELECT recommendation_summary_rebuild()"))
+        self.db.commit()
@@ -0,0 +1,180 @@
+"""
+Read-through hot tier: the columnar in-memory store in front of PostgreSQL.
+
+With RECOMMENDATION_HOT_TIER_ENABLED, top recommendation queries are
+answered by a TopRecommendationDAOMock over a ColumnarRecommendationStore
+copy of aws_recommendation_consolidate, as long as that copy was built from
+the data version the request read (so ETags and bodies stay consistent).
+
+A request that reads a newer data version is served by the database and
+starts a reload in a background thread; no request waits for the copy, and
+the event loop is never blocked by it. The copy is read in one REPEATABLE
+READ snapshot together with the data version it is tagged with.
+"""
+from typing import Any, Callable, Dict, Optional, Tuple
+import logging
+import os
+import threading
+import time
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from src.config import load_environment
+from src.database.pool_config import env_flag
+from src.database.replicas import get_read_session_factory
+from src.dashboard.overview.dao.data_version_dao import DataVersionDAO
+from src.dashboard.overview.models.recommendation import AWSRecommendationConsolidate
+
+load_environment()
+
+logger = logging.getLogger(__name__)
+
+# Off by default: the copy costs memory in every worker process
+RECOMMENDATION_HOT_TIER_ENABLED = env_flag("RECOMMENDATION_HOT_TIER_ENABLED")
+# Rows fetched from the server-side cursor per round trip while reloading
+RECOMMENDATION_HOT_TIER_BATCH_SIZE = int(os.getenv("RECOMMENDATION_HOT_TIER_BATCH_SIZE", "50000"))
+# After a failed reload, requests do not start another one for this long
+RECOMMENDATION_HOT_TIER_RETRY_SECONDS = float(os.getenv("RECOMMENDATION_HOT_TIER_RETRY_SECONDS", "30"))
+
+
+class RecommendationHotTier:
+    """Columnar copy of the recommendations, reloaded in the background on data version changes."""
+
+    def __init__(
+        self,
+        enabled: bool,
+        batch_size: int = 50000,
+        retry_seconds: float = 30.0,
+        session_factory: Optional[Callable[[], Session]] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """Initialize an empty hot tier.
+
+        Args:
+            enabled: False makes dao_for always answer None
+            batch_size: Rows fetched per round trip while reloading
+            retry_seconds: Pause after a failed reload before the next attempt
+            session_factory: Opens the session a reload reads from; a read
+                replica or the primary (get_read_session_factory) when None
+            clock: Monotonic time source (overridable for testing)
+        """
+        self.enabled = enabled
+        self.batch_size = batch_size
+        self.retry_seconds = retry_seconds
+        self._session_factory = session_factory
+        self._clock = clock
+        # (data version, TopRecommendationDAOMock), replaced as a whole so
+        # lock-free readers never pair a copy with another version
+        self._current: Optional[Tuple[int, Any]] = None
+        self._loading: Optional[threading.Thread] = None
+        self._failed_at: Optional[float] = None
+        self._lock = threading.Lock()
+        self._counters = {"reloads": 0, "failures": 0}
+
+    def dao_for(self, data_version: int) -> Any:
+        """
+        Get the in-memory DAO if it holds exactly the given data version.
+
+        Never blocks: when the copy is missing or older, a background reload
+        is started (unless one is running) and the caller uses the database.
+
+        Args:
+            data_version: Data version the request read
+
+        Returns:
+            TopRecommendationDAOMock over the copy, or None to query the database
+        """
+        if not self.enabled:
+            return None
+        current = self._current
+        if current is not None and current[0] == data_version:
+            return current[1]
+        if current is None or data_version > current[0]:
+            self._start_reload()
+        return None
+
+    def _start_reload(self) -> None:
+        with self._lock:
+            if self._loading is not None:
+                return
+            if self._failed_at is not None and self._clock() - self._failed_at < self.retry_seconds:
+                return
+            self._loading = threading.Thread(
+                target=self._reload,
+                name="recommendation-hot-tier-reload",
+                daemon=True
+            )
+            self._loading.start()
+
+    def _load_statement(self):
+        """SELECT of the in-memory columns, streamed from a server-side cursor."""
+        # Imported here so NumPy is only loaded by processes that use the hot tier
+        from src.dashboard.overview.dao.top_recommendation_dao_mock import STORE_COLUMNS
+
+        columns = [getattr(AWSRecommendationConsolidate, column) for column in STORE_COLUMNS]
+        return select(*columns).execution_options(yield_per=self.batch_size)
+
+    def _open_session(self) -> Session:
+        if self._session_factory is not None:
+            return self._session_factory()
+        return get_read_session_factory()()
+
+    def reload(self) -> None:
+        """Load a fresh copy now, on the calling thread, and swap it in."""
+        from src.dashboard.overview.dao.top_recommendation_dao_mock import (
+            ColumnarRecommendationStore,
+            TopRecommendationDAOMock
+        )
+
+        db = self._open_session()
+        try:
+            # Rows and version from one snapshot, so the copy matches its tag
+            db.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+            version = DataVersionDAO(db).get_version()
+            store = ColumnarRecommendationStore.from_records(db.execute(self._load_statement()))
+        finally:
+            db.close()
+
+        with self._lock:
+            if self._current is None or version > self._current[0]:
+                self._current = (version, TopRecommendationDAOMock(store=store))
+            self._counters["reloads"] += 1
+        logger.info(f"Loaded {len(store)} recommendations into the hot tier at data version {version}")
+
+    def _reload(self) -> None:
+        try:
+            self.reload()
+            failed_at = None
+        except Exception as e:
+            logger.warning(f"Recommendation hot tier reload failed: {str(e)}")
+            failed_at = self._clock()
+        with self._lock:
+            self._failed_at = failed_at
+            if failed_at is not None:
+                self._counters["failures"] += 1
+            self._loading = None
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Snapshot of the hot tier state in this worker process.
+
+        Returns:
+            Dictionary with enabled, data_version, rows, loading, reloads and failures
+        """
+        with self._lock:
+            current = self._current
+            return {
+                "enabled": self.enabled,
+                "data_version": current[0] if current is not None else None,
+                "rows": len(current[1].store) if current is not None else 0,
+                "loading": self._loading is not None,
+                **self._counters
+            }
+
+
+recommendation_hot_tier = RecommendationHotTier(
+    RECOMMENDATION_HOT_TIER_ENABLED,
+    batch_size=RECOMMENDATION_HOT_TIER_BATCH_SIZE,
+    retry_seconds=RECOMMENDATION_HOT_TIER_RETRY_SECONDS
+)
@@ -0,0 +1,192 @@
+"""
+Async Data Access Object for Top Recommendations.
+Runs the same queries as TopRecommendationDAO through an AsyncSession.
+"""
+from typing import Any, AsyncIterator, List, Mapping, Optional, Sequence, Tuple
+from decimal import Decimal
+from sqlalchemy import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.dashboard.overview.dao.top_recommendation_dao import (
+    TOP_RECOMMENDATION_COLUMNS,
+    FacetCounts,
+    TopRecommendationDAO
+)
+from src.dashboard.overview.models.recommendation import AWSRecommendationConsolidate
+
+
+class TopRecommendationAsyncDAO:
+    """Async DAO class for Top Recommendation operations."""
+
+    def __init__(self, db: AsyncSession):
+        """Initialize the DAO with an async database session.
+        
+        Args:
+            db: SQLAlchemy async database session
+        """
+        self.db = db
+
+    async def get_top_recommendations(
+        self,
+        platform: str,
+        limit: int = 6
+    ) -> List[AWSRecommendationConsolidate]:
+        """
+        Fetch top recommendations based on potential savings (actual_cost - target_cost).
+        
+        Args:
+            platform: The platform filter (aws, databricks, snowflakes, google_cloud, all_platform)
+            limit: Maximum number of recommendations to return (default: 6)
+            
+        Returns:
+            List of top recommendations ordered by potential savings descending
+        """
+        statement = TopRecommendationDAO._top_recommendations_statement(platform, limit)
+        result = await self.db.execute(statement)
+        return list(result.scalars().all())
+
+    async def get_top_recommendation_rows(
+        self,
+        platform: str,
+        limit: int = 6,
+        columns: Sequence = TOP_RECOMMENDATION_COLUMNS
+    ) -> Sequence[Row]:
+        """
+        Fetch only the given columns of the top recommendations.
+        
+        Args:
+            platform: The platform filter (aws, databricks, snowflakes, google_cloud, all_platform)
+            limit: Maximum number of recommendations to return (default: 6)
+            columns: Model columns to select (default: the columns the service reads)
+            
+        Returns:
+            Rows with attribute access by column name, ordered by potential savings descending
+        """
+        statement = TopRecommendationDAO._top_recommendations_statement(platform, limit, columns)
+        result = await self.db.execute(statement)
+        return result.all()
+
+    async def get_top_recommendation_rows_batch(
+        self,
+        requests: Sequence[Tuple[str, int]],
+        columns: Sequence = TOP_RECOMMENDATION_COLUMNS
+    ) -> List[List[Row]]:
+        """
+        Fetch the top recommendations of several platforms in one round trip.
+        
+        Args:
+            requests: (platform, limit) pairs
+            columns: Model columns to select (default: the columns the service reads)
+            
+        Returns:
+            One list of rows per request, each ordered by potential savings descending
+        """
+        if not requests:
+            return []
+        statement = TopRecommendationDAO._top_recommendations_batch_statement(requests, columns)
+        result = await self.db.execute(statement)
+        return TopRecommendationDAO._group_batch_rows(result.all(), len(requests))
+
+    async def stream_recommendations(
+        self,
+        platform: str,
+        batch_size: int = 5000
+    ) -> AsyncIterator[Row]:
+        """
+        Stream every recommendation for a platform without loading them all.
+        
+        Args:
+            platform: The platform filter (aws, databricks, snowflakes, google_cloud, all_platform)
+            batch_size: Rows fetched from the cursor per round trip (default: 5000)
+            
+        Yields:
+            Rows with the EXPORT_COLUMNS, in storage order
+        """
+        statement = TopRecommendationDAO._export_statement(platform, batch_size)
+        result = await self.db.stream(statement)
+        async for row in result:
+            yield row
+
+    async def list_recommendations(
+        self,
+        platform: str,
+        limit: int = 50,
+        after: Optional[Tuple[Decimal, int]] = None,
+        filters: Optional[Mapping[str, Any]] = None
+    ) -> Sequence[Row]:
+        """
+        Fetch one keyset page of recommendations ordered by potential savings.
+        
+        Args:
+            platform: The platform filter (aws, databricks, snowflakes, google_cloud, all_platform)
+            limit: Maximum number of rows to return (default: 50)
+            after: (potential, id) of the last row of the previous page; None for the first page
+            filters: Filter DSL mapping (see TopRecommendationDAO._apply_filters)
+            
+        Returns:
+            Rows with id, type, description, recommendation and potential
+        """
+        statement = TopRecommendationDAO._list_recommendations_statement(platform, limit, after, filters)
+        result = await self.db.execute(statement)
+        return result.all()
+
+    async def get_facet_counts(
+        self,
+        platform: str,
+        facets: Sequence[str],
+        filters: Optional[Mapping[str, Any]] = None,
+        facet_limit: int = 20
+    ) -> FacetCounts:
+        """
+        Count the filtered recommendations by every facet in one grouped query.
+        
+        Args:
+            platform: The platform filter (aws, databricks, snowflakes, google_cloud, all_platform)
+            facets: Facet names (FACET_COLUMNS keys or "tag:<key>")
+            filters: Filter DSL mapping (see TopRecommendationDAO._apply_filters)
+            facet_limit: Maximum number of values returned per facet (default: 20)
+            
+        Returns:
+            (total, {facet: [(value, count), ...]}) with values by count descending
+        """
+        statement = TopRecommendationDAO._facet_counts_statement(platform, facets, filters)
+        result = await self.db.execute(statement)
+        return TopRecommendationDAO._parse_facet_rows(result.all(), facets, facet_limit)
+
+    async def search_recommendations(
+        self,
+        query_text: str,
+        platform: str,
+        limit: int = 20,
+        after: Optional[Tuple[float, int]] = None
+    ) -> Sequence[Row]:
+        """
+        Fetch one keyset page of recommendations matching a keyword search.
+        
+        Args:
+            query_text: Search text as typed by the user
+            platform: The platform filter (aws, databricks, snowflakes, google_cloud, all_platform)
+            limit: Maximum number of rows to return (default: 20)
+            after: (rank, id) of the last row of the previous page; None for the first page
+            
+        Returns:
+            Rows with id, type, description, recommendation, potential and rank,
+            most relevant first
+        """
+        statement = TopRecommendationDAO._search_statement(query_text, platform, limit, after)
+        result = await self.db.execute(statement)
+        return result.all()
+
+    async def get_recommendation_by_id(
+        self,
+        recommendation_id: int
+    ) -> Optional[AWSRecommendationConsolidate]:
+        """
+        Fetch a single recommendation by ID.
+        
+        Args:
+            recommendation_id: The ID of the recommendation
+            
+        Returns:
+            The recommendation if found, None otherwise
+        """
+        return await self.db.get(AWSRecommendationConsolidate, recommendation_id)
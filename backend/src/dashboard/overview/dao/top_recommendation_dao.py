@@ -2,15 +2,74 @@
 Data Access Object for Top Recommendations.
 Handles database queries for fetching top recommendations based on potential savings.
 """
-from typing import List, Optional
-from sqlalchemy import desc
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
+from decimal import Decimal
+from sqlalchemy import Row, Select, desc, func, literal, select, tuple_, union_all
+from sqlalchemy.sql.elements import ColumnElement
+from sqlalchemy.dialects.postgresql import REAL
 from sqlalchemy.orm import Session
-from src.dashboard.overview.models.recommendation import AWSRecommendationConsolidate
+from src.dashboard.overview.models.recommendation import (
+    SEARCH_CONFIG,
+    AWSRecommendationConsolidate
+)
+
+# Columns read by TopRecommendationService when formatting a response
+TOP_RECOMMENDATION_COLUMNS = (
+    AWSRecommendationConsolidate.type,
+    AWSRecommendationConsolidate.description,
+    AWSRecommendationConsolidate.recommendation,
+    AWSRecommendationConsolidate.potential
+)
+
+
+# Columns returned by the keyset-paginated recommendation listing
+RECOMMENDATION_LIST_COLUMNS = (
+    AWSRecommendationConsolidate.id,
+    AWSRecommendationConsolidate.type,
+    AWSRecommendationConsolidate.description,
+    AWSRecommendationConsolidate.recommendation,
+    AWSRecommendationConsolidate.potential
+)
+
+# Columns written by the recommendation export, in output order
+# (search_vector is derived from the text columns and not exported)
+EXPORT_COLUMNS = tuple(
+    column for column in AWSRecommendationConsolidate.__table__.columns
+    if column.name != "search_vector"
+)
+
+
+# Filter DSL keys matched with IN (any of the listed values)
+FILTER_COLUMNS = {
+    "account": AWSRecommendationConsolidate.account,
+    "region": AWSRecommendationConsolidate.region,
+    "service": AWSRecommendationConsolidate.service,
+    "sub_service": AWSRecommendationConsolidate.sub_service,
+    "risk_level": AWSRecommendationConsolidate.risk_level
+}
+
+# Facets countable by column; "tag:<key>" facets count values of one tags_json key
+FACET_COLUMNS = {
+    **FILTER_COLUMNS,
+    "actionable": AWSRecommendationConsolidate.actionable
+}
+TAG_FACET_PREFIX = "tag:"
+
+# (total, {facet: [(value, count), ...]}) as returned by get_facet_counts
+FacetCounts = Tuple[int, Dict[str, List[Tuple[Any, int]]]]
 
 
 class TopRecommendationDAO:
     """DAO class for Top Recommendation operations."""
 
+    # Map platform request key to the type field in database
+    PLATFORM_MAPPING = {
+        "aws": "AWS",
+        "databricks": "Databricks",
+        "snowflakes": "Snowflakes",
+        "google_cloud": "Google Cloud"
+    }
+
     def __init__(self, db: Session):
         """Initialize the DAO with a database session.
         
@@ -19,53 +78,504 @@ class TopRecommendationDAO:
         """
         self.db = db
 
-    def get_top_recommendations(
-        self,
+    @staticmethod
+    def _top_recommendations_statement(
         platform: str,
-        limit: int = 6
-    ) -> List[AWSRecommendationConsolidate]:
+        limit: int,
+        columns: Optional[Sequence] = None
+    ) -> Select:
         """
-        Fetch top recommendations based on potential savings (actual_cost - target_cost).
+        Build the top recommendations query shared by the sync and async DAOs.
         
         Args:
             platform: The platform filter (aws, databricks, snowflakes, google_cloud, all_platform)
-            limit: Maximum number of recommendations to return (default: 6)
+            limit: Maximum number of recommendations to return
+            columns: Columns to project; None selects full ORM entities
             
         Returns:
-            List of top recommendations ordered by potential savings descending
+            SELECT statement ordered by potential savings descending
+        """
+        query = select(*columns) if columns else select(AWSRecommendationConsolidate)
+        query = TopRecommendationDAO._apply_platform_filter(query, platform)
+        query = TopRecommendationDAO._apply_savings_filter(query)
+        
+        # Order by potential savings (descending), id as a stable tie-breaker, and limit results
+        return (
+            query
+            .order_by(
+                desc(AWSRecommendationConsolidate.potential),
+                desc(AWSRecommendationConsolidate.id)
+            )
+            .limit(limit)
+        )
+
+    @classmethod
+    def _apply_platform_filter(cls, query: Select, platform: str) -> Select:
         """
-        query = self.db.query(AWSRecommendationConsolidate)
+        Restrict a query to one platform.
         
+        Args:
+            query: SELECT over aws_recommendation_consolidate
+            platform: The platform filter (aws, databricks, snowflakes, google_cloud, all_platform)
+            
+        Returns:
+            The filtered SELECT statement
+        """
         # Apply platform filter if not 'all_platform'
         if platform and platform.lower() != "all_platform":
-            # Map platform key to the type field in database
-            platform_mapping = {
-                "aws": "AWS",
-                "databricks": "Databricks",
-                "snowflakes": "Snowflakes",
-                "google_cloud": "Google Cloud"
-            }
-            platform_type = platform_mapping.get(platform.lower())
+            platform_type = cls.PLATFORM_MAPPING.get(platform.lower())
             if platform_type:
-                query = query.filter(
+                query = query.where(
                     AWSRecommendationConsolidate.type == platform_type
                 )
+        return query
+
+    @staticmethod
+    def _apply_savings_filter(query: Select) -> Select:
+        """
+        Restrict a query to rows with positive potential savings.
         
-        # Filter for records with valid potential savings
-        query = query.filter(
+        Args:
+            query: SELECT over aws_recommendation_consolidate
+            
+        Returns:
+            The filtered SELECT statement
+        """
+        return query.where(
             AWSRecommendationConsolidate.potential.isnot(None),
             AWSRecommendationConsolidate.potential > 0
         )
+
+    @staticmethod
+    def _apply_filters(query: Select, filters: Optional[Mapping[str, Any]]) -> Select:
+        """
+        Restrict a query with the recommendation filter DSL.
+        
+        Every key narrows the result (AND); list values match any of the
+        listed values (IN). Keys:
+        
+        - account, region, service, sub_service, risk_level: list of values
+        - actionable: true or false
+        - tags: {key: value} pairs the tags_json document must contain,
+          matched with @> so the GIN jsonb_path_ops index applies
+        
+        Args:
+            query: SELECT over aws_recommendation_consolidate
+            filters: Filter DSL mapping; None or empty leaves the query unchanged
+            
+        Returns:
+            The filtered SELECT statement
+            
+        Raises:
+            ValueError: If a key is not part of the filter DSL
+        """
+        for key, value in (filters or {}).items():
+            if value is None:
+                continue
+            if key in FILTER_COLUMNS:
+                query = query.where(FILTER_COLUMNS[key].in_(list(value)))
+            elif key == "actionable":
+                query = query.where(AWSRecommendationConsolidate.actionable.is_(bool(value)))
+            elif key == "tags":
+                if value:
+                    query = query.where(AWSRecommendationConsolidate.tags_json.contains(dict(value)))
+            else:
+                raise ValueError(f"Unknown recommendation filter: {key}")
+        return query
+
+    @staticmethod
+    def _facet_expression(facet: str) -> ColumnElement:
+        """
+        Grouping expression of one facet.
+        
+        Args:
+            facet: A FACET_COLUMNS key or "tag:<key>"
+            
+        Returns:
+            Column or tags_json ->> key expression
+            
+        Raises:
+            ValueError: If the facet is unknown
+        """
+        if facet in FACET_COLUMNS:
+            return FACET_COLUMNS[facet]
+        if facet.startswith(TAG_FACET_PREFIX) and len(facet) > len(TAG_FACET_PREFIX):
+            return AWSRecommendationConsolidate.tags_json[facet[len(TAG_FACET_PREFIX):]].astext
+        raise ValueError(f"Unknown recommendation facet: {facet}")
+
+    @staticmethod
+    def _facet_counts_statement(
+        platform: str,
+        facets: Sequence[str],
+        filters: Optional[Mapping[str, Any]] = None
+    ) -> Select:
+        """
+        Build one grouped query counting the filtered rows by every facet.
+        
+        GROUPING SETS ((facet_1), ..., (facet_n), ()) aggregates all facets and
+        the total in a single scan of the filtered rows; GROUPING() tells the
+        result rows of each set apart.
+        
+        Args:
+            platform: The platform filter (aws, databricks, snowflakes, google_cloud, all_platform)
+            facets: Facet names (FACET_COLUMNS keys or "tag:<key>")
+            filters: Filter DSL mapping applied before counting
+            
+        Returns:
+            SELECT of one column per facet, grouping and count
+        """
+        expressions = [TopRecommendationDAO._facet_expression(facet) for facet in facets]
+        query = select(
+            *(expression.label(f"facet_{i}") for i, expression in enumerate(expressions)),
+            func.grouping(*expressions).label("grouping"),
+            func.count().label("count")
+        )
+        query = TopRecommendationDAO._apply_platform_filter(query, platform)
+        query = TopRecommendationDAO._apply_savings_filter(query)
+        query = TopRecommendationDAO._apply_filters(query, filters)
+        return query.group_by(func.grouping_sets(*expressions, tuple_()))
+
+    @staticmethod
+    def _parse_facet_rows(
+        rows: Sequence[Row],
+        facets: Sequence[str],
+        facet_limit: int
+    ) -> FacetCounts:
+        """
+        Split the rows of _facet_counts_statement into per-facet counts.
+        
+        Args:
+            rows: Result rows of _facet_counts_statement
+            facets: Facet names the statement was built with
+            facet_limit: Maximum number of values kept per facet
+            
+        Returns:
+            (total, {facet: [(value, count), ...]}) with values by count descending
+        """
+        width = len(facets)
+        total = 0
+        counts: Dict[str, List[Tuple[Any, int]]] = {facet: [] for facet in facets}
+        for row in rows:
+            # Bit (width - 1 - i) of GROUPING() is 0 only in the set grouping facet i
+            grouped = [i for i in range(width) if not (row.grouping >> (width - 1 - i)) & 1]
+            if not grouped:
+                total = row.count
+                continue
+            index = grouped[0]
+            counts[facets[index]].append((row[index], row.count))
+
+        for facet, values in counts.items():
+            values.sort(key=lambda item: (-item[1], str(item[0])))
+            del values[facet_limit:]
+        return total, counts
+
+    @staticmethod
+    def _list_recommendations_statement(
+        platform: str,
+        limit: int,
+        after: Optional[Tuple[Decimal, int]] = None,
+        filters: Optional[Mapping[str, Any]] = None
+    ) -> Select:
+        """
+        Build one keyset page of recommendations ordered by (potential, id) descending.
+        
+        Args:
+            platform: The platform filter (aws, databricks, snowflakes, google_cloud, all_platform)
+            limit: Maximum number of rows to return
+            after: (potential, id) of the last row of the previous page; None for the first page
+            filters: Filter DSL mapping (see _apply_filters); None for no extra filters
+            
+        Returns:
+            SELECT statement for the page
+        """
+        query = TopRecommendationDAO._apply_platform_filter(
+            select(*RECOMMENDATION_LIST_COLUMNS),
+            platform
+        )
+        query = TopRecommendationDAO._apply_savings_filter(query)
+        query = TopRecommendationDAO._apply_filters(query, filters)
+        
+        # Seek past the previous page instead of OFFSET, so every page costs the same
+        if after is not None:
+            query = query.where(
+                tuple_(
+                    AWSRecommendationConsolidate.potential,
+                    AWSRecommendationConsolidate.id
+                ) < tuple_(*after)
+            )
         
-        # Order by potential savings (descending) and limit results
-        recommendations = (
+        return (
             query
-            .order_by(desc(AWSRecommendationConsolidate.potential))
+            .order_by(
+                desc(AWSRecommendationConsolidate.potential),
+                desc(AWSRecommendationConsolidate.id)
+            )
             .limit(limit)
-            .all()
         )
+
+    @staticmethod
+    def _search_statement(
+        query_text: str,
+        platform: str,
+        limit: int,
+        after: Optional[Tuple[float, int]] = None
+    ) -> Select:
+        """
+        Build one keyset page of full-text search results ordered by (rank, id) descending.
+        
+        Matching uses the GIN index on search_vector; websearch_to_tsquery
+        accepts free text ("reserved instances", "ebs -snapshot") and never
+        raises a syntax error.
         
-        return recommendations
+        Args:
+            query_text: Search text as typed by the user
+            platform: The platform filter (aws, databricks, snowflakes, google_cloud, all_platform)
+            limit: Maximum number of rows to return
+            after: (rank, id) of the last row of the previous page; None for the first page
+            
+        Returns:
+            SELECT of RECOMMENDATION_LIST_COLUMNS plus rank
+        """
+        ts_query = func.websearch_to_tsquery(SEARCH_CONFIG, query_text)
+        rank = func.ts_rank_cd(AWSRecommendationConsolidate.search_vector, ts_query)
+
+        query = TopRecommendationDAO._apply_platform_filter(
+            select(*RECOMMENDATION_LIST_COLUMNS, rank.label("rank")),
+            platform
+        ).where(AWSRecommendationConsolidate.search_vector.bool_op("@@")(ts_query))
+
+        # ts_rank_cd returns real; compare as real so the cursor value matches exactly
+        if after is not None:
+            query = query.where(
+                tuple_(rank, AWSRecommendationConsolidate.id)
+                < tuple_(literal(after[0], REAL), literal(after[1]))
+            )
+
+        return query.order_by(
+            desc(rank),
+            desc(AWSRecommendationConsolidate.id)
+        ).limit(limit)
+
+    def get_top_recommendations(
+        self,
+        platform: str,
+        limit: int = 6
+    ) -> List[AWSRecommendationConsolidate]:
+        """
+        Fetch top recommendations based on potential savings (actual_cost - target_cost).
+        
+        Args:
+            platform: The platform filter (aws, databricks, snowflakes, google_cloud, all_platform)
+            limit: Maximum number of recommendations to return (default: 6)
+            
+        Returns:
+            List of top recommendations ordered by potential savings descending
+        """
+        statement = self._top_recommendations_statement(platform, limit)
+        return list(self.db.execute(statement).scalars().all())
+
+    def get_top_recommendation_rows(
+        self,
+        platform: str,
+        limit: int = 6,
+        columns: Sequence = TOP_RECOMMENDATION_COLUMNS
+    ) -> Sequence[Row]:
+        """
+        Fetch only the given columns of the top recommendations.
+        
+        Returns lightweight row tuples instead of ORM entities, so large
+        columns (tags_json, justifications, configuration blobs) are never
+        transferred and no identity-map bookkeeping is done.
+        
+        Args:
+            platform: The platform filter (aws, databricks, snowflakes, google_cloud, all_platform)
+            limit: Maximum number of recommendations to return (default: 6)
+            columns: Model columns to select (default: the columns the service reads)
+            
+        Returns:
+            Rows with attribute access by column name, ordered by potential savings descending
+        """
+        statement = self._top_recommendations_statement(platform, limit, columns)
+        return self.db.execute(statement).all()
+
+    @staticmethod
+    def _top_recommendations_batch_statement(
+        requests: Sequence[Tuple[str, int]],
+        columns: Sequence = TOP_RECOMMENDATION_COLUMNS
+    ) -> Select:
+        """
+        Build one query returning the top N of several platforms.
+        
+        Each (platform, limit) is its own LIMITed branch, so every branch is
+        an index-ordered top-N scan; the branches are combined with UNION ALL
+        and tagged with their position in requests.
+        
+        Args:
+            requests: (platform, limit) pairs
+            columns: Model columns to select (default: the columns the service reads)
+            
+        Returns:
+            SELECT of batch_index plus columns, ordered by batch_index then potential savings
+        """
+        branch_columns = (*columns, AWSRecommendationConsolidate.id)
+        branches = []
+        for index, (platform, limit) in enumerate(requests):
+            top_n = TopRecommendationDAO._top_recommendations_statement(
+                platform, limit, branch_columns
+            ).subquery()
+            branches.append(select(literal(index).label("batch_index"), *top_n.c))
+
+        combined = union_all(*branches).subquery()
+        return select(combined).order_by(
+            combined.c.batch_index,
+            desc(combined.c.potential),
+            desc(combined.c.id)
+        )
+
+    @staticmethod
+    def _group_batch_rows(rows: Sequence[Row], size: int) -> List[List[Row]]:
+        """
+        Split rows of the batch query back into one list per request.
+        
+        Args:
+            rows: Rows of _top_recommendations_batch_statement
+            size: Number of requests in the batch
+            
+        Returns:
+            Lists of rows, in request order
+        """
+        groups: List[List[Row]] = [[] for _ in range(size)]
+        for row in rows:
+            groups[row.batch_index].append(row)
+        return groups
+
+    def get_top_recommendation_rows_batch(
+        self,
+        requests: Sequence[Tuple[str, int]],
+        columns: Sequence = TOP_RECOMMENDATION_COLUMNS
+    ) -> List[List[Row]]:
+        """
+        Fetch the top recommendations of several platforms in one round trip.
+        
+        Args:
+            requests: (platform, limit) pairs
+            columns: Model columns to select (default: the columns the service reads)
+            
+        Returns:
+            One list of rows per request, each ordered by potential savings descending
+        """
+        if not requests:
+            return []
+        statement = self._top_recommendations_batch_statement(requests, columns)
+        return self._group_batch_rows(self.db.execute(statement).all(), len(requests))
+
+    @staticmethod
+    def _export_statement(platform: str, batch_size: int) -> Select:
+        """
+        Build the full-table export query, streamed in batches from a server-side cursor.
+        
+        Args:
+            platform: The platform filter (aws, databricks, snowflakes, google_cloud, all_platform)
+            batch_size: Rows fetched from the cursor per round trip
+            
+        Returns:
+            Unordered SELECT statement over EXPORT_COLUMNS; no ORDER BY so
+            Postgres can stream a sequential scan without sorting the table
+        """
+        query = TopRecommendationDAO._apply_platform_filter(
+            select(*EXPORT_COLUMNS),
+            platform
+        )
+        return query.execution_options(yield_per=batch_size)
+
+    def stream_recommendations(
+        self,
+        platform: str,
+        batch_size: int = 5000
+    ) -> Iterator[Row]:
+        """
+        Stream every recommendation for a platform without loading them all.
+        
+        Uses a server-side cursor (yield_per implies stream_results), so
+        memory stays bounded by batch_size whatever the table size.
+        
+        Args:
+            platform: The platform filter (aws, databricks, snowflakes, google_cloud, all_platform)
+            batch_size: Rows fetched from the cursor per round trip (default: 5000)
+            
+        Yields:
+            Rows with the EXPORT_COLUMNS, in storage order
+        """
+        statement = self._export_statement(platform, batch_size)
+        yield from self.db.execute(statement)
+
+    def list_recommendations(
+        self,
+        platform: str,
+        limit: int = 50,
+        after: Optional[Tuple[Decimal, int]] = None,
+        filters: Optional[Mapping[str, Any]] = None
+    ) -> Sequence[Row]:
+        """
+        Fetch one keyset page of recommendations ordered by potential savings.
+        
+        Args:
+            platform: The platform filter (aws, databricks, snowflakes, google_cloud, all_platform)
+            limit: Maximum number of rows to return (default: 50)
+            after: (potential, id) of the last row of the previous page; None for the first page
+            filters: Filter DSL mapping (see TopRecommendationDAO._apply_filters)
+            
+        Returns:
+            Rows with id, type, description, recommendation and potential
+        """
+        statement = self._list_recommendations_statement(platform, limit, after, filters)
+        return self.db.execute(statement).all()
+
+    def get_facet_counts(
+        self,
+        platform: str,
+        facets: Sequence[str],
+        filters: Optional[Mapping[str, Any]] = None,
+        facet_limit: int = 20
+    ) -> FacetCounts:
+        """
+        Count the filtered recommendations by every facet in one grouped query.
+        
+        Args:
+            platform: The platform filter (aws, databricks, snowflakes, google_cloud, all_platform)
+            facets: Facet names (FACET_COLUMNS keys or "tag:<key>")
+            filters: Filter DSL mapping (see TopRecommendationDAO._apply_filters)
+            facet_limit: Maximum number of values returned per facet (default: 20)
+            
+        Returns:
+            (total, {facet: [(value, count), ...]}) with values by count descending
+        """
+        statement = self._facet_counts_statement(platform, facets, filters)
+        rows = self.db.execute(statement).all()
+        return self._parse_facet_rows(rows, facets, facet_limit)
+
+    def search_recommendations(
+        self,
+        query_text: str,
+        platform: str,
+        limit: int = 20,
+        after: Optional[Tuple[float, int]] = None
+    ) -> Sequence[Row]:
+        """
+        Fetch one keyset page of recommendations matching a keyword search.
+        
+        Args:
+            query_text: Search text as typed by the user
+            platform: The platform filter (aws, databricks, snowflakes, google_cloud, all_platform)
+            limit: Maximum number of rows to return (default: 20)
+            after: (rank, id) of the last row of the previous page; None for the first page
+            
+        Returns:
+            Rows with id, type, description, recommendation, potential and rank,
+            most relevant first
+        """
+        statement = self._search_statement(query_text, platform, limit, after)
+        return self.db.execute(statement).all()
 
     def get_recommendation_by_id(
         self,
@@ -80,8 +590,4 @@ class TopRecommendationDAO:
         Returns:
             The recommendation if found, None otherwise
         """
-        return (
-            self.db.query(AWSRecommendationConsolidate)
-            .filter(AWSRecommendationConsolidate.id == recommendation_id)
-            .first()
-        )
+        return self.db.get(AWSRecommendationConsolidate, recommendation_id)
@@ -0,0 +1,774 @@
+"""
+In-memory, columnar implementation of the TopRecommendationDAO interface.
+
+Recommendations are held as NumPy arrays, one per AWSRecommendationConsolidate
+column (text columns dictionary-encoded), so millions of rows fit in memory
+and a top-N query is a vectorized argpartition over one platform's rows.
+
+Used by main_mock.py to run and load-test the API without PostgreSQL.
+"""
+from collections import namedtuple
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
+import csv
+import logging
+import os
+import re
+
+import numpy as np
+
+from src.config import load_environment
+from src.dashboard.overview.dao.top_recommendation_dao import (
+    EXPORT_COLUMNS,
+    FILTER_COLUMNS,
+    TAG_FACET_PREFIX,
+    FacetCounts,
+    RECOMMENDATION_LIST_COLUMNS,
+    TOP_RECOMMENDATION_COLUMNS,
+    TopRecommendationDAO
+)
+from src.dashboard.overview.models.recommendation import AWSRecommendationConsolidate
+
+load_environment()
+
+logger = logging.getLogger(__name__)
+
+# Columns held in memory; large or per-row unique text (configuration blobs,
+# justifications, tags_json, resource names) is left out and reads as None
+TEXT_COLUMNS = (
+    "type", "account", "region", "service", "sub_service",
+    "recommendation", "description", "risk_level", "impact"
+)
+NUMERIC_COLUMNS = ("potential", "actual_cost", "target_cost")
+BOOLEAN_COLUMNS = ("actionable",)
+STORE_COLUMNS = ("id", *TEXT_COLUMNS, *NUMERIC_COLUMNS, *BOOLEAN_COLUMNS)
+
+# Keyword search weights, in the order of the search_vector setweight labels
+SEARCH_WEIGHTS = (("recommendation", 1.0), ("description", 0.4))
+
+# Generated datasets: platform mix and recommendation wording of benchmarks.seed_dataset
+PLATFORM_WEIGHTS = (
+    ("AWS", 0.80),
+    ("Google Cloud", 0.08),
+    ("Databricks", 0.07),
+    ("Snowflakes", 0.05)
+)
+GENERATED_RECOMMENDATIONS = (
+    ("Right-size instance", "Recommended to right-size {platform} resources based on 30-day utilization"),
+    ("Delete unused volume", "Delete unused {platform} volumes - no attachments found"),
+    ("Purchase Reserved Instances", "Convert On-Demand capacity to Reserved Instances for long-running {platform} workloads"),
+    ("Configure auto-termination", "Schedule {platform} cluster auto-termination during non-business hours"),
+    ("Reduce warehouse size", "Reduce {platform} warehouse size based on usage patterns"),
+    ("Migrate generation", "Migrate {platform} resources to a newer generation for better price-performance")
+)
+LEVELS = ("Low", "Medium", "High")
+
+# Mock mode dataset: a CSV (e.g. from the export endpoint) or generated rows
+MOCK_RECOMMENDATION_CSV = os.getenv("MOCK_RECOMMENDATION_CSV", "")
+MOCK_RECOMMENDATION_ROWS = int(os.getenv("MOCK_RECOMMENDATION_ROWS", "100000"))
+MOCK_RECOMMENDATION_SEED = int(os.getenv("MOCK_RECOMMENDATION_SEED", "42"))
+
+_EMPTY_POSITIONS = np.empty(0, dtype=np.int64)
+_EMPTY_VALUES = np.empty(0, dtype=np.float64)
+
+
+@lru_cache(maxsize=64)
+def _row_type(fields: Tuple[str, ...]) -> type:
+    """Row tuple class with attribute access, like SQLAlchemy's Row."""
+    return namedtuple("RecommendationRow", fields)
+
+
+def _column_key(column: Any) -> str:
+    """Attribute name of a model column (InstrumentedAttribute or Column) or a plain name."""
+    return column if isinstance(column, str) else column.key
+
+
+def _encode_text(values: Sequence[Optional[str]]) -> Tuple[np.ndarray, np.ndarray]:
+    """Dictionary-encode text as int32 codes (-1 for NULL) and a vocabulary array."""
+    vocabulary: Dict[str, int] = {}
+    codes = np.fromiter(
+        (-1 if value is None else vocabulary.setdefault(value, len(vocabulary)) for value in values),
+        dtype=np.int32,
+        count=len(values)
+    )
+    return codes, np.array(list(vocabulary), dtype=object)
+
+
+def _encode_numeric(values: Sequence[Any]) -> np.ndarray:
+    """Encode Numeric values as float64 (NaN for NULL)."""
+    return np.fromiter(
+        (np.nan if value is None else float(value) for value in values),
+        dtype=np.float64,
+        count=len(values)
+    )
+
+
+def _encode_boolean(values: Sequence[Optional[bool]]) -> np.ndarray:
+    """Encode booleans as int8 (1, 0, -1 for NULL)."""
+    return np.fromiter(
+        (-1 if value is None else int(bool(value)) for value in values),
+        dtype=np.int8,
+        count=len(values)
+    )
+
+
+def _parse_csv_value(column: str, value: str) -> Any:
+    """Convert a CSV field of the export format to its column type."""
+    if value == "":
+        return None
+    if column in BOOLEAN_COLUMNS:
+        return value.lower() in ("true", "t", "1")
+    if column == "id":
+        return int(value)
+    return value
+
+
+class ColumnarRecommendationStore:
+    """Read-only columnar copy of aws_recommendation_consolidate."""
+
+    def __init__(
+        self,
+        ids: np.ndarray,
+        text_codes: Dict[str, np.ndarray],
+        vocabularies: Dict[str, np.ndarray],
+        numerics: Dict[str, np.ndarray],
+        booleans: Dict[str, np.ndarray]
+    ):
+        """Index the columns for top-N and id lookups.
+
+        Args:
+            ids: Primary keys (int64)
+            text_codes: Dictionary codes per text column (-1 for NULL)
+            vocabularies: Distinct values per text column, indexed by code
+            numerics: Float64 values per numeric column (NaN for NULL)
+            booleans: Int8 values per boolean column (-1 for NULL)
+        """
+        self.ids = ids
+        self.text_codes = text_codes
+        self.vocabularies = vocabularies
+        self.numerics = numerics
+        self.booleans = booleans
+        self.potential = numerics["potential"]
+
+        # Rows eligible for top-N (potential > 0; NaN compares False), overall and
+        # per type, with their negated potential laid out contiguously so a query
+        # runs argpartition without gathering values first
+        positive = np.flatnonzero(self.potential > 0)
+        type_codes = text_codes["type"][positive]
+        self._type_codes = {value: code for code, value in enumerate(vocabularies["type"])}
+        self._candidates_by_type: Dict[Optional[int], Tuple[np.ndarray, np.ndarray]] = {
+            None: (positive, -self.potential[positive])
+        }
+        for code in range(len(vocabularies["type"])):
+            positions = positive[type_codes == code]
+            self._candidates_by_type[code] = (positions, -self.potential[positions])
+        self._id_order = np.argsort(ids, kind="stable")
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @classmethod
+    def from_columns(cls, columns: Dict[str, Sequence[Any]]) -> "ColumnarRecommendationStore":
+        """
+        Build a store from Python value lists keyed by column name.
+
+        Args:
+            columns: Values per column; missing columns are all NULL and a
+                missing id column is numbered from 1
+
+        Returns:
+            The store
+        """
+        size = len(next(iter(columns.values()))) if columns else 0
+        nulls = [None] * size
+
+        if columns.get("id") is not None:
+            ids = np.fromiter(columns["id"], dtype=np.int64, count=size)
+        else:
+            ids = np.arange(1, size + 1, dtype=np.int64)
+
+        text_codes, vocabularies = {}, {}
+        for column in TEXT_COLUMNS:
+            text_codes[column], vocabularies[column] = _encode_text(columns.get(column, nulls))
+
+        return cls(
+            ids=ids,
+            text_codes=text_codes,
+            vocabularies=vocabularies,
+            numerics={column: _encode_numeric(columns.get(column, nulls)) for column in NUMERIC_COLUMNS},
+            booleans={column: _encode_boolean(columns.get(column, nulls)) for column in BOOLEAN_COLUMNS}
+        )
+
+    @classmethod
+    def from_records(cls, records: Iterable[Any]) -> "ColumnarRecommendationStore":
+        """
+        Build a store from rows, entities or dictionaries.
+
+        Args:
+            records: Objects exposing the STORE_COLUMNS as attributes, or dicts
+
+        Returns:
+            The store
+        """
+        columns: Dict[str, List[Any]] = {column: [] for column in STORE_COLUMNS}
+        for record in records:
+            get = record.get if isinstance(record, dict) else lambda name: getattr(record, name, None)
+            for column, values in columns.items():
+                values.append(get(column))
+
+        if all(value is None for value in columns["id"]):
+            del columns["id"]
+        return cls.from_columns(columns)
+
+    @classmethod
+    def from_csv(cls, path: str) -> "ColumnarRecommendationStore":
+        """
+        Load a store from a CSV with a header of column names.
+
+        The recommendation export (format=csv) produces this layout; columns
+        not held in memory are skipped.
+
+        Args:
+            path: CSV file path
+
+        Returns:
+            The store
+        """
+        with open(path, newline="") as handle:
+            reader = csv.reader(handle)
+            header = next(reader)
+            wanted = [(index, name) for index, name in enumerate(header) if name in STORE_COLUMNS]
+            columns: Dict[str, List[Any]] = {name: [] for _, name in wanted}
+            for record in reader:
+                for index, name in wanted:
+                    columns[name].append(_parse_csv_value(name, record[index]))
+        return cls.from_columns(columns)
+
+    @classmethod
+    def generate(cls, rows: int, seed: int = 42) -> "ColumnarRecommendationStore":
+        """
+        Generate a deterministic dataset directly as arrays (millions of rows in seconds).
+
+        Args:
+            rows: Number of rows
+            seed: Random seed
+
+        Returns:
+            The store
+        """
+        rng = np.random.default_rng(seed)
+        platforms = np.array([name for name, _ in PLATFORM_WEIGHTS], dtype=object)
+        weights = np.array([weight for _, weight in PLATFORM_WEIGHTS])
+        type_codes = rng.choice(len(platforms), size=rows, p=weights / weights.sum()).astype(np.int32)
+        recommendation_codes = rng.integers(len(GENERATED_RECOMMENDATIONS), size=rows, dtype=np.int32)
+
+        # One description per (recommendation, platform) pair
+        descriptions = np.array(
+            [
+                template.format(platform=platform)
+                for _, template in GENERATED_RECOMMENDATIONS
+                for platform in platforms
+            ],
+            dtype=object
+        )
+        accounts = np.array(
+            [str(account) for account in rng.integers(10 ** 11, 10 ** 12, size=200)],
+            dtype=object
+        )
+
+        actual = np.round(rng.lognormal(5, 1.2, size=rows), 4)
+        target = np.round(actual * rng.uniform(0.0, 0.95, size=rows), 4)
+        levels = np.array(LEVELS, dtype=object)
+
+        return cls(
+            ids=np.arange(1, rows + 1, dtype=np.int64),
+            text_codes={
+                "type": type_codes,
+                "account": rng.integers(len(accounts), size=rows, dtype=np.int32),
+                "recommendation": recommendation_codes,
+                "description": recommendation_codes * len(platforms) + type_codes,
+                "risk_level": rng.integers(len(levels), size=rows, dtype=np.int32),
+                "impact": rng.integers(len(levels), size=rows, dtype=np.int32),
+                **{
+                    column: np.full(rows, -1, dtype=np.int32)
+                    for column in ("region", "service", "sub_service")
+                }
+            },
+            vocabularies={
+                "type": platforms,
+                "account": accounts,
+                "recommendation": np.array([title for title, _ in GENERATED_RECOMMENDATIONS], dtype=object),
+                "description": descriptions,
+                "risk_level": levels,
+                "impact": levels,
+                **{column: np.empty(0, dtype=object) for column in ("region", "service", "sub_service")}
+            },
+            numerics={
+                "potential": np.round(actual - target, 4),
+                "actual_cost": actual,
+                "target_cost": target
+            },
+            booleans={"actionable": (rng.random(rows) < 0.7).astype(np.int8)}
+        )
+
+    def _candidates(self, platform_type: Optional[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """Positions and negated potential of rows with positive potential, for one type or all."""
+        if platform_type is None:
+            return self._candidates_by_type[None]
+        code = self._type_codes.get(platform_type)
+        if code is None:
+            return _EMPTY_POSITIONS, _EMPTY_VALUES
+        return self._candidates_by_type[code]
+
+    def filter_mask(self, filters: Optional[Mapping[str, Any]]) -> Optional[np.ndarray]:
+        """
+        Boolean mask of the rows matching the recommendation filter DSL.
+
+        Args:
+            filters: Filter DSL mapping (see TopRecommendationDAO._apply_filters);
+                tag filters match no rows since tags_json is not held in memory
+
+        Returns:
+            Mask over all rows, or None when nothing is filtered
+
+        Raises:
+            ValueError: If a key is not part of the filter DSL
+        """
+        mask = None
+        for key, value in (filters or {}).items():
+            if value is None:
+                continue
+            if key in FILTER_COLUMNS:
+                vocabulary = {text: code for code, text in enumerate(self.vocabularies[key])}
+                codes = [vocabulary[text] for text in value if text in vocabulary]
+                matched = np.isin(self.text_codes[key], codes)
+            elif key == "actionable":
+                matched = self.booleans["actionable"] == int(bool(value))
+            elif key == "tags":
+                if not value:
+                    continue
+                matched = np.zeros(len(self.ids), dtype=bool)
+            else:
+                raise ValueError(f"Unknown recommendation filter: {key}")
+            mask = matched if mask is None else mask & matched
+        return mask
+
+    def facet_counts(
+        self,
+        platform_type: Optional[str],
+        facets: Sequence[str],
+        mask: Optional[np.ndarray] = None,
+        facet_limit: int = 20
+    ) -> Tuple[int, Dict[str, List[Tuple[Any, int]]]]:
+        """
+        Count rows with positive potential by every facet.
+
+        Args:
+            platform_type: DB type to filter on; None for every platform
+            facets: Facet names (FACET_COLUMNS keys or "tag:<key>")
+            mask: Row mask from filter_mask; None for every row
+            facet_limit: Maximum number of values kept per facet
+
+        Returns:
+            (total, {facet: [(value, count), ...]}) with values by count descending
+        """
+        candidates, _ = self._candidates(platform_type)
+        if mask is not None:
+            candidates = candidates[mask[candidates]]
+        total = int(candidates.size)
+
+        counts: Dict[str, List[Tuple[Any, int]]] = {}
+        for facet in facets:
+            if facet in self.text_codes:
+                # code -1 (NULL) is counted in the last bucket
+                size = len(self.vocabularies[facet])
+                codes = self.text_codes[facet][candidates]
+                tally = np.bincount(np.where(codes < 0, size, codes), minlength=size + 1)
+                labels = [*self.vocabularies[facet], None]
+            elif facet in self.booleans:
+                tally = np.bincount(self.booleans[facet][candidates] + 1, minlength=3)
+                labels = [None, False, True]
+            elif facet.startswith(TAG_FACET_PREFIX) and len(facet) > len(TAG_FACET_PREFIX):
+                tally, labels = np.array([total]), [None]
+            else:
+                raise ValueError(f"Unknown recommendation facet: {facet}")
+            values = [(label, int(count)) for label, count in zip(labels, tally.tolist()) if count]
+            values.sort(key=lambda item: (-item[1], str(item[0])))
+            counts[facet] = values[:facet_limit]
+        return total, counts
+
+    def top_positions(
+        self,
+        platform_type: Optional[str],
+        limit: int,
+        after: Optional[Tuple[Decimal, int]] = None,
+        mask: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Positions of the top rows by (potential, id) descending.
+
+        argpartition finds the limit-th largest potential in linear time;
+        only rows at or above it are sorted, so the cost stays close to one
+        pass over the platform's rows whatever the limit.
+
+        Args:
+            platform_type: DB type to filter on; None for every platform
+            limit: Maximum number of rows
+            after: (potential, id) to seek past, as in keyset pagination
+            mask: Row mask from filter_mask; None for every row
+
+        Returns:
+            Row positions in result order
+        """
+        candidates, negated = self._candidates(platform_type)
+        if mask is not None:
+            keep = mask[candidates]
+            candidates, negated = candidates[keep], negated[keep]
+        if after is not None:
+            after_negated, after_id = -float(after[0]), int(after[1])
+            keep = (negated > after_negated) | (
+                (negated == after_negated) & (self.ids[candidates] < after_id)
+            )
+            candidates, negated = candidates[keep], negated[keep]
+
+        if limit <= 0 or candidates.size == 0:
+            return _EMPTY_POSITIONS
+
+        if candidates.size > limit:
+            top = np.argpartition(negated, limit - 1)[:limit]
+            # Keep every row tied with the cut-off so the id tie-break is exact
+            keep = np.flatnonzero(negated <= negated[top].max())
+            candidates, negated = candidates[keep], negated[keep]
+
+        order = np.lexsort((-self.ids[candidates], negated))[:limit]
+        return candidates[order]
+
+    def search_positions(
+        self,
+        query_text: str,
+        platform_type: Optional[str],
+        limit: int,
+        after: Optional[Tuple[float, int]] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Positions and ranks of rows matching the words of a search, best first.
+
+        Matching is done once per distinct text value, then mapped to rows
+        through the dictionary codes.
+
+        Args:
+            query_text: Search text; words are matched case-insensitively
+            platform_type: DB type to filter on; None for every platform
+            limit: Maximum number of positions to return
+            after: (rank, id) keyset position to continue after
+
+        Returns:
+            (positions, ranks) ordered by rank then id, both descending
+        """
+        words = set(re.findall(r"[a-z0-9]+", query_text.lower()))
+        if not words:
+            return _EMPTY_POSITIONS, _EMPTY_VALUES
+
+        ranks = np.zeros(len(self.ids), dtype=np.float64)
+        for column, weight in SEARCH_WEIGHTS:
+            vocabulary_ranks = np.array(
+                [
+                    weight * len(words.intersection(re.findall(r"[a-z0-9]+", value.lower())))
+                    for value in self.vocabularies[column]
+                ] + [0.0],
+                dtype=np.float64
+            )
+            # code -1 (NULL) indexes the trailing zero
+            ranks += vocabulary_ranks[self.text_codes[column]]
+
+        candidates = self.positions(platform_type)
+        candidates = candidates[ranks[candidates] > 0]
+        if after is not None:
+            after_rank, after_id = after
+            candidate_ranks = ranks[candidates]
+            candidates = candidates[
+                (candidate_ranks < after_rank)
+                | ((candidate_ranks == after_rank) & (self.ids[candidates] < after_id))
+            ]
+
+        order = np.lexsort((-self.ids[candidates], -ranks[candidates]))[:limit]
+        positions = candidates[order]
+        return positions, ranks[positions]
+
+    def position_of(self, recommendation_id: int) -> Optional[int]:
+        """Position of a primary key, or None if absent."""
+        index = np.searchsorted(self.ids, recommendation_id, sorter=self._id_order)
+        if index < len(self.ids) and self.ids[self._id_order[index]] == recommendation_id:
+            return int(self._id_order[index])
+        return None
+
+    def positions(self, platform_type: Optional[str]) -> np.ndarray:
+        """Positions of every row of a type (or all rows), in storage order."""
+        if platform_type is None:
+            return np.arange(len(self.ids))
+        code = self._type_codes.get(platform_type)
+        if code is None:
+            return _EMPTY_POSITIONS
+        return np.flatnonzero(self.text_codes["type"] == code)
+
+    def _column_values(self, column: str, positions: np.ndarray) -> List[Any]:
+        """Decode one column at the given positions to Python values."""
+        if column == "id":
+            return self.ids[positions].tolist()
+        if column in self.text_codes:
+            codes = self.text_codes[column][positions]
+            vocabulary = self.vocabularies[column]
+            return [None if code < 0 else vocabulary[code] for code in codes.tolist()]
+        if column in self.numerics:
+            return [
+                None if value != value else Decimal(f"{value:.4f}")
+                for value in self.numerics[column][positions].tolist()
+            ]
+        if column in self.booleans:
+            return [None if value < 0 else bool(value) for value in self.booleans[column][positions].tolist()]
+        return [None] * len(positions)
+
+    def rows(self, positions: np.ndarray, columns: Sequence[Any]) -> List[tuple]:
+        """
+        Materialize rows with attribute access by column name.
+
+        Args:
+            positions: Row positions
+            columns: Model columns or names to return
+
+        Returns:
+            Row tuples in position order
+        """
+        fields = tuple(_column_key(column) for column in columns)
+        row_type = _row_type(fields)
+        values = [self._column_values(field, positions) for field in fields]
+        return [row_type(*row) for row in zip(*values)]
+
+    def entities(self, positions: np.ndarray) -> List[AWSRecommendationConsolidate]:
+        """Materialize transient model instances with the in-memory columns."""
+        return [
+            AWSRecommendationConsolidate(**row._asdict())
+            for row in self.rows(positions, STORE_COLUMNS)
+        ]
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Size of the store.
+
+        Returns:
+            Dictionary with row count and approximate array bytes
+        """
+        arrays = [self.ids, *self.text_codes.values(), *self.numerics.values(), *self.booleans.values()]
+        return {"rows": len(self.ids), "array_bytes": int(sum(array.nbytes for array in arrays))}
+
+
+class TopRecommendationDAOMock(TopRecommendationDAO):
+    """TopRecommendationDAO served from a ColumnarRecommendationStore."""
+
+    def __init__(self, db: Any = None, store: Optional[ColumnarRecommendationStore] = None):
+        """Initialize the DAO with a columnar store.
+
+        Args:
+            db: Ignored session placeholder, kept for the DAO signature
+            store: Store to read; the mock dataset (get_mock_store) when None
+        """
+        self.db = db
+        self.store = store if store is not None else get_mock_store()
+
+    @classmethod
+    def _platform_type(cls, platform: str) -> Optional[str]:
+        """DB type for a platform filter; None means no filter, as in _apply_platform_filter."""
+        if platform and platform.lower() != "all_platform":
+            return cls.PLATFORM_MAPPING.get(platform.lower())
+        return None
+
+    def get_top_recommendations(
+        self,
+        platform: str,
+        limit: int = 6
+    ) -> List[AWSRecommendationConsolidate]:
+        """
+        Fetch top recommendations based on potential savings.
+
+        Args:
+            platform: The platform filter (aws, databricks, snowflakes, google_cloud, all_platform)
+            limit: Maximum number of recommendations to return (default: 6)
+
+        Returns:
+            Transient entities ordered by potential savings descending
+        """
+        return self.store.entities(self.store.top_positions(self._platform_type(platform), limit))
+
+    def get_top_recommendation_rows(
+        self,
+        platform: str,
+        limit: int = 6,
+        columns: Sequence = TOP_RECOMMENDATION_COLUMNS
+    ) -> List[tuple]:
+        """
+        Fetch only the given columns of the top recommendations.
+
+        Args:
+            platform: The platform filter (aws, databricks, snowflakes, google_cloud, all_platform)
+            limit: Maximum number of recommendations to return (default: 6)
+            columns: Model columns to return (default: the columns the service reads)
+
+        Returns:
+            Rows with attribute access by column name, ordered by potential savings descending
+        """
+        positions = self.store.top_positions(self._platform_type(platform), limit)
+        return self.store.rows(positions, columns)
+
+    def get_top_recommendation_rows_batch(
+        self,
+        requests: Sequence[Tuple[str, int]],
+        columns: Sequence = TOP_RECOMMENDATION_COLUMNS
+    ) -> List[List[tuple]]:
+        """
+        Fetch the top recommendations of several platforms.
+
+        Args:
+            requests: (platform, limit) pairs
+            columns: Model columns to return (default: the columns the service reads)
+
+        Returns:
+            One list of rows per request, each ordered by potential savings descending
+        """
+        return [
+            self.get_top_recommendation_rows(platform, limit, columns)
+            for platform, limit in requests
+        ]
+
+    def stream_recommendations(
+        self,
+        platform: str,
+        batch_size: int = 5000
+    ) -> Iterator[tuple]:
+        """
+        Stream every recommendation for a platform, batch_size rows at a time.
+
+        Args:
+            platform: The platform filter (aws, databricks, snowflakes, google_cloud, all_platform)
+            batch_size: Rows materialized at a time (default: 5000)
+
+        Yields:
+            Rows with the EXPORT_COLUMNS (columns not held in memory are None)
+        """
+        positions = self.store.positions(self._platform_type(platform))
+        for start in range(0, len(positions), batch_size):
+            yield from self.store.rows(positions[start:start + batch_size], EXPORT_COLUMNS)
+
+    def list_recommendations(
+        self,
+        platform: str,
+        limit: int = 50,
+        after: Optional[Tuple[Decimal, int]] = None,
+        filters: Optional[Mapping[str, Any]] = None
+    ) -> List[tuple]:
+        """
+        Fetch one keyset page of recommendations ordered by potential savings.
+
+        Args:
+            platform: The platform filter (aws, databricks, snowflakes, google_cloud, all_platform)
+            limit: Maximum number of rows to return (default: 50)
+            after: (potential, id) of the last row of the previous page; None for the first page
+            filters: Filter DSL mapping (see TopRecommendationDAO._apply_filters)
+
+        Returns:
+            Rows with id, type, description, recommendation and potential
+        """
+        positions = self.store.top_positions(
+            self._platform_type(platform), limit, after, self.store.filter_mask(filters)
+        )
+        return self.store.rows(positions, RECOMMENDATION_LIST_COLUMNS)
+
+    def get_facet_counts(
+        self,
+        platform: str,
+        facets: Sequence[str],
+        filters: Optional[Mapping[str, Any]] = None,
+        facet_limit: int = 20
+    ) -> FacetCounts:
+        """
+        Count the filtered recommendations by every facet.
+
+        Args:
+            platform: The platform filter (aws, databricks, snowflakes, google_cloud, all_platform)
+            facets: Facet names (FACET_COLUMNS keys or "tag:<key>")
+            filters: Filter DSL mapping (see TopRecommendationDAO._apply_filters)
+            facet_limit: Maximum number of values returned per facet (default: 20)
+
+        Returns:
+            (total, {facet: [(value, count), ...]}) with values by count descending
+        """
+        return self.store.facet_counts(
+            self._platform_type(platform), facets, self.store.filter_mask(filters), facet_limit
+        )
+
+    def search_recommendations(
+        self,
+        query_text: str,
+        platform: str,
+        limit: int = 20,
+        after: Optional[Tuple[float, int]] = None
+    ) -> List[tuple]:
+        """
+        Fetch one keyset page of recommendations matching a keyword search.
+
+        Scores whole-word matches against the recommendation (weight 1.0) and
+        description (weight 0.4) vocabularies, a rough stand-in for the
+        weighted tsvector ranking of the database.
+
+        Args:
+            query_text: Search text as typed by the user
+            platform: The platform filter (aws, databricks, snowflakes, google_cloud, all_platform)
+            limit: Maximum number of rows to return (default: 20)
+            after: (rank, id) of the last row of the previous page; None for the first page
+
+        Returns:
+            Rows with id, type, description, recommendation, potential and rank,
+            most relevant first
+        """
+        positions, ranks = self.store.search_positions(
+            query_text, self._platform_type(platform), limit, after
+        )
+        rows = self.store.rows(positions, (*RECOMMENDATION_LIST_COLUMNS, "rank"))
+        return [row._replace(rank=rank) for row, rank in zip(rows, ranks.tolist())]
+
+    def get_recommendation_by_id(
+        self,
+        recommendation_id: int
+    ) -> Optional[AWSRecommendationConsolidate]:
+        """
+        Fetch a single recommendation by ID.
+
+        Args:
+            recommendation_id: The ID of the recommendation
+
+        Returns:
+            A transient entity if found, None otherwise
+        """
+        position = self.store.position_of(recommendation_id)
+        if position is None:
+            return None
+        return self.store.entities(np.array([position]))[0]
+
+
+@lru_cache(maxsize=1)
+def get_mock_store() -> ColumnarRecommendationStore:
+    """
+    Load the mock mode dataset once per process.
+
+    Reads MOCK_RECOMMENDATION_CSV when set, otherwise generates
+    MOCK_RECOMMENDATION_ROWS rows with MOCK_RECOMMENDATION_SEED.
+
+    Returns:
+        The shared mock store
+    """
+    if MOCK_RECOMMENDATION_CSV:
+        store = ColumnarRecommendationStore.from_csv(MOCK_RECOMMENDATION_CSV)
+    else:
+        store = ColumnarRecommendationStore.generate(MOCK_RECOMMENDATION_ROWS, MOCK_RECOMMENDATION_SEED)
+    logger.info(f"Mock recommendation store ready: {store.stats()}")
+    return store
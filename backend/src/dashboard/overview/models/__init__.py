@@ -1,3 +1,9 @@
 from .recommendation import AWSRecommendationConsolidate
+from .platform_summary import RecommendationPlatformSummary
+from .data_version import RecommendationDataVersion
 
-__all__ = ["AWSRecommendationConsolidate"]
+__all__ = [
+    "AWSRecommendationConsolidate",
+    "RecommendationPlatformSummary",
+    "RecommendationDataVersion"
+]
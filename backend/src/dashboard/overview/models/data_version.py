@@ -0,0 +1,18 @@
+"""
+Database model for the recommendation_data_version counter table.
+"""
+from sqlalchemy import Column, BigInteger, SmallInteger, DateTime
+from src.database.base import Base
+
+
+class RecommendationDataVersion(Base):
+    """Model for recommendation_data_version table (single row, bumped by triggers)."""
+    
+    __tablename__ = "recommendation_data_version"
+
+    id = Column(SmallInteger, primary_key=True, default=1)
+    version = Column(BigInteger, nullable=False)
+    updated_at = Column(DateTime, nullable=False)
+
+    def __repr__(self):
+        return f"<RecommendationDataVersion(version={self.version})>"
@@ -0,0 +1,20 @@
+"""
+Database model for the recommendation_platform_summary rollup table.
+"""
+from sqlalchemy import Column, BigInteger, Text, Numeric, DateTime
+from src.database.base import Base
+
+
+class RecommendationPlatformSummary(Base):
+    """Model for recommendation_platform_summary table (maintained by triggers)."""
+    
+    __tablename__ = "recommendation_platform_summary"
+
+    type = Column(Text, primary_key=True)
+    recommendation_count = Column(BigInteger, nullable=False)
+    potential_count = Column(BigInteger, nullable=False)
+    total_potential = Column(Numeric(24, 4), nullable=False)
+    updated_at = Column(DateTime, nullable=False)
+
+    def __repr__(self):
+        return f"<RecommendationPlatformSummary(type={self.type}, recommendation_count={self.recommendation_count})>"
@@ -1,10 +1,20 @@
 """
 Database model for AWS Recommendation Consolidate table.
 """
-from sqlalchemy import Column, BigInteger, Text, Numeric, Boolean
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy import Column, BigInteger, Text, Numeric, Boolean, DateTime, Computed, func
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
+from sqlalchemy.orm import deferred
 from src.database.base import Base
 
+# Text search configuration of search_vector (migration 0007); queries must use the same one
+SEARCH_CONFIG = "english"
+
+SEARCH_VECTOR_EXPRESSION = (
+    f"setweight(to_tsvector('{SEARCH_CONFIG}'::regconfig, coalesce(recommendation, '')), 'A') "
+    f"|| setweight(to_tsvector('{SEARCH_CONFIG}'::regconfig, coalesce(description, '')), 'B') "
+    f"|| setweight(to_tsvector('{SEARCH_CONFIG}'::regconfig, coalesce(justifications, '')), 'C')"
+)
+
 
 class AWSRecommendationConsolidate(Base):
     """Model for aws_recommendation_consolidate table."""
@@ -12,7 +22,8 @@ class AWSRecommendationConsolidate(Base):
     __tablename__ = "aws_recommendation_consolidate"
 
     id = Column(BigInteger, primary_key=True, autoincrement=True)
-    type = Column(Text, nullable=True)
+    # LIST partition key (migration 0009); the table's primary key is (id, type)
+    type = Column(Text, nullable=False, server_default="")
     account = Column(Text, nullable=True)
     region = Column(Text, nullable=True)
     resource_name = Column(Text, nullable=True)
@@ -31,6 +42,10 @@ class AWSRecommendationConsolidate(Base):
     actionable = Column(Boolean, nullable=True)
     risk_level = Column(Text, nullable=True)
     impact = Column(Text, nullable=True)
+    created_at = Column(DateTime, nullable=True, server_default=func.now())
+    updated_at = Column(DateTime, nullable=True, server_default=func.now(), onupdate=func.now())
+    # Maintained by PostgreSQL; deferred so entity loads never fetch it
+    search_vector = deferred(Column(TSVECTOR, Computed(SEARCH_VECTOR_EXPRESSION, persisted=True)))
 
     def __repr__(self):
         return f"<AWSRecommendationConsolidate(id={self.id}, resource_name={self.resource_name})>"
@@ -3,12 +3,49 @@ Overview module router.
 Aggregates all overview-related API routes.
 """
 from fastapi import APIRouter
-from src.dashboard.overview.api import top_recommendation_router
+from src.dashboard.overview.api import (
+    top_recommendation_router,
+    recommendation_list_router,
+    recommendation_search_router,
+    recommendation_filter_router,
+    recommendation_export_router,
+    platform_summary_router
+)
+from src.dashboard.overview.schemas.top_recommendation_schema import (
+    ServiceUnavailableError,
+    TooManyRequestsError
+)
 
 router = APIRouter(
     prefix="/overview",
-    tags=["Overview"]
+    tags=["Overview"],
+    # Returned by src.admission.AdmissionMiddleware before a route runs
+    responses={
+        429: {
+            "description": "Client rate limit exceeded; retry after the Retry-After header",
+            "model": TooManyRequestsError
+        },
+        503: {
+            "description": "Overloaded or database unavailable; retry after the Retry-After header",
+            "model": ServiceUnavailableError
+        }
+    }
 )
 
 # Include top recommendation routes
 router.include_router(top_recommendation_router)
+
+# Include recommendation listing routes
+router.include_router(recommendation_list_router)
+
+# Include recommendation search routes
+router.include_router(recommendation_search_router)
+
+# Include faceted recommendation filter routes
+router.include_router(recommendation_filter_router)
+
+# Include recommendation export routes
+router.include_router(recommendation_export_router)
+
+# Include platform savings summary routes
+router.include_router(platform_summary_router)
@@ -1,6 +1,11 @@
 from .top_recommendation_schema import (
     TopRecommendationRequest,
     TopRecommendationResponse,
+    TopRecommendationBatchEntry,
+    TopRecommendationBatchRequest,
+    TopRecommendationGroup,
+    TopRecommendationBatchSuccessResponse,
+    TopRecommendationBatchResponse,
     RecommendationItem,
     SuccessResponse,
     InvalidRequestError,
@@ -11,10 +16,44 @@ from .top_recommendation_schema import (
     InternalServerError,
     ServiceUnavailableError
 )
+from .recommendation_list_schema import (
+    RecommendationListRequest,
+    RecommendationListItem,
+    RecommendationListPage,
+    RecommendationListSuccessResponse,
+    RecommendationListResponse
+)
+from .recommendation_search_schema import (
+    RecommendationSearchRequest,
+    RecommendationSearchItem,
+    RecommendationSearchPage,
+    RecommendationSearchSuccessResponse,
+    RecommendationSearchResponse
+)
+from .recommendation_filter_schema import (
+    RecommendationFilter,
+    RecommendationFilterRequest,
+    FacetCount,
+    RecommendationFilterItem,
+    RecommendationFilterPage,
+    RecommendationFilterSuccessResponse,
+    RecommendationFilterResponse
+)
+from .platform_summary_schema import (
+    PlatformSummaryRequest,
+    PlatformSummaryItem,
+    PlatformSummarySuccessResponse,
+    PlatformSummaryResponse
+)
 
 __all__ = [
     "TopRecommendationRequest",
     "TopRecommendationResponse",
+    "TopRecommendationBatchEntry",
+    "TopRecommendationBatchRequest",
+    "TopRecommendationGroup",
+    "TopRecommendationBatchSuccessResponse",
+    "TopRecommendationBatchResponse",
     "RecommendationItem",
     "SuccessResponse",
     "InvalidRequestError",
@@ -23,5 +62,26 @@ __all__ = [
     "NotFoundError",
     "TooManyRequestsError",
     "InternalServerError",
-    "ServiceUnavailableError"
+    "ServiceUnavailableError",
+    "RecommendationListRequest",
+    "RecommendationListItem",
+    "RecommendationListPage",
+    "RecommendationListSuccessResponse",
+    "RecommendationListResponse",
+    "RecommendationSearchRequest",
+    "RecommendationSearchItem",
+    "RecommendationSearchPage",
+    "RecommendationSearchSuccessResponse",
+    "RecommendationSearchResponse",
+    "RecommendationFilter",
+    "RecommendationFilterRequest",
+    "FacetCount",
+    "RecommendationFilterItem",
+    "RecommendationFilterPage",
+    "RecommendationFilterSuccessResponse",
+    "RecommendationFilterResponse",
+    "PlatformSummaryRequest",
+    "PlatformSummaryItem",
+    "PlatformSummarySuccessResponse",
+    "PlatformSummaryResponse"
 ]
@@ -0,0 +1,55 @@
+"""
+Pydantic schemas for the Platform Savings Summary API.
+"""
+from typing import List, Literal
+from pydantic import BaseModel, Field
+
+
+# Request Schema
+class PlatformSummaryRequest(BaseModel):
+    """Request schema for the platform savings summary endpoint."""
+    platform: Literal["all_platform", "google_cloud", "aws", "databricks", "snowflakes"] = Field(
+        ...,
+        description="Platform filter for the summary"
+    )
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "platform": "all_platform"
+            }
+        }
+
+
+# Response Data Schema
+class PlatformSummaryItem(BaseModel):
+    """Savings summary of one platform."""
+    platform_name: str = Field(..., description="Name of the platform (AWS, Databricks, Snowflakes)")
+    recommendation_count: int = Field(..., description="Number of recommendations")
+    total_potential_savings: float = Field(..., description="Sum of potential savings")
+    avg_savings: float = Field(..., description="Average potential savings per recommendation")
+    value: str = Field(..., description="Total potential savings formatted as 'Save $XXX.XX'")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "platform_name": "AWS",
+                "recommendation_count": 4,
+                "total_potential_savings": 2591.62,
+                "avg_savings": 647.91,
+                "value": "Save $2,591.62"
+            }
+        }
+
+
+class PlatformSummarySuccessResponse(BaseModel):
+    """Success response wrapper for the platform savings summary."""
+    status_code: int = Field(default=200, description="HTTP status code")
+    message: str = Field(default="Data Received Successfully", description="Response message")
+    status: bool = Field(default=True, description="Success status")
+    data: List[PlatformSummaryItem] = Field(default=[], description="Summary per platform")
+
+
+class PlatformSummaryResponse(BaseModel):
+    """Full response schema for the platform savings summary."""
+    success_response: PlatformSummarySuccessResponse
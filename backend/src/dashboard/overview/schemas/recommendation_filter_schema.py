@@ -0,0 +1,167 @@
+"""
+Pydantic schemas for the faceted Recommendation Filter API.
+"""
+from typing import Dict, List, Optional, Literal, Union
+import re
+from pydantic import BaseModel, Field, field_validator
+
+# Facets countable by column; "tag:<key>" counts the values of one tags_json key
+FACET_NAMES = ("account", "region", "service", "sub_service", "risk_level", "actionable")
+TAG_FACET_PATTERN = re.compile(r"^tag:[A-Za-z0-9_.\-]{1,64}$")
+
+
+# Request Schema
+class RecommendationFilter(BaseModel):
+    """
+    Filter DSL for recommendations.
+    
+    Every field that is set narrows the result (AND); list fields match any
+    of the listed values (OR).
+    """
+    account: Optional[List[str]] = Field(default=None, min_length=1, max_length=100, description="Account IDs")
+    region: Optional[List[str]] = Field(default=None, min_length=1, max_length=50, description="Regions")
+    service: Optional[List[str]] = Field(default=None, min_length=1, max_length=50, description="Services")
+    sub_service: Optional[List[str]] = Field(default=None, min_length=1, max_length=50, description="Sub-services")
+    risk_level: Optional[List[str]] = Field(default=None, min_length=1, max_length=10, description="Risk levels")
+    actionable: Optional[bool] = Field(default=None, description="Only actionable (true) or non-actionable (false)")
+    tags: Optional[Dict[str, str]] = Field(
+        default=None,
+        max_length=20,
+        description="Tag key/value pairs that must all be present in tags_json"
+    )
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "region": ["us-east-1"],
+                "service": ["EC2"],
+                "risk_level": ["Low"],
+                "actionable": True,
+                "tags": {"env": "prod"}
+            }
+        }
+
+
+class RecommendationFilterRequest(BaseModel):
+    """Request schema for the filtered, keyset-paginated listing with facet counts."""
+    platform: Literal["all_platform", "google_cloud", "aws", "databricks", "snowflakes"] = Field(
+        ...,
+        description="Platform filter for recommendations"
+    )
+    filters: RecommendationFilter = Field(
+        default_factory=RecommendationFilter,
+        description="Filter DSL; omitted fields do not filter"
+    )
+    facets: List[str] = Field(
+        default=list(FACET_NAMES),
+        max_length=12,
+        description="Facets to count ('account', 'region', 'service', 'sub_service', 'risk_level', "
+                    "'actionable' or 'tag:<key>'); send [] to skip counting, e.g. on later pages"
+    )
+    facet_limit: int = Field(
+        default=20,
+        ge=1,
+        le=200,
+        description="Maximum number of values returned per facet"
+    )
+    limit: int = Field(
+        default=50,
+        ge=1,
+        le=500,
+        description="Page size"
+    )
+    cursor: Optional[str] = Field(
+        default=None,
+        description="Opaque cursor from the previous page's next_cursor; omit for the first page"
+    )
+
+    @field_validator("facets")
+    @classmethod
+    def validate_facets(cls, facets: List[str]) -> List[str]:
+        """Reject unknown facet names and drop duplicates, keeping order."""
+        for facet in facets:
+            if facet not in FACET_NAMES and not TAG_FACET_PATTERN.match(facet):
+                raise ValueError(f"Unknown facet: {facet}")
+        return list(dict.fromkeys(facets))
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "platform": "aws",
+                "filters": {
+                    "region": ["us-east-1"],
+                    "service": ["EC2"],
+                    "risk_level": ["Low"],
+                    "actionable": True,
+                    "tags": {"env": "prod"}
+                },
+                "facets": ["account", "region", "service", "risk_level", "tag:team"],
+                "limit": 50,
+                "cursor": None
+            }
+        }
+
+
+# Response Data Schema
+class FacetCount(BaseModel):
+    """Number of matching recommendations with one facet value."""
+    value: Optional[Union[bool, str]] = Field(..., description="Facet value; null counts rows without a value")
+    count: int = Field(..., description="Number of matching recommendations")
+
+
+class RecommendationFilterItem(BaseModel):
+    """Single recommendation in a filtered page."""
+    id: int = Field(..., description="Recommendation ID")
+    platform_name: str = Field(..., description="Name of the platform (AWS, Databricks, Snowflakes)")
+    description: str = Field(..., description="Recommendation description")
+    value: str = Field(..., description="Potential savings value formatted as 'Save $XXX.XX'")
+
+
+class RecommendationFilterPage(BaseModel):
+    """One page of filtered recommendations with facet counts."""
+    items: List[RecommendationFilterItem] = Field(default=[], description="Recommendations on this page")
+    next_cursor: Optional[str] = Field(default=None, description="Cursor for the next page; null on the last page")
+    has_more: bool = Field(default=False, description="Whether another page exists")
+    total: Optional[int] = Field(default=None, description="Number of matching recommendations; null when no facets were requested")
+    facets: Dict[str, List[FacetCount]] = Field(default={}, description="Counts per requested facet, most frequent first")
+
+
+class RecommendationFilterSuccessResponse(BaseModel):
+    """Success response wrapper for a filtered page."""
+    status_code: int = Field(default=200, description="HTTP status code")
+    message: str = Field(default="Data Received Successfully", description="Response message")
+    status: bool = Field(default=True, description="Success status")
+    data: RecommendationFilterPage = Field(..., description="Page of filtered recommendations")
+
+
+class RecommendationFilterResponse(BaseModel):
+    """Full response schema for the faceted recommendation filter."""
+    success_response: RecommendationFilterSuccessResponse
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "success_response": {
+                    "status_code": 200,
+                    "message": "Data Received Successfully",
+                    "status": True,
+                    "data": {
+                        "items": [
+                            {
+                                "id": 1,
+                                "platform_name": "AWS",
+                                "description": "Recommended to right-size EC2 instance",
+                                "value": "Save $781.12"
+                            }
+                        ],
+                        "next_cursor": "eyJwIjoiNzgxLjEyMDAiLCJpIjoxfQ",
+                        "has_more": True,
+                        "total": 1834,
+                        "facets": {
+                            "risk_level": [{"value": "Low", "count": 1834}],
+                            "tag:team": [{"value": "data", "count": 472}, {"value": "ml", "count": 461}]
+                        }
+                    }
+                }
+            }
+        }
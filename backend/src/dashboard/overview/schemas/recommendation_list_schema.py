@@ -0,0 +1,95 @@
+"""
+Pydantic schemas for the Recommendation Listing API.
+"""
+from typing import List, Optional, Literal
+from pydantic import BaseModel, Field
+
+
+# Request Schema
+class RecommendationListRequest(BaseModel):
+    """Request schema for the keyset-paginated recommendation listing."""
+    platform: Literal["all_platform", "google_cloud", "aws", "databricks", "snowflakes"] = Field(
+        ...,
+        description="Platform filter for recommendations"
+    )
+    limit: int = Field(
+        default=50,
+        ge=1,
+        le=500,
+        description="Page size"
+    )
+    cursor: Optional[str] = Field(
+        default=None,
+        description="Opaque cursor from the previous page's next_cursor; omit for the first page"
+    )
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "platform": "aws",
+                "limit": 50,
+                "cursor": None
+            }
+        }
+
+
+# Response Data Schema
+class RecommendationListItem(BaseModel):
+    """Single recommendation in a listing page."""
+    id: int = Field(..., description="Recommendation ID")
+    platform_name: str = Field(..., description="Name of the platform (AWS, Databricks, Snowflakes)")
+    description: str = Field(..., description="Recommendation description")
+    value: str = Field(..., description="Potential savings value formatted as 'Save $XXX.XX'")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "id": 1,
+                "platform_name": "AWS",
+                "description": "Recommended to right-size EC2 instance",
+                "value": "Save $781.12"
+            }
+        }
+
+
+class RecommendationListPage(BaseModel):
+    """One page of recommendations."""
+    items: List[RecommendationListItem] = Field(default=[], description="Recommendations on this page")
+    next_cursor: Optional[str] = Field(default=None, description="Cursor for the next page; null on the last page")
+    has_more: bool = Field(default=False, description="Whether another page exists")
+
+
+class RecommendationListSuccessResponse(BaseModel):
+    """Success response wrapper for a listing page."""
+    status_code: int = Field(default=200, description="HTTP status code")
+    message: str = Field(default="Data Received Successfully", description="Response message")
+    status: bool = Field(default=True, description="Success status")
+    data: RecommendationListPage = Field(..., description="Page of recommendations")
+
+
+class RecommendationListResponse(BaseModel):
+    """Full response schema for the recommendation listing."""
+    success_response: RecommendationListSuccessResponse
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "success_response": {
+                    "status_code": 200,
+                    "message": "Data Received Successfully",
+                    "status": True,
+                    "data": {
+                        "items": [
+                            {
+                                "id": 1,
+                                "platform_name": "AWS",
+                                "description": "Recommended to right-size EC2 instance",
+                                "value": "Save $781.12"
+                            }
+                        ],
+                        "next_cursor": "eyJwIjoiNzgxLjEyMDAiLCJpIjoxfQ",
+                        "has_more": True
+                    }
+                }
+            }
+        }
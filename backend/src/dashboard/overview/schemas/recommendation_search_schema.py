@@ -0,0 +1,105 @@
+"""
+Pydantic schemas for the Recommendation Search API.
+"""
+from typing import List, Optional, Literal
+from pydantic import BaseModel, Field
+
+
+# Request Schema
+class RecommendationSearchRequest(BaseModel):
+    """Request schema for the ranked, keyset-paginated recommendation search."""
+    query: str = Field(
+        ...,
+        min_length=1,
+        max_length=200,
+        description="Search text; supports quoted phrases, OR and -excluded words"
+    )
+    platform: Literal["all_platform", "google_cloud", "aws", "databricks", "snowflakes"] = Field(
+        ...,
+        description="Platform filter for recommendations"
+    )
+    limit: int = Field(
+        default=20,
+        ge=1,
+        le=100,
+        description="Page size"
+    )
+    cursor: Optional[str] = Field(
+        default=None,
+        description="Opaque cursor from the previous page's next_cursor; omit for the first page"
+    )
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "query": "reserved instances",
+                "platform": "aws",
+                "limit": 20,
+                "cursor": None
+            }
+        }
+
+
+# Response Data Schema
+class RecommendationSearchItem(BaseModel):
+    """Single recommendation in a search results page."""
+    id: int = Field(..., description="Recommendation ID")
+    platform_name: str = Field(..., description="Name of the platform (AWS, Databricks, Snowflakes)")
+    description: str = Field(..., description="Recommendation description")
+    value: str = Field(..., description="Potential savings value formatted as 'Save $XXX.XX'")
+    rank: float = Field(..., description="Relevance score; higher is more relevant")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "id": 1,
+                "platform_name": "AWS",
+                "description": "Purchase Reserved Instances for steady-state workloads",
+                "value": "Save $781.12",
+                "rank": 0.2
+            }
+        }
+
+
+class RecommendationSearchPage(BaseModel):
+    """One page of search results."""
+    items: List[RecommendationSearchItem] = Field(default=[], description="Matching recommendations on this page")
+    next_cursor: Optional[str] = Field(default=None, description="Cursor for the next page; null on the last page")
+    has_more: bool = Field(default=False, description="Whether another page exists")
+
+
+class RecommendationSearchSuccessResponse(BaseModel):
+    """Success response wrapper for a search results page."""
+    status_code: int = Field(default=200, description="HTTP status code")
+    message: str = Field(default="Data Received Successfully", description="Response message")
+    status: bool = Field(default=True, description="Success status")
+    data: RecommendationSearchPage = Field(..., description="Page of search results")
+
+
+class RecommendationSearchResponse(BaseModel):
+    """Full response schema for the recommendation search."""
+    success_response: RecommendationSearchSuccessResponse
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "success_response": {
+                    "status_code": 200,
+                    "message": "Data Received Successfully",
+                    "status": True,
+                    "data": {
+                        "items": [
+                            {
+                                "id": 1,
+                                "platform_name": "AWS",
+                                "description": "Purchase Reserved Instances for steady-state workloads",
+                                "value": "Save $781.12",
+                                "rank": 0.2
+                            }
+                        ],
+                        "next_cursor": "eyJyIjowLjIsImkiOjEsInEiOiI5ZjJjIn0",
+                        "has_more": True
+                    }
+                }
+            }
+        }
@@ -21,6 +21,36 @@ class TopRecommendationRequest(BaseModel):
         }
 
 
+class TopRecommendationBatchEntry(BaseModel):
+    """One platform tab requested from the batch endpoint."""
+    platform: Literal["all_platform", "google_cloud", "aws", "databricks", "snowflakes"] = Field(
+        ...,
+        description="Platform filter for recommendations"
+    )
+    limit: int = Field(6, ge=1, le=50, description="Number of recommendations for this platform")
+
+
+class TopRecommendationBatchRequest(BaseModel):
+    """Request schema for the multi-platform top recommendations endpoint."""
+    requests: List[TopRecommendationBatchEntry] = Field(
+        ...,
+        min_length=1,
+        max_length=10,
+        description="Platforms to fetch, returned in the same order"
+    )
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "requests": [
+                    {"platform": "all_platform", "limit": 6},
+                    {"platform": "aws", "limit": 6},
+                    {"platform": "google_cloud", "limit": 6}
+                ]
+            }
+        }
+
+
 # Response Data Schema
 class RecommendationItem(BaseModel):
     """Single recommendation item in response."""
@@ -69,6 +99,26 @@ class TopRecommendationResponse(BaseModel):
         }
 
 
+class TopRecommendationGroup(BaseModel):
+    """Top recommendations of one requested platform."""
+    platform: str = Field(..., description="Platform filter as requested")
+    limit: int = Field(..., description="Requested number of recommendations")
+    data: List[RecommendationItem] = Field(default=[], description="List of recommendations")
+
+
+class TopRecommendationBatchSuccessResponse(BaseModel):
+    """Success response wrapper for the batch endpoint."""
+    status_code: int = Field(default=200, description="HTTP status code")
+    message: str = Field(default="Data Received Successfully", description="Response message")
+    status: bool = Field(default=True, description="Success status")
+    data: List[TopRecommendationGroup] = Field(default=[], description="One group per requested platform")
+
+
+class TopRecommendationBatchResponse(BaseModel):
+    """Full response schema for the multi-platform top recommendations endpoint."""
+    success_response: TopRecommendationBatchSuccessResponse
+
+
 # Error Response Schemas
 class ErrorDetail(BaseModel):
     """Error detail schema."""
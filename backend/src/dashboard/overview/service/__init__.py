@@ -1,3 +1,53 @@
-from .top_recommendation_service import TopRecommendationService
+from .top_recommendation_service import (
+    TopRecommendationService,
+    TopRecommendationPayload,
+    build_batch_body
+)
+from .top_recommendation_async_service import TopRecommendationAsyncService
+from .recommendation_list_service import RecommendationListService, InvalidCursorError
+from .recommendation_list_async_service import RecommendationListAsyncService
+from .recommendation_search_service import RecommendationSearchService
+from .recommendation_search_async_service import RecommendationSearchAsyncService
+from .recommendation_filter_service import RecommendationFilterService
+from .recommendation_filter_async_service import RecommendationFilterAsyncService
+from .recommendation_export_service import RecommendationExportService, EXPORT_MEDIA_TYPES
+from .recommendation_export_async_service import RecommendationExportAsyncService
+from .platform_summary_service import PlatformSummaryService
+from .platform_summary_async_service import PlatformSummaryAsyncService
+from .data_version_service import DataVersionService, invalidate_data_version
+from .data_version_async_service import DataVersionAsyncService
+from .top_recommendation_cache import (
+    top_recommendation_cache,
+    shared_payload_cache,
+    invalidate_top_recommendations,
+    get_top_recommendation_cache_stats
+)
+from .top_recommendation_refresher import TopRecommendationRefresher, top_recommendation_refresher
 
-__all__ = ["TopRecommendationService"]
+__all__ = [
+    "TopRecommendationService",
+    "TopRecommendationPayload",
+    "build_batch_body",
+    "TopRecommendationAsyncService",
+    "RecommendationListService",
+    "RecommendationListAsyncService",
+    "InvalidCursorError",
+    "RecommendationSearchService",
+    "RecommendationSearchAsyncService",
+    "RecommendationFilterService",
+    "RecommendationFilterAsyncService",
+    "RecommendationExportService",
+    "RecommendationExportAsyncService",
+    "EXPORT_MEDIA_TYPES",
+    "PlatformSummaryService",
+    "PlatformSummaryAsyncService",
+    "DataVersionService",
+    "DataVersionAsyncService",
+    "invalidate_data_version",
+    "top_recommendation_cache",
+    "shared_payload_cache",
+    "invalidate_top_recommendations",
+    "get_top_recommendation_cache_stats",
+    "TopRecommendationRefresher",
+    "top_recommendation_refresher"
+]
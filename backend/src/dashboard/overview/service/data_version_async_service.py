@@ -0,0 +1,39 @@
+"""
+Async service layer for the recommendation data version.
+Same caching as DataVersionService, backed by the async DAO.
+"""
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.dashboard.overview.dao.data_version_async_dao import DataVersionAsyncDAO
+from src.dashboard.overview.service.data_version_service import (
+    DATA_VERSION_KEY,
+    DataVersionService,
+    data_version_cache
+)
+
+
+class DataVersionAsyncService(DataVersionService):
+    """Async service class for the recommendation data version."""
+
+    def __init__(self, db: AsyncSession):
+        """Initialize the service with an async database session.
+        
+        Args:
+            db: SQLAlchemy async database session
+        """
+        self.dao = DataVersionAsyncDAO(db)
+
+    async def get_version(self) -> int:
+        """
+        Get the current data version, reusing a recent read when available.
+        
+        Returns:
+            Version number of aws_recommendation_consolidate
+        """
+        version = data_version_cache.get(DATA_VERSION_KEY)
+
+        if version is None:
+            version = await self.dao.get_version()
+            data_version_cache.set(DATA_VERSION_KEY, version)
+
+        return version
@@ -0,0 +1,65 @@
+"""
+Service layer for the recommendation data version.
+Serves the trigger-maintained version of aws_recommendation_consolidate,
+used for ETags and as part of response cache keys.
+"""
+import logging
+import os
+from sqlalchemy.orm import Session
+
+from src.cache.ttl_cache import TTLCache
+from src.config import load_environment
+from src.dashboard.overview.dao.data_version_dao import DataVersionDAO
+
+load_environment()
+
+logger = logging.getLogger(__name__)
+
+# How long a worker may reuse a version it read; 0 reads it on every request
+RECOMMENDATION_DATA_VERSION_TTL_SECONDS = float(
+    os.getenv("RECOMMENDATION_DATA_VERSION_TTL_SECONDS", "1")
+)
+
+DATA_VERSION_KEY = "aws_recommendation_consolidate"
+
+data_version_cache = TTLCache(
+    max_entries=1,
+    ttl_seconds=RECOMMENDATION_DATA_VERSION_TTL_SECONDS
+)
+
+
+def invalidate_data_version() -> None:
+    """
+    Drop the locally cached data version.
+    
+    Writers in this process call this after committing so the next request
+    reads the bumped version instead of waiting out the TTL.
+    """
+    data_version_cache.invalidate(DATA_VERSION_KEY)
+
+
+class DataVersionService:
+    """Service class for the recommendation data version."""
+
+    def __init__(self, db: Session):
+        """Initialize the service with a database session.
+        
+        Args:
+            db: SQLAlchemy database session
+        """
+        self.dao = DataVersionDAO(db)
+
+    def get_version(self) -> int:
+        """
+        Get the current data version, reusing a recent read when available.
+        
+        Returns:
+            Version number of aws_recommendation_consolidate
+        """
+        version = data_version_cache.get(DATA_VERSION_KEY)
+
+        if version is None:
+            version = self.dao.get_version()
+            data_version_cache.set(DATA_VERSION_KEY, version)
+
+        return version
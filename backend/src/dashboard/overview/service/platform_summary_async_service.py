@@ -0,0 +1,60 @@
+"""
+Async service layer for the Platform Savings Summary.
+Same formatting as PlatformSummaryService, backed by the async DAO.
+"""
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.dashboard.overview.dao.platform_summary_async_dao import PlatformSummaryAsyncDAO
+from src.dashboard.overview.schemas.platform_summary_schema import PlatformSummaryResponse
+from src.dashboard.overview.service.platform_summary_service import PlatformSummaryService
+from src.dashboard.overview.service.top_recommendation_cache import (
+    shared_payload_cache,
+    shared_payload_key
+)
+
+
+class PlatformSummaryAsyncService(PlatformSummaryService):
+    """Async service class for Platform Savings Summary operations."""
+
+    def __init__(self, db: AsyncSession):
+        """Initialize the service with an async database session.
+        
+        Args:
+            db: SQLAlchemy async database session
+        """
+        self.dao = PlatformSummaryAsyncDAO(db)
+
+    async def get_platform_summary(self, platform: str) -> PlatformSummaryResponse:
+        """
+        Get count, total and average potential savings per platform.
+        
+        Args:
+            platform: The platform filter (aws, databricks, snowflakes, google_cloud, all_platform)
+            
+        Returns:
+            PlatformSummaryResponse ordered by total savings descending
+        """
+        rows = await self.dao.get_platform_summaries(platform)
+        return self._build_response(rows)
+
+    async def get_platform_summary_body(self, platform: str, data_version: int) -> bytes:
+        """
+        Get the serialized savings summary, shared by the workers of a host.
+        
+        Args:
+            platform: The platform filter (aws, databricks, snowflakes, google_cloud, all_platform)
+            data_version: Data version the caller read, part of the shared cache key
+            
+        Returns:
+            JSON body of the PlatformSummaryResponse
+        """
+        async def load_body() -> bytes:
+            return self._serialize(await self.get_platform_summary(platform))
+
+        if not shared_payload_cache.enabled:
+            return await load_body()
+
+        return await shared_payload_cache.get_or_load_async(
+            shared_payload_key("platform-savings", data_version, platform),
+            load_body
+        )
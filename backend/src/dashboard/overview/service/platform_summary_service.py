@@ -0,0 +1,100 @@
+"""
+Service layer for the Platform Savings Summary.
+Formats the per-platform rollup for the overview tiles.
+"""
+from typing import Sequence
+import orjson
+from sqlalchemy import Row
+from sqlalchemy.orm import Session
+
+from src.dashboard.overview.dao.platform_summary_dao import PlatformSummaryDAO
+from src.dashboard.overview.schemas.platform_summary_schema import (
+    PlatformSummaryItem,
+    PlatformSummaryResponse,
+    PlatformSummarySuccessResponse
+)
+from src.dashboard.overview.service.top_recommendation_cache import (
+    shared_payload_cache,
+    shared_payload_key
+)
+from src.dashboard.overview.service.top_recommendation_service import TopRecommendationService
+
+
+class PlatformSummaryService:
+    """Service class for Platform Savings Summary operations."""
+
+    def __init__(self, db: Session):
+        """Initialize the service with a database session.
+        
+        Args:
+            db: SQLAlchemy database session
+        """
+        self.dao = PlatformSummaryDAO(db)
+
+    @staticmethod
+    def _build_response(rows: Sequence[Row]) -> PlatformSummaryResponse:
+        """
+        Transform rollup rows into the summary response.
+        
+        Args:
+            rows: Rows from PlatformSummaryDAO.get_platform_summaries
+            
+        Returns:
+            PlatformSummaryResponse with one item per platform
+        """
+        items = [
+            PlatformSummaryItem(
+                platform_name=TopRecommendationService._get_platform_display_name(row.type or None),
+                recommendation_count=row.recommendation_count,
+                total_potential_savings=round(float(row.total_potential), 2),
+                avg_savings=round(float(row.avg_potential or 0), 2),
+                value=TopRecommendationService._format_savings(row.total_potential)
+            )
+            for row in rows
+        ]
+
+        return PlatformSummaryResponse(
+            success_response=PlatformSummarySuccessResponse(
+                status_code=200,
+                message="Data Received Successfully",
+                status=True,
+                data=items
+            )
+        )
+
+    @staticmethod
+    def _serialize(response: PlatformSummaryResponse) -> bytes:
+        """Serialize a summary response to its JSON body."""
+        return orjson.dumps(response.model_dump())
+
+    def get_platform_summary(self, platform: str) -> PlatformSummaryResponse:
+        """
+        Get count, total and average potential savings per platform.
+        
+        Args:
+            platform: The platform filter (aws, databricks, snowflakes, google_cloud, all_platform)
+            
+        Returns:
+            PlatformSummaryResponse ordered by total savings descending
+        """
+        rows = self.dao.get_platform_summaries(platform)
+        return self._build_response(rows)
+
+    def get_platform_summary_body(self, platform: str, data_version: int) -> bytes:
+        """
+        Get the serialized savings summary, shared by the workers of a host.
+        
+        Args:
+            platform: The platform filter (aws, databricks, snowflakes, google_cloud, all_platform)
+            data_version: Data version the caller read, part of the shared cache key
+            
+        Returns:
+            JSON body of the PlatformSummaryResponse
+        """
+        if not shared_payload_cache.enabled:
+            return self._serialize(self.get_platform_summary(platform))
+
+        return shared_payload_cache.get_or_load(
+            shared_payload_key("platform-savings", data_version, platform),
+            lambda: self._serialize(self.get_platform_summary(platform))
+        )
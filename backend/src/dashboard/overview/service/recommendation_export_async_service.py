@@ -0,0 +1,55 @@
+"""
+Async service layer for the Recommendation Export.
+Same encoding as RecommendationExportService, backed by the async DAO.
+"""
+from typing import AsyncIterator, List
+from sqlalchemy import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.dashboard.overview.dao.top_recommendation_async_dao import TopRecommendationAsyncDAO
+from src.dashboard.overview.service.recommendation_export_service import (
+    EXPORT_CHUNK_ROWS,
+    RecommendationExportService
+)
+
+
+class RecommendationExportAsyncService(RecommendationExportService):
+    """Async service class for streaming recommendation exports."""
+
+    def __init__(self, db: AsyncSession):
+        """Initialize the service with an async database session.
+        
+        Args:
+            db: SQLAlchemy async database session, owned by the caller for the whole stream
+        """
+        self.dao = TopRecommendationAsyncDAO(db)
+
+    async def iter_export(
+        self,
+        platform: str,
+        export_format: str = "ndjson",
+        batch_size: int = 5000
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream all recommendations for a platform as encoded chunks.
+        
+        Args:
+            platform: The platform filter (aws, databricks, snowflakes, google_cloud, all_platform)
+            export_format: 'ndjson' or 'csv'
+            batch_size: Rows fetched from the server-side cursor per round trip
+            
+        Yields:
+            Encoded chunks of at most EXPORT_CHUNK_ROWS rows
+        """
+        header = self._encode_header(export_format)
+        if header:
+            yield header
+
+        chunk: List[Row] = []
+        async for row in self.dao.stream_recommendations(platform, batch_size):
+            chunk.append(row)
+            if len(chunk) >= EXPORT_CHUNK_ROWS:
+                yield self._encode_rows(chunk, export_format)
+                chunk = []
+        if chunk:
+            yield self._encode_rows(chunk, export_format)
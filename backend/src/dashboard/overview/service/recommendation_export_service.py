@@ -0,0 +1,122 @@
+"""
+Service layer for the Recommendation Export.
+Encodes streamed DAO rows as NDJSON or CSV chunks for a StreamingResponse.
+"""
+from typing import Any, Iterator, List, Sequence
+from datetime import date, datetime
+from decimal import Decimal
+import csv
+import io
+import json
+from sqlalchemy import Row
+from sqlalchemy.orm import Session
+
+from src.dashboard.overview.dao.top_recommendation_dao import EXPORT_COLUMNS, TopRecommendationDAO
+
+# Media type per supported export format
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv"
+}
+
+# Rows encoded into each chunk written to the response
+EXPORT_CHUNK_ROWS = 500
+
+
+def _json_default(value: Any) -> Any:
+    """Encode column types the stdlib json module does not handle.
+
+    NUMERIC values become strings, as in CSV exports, so no precision is lost.
+    """
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class RecommendationExportService:
+    """Service class for streaming recommendation exports."""
+
+    def __init__(self, db: Session):
+        """Initialize the service with a database session.
+        
+        Args:
+            db: SQLAlchemy database session, owned by the caller for the whole stream
+        """
+        self.dao = TopRecommendationDAO(db)
+
+    @staticmethod
+    def _encode_header(export_format: str) -> bytes:
+        """
+        Get the bytes written before the first row.
+        
+        Args:
+            export_format: 'ndjson' or 'csv'
+            
+        Returns:
+            CSV header line, or nothing for NDJSON
+        """
+        if export_format != "csv":
+            return b""
+        buffer = io.StringIO()
+        csv.writer(buffer).writerow([column.name for column in EXPORT_COLUMNS])
+        return buffer.getvalue().encode()
+
+    @staticmethod
+    def _encode_rows(rows: Sequence[Row], export_format: str) -> bytes:
+        """
+        Encode a chunk of rows.
+        
+        Args:
+            rows: Rows with the EXPORT_COLUMNS
+            export_format: 'ndjson' or 'csv'
+            
+        Returns:
+            Encoded chunk, one line per row
+        """
+        if export_format == "csv":
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            for row in rows:
+                writer.writerow([
+                    json.dumps(value) if isinstance(value, (dict, list)) else ("" if value is None else value)
+                    for value in row
+                ])
+            return buffer.getvalue().encode()
+
+        lines = [
+            json.dumps(dict(row._mapping), default=_json_default, separators=(",", ":"))
+            for row in rows
+        ]
+        return ("\n".join(lines) + "\n").encode()
+
+    def iter_export(
+        self,
+        platform: str,
+        export_format: str = "ndjson",
+        batch_size: int = 5000
+    ) -> Iterator[bytes]:
+        """
+        Stream all recommendations for a platform as encoded chunks.
+        
+        Args:
+            platform: The platform filter (aws, databricks, snowflakes, google_cloud, all_platform)
+            export_format: 'ndjson' or 'csv'
+            batch_size: Rows fetched from the server-side cursor per round trip
+            
+        Yields:
+            Encoded chunks of at most EXPORT_CHUNK_ROWS rows
+        """
+        header = self._encode_header(export_format)
+        if header:
+            yield header
+
+        chunk: List[Row] = []
+        for row in self.dao.stream_recommendations(platform, batch_size):
+            chunk.append(row)
+            if len(chunk) >= EXPORT_CHUNK_ROWS:
+                yield self._encode_rows(chunk, export_format)
+                chunk = []
+        if chunk:
+            yield self._encode_rows(chunk, export_format)
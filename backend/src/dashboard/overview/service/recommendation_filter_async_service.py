@@ -0,0 +1,66 @@
+"""
+Async service layer for the faceted Recommendation Filter.
+Same formatting as RecommendationFilterService, backed by the async DAO.
+"""
+from typing import Any, Mapping, Optional, Sequence
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.dashboard.overview.dao.top_recommendation_async_dao import TopRecommendationAsyncDAO
+from src.dashboard.overview.schemas.recommendation_filter_schema import RecommendationFilterResponse
+from src.dashboard.overview.service.recommendation_filter_service import RecommendationFilterService
+from src.dashboard.overview.service.recommendation_list_service import decode_cursor
+
+
+class RecommendationFilterAsyncService(RecommendationFilterService):
+    """Async service class for the filtered recommendation listing with facet counts."""
+
+    def __init__(self, db: AsyncSession):
+        """Initialize the service with an async database session.
+        
+        Args:
+            db: SQLAlchemy async database session
+        """
+        self.dao = TopRecommendationAsyncDAO(db)
+
+    async def filter_recommendations(
+        self,
+        platform: str,
+        filters: Optional[Mapping[str, Any]] = None,
+        facets: Sequence[str] = (),
+        facet_limit: int = 20,
+        limit: int = 50,
+        cursor: Optional[str] = None
+    ) -> RecommendationFilterResponse:
+        """
+        Get one filtered page of recommendations and the facet counts of the filter.
+        
+        Args:
+            platform: The platform filter (aws, databricks, snowflakes, google_cloud, all_platform)
+            filters: Filter DSL mapping (see TopRecommendationDAO._apply_filters)
+            facets: Facets to count; empty to skip counting
+            facet_limit: Maximum number of values returned per facet (default: 20)
+            limit: Page size (default: 50)
+            cursor: next_cursor of the previous page; None for the first page
+            
+        Returns:
+            RecommendationFilterResponse for the requested page
+            
+        Raises:
+            InvalidCursorError: If the cursor is malformed
+        """
+        after = decode_cursor(cursor) if cursor else None
+        rows = await self.dao.list_recommendations(
+            platform=platform,
+            limit=limit + 1,
+            after=after,
+            filters=filters
+        )
+        facet_counts = None
+        if facets:
+            facet_counts = await self.dao.get_facet_counts(
+                platform=platform,
+                facets=facets,
+                filters=filters,
+                facet_limit=facet_limit
+            )
+        return self._build_response(rows, limit, facet_counts)
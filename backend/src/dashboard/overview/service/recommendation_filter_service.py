@@ -0,0 +1,135 @@
+"""
+Service layer for the faceted Recommendation Filter.
+Formats filtered keyset pages and the facet counts of the same filter.
+"""
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+from sqlalchemy import Row
+from sqlalchemy.orm import Session
+
+from src.dashboard.overview.dao.top_recommendation_dao import FacetCounts, TopRecommendationDAO
+from src.dashboard.overview.schemas.recommendation_filter_schema import (
+    FacetCount,
+    RecommendationFilterItem,
+    RecommendationFilterPage,
+    RecommendationFilterResponse,
+    RecommendationFilterSuccessResponse
+)
+from src.dashboard.overview.service.recommendation_list_service import decode_cursor, encode_cursor
+from src.dashboard.overview.service.top_recommendation_service import TopRecommendationService
+
+
+class RecommendationFilterService:
+    """Service class for the filtered recommendation listing with facet counts."""
+
+    def __init__(self, db: Session):
+        """Initialize the service with a database session.
+        
+        Args:
+            db: SQLAlchemy database session
+        """
+        self.dao = TopRecommendationDAO(db)
+
+    @staticmethod
+    def _build_response(
+        rows: Sequence[Row],
+        limit: int,
+        facet_counts: Optional[FacetCounts]
+    ) -> RecommendationFilterResponse:
+        """
+        Format a page fetched with one extra row, and its facet counts, into the response.
+        
+        Args:
+            rows: Up to limit + 1 rows; the extra row only signals another page
+            limit: Requested page size
+            facet_counts: (total, counts) from the DAO; None when no facets were requested
+            
+        Returns:
+            RecommendationFilterResponse with items, next cursor and facets
+        """
+        has_more = len(rows) > limit
+        page_rows = rows[:limit]
+
+        items = [
+            RecommendationFilterItem(
+                id=row.id,
+                platform_name=TopRecommendationService._get_platform_display_name(row.type),
+                description=row.description or row.recommendation or "Recommended optimization",
+                value=TopRecommendationService._format_savings(row.potential)
+            )
+            for row in page_rows
+        ]
+
+        next_cursor = None
+        if has_more:
+            last = page_rows[-1]
+            next_cursor = encode_cursor(last.potential, last.id)
+
+        total = None
+        facets: Dict[str, List[FacetCount]] = {}
+        if facet_counts is not None:
+            total, counts = facet_counts
+            facets = {
+                facet: [FacetCount(value=value, count=count) for value, count in values]
+                for facet, values in counts.items()
+            }
+
+        return RecommendationFilterResponse(
+            success_response=RecommendationFilterSuccessResponse(
+                status_code=200,
+                message="Data Received Successfully",
+                status=True,
+                data=RecommendationFilterPage(
+                    items=items,
+                    next_cursor=next_cursor,
+                    has_more=has_more,
+                    total=total,
+                    facets=facets
+                )
+            )
+        )
+
+    def filter_recommendations(
+        self,
+        platform: str,
+        filters: Optional[Mapping[str, Any]] = None,
+        facets: Sequence[str] = (),
+        facet_limit: int = 20,
+        limit: int = 50,
+        cursor: Optional[str] = None
+    ) -> RecommendationFilterResponse:
+        """
+        Get one filtered page of recommendations and the facet counts of the filter.
+        
+        Facet counts cover every recommendation matching the filter, not only
+        the page, and come from one grouped query.
+        
+        Args:
+            platform: The platform filter (aws, databricks, snowflakes, google_cloud, all_platform)
+            filters: Filter DSL mapping (see TopRecommendationDAO._apply_filters)
+            facets: Facets to count; empty to skip counting
+            facet_limit: Maximum number of values returned per facet (default: 20)
+            limit: Page size (default: 50)
+            cursor: next_cursor of the previous page; None for the first page
+            
+        Returns:
+            RecommendationFilterResponse for the requested page
+            
+        Raises:
+            InvalidCursorError: If the cursor is malformed
+        """
+        after = decode_cursor(cursor) if cursor else None
+        rows = self.dao.list_recommendations(
+            platform=platform,
+            limit=limit + 1,
+            after=after,
+            filters=filters
+        )
+        facet_counts = None
+        if facets:
+            facet_counts = self.dao.get_facet_counts(
+                platform=platform,
+                facets=facets,
+                filters=filters,
+                facet_limit=facet_limit
+            )
+        return self._build_response(rows, limit, facet_counts)
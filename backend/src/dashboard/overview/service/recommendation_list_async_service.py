@@ -0,0 +1,53 @@
+"""
+Async service layer for the Recommendation Listing.
+Same pagination logic as RecommendationListService, backed by the async DAO.
+"""
+from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.dashboard.overview.dao.top_recommendation_async_dao import TopRecommendationAsyncDAO
+from src.dashboard.overview.schemas.recommendation_list_schema import RecommendationListResponse
+from src.dashboard.overview.service.recommendation_list_service import (
+    RecommendationListService,
+    decode_cursor
+)
+
+
+class RecommendationListAsyncService(RecommendationListService):
+    """Async service class for the keyset-paginated recommendation listing."""
+
+    def __init__(self, db: AsyncSession):
+        """Initialize the service with an async database session.
+        
+        Args:
+            db: SQLAlchemy async database session
+        """
+        self.dao = TopRecommendationAsyncDAO(db)
+
+    async def list_recommendations(
+        self,
+        platform: str,
+        limit: int = 50,
+        cursor: Optional[str] = None
+    ) -> RecommendationListResponse:
+        """
+        Get one page of recommendations ordered by potential savings.
+        
+        Args:
+            platform: The platform filter (aws, databricks, snowflakes, google_cloud, all_platform)
+            limit: Page size (default: 50)
+            cursor: next_cursor of the previous page; None for the first page
+            
+        Returns:
+            RecommendationListResponse for the requested page
+            
+        Raises:
+            InvalidCursorError: If the cursor is malformed
+        """
+        after = decode_cursor(cursor) if cursor else None
+        rows = await self.dao.list_recommendations(
+            platform=platform,
+            limit=limit + 1,
+            after=after
+        )
+        return self._build_response(rows, limit)
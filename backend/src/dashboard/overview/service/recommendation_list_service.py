@@ -0,0 +1,142 @@
+"""
+Service layer for the Recommendation Listing.
+Handles keyset pagination cursors and formatting of listing pages.
+"""
+from typing import Optional, Sequence, Tuple
+from decimal import Decimal, InvalidOperation
+import base64
+import json
+from sqlalchemy import Row
+from sqlalchemy.orm import Session
+
+from src.dashboard.overview.dao.top_recommendation_dao import TopRecommendationDAO
+from src.dashboard.overview.schemas.recommendation_list_schema import (
+    RecommendationListItem,
+    RecommendationListPage,
+    RecommendationListResponse,
+    RecommendationListSuccessResponse
+)
+from src.dashboard.overview.service.top_recommendation_service import TopRecommendationService
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a listing cursor cannot be decoded."""
+
+
+def encode_cursor(potential: Decimal, recommendation_id: int) -> str:
+    """
+    Encode the keyset position of a row as an opaque cursor.
+    
+    Args:
+        potential: Potential savings of the last row on the page
+        recommendation_id: ID of the last row on the page
+        
+    Returns:
+        URL-safe cursor string
+    """
+    payload = json.dumps({"p": str(potential), "i": recommendation_id}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[Decimal, int]:
+    """
+    Decode a cursor produced by encode_cursor.
+    
+    Args:
+        cursor: Cursor string from a previous page
+        
+    Returns:
+        (potential, id) keyset position
+        
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return Decimal(payload["p"]), int(payload["i"])
+    except (ValueError, TypeError, KeyError, InvalidOperation) as e:
+        raise InvalidCursorError("Invalid pagination cursor") from e
+
+
+class RecommendationListService:
+    """Service class for the keyset-paginated recommendation listing."""
+
+    def __init__(self, db: Session):
+        """Initialize the service with a database session.
+        
+        Args:
+            db: SQLAlchemy database session
+        """
+        self.dao = TopRecommendationDAO(db)
+
+    @staticmethod
+    def _build_response(rows: Sequence[Row], limit: int) -> RecommendationListResponse:
+        """
+        Format a page fetched with one extra row into the listing response.
+        
+        Args:
+            rows: Up to limit + 1 rows; the extra row only signals another page
+            limit: Requested page size
+            
+        Returns:
+            RecommendationListResponse with items and the next cursor
+        """
+        has_more = len(rows) > limit
+        page_rows = rows[:limit]
+
+        items = [
+            RecommendationListItem(
+                id=row.id,
+                platform_name=TopRecommendationService._get_platform_display_name(row.type),
+                description=row.description or row.recommendation or "Recommended optimization",
+                value=TopRecommendationService._format_savings(row.potential)
+            )
+            for row in page_rows
+        ]
+
+        next_cursor = None
+        if has_more:
+            last = page_rows[-1]
+            next_cursor = encode_cursor(last.potential, last.id)
+
+        return RecommendationListResponse(
+            success_response=RecommendationListSuccessResponse(
+                status_code=200,
+                message="Data Received Successfully",
+                status=True,
+                data=RecommendationListPage(
+                    items=items,
+                    next_cursor=next_cursor,
+                    has_more=has_more
+                )
+            )
+        )
+
+    def list_recommendations(
+        self,
+        platform: str,
+        limit: int = 50,
+        cursor: Optional[str] = None
+    ) -> RecommendationListResponse:
+        """
+        Get one page of recommendations ordered by potential savings.
+        
+        Args:
+            platform: The platform filter (aws, databricks, snowflakes, google_cloud, all_platform)
+            limit: Page size (default: 50)
+            cursor: next_cursor of the previous page; None for the first page
+            
+        Returns:
+            RecommendationListResponse for the requested page
+            
+        Raises:
+            InvalidCursorError: If the cursor is malformed
+        """
+        after = decode_cursor(cursor) if cursor else None
+        rows = self.dao.list_recommendations(
+            platform=platform,
+            limit=limit + 1,
+            after=after
+        )
+        return self._build_response(rows, limit)
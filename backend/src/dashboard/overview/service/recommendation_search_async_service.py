@@ -0,0 +1,56 @@
+"""
+Async service layer for the Recommendation Search.
+Same pagination logic as RecommendationSearchService, backed by the async DAO.
+"""
+from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.dashboard.overview.dao.top_recommendation_async_dao import TopRecommendationAsyncDAO
+from src.dashboard.overview.schemas.recommendation_search_schema import RecommendationSearchResponse
+from src.dashboard.overview.service.recommendation_search_service import (
+    RecommendationSearchService,
+    decode_search_cursor
+)
+
+
+class RecommendationSearchAsyncService(RecommendationSearchService):
+    """Async service class for the ranked, keyset-paginated recommendation search."""
+
+    def __init__(self, db: AsyncSession):
+        """Initialize the service with an async database session.
+        
+        Args:
+            db: SQLAlchemy async database session
+        """
+        self.dao = TopRecommendationAsyncDAO(db)
+
+    async def search_recommendations(
+        self,
+        query_text: str,
+        platform: str,
+        limit: int = 20,
+        cursor: Optional[str] = None
+    ) -> RecommendationSearchResponse:
+        """
+        Get one page of recommendations matching a keyword search, most relevant first.
+        
+        Args:
+            query_text: Search text as typed by the user
+            platform: The platform filter (aws, databricks, snowflakes, google_cloud, all_platform)
+            limit: Page size (default: 20)
+            cursor: next_cursor of the previous page; None for the first page
+            
+        Returns:
+            RecommendationSearchResponse for the requested page
+            
+        Raises:
+            InvalidCursorError: If the cursor is malformed or belongs to another search
+        """
+        after = decode_search_cursor(cursor, query_text, platform) if cursor else None
+        rows = await self.dao.search_recommendations(
+            query_text=query_text,
+            platform=platform,
+            limit=limit + 1,
+            after=after
+        )
+        return self._build_response(rows, limit, query_text, platform)
@@ -0,0 +1,167 @@
+"""
+Service layer for the Recommendation Search.
+Handles ranked keyset pagination cursors and formatting of search result pages.
+"""
+from typing import Optional, Sequence, Tuple
+import base64
+import hashlib
+import json
+from sqlalchemy import Row
+from sqlalchemy.orm import Session
+
+from src.dashboard.overview.dao.top_recommendation_dao import TopRecommendationDAO
+from src.dashboard.overview.schemas.recommendation_search_schema import (
+    RecommendationSearchItem,
+    RecommendationSearchPage,
+    RecommendationSearchResponse,
+    RecommendationSearchSuccessResponse
+)
+from src.dashboard.overview.service.recommendation_list_service import InvalidCursorError
+from src.dashboard.overview.service.top_recommendation_service import TopRecommendationService
+
+
+def _search_fingerprint(query_text: str, platform: str) -> str:
+    """Short hash tying a cursor to the search it was issued for."""
+    return hashlib.sha256(f"{platform}\x00{query_text}".encode()).hexdigest()[:8]
+
+
+def encode_search_cursor(rank: float, recommendation_id: int, query_text: str, platform: str) -> str:
+    """
+    Encode the keyset position of a search result as an opaque cursor.
+    
+    Args:
+        rank: Relevance score of the last row on the page
+        recommendation_id: ID of the last row on the page
+        query_text: Search text the page was fetched for
+        platform: Platform filter the page was fetched for
+        
+    Returns:
+        URL-safe cursor string
+    """
+    payload = json.dumps(
+        {"r": rank, "i": recommendation_id, "q": _search_fingerprint(query_text, platform)},
+        separators=(",", ":")
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_search_cursor(cursor: str, query_text: str, platform: str) -> Tuple[float, int]:
+    """
+    Decode a cursor produced by encode_search_cursor.
+    
+    Args:
+        cursor: Cursor string from a previous page
+        query_text: Search text of the current request
+        platform: Platform filter of the current request
+        
+    Returns:
+        (rank, id) keyset position
+        
+    Raises:
+        InvalidCursorError: If the cursor is malformed or belongs to another search
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        position = float(payload["r"]), int(payload["i"])
+        fingerprint = payload["q"]
+    except (ValueError, TypeError, KeyError) as e:
+        raise InvalidCursorError("Invalid pagination cursor") from e
+
+    if fingerprint != _search_fingerprint(query_text, platform):
+        raise InvalidCursorError("Pagination cursor belongs to a different search")
+    return position
+
+
+class RecommendationSearchService:
+    """Service class for the ranked, keyset-paginated recommendation search."""
+
+    def __init__(self, db: Session):
+        """Initialize the service with a database session.
+        
+        Args:
+            db: SQLAlchemy database session
+        """
+        self.dao = TopRecommendationDAO(db)
+
+    @staticmethod
+    def _build_response(
+        rows: Sequence[Row],
+        limit: int,
+        query_text: str,
+        platform: str
+    ) -> RecommendationSearchResponse:
+        """
+        Format a page fetched with one extra row into the search response.
+        
+        Args:
+            rows: Up to limit + 1 rows; the extra row only signals another page
+            limit: Requested page size
+            query_text: Search text, bound into the next cursor
+            platform: Platform filter, bound into the next cursor
+            
+        Returns:
+            RecommendationSearchResponse with items and the next cursor
+        """
+        has_more = len(rows) > limit
+        page_rows = rows[:limit]
+
+        items = [
+            RecommendationSearchItem(
+                id=row.id,
+                platform_name=TopRecommendationService._get_platform_display_name(row.type),
+                description=row.description or row.recommendation or "Recommended optimization",
+                value=TopRecommendationService._format_savings(row.potential),
+                rank=row.rank
+            )
+            for row in page_rows
+        ]
+
+        next_cursor = None
+        if has_more:
+            last = page_rows[-1]
+            next_cursor = encode_search_cursor(last.rank, last.id, query_text, platform)
+
+        return RecommendationSearchResponse(
+            success_response=RecommendationSearchSuccessResponse(
+                status_code=200,
+                message="Data Received Successfully",
+                status=True,
+                data=RecommendationSearchPage(
+                    items=items,
+                    next_cursor=next_cursor,
+                    has_more=has_more
+                )
+            )
+        )
+
+    def search_recommendations(
+        self,
+        query_text: str,
+        platform: str,
+        limit: int = 20,
+        cursor: Optional[str] = None
+    ) -> RecommendationSearchResponse:
+        """
+        Get one page of recommendations matching a keyword search, most relevant first.
+        
+        Args:
+            query_text: Search text as typed by the user
+            platform: The platform filter (aws, databricks, snowflakes, google_cloud, all_platform)
+            limit: Page size (default: 20)
+            cursor: next_cursor of the previous page; None for the first page
+            
+        Returns:
+            RecommendationSearchResponse for the requested page
+            
+        Raises:
+            InvalidCursorError: If the cursor is malformed or belongs to another search
+        """
+        after = decode_search_cursor(cursor, query_text, platform) if cursor else None
+        rows = self.dao.search_recommendations(
+            query_text=query_text,
+            platform=platform,
+            limit=limit + 1,
+            after=after
+        )
+        return self._build_response(rows, limit, query_text, platform)
@@ -0,0 +1,162 @@
+"""
+Async service layer for Top Recommendations.
+Same business logic as TopRecommendationService, backed by the async DAO.
+"""
+from typing import List, Optional, Sequence, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.dashboard.overview.dao.recommendation_hot_tier import recommendation_hot_tier
+from src.dashboard.overview.dao.top_recommendation_async_dao import TopRecommendationAsyncDAO
+from src.dashboard.overview.service.data_version_async_service import DataVersionAsyncService
+from src.dashboard.overview.schemas.top_recommendation_schema import TopRecommendationResponse
+from src.dashboard.overview.service.top_recommendation_cache import (
+    shared_payload_cache,
+    top_recommendation_cache,
+    top_recommendation_async_flight
+)
+from src.dashboard.overview.service.top_recommendation_service import (
+    TopRecommendationPayload,
+    TopRecommendationService,
+    shared_top_recommendation_key
+)
+
+
+class TopRecommendationAsyncService(TopRecommendationService):
+    """Async service class for Top Recommendation operations."""
+
+    def __init__(self, db: AsyncSession):
+        """Initialize the service with an async database session.
+        
+        Args:
+            db: SQLAlchemy async database session
+        """
+        self.dao = TopRecommendationAsyncDAO(db)
+        self.data_version = DataVersionAsyncService(db)
+
+    async def get_top_recommendations(
+        self,
+        platform: str,
+        limit: int = 6
+    ) -> TopRecommendationResponse:
+        """
+        Get top recommendations based on potential savings.
+        
+        Args:
+            platform: The platform filter (aws, databricks, snowflakes, google_cloud, all_platform)
+            limit: Maximum number of recommendations to return (default: 6)
+            
+        Returns:
+            TopRecommendationResponse with formatted recommendations
+        """
+        payload = await self.get_top_recommendations_payload(platform, limit)
+        return self._build_response(payload.items)
+
+    async def get_top_recommendations_payload(
+        self,
+        platform: str,
+        limit: int = 6,
+        data_version: Optional[int] = None
+    ) -> TopRecommendationPayload:
+        """
+        Get top recommendations with their pre-serialized response body.
+        
+        Args:
+            platform: The platform filter (aws, databricks, snowflakes, google_cloud, all_platform)
+            limit: Maximum number of recommendations to return (default: 6)
+            data_version: Data version the caller already read; read here when None
+            
+        Returns:
+            TopRecommendationPayload with items and JSON body
+        """
+        if data_version is None:
+            data_version = await self.data_version.get_version()
+
+        cache_key = (data_version, platform, limit)
+        payload = top_recommendation_cache.get(cache_key)
+
+        if payload is None:
+            payload = await top_recommendation_async_flight.do(
+                cache_key,
+                lambda: self._load_payload(cache_key)
+            )
+
+        return payload
+
+    async def _load_payload(self, cache_key: Tuple[int, str, int]) -> TopRecommendationPayload:
+        """
+        Load a payload missing from the in-process cache and populate it.
+        
+        Args:
+            cache_key: (data version, platform filter, limit)
+            
+        Returns:
+            TopRecommendationPayload for the key
+        """
+        if shared_payload_cache.enabled:
+            async def load_body() -> bytes:
+                return (await self._fetch_payload(cache_key)).body
+
+            body = await shared_payload_cache.get_or_load_async(
+                shared_top_recommendation_key(cache_key),
+                load_body
+            )
+            payload = TopRecommendationPayload.from_body(body)
+        else:
+            payload = await self._fetch_payload(cache_key)
+
+        top_recommendation_cache.set(cache_key, payload)
+        return payload
+
+    async def _fetch_payload(self, cache_key: Tuple[int, str, int]) -> TopRecommendationPayload:
+        """
+        Fetch recommendations from the hot tier if it holds the data version, else the database.
+        
+        Args:
+            cache_key: (data version, platform filter, limit)
+            
+        Returns:
+            TopRecommendationPayload for the fetched rows
+        """
+        data_version, platform, limit = cache_key
+        hot_dao = recommendation_hot_tier.dao_for(data_version)
+        if hot_dao is not None:
+            recommendations = hot_dao.get_top_recommendation_rows(platform=platform, limit=limit)
+        else:
+            recommendations = await self.dao.get_top_recommendation_rows(
+                platform=platform,
+                limit=limit
+            )
+        return TopRecommendationPayload(self._build_items(recommendations))
+
+    async def get_top_recommendations_batch(
+        self,
+        requests: Sequence[Tuple[str, int]],
+        data_version: Optional[int] = None
+    ) -> List[TopRecommendationPayload]:
+        """
+        Get the top recommendations of several platforms at once.
+        
+        Args:
+            requests: (platform, limit) pairs
+            data_version: Data version the caller already read; read here when None
+            
+        Returns:
+            One TopRecommendationPayload per request, in request order
+        """
+        if data_version is None:
+            data_version = await self.data_version.get_version()
+
+        cache_keys = [(data_version, platform, limit) for platform, limit in requests]
+        payloads = self._cached_payloads(cache_keys)
+        missing = [key for key, payload in payloads.items() if payload is None]
+
+        if missing:
+            requested = [(platform, limit) for _, platform, limit in missing]
+            hot_dao = recommendation_hot_tier.dao_for(data_version)
+            if hot_dao is not None:
+                row_groups = hot_dao.get_top_recommendation_rows_batch(requested)
+            else:
+                row_groups = await self.dao.get_top_recommendation_rows_batch(requested)
+            payloads.update(self._store_payloads(missing, row_groups))
+
+        return [payloads[key] for key in cache_keys]
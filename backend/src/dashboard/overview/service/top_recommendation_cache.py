@@ -0,0 +1,144 @@
+"""
+Shared cache of formatted, pre-serialized top recommendations.
+Keyed by (data version, platform, limit) and sitting between the services and the DAO,
+with single-flight coalescing of concurrent misses for the same key.
+
+An optional host-wide tier shares serialized bodies between worker processes,
+so a refresh (a data version bump) costs one DB query per host, not per worker.
+"""
+from typing import Any, Dict, Hashable, Optional
+import logging
+import os
+
+from src.cache.shared_file_cache import SharedFileCache, default_shared_directory
+from src.cache.single_flight import AsyncSingleFlight, SingleFlight
+from src.cache.ttl_cache import TTLCache
+from src.config import load_environment
+from src.database.pool_config import env_flag
+from src.dashboard.overview.dao.recommendation_hot_tier import recommendation_hot_tier
+
+load_environment()
+
+logger = logging.getLogger(__name__)
+
+TOP_RECOMMENDATION_CACHE_TTL_SECONDS = float(
+    os.getenv("TOP_RECOMMENDATION_CACHE_TTL_SECONDS", "60")
+)
+TOP_RECOMMENDATION_CACHE_MAX_ENTRIES = int(
+    os.getenv("TOP_RECOMMENDATION_CACHE_MAX_ENTRIES", "128")
+)
+
+top_recommendation_cache = TTLCache(
+    max_entries=TOP_RECOMMENDATION_CACHE_MAX_ENTRIES,
+    ttl_seconds=TOP_RECOMMENDATION_CACHE_TTL_SECONDS
+)
+
+# Longest a superseded payload may still be served while its refresh runs (or keeps failing)
+TOP_RECOMMENDATION_STALE_SECONDS = float(
+    os.getenv("TOP_RECOMMENDATION_STALE_SECONDS", "300")
+)
+
+# Most recent payload per (platform, limit) as (data version, payload), whatever the
+# version; served stale-while-revalidate by the background refresher
+latest_top_recommendations = TTLCache(
+    max_entries=TOP_RECOMMENDATION_CACHE_MAX_ENTRIES,
+    ttl_seconds=TOP_RECOMMENDATION_STALE_SECONDS
+)
+
+# Off by default; enable when running several uvicorn/gunicorn workers per host
+SHARED_PAYLOAD_CACHE_ENABLED = env_flag("SHARED_PAYLOAD_CACHE_ENABLED")
+# Give each deployment on a host its own directory
+SHARED_PAYLOAD_CACHE_DIR = os.getenv(
+    "SHARED_PAYLOAD_CACHE_DIR",
+    default_shared_directory("prism-payload-cache")
+)
+
+# Serialized top recommendation and summary bodies, shared by the workers of a host
+shared_payload_cache = SharedFileCache(
+    directory=SHARED_PAYLOAD_CACHE_DIR,
+    ttl_seconds=TOP_RECOMMENDATION_CACHE_TTL_SECONDS if SHARED_PAYLOAD_CACHE_ENABLED else 0
+)
+
+# Identical concurrent misses share one DB query (threadpool and event loop callers)
+top_recommendation_flight = SingleFlight()
+top_recommendation_async_flight = AsyncSingleFlight()
+
+
+def _normalize_platform(platform: str) -> str:
+    """Map a request key ('google_cloud') or DB type ('Google Cloud') to the request key."""
+    return platform.strip().lower().replace(" ", "_")
+
+
+def shared_payload_key(kind: str, data_version: int, *parts: Hashable) -> str:
+    """
+    Build the shared cache key of a response body.
+    
+    The data version is part of the key, so every worker moves to fresh
+    entries as soon as it reads a bumped version.
+    
+    Args:
+        kind: Response family, e.g. 'top-recommendation'
+        data_version: Data version the body was built from
+        *parts: Request parameters that select the body
+        
+    Returns:
+        Key string
+    """
+    return ":".join([kind, str(data_version), *map(str, parts)])
+
+
+def invalidate_top_recommendations(platform: Optional[str] = None) -> int:
+    """
+    Drop this process's cached top recommendations for a platform.
+    
+    Freshness does not depend on this call: every cache key includes the
+    data version, so once a committed write bumps recommendation_data_version
+    each worker serves new entries as soon as it reads the new version
+    (within RECOMMENDATION_DATA_VERSION_TTL_SECONDS), and superseded ones
+    expire with their TTL. Calling this only frees memory early, and
+    only in the calling process; called from an ingestion CLI, it cannot
+    reach the caches of the API workers. The host-wide shared tier is left
+    to expire on its own.
+    
+    Invalidating a single platform also drops the 'all_platform' entries,
+    since those rankings include every platform.
+    
+    Args:
+        platform: Platform key or DB type that changed; None drops everything
+        
+    Returns:
+        Number of cache entries removed
+    """
+    if platform is None:
+        removed = top_recommendation_cache.clear()
+        latest_top_recommendations.clear()
+    else:
+        affected = {_normalize_platform(platform), "all_platform"}
+        removed = top_recommendation_cache.invalidate_where(
+            lambda key: key[1] in affected
+        )
+        latest_top_recommendations.invalidate_where(lambda key: key[0] in affected)
+
+    logger.info(
+        f"Invalidated {removed} cached top recommendation entries for platform: {platform or 'ALL'}"
+    )
+    return removed
+
+
+def get_top_recommendation_cache_stats() -> Dict[str, Dict[str, Any]]:
+    """
+    Get cache and request coalescing counters for top recommendations.
+    
+    Returns:
+        Dictionary with the cache counters, the latest-payload (stale) tier,
+        this worker's host-wide cache counters, the sync/async
+        single-flight counters and the in-memory hot tier state
+    """
+    return {
+        "cache": top_recommendation_cache.stats(),
+        "latest": latest_top_recommendations.stats(),
+        "shared_cache": shared_payload_cache.stats(),
+        "single_flight": top_recommendation_flight.stats(),
+        "async_single_flight": top_recommendation_async_flight.stats(),
+        "hot_tier": recommendation_hot_tier.stats()
+    }
@@ -0,0 +1,282 @@
+"""
+Background stale-while-revalidate refresher for top recommendations.
+
+Started by the FastAPI lifespan, it refreshes the top recommendations of
+every TopRecommendationRequest platform each
+TOP_RECOMMENDATION_REFRESH_INTERVAL_SECONDS (jittered, so workers do not
+refresh in step), well before cached entries expire:
+
+- if the data version is unchanged, the cached payload is still correct and
+  only its expiry is pushed back, without querying the recommendations;
+- otherwise the payload of the new version is loaded through the service
+  (in-process cache, single-flight, host-wide cache).
+
+Requests on the top recommendation endpoint are answered from the latest
+payload of their platform. When it was built from an older data version,
+it is served with that version's ETag while a background refresh for the
+new version runs, so no request waits on the query. At most
+TOP_RECOMMENDATION_REFRESH_CONCURRENCY refreshes run at once.
+"""
+from typing import Dict, Optional, Sequence, Tuple, get_args
+import asyncio
+import logging
+import os
+import random
+
+from fastapi.concurrency import run_in_threadpool
+
+from src.config import load_environment
+from src.database.pool_config import env_flag
+from src.database.replicas import get_async_read_session_factory, get_read_session_factory
+from src.database.session import USE_ASYNC_DB
+from src.dashboard.overview.schemas.top_recommendation_schema import TopRecommendationRequest
+from src.dashboard.overview.service.data_version_async_service import DataVersionAsyncService
+from src.dashboard.overview.service.data_version_service import DataVersionService
+from src.dashboard.overview.service.top_recommendation_async_service import TopRecommendationAsyncService
+from src.dashboard.overview.service.top_recommendation_cache import (
+    TOP_RECOMMENDATION_CACHE_TTL_SECONDS,
+    latest_top_recommendations,
+    top_recommendation_cache
+)
+from src.dashboard.overview.service.top_recommendation_service import (
+    TopRecommendationPayload,
+    TopRecommendationService
+)
+
+load_environment()
+
+logger = logging.getLogger(__name__)
+
+TOP_RECOMMENDATION_REFRESH_ENABLED = env_flag("TOP_RECOMMENDATION_REFRESH_ENABLED", "true")
+# Defaults to half the cache TTL, so entries are renewed long before they expire
+TOP_RECOMMENDATION_REFRESH_INTERVAL_SECONDS = float(
+    os.getenv("TOP_RECOMMENDATION_REFRESH_INTERVAL_SECONDS", str(TOP_RECOMMENDATION_CACHE_TTL_SECONDS / 2))
+)
+# Each interval is drawn from interval * (1 +/- jitter)
+TOP_RECOMMENDATION_REFRESH_JITTER = float(os.getenv("TOP_RECOMMENDATION_REFRESH_JITTER", "0.2"))
+TOP_RECOMMENDATION_REFRESH_CONCURRENCY = int(os.getenv("TOP_RECOMMENDATION_REFRESH_CONCURRENCY", "2"))
+
+# Every platform the top recommendation endpoint accepts, and the limit it serves
+REFRESH_PLATFORMS: Tuple[str, ...] = get_args(TopRecommendationRequest.model_fields["platform"].annotation)
+TOP_RECOMMENDATION_LIMIT = 6
+
+LatestPayload = Tuple[int, TopRecommendationPayload]
+
+
+class TopRecommendationRefresher:
+    """Periodic and on-demand refreshes of the latest top recommendation payloads."""
+
+    def __init__(
+        self,
+        platforms: Sequence[str],
+        limit: int,
+        interval_seconds: float,
+        jitter: float,
+        concurrency: int,
+        enabled: bool = True
+    ):
+        """Initialize the refresher.
+
+        Args:
+            platforms: Platform filters to keep fresh
+            limit: Number of recommendations per platform
+            interval_seconds: Mean time between refresh rounds
+            jitter: Relative spread of each interval, e.g. 0.2 for +/- 20%
+            concurrency: Refreshes allowed to run at once
+            enabled: False turns every method into a no-op
+        """
+        self.platforms = tuple(platforms)
+        self.limit = limit
+        self.interval_seconds = interval_seconds
+        self.jitter = jitter
+        self.concurrency = max(1, concurrency)
+        self.enabled = (
+            enabled
+            and interval_seconds > 0
+            and top_recommendation_cache.enabled
+            and latest_top_recommendations.enabled
+        )
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._refreshes: Dict[Tuple[str, int], asyncio.Task] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._counters = {"refreshed": 0, "skipped_unchanged": 0, "failed": 0, "stale_served": 0}
+
+    def _jittered(self, seconds: float) -> float:
+        return seconds * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    @staticmethod
+    def remember(platform: str, limit: int, data_version: int, payload: TopRecommendationPayload) -> None:
+        """
+        Record a payload as the latest of its platform unless a newer one is known.
+
+        Args:
+            platform: Platform filter
+            limit: Number of recommendations
+            data_version: Data version the payload was built from
+            payload: Payload to serve
+        """
+        key = (platform, limit)
+        latest = latest_top_recommendations.get(key)
+        if latest is None or latest[0] <= data_version:
+            latest_top_recommendations.set(key, (data_version, payload))
+
+    def serve(self, platform: str, limit: int, data_version: int) -> Optional[LatestPayload]:
+        """
+        Get the latest payload to answer a request with, revalidating it if superseded.
+
+        Args:
+            platform: Platform filter of the request
+            limit: Number of recommendations of the request
+            data_version: Data version the request read
+
+        Returns:
+            (data version, payload) to serve, possibly from an older version;
+            None when the request should load the payload itself
+        """
+        if not self.enabled:
+            return None
+        latest = latest_top_recommendations.get((platform, limit))
+        if latest is None or latest[0] > data_version:
+            return None
+        if latest[0] < data_version:
+            self._counters["stale_served"] += 1
+            self.revalidate(platform, limit)
+        return latest
+
+    @staticmethod
+    def _renew_if_unchanged(platform: str, limit: int, data_version: int) -> bool:
+        """Push back the expiry of a payload still built from the current version."""
+        key = (platform, limit)
+        latest = latest_top_recommendations.get(key)
+        if latest is None or latest[0] != data_version:
+            return False
+        latest_top_recommendations.set(key, latest)
+        top_recommendation_cache.set((data_version, platform, limit), latest[1])
+        return True
+
+    def _refresh_sync(self, platform: str, limit: int) -> Optional[LatestPayload]:
+        db = get_read_session_factory()()
+        try:
+            data_version = DataVersionService(db).get_version()
+            if self._renew_if_unchanged(platform, limit, data_version):
+                return None
+            payload = TopRecommendationService(db).get_top_recommendations_payload(
+                platform, limit, data_version=data_version
+            )
+            return data_version, payload
+        finally:
+            db.close()
+
+    async def _refresh_async(self, platform: str, limit: int) -> Optional[LatestPayload]:
+        async with (await get_async_read_session_factory())() as db:
+            data_version = await DataVersionAsyncService(db).get_version()
+            if self._renew_if_unchanged(platform, limit, data_version):
+                return None
+            payload = await TopRecommendationAsyncService(db).get_top_recommendations_payload(
+                platform, limit, data_version=data_version
+            )
+            return data_version, payload
+
+    async def refresh(self, platform: str, limit: int) -> None:
+        """
+        Refresh one platform now, waiting for a free concurrency slot.
+
+        Failures are logged and counted, not raised; the previous payload
+        keeps being served until TOP_RECOMMENDATION_STALE_SECONDS.
+
+        Args:
+            platform: Platform filter
+            limit: Number of recommendations
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        async with self._semaphore:
+            try:
+                if USE_ASYNC_DB:
+                    loaded = await self._refresh_async(platform, limit)
+                else:
+                    loaded = await run_in_threadpool(self._refresh_sync, platform, limit)
+            except Exception as e:
+                self._counters["failed"] += 1
+                logger.warning(f"Top recommendation refresh failed for platform {platform}: {str(e)}")
+                return
+
+        if loaded is None:
+            self._counters["skipped_unchanged"] += 1
+            return
+        data_version, payload = loaded
+        # The service may have returned a cached entry; renew it along with the latest payload
+        top_recommendation_cache.set((data_version, platform, limit), payload)
+        self.remember(platform, limit, data_version, payload)
+        self._counters["refreshed"] += 1
+
+    def revalidate(self, platform: str, limit: int) -> asyncio.Task:
+        """
+        Start a background refresh of one platform unless one is already running.
+
+        Args:
+            platform: Platform filter
+            limit: Number of recommendations
+
+        Returns:
+            The task running the refresh
+        """
+        key = (platform, limit)
+        task = self._refreshes.get(key)
+        if task is None:
+            task = asyncio.get_running_loop().create_task(self.refresh(platform, limit))
+            self._refreshes[key] = task
+            task.add_done_callback(lambda _: self._refreshes.pop(key, None))
+        return task
+
+    async def refresh_all(self) -> None:
+        """Refresh every platform, joining refreshes already in flight."""
+        await asyncio.gather(*(self.revalidate(platform, self.limit) for platform in self.platforms))
+
+    async def _run(self) -> None:
+        # Start at a random point of the first interval so workers spread out
+        delay = random.uniform(0, self.interval_seconds * self.jitter)
+        while True:
+            await asyncio.sleep(delay)
+            await self.refresh_all()
+            delay = self._jittered(self.interval_seconds)
+
+    def start(self) -> None:
+        """Start the refresh loop on the running event loop (lifespan start-up)."""
+        if not self.enabled or self._task is not None:
+            return
+        self._task = asyncio.get_running_loop().create_task(self._run())
+        logger.info(
+            f"Top recommendation refresher started: {len(self.platforms)} platforms every "
+            f"~{self.interval_seconds:g}s, {self.concurrency} at a time"
+        )
+
+    async def stop(self) -> None:
+        """Cancel the refresh loop and any refresh in flight (lifespan shutdown)."""
+        tasks = [task for task in (self._task, *self._refreshes.values()) if task is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._task = None
+        self._refreshes.clear()
+        # Bound to the loop that is shutting down
+        self._semaphore = None
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Refresh counters of this worker process.
+
+        Returns:
+            Dictionary with refreshed, skipped_unchanged, failed, stale_served and in_flight
+        """
+        return {**self._counters, "in_flight": len(self._refreshes)}
+
+
+top_recommendation_refresher = TopRecommendationRefresher(
+    REFRESH_PLATFORMS,
+    TOP_RECOMMENDATION_LIMIT,
+    TOP_RECOMMENDATION_REFRESH_INTERVAL_SECONDS,
+    TOP_RECOMMENDATION_REFRESH_JITTER,
+    TOP_RECOMMENDATION_REFRESH_CONCURRENCY,
+    enabled=TOP_RECOMMENDATION_REFRESH_ENABLED
+)
@@ -2,16 +2,98 @@
 Service layer for Top Recommendations.
 Handles business logic for fetching and formatting top recommendations.
 """
-from typing import List
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 from decimal import Decimal
+import orjson
 from sqlalchemy.orm import Session
 
+from src.dashboard.overview.dao.recommendation_hot_tier import recommendation_hot_tier
 from src.dashboard.overview.dao.top_recommendation_dao import TopRecommendationDAO
+from src.dashboard.overview.service.data_version_service import DataVersionService
+from src.dashboard.overview.models.recommendation import AWSRecommendationConsolidate
 from src.dashboard.overview.schemas.top_recommendation_schema import (
     RecommendationItem,
     SuccessResponse,
     TopRecommendationResponse
 )
+from src.dashboard.overview.service.top_recommendation_cache import (
+    shared_payload_cache,
+    shared_payload_key,
+    top_recommendation_cache,
+    top_recommendation_flight
+)
+
+
+SUCCESS_MESSAGE = "Data Received Successfully"
+
+
+class TopRecommendationPayload:
+    """Formatted top recommendations and their serialized TopRecommendationResponse body."""
+
+    __slots__ = ("items", "body")
+
+    def __init__(self, items: Tuple[Dict[str, str], ...]):
+        """Serialize the response body once, when the payload is built.
+        
+        Args:
+            items: Formatted item dictionaries with the RecommendationItem fields
+        """
+        self.items = items
+        self.body: bytes = orjson.dumps({
+            "success_response": {
+                "status_code": 200,
+                "message": SUCCESS_MESSAGE,
+                "status": True,
+                "data": list(items)
+            }
+        })
+
+    @classmethod
+    def from_body(cls, body: bytes) -> "TopRecommendationPayload":
+        """Rebuild a payload from a body serialized by another worker process.
+        
+        Args:
+            body: JSON body of a TopRecommendationResponse
+            
+        Returns:
+            Payload reusing the body as-is
+        """
+        payload = cls.__new__(cls)
+        payload.items = tuple(orjson.loads(body)["success_response"]["data"])
+        payload.body = body
+        return payload
+
+
+def shared_top_recommendation_key(cache_key: Tuple[int, str, int]) -> str:
+    """Host-wide cache key of a (data version, platform, limit) cache key."""
+    return shared_payload_key("top-recommendation", *cache_key)
+
+
+def build_batch_body(
+    requests: Sequence[Tuple[str, int]],
+    payloads: Sequence[TopRecommendationPayload]
+) -> bytes:
+    """
+    Serialize a TopRecommendationBatchResponse from per-platform payloads.
+    
+    Args:
+        requests: (platform, limit) pairs in response order
+        payloads: Payload of each request
+        
+    Returns:
+        JSON body
+    """
+    return orjson.dumps({
+        "success_response": {
+            "status_code": 200,
+            "message": SUCCESS_MESSAGE,
+            "status": True,
+            "data": [
+                {"platform": platform, "limit": limit, "data": list(payload.items)}
+                for (platform, limit), payload in zip(requests, payloads)
+            ]
+        }
+    })
 
 
 class TopRecommendationService:
@@ -24,6 +106,7 @@ class TopRecommendationService:
             db: SQLAlchemy database session
         """
         self.dao = TopRecommendationDAO(db)
+        self.data_version = DataVersionService(db)
 
     @staticmethod
     def _format_savings(potential: Decimal) -> str:
@@ -63,6 +146,55 @@ class TopRecommendationService:
         }
         return platform_mapping.get(platform_type, platform_type or "Unknown")
 
+    @classmethod
+    def _build_items(
+        cls,
+        recommendations: Iterable[AWSRecommendationConsolidate]
+    ) -> Tuple[Dict[str, str], ...]:
+        """
+        Transform DAO results into response item dictionaries.
+        
+        Args:
+            recommendations: Entities or projected rows exposing type,
+                description, recommendation and potential
+            
+        Returns:
+            Tuple of formatted items with the RecommendationItem fields
+        """
+        return tuple(
+            {
+                "platform_name": cls._get_platform_display_name(rec.type),
+                "description": rec.description or rec.recommendation or "Recommended optimization",
+                "value": cls._format_savings(rec.potential)
+            }
+            for rec in recommendations
+        )
+
+    @staticmethod
+    def _build_response(
+        recommendation_items: Iterable[Dict[str, str]]
+    ) -> TopRecommendationResponse:
+        """
+        Wrap formatted items in the top recommendations response.
+        
+        Items come from our own formatting of DB rows, so the models are
+        constructed without re-running validation.
+        
+        Args:
+            recommendation_items: Formatted item dictionaries
+            
+        Returns:
+            TopRecommendationResponse with formatted recommendations
+        """
+        success_response = SuccessResponse.model_construct(
+            status_code=200,
+            message=SUCCESS_MESSAGE,
+            status=True,
+            data=[RecommendationItem.model_construct(**item) for item in recommendation_items]
+        )
+
+        return TopRecommendationResponse.model_construct(success_response=success_response)
+
     def get_top_recommendations(
         self,
         platform: str,
@@ -78,29 +210,168 @@ class TopRecommendationService:
         Returns:
             TopRecommendationResponse with formatted recommendations
         """
-        # Fetch recommendations from database
-        recommendations = self.dao.get_top_recommendations(
+        payload = self.get_top_recommendations_payload(platform, limit)
+        return self._build_response(payload.items)
+
+    def get_top_recommendations_payload(
+        self,
+        platform: str,
+        limit: int = 6,
+        data_version: Optional[int] = None
+    ) -> TopRecommendationPayload:
+        """
+        Get top recommendations with their pre-serialized response body.
+        
+        Results are served from the shared top recommendation cache when a
+        live entry exists for (data version, platform, limit), so a write to
+        the table retires cached entries at once. Concurrent misses for the
+        same key share a single DB query.
+        
+        Args:
+            platform: The platform filter (aws, databricks, snowflakes, google_cloud, all_platform)
+            limit: Maximum number of recommendations to return (default: 6)
+            data_version: Data version the caller already read; read here when None
+            
+        Returns:
+            TopRecommendationPayload with items and JSON body
+        """
+        if data_version is None:
+            data_version = self.data_version.get_version()
+
+        cache_key = (data_version, platform, limit)
+        payload = top_recommendation_cache.get(cache_key)
+
+        if payload is None:
+            payload = top_recommendation_flight.do(
+                cache_key,
+                lambda: self._load_payload(cache_key)
+            )
+
+        return payload
+
+    def _load_payload(self, cache_key: Tuple[int, str, int]) -> TopRecommendationPayload:
+        """
+        Load a payload missing from the in-process cache and populate it.
+        
+        With the host-wide cache enabled, one worker process queries the
+        database and the others reuse its serialized body.
+        
+        Args:
+            cache_key: (data version, platform filter, limit)
+            
+        Returns:
+            TopRecommendationPayload for the key
+        """
+        if shared_payload_cache.enabled:
+            body = shared_payload_cache.get_or_load(
+                shared_top_recommendation_key(cache_key),
+                lambda: self._fetch_payload(cache_key).body
+            )
+            payload = TopRecommendationPayload.from_body(body)
+        else:
+            payload = self._fetch_payload(cache_key)
+
+        top_recommendation_cache.set(cache_key, payload)
+        return payload
+
+    def _fetch_payload(self, cache_key: Tuple[int, str, int]) -> TopRecommendationPayload:
+        """
+        Fetch recommendations from the hot tier if it holds the data version, else the database.
+        
+        Args:
+            cache_key: (data version, platform filter, limit)
+            
+        Returns:
+            TopRecommendationPayload for the fetched rows
+        """
+        data_version, platform, limit = cache_key
+        dao = recommendation_hot_tier.dao_for(data_version) or self.dao
+        recommendations = dao.get_top_recommendation_rows(
             platform=platform,
             limit=limit
         )
+        return TopRecommendationPayload(self._build_items(recommendations))
 
-        # Transform to response format
-        recommendation_items: List[RecommendationItem] = []
+    @staticmethod
+    def _cached_payloads(
+        cache_keys: Sequence[Tuple[int, str, int]]
+    ) -> Dict[Tuple[int, str, int], Optional[TopRecommendationPayload]]:
+        """
+        Look up several cache keys at once, in-process first, then host-wide.
         
-        for rec in recommendations:
-            item = RecommendationItem(
-                platform_name=self._get_platform_display_name(rec.type),
-                description=rec.description or rec.recommendation or "Recommended optimization",
-                value=self._format_savings(rec.potential)
-            )
-            recommendation_items.append(item)
+        Args:
+            cache_keys: (data version, platform filter, limit) keys, duplicates allowed
+            
+        Returns:
+            Payload per distinct key; None for misses
+        """
+        payloads = {key: top_recommendation_cache.get(key) for key in cache_keys}
 
-        # Build success response
-        success_response = SuccessResponse(
-            status_code=200,
-            message="Data Received Successfully",
-            status=True,
-            data=recommendation_items
-        )
+        if shared_payload_cache.enabled:
+            for key, payload in payloads.items():
+                if payload is not None:
+                    continue
+                body = shared_payload_cache.get(shared_top_recommendation_key(key))
+                if body is not None:
+                    payloads[key] = TopRecommendationPayload.from_body(body)
+                    top_recommendation_cache.set(key, payloads[key])
+
+        return payloads
+
+    @staticmethod
+    def _store_payloads(
+        cache_keys: Sequence[Tuple[int, str, int]],
+        row_groups: Sequence[Sequence]
+    ) -> Dict[Tuple[int, str, int], TopRecommendationPayload]:
+        """
+        Build payloads for freshly fetched row groups and cache them.
+        
+        Args:
+            cache_keys: Keys the row groups were fetched for
+            row_groups: One group of rows per key, in the same order
+            
+        Returns:
+            Payload per key
+        """
+        loaded = {}
+        for cache_key, rows in zip(cache_keys, row_groups):
+            payload = TopRecommendationPayload(TopRecommendationService._build_items(rows))
+            top_recommendation_cache.set(cache_key, payload)
+            if shared_payload_cache.enabled:
+                shared_payload_cache.set(shared_top_recommendation_key(cache_key), payload.body)
+            loaded[cache_key] = payload
+        return loaded
+
+    def get_top_recommendations_batch(
+        self,
+        requests: Sequence[Tuple[str, int]],
+        data_version: Optional[int] = None
+    ) -> List[TopRecommendationPayload]:
+        """
+        Get the top recommendations of several platforms at once.
+        
+        Cached platforms are served from the in-process or host-wide cache;
+        all the others are fetched together with a single query.
+        
+        Args:
+            requests: (platform, limit) pairs
+            data_version: Data version the caller already read; read here when None
+            
+        Returns:
+            One TopRecommendationPayload per request, in request order
+        """
+        if data_version is None:
+            data_version = self.data_version.get_version()
+
+        cache_keys = [(data_version, platform, limit) for platform, limit in requests]
+        payloads = self._cached_payloads(cache_keys)
+        missing = [key for key, payload in payloads.items() if payload is None]
+
+        if missing:
+            dao = recommendation_hot_tier.dao_for(data_version) or self.dao
+            row_groups = dao.get_top_recommendation_rows_batch(
+                [(platform, limit) for _, platform, limit in missing]
+            )
+            payloads.update(self._store_payloads(missing, row_groups))
 
-        return TopRecommendationResponse(success_response=success_response)
+        return [payloads[key] for key in cache_keys]
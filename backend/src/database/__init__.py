@@ -1,4 +1,35 @@
-from .base import Base
-from .session import get_db, SessionLocal, engine
+"""
+Database package. Exports resolve on first access, so importing one
+submodule (e.g. pool_config) does not create engines or load drivers.
+"""
+from importlib import import_module
+from typing import Any
 
-__all__ = ["Base", "get_db", "SessionLocal", "engine"]
+_EXPORTS = {
+    "Base": ".base",
+    "get_db": ".session",
+    "get_engine": ".session",
+    "get_session_factory": ".session",
+    "SessionLocal": ".session",
+    "engine": ".session",
+    "USE_ASYNC_DB": ".session",
+    "get_async_db": ".async_session",
+    "get_async_engine": ".async_session",
+    "get_async_session_factory": ".async_session",
+    "AsyncSessionLocal": ".async_session",
+    "async_engine": ".async_session",
+    "get_read_db": ".replicas",
+    "get_async_read_db": ".replicas",
+    "replica_router": ".replicas",
+    "get_request_db": ".dependencies",
+    "get_request_read_db": ".dependencies"
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(_EXPORTS[name], __name__), name)
+
+
+__all__ = list(_EXPORTS)
@@ -0,0 +1,106 @@
+"""
+Async database session management.
+
+Provides an asyncpg-backed engine and ``AsyncSession`` factory so that
+request handlers running on the event loop never block on database I/O.
+Like the sync engine, it is created on first use; in sync mode asyncpg is
+never imported.
+"""
+from typing import Any, AsyncGenerator, Optional
+import threading
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine
+)
+
+from src.database.pool_config import configure_engine
+from src.database.session import DATABASE_URL, POOL_SETTINGS
+from src.observability.db import InstrumentedAsyncQueuePool, instrument_engine
+
+
+def to_async_url(url: str) -> str:
+    """
+    Convert a sync PostgreSQL URL to its asyncpg equivalent.
+
+    Args:
+        url: Database URL such as ``postgresql://`` or ``postgresql+psycopg2://``
+
+    Returns:
+        The same URL using the ``postgresql+asyncpg://`` driver
+    """
+    for prefix in ("postgresql+psycopg2://", "postgresql://", "postgres://"):
+        if url.startswith(prefix):
+            return "postgresql+asyncpg://" + url[len(prefix):]
+    return url
+
+
+_async_engine: Optional[AsyncEngine] = None
+_async_session_factory: Optional[async_sessionmaker] = None
+_async_engine_lock = threading.Lock()
+
+
+def get_async_engine() -> AsyncEngine:
+    """
+    Get the async engine, creating it on the first call.
+    
+    Returns:
+        The process-wide SQLAlchemy async engine
+    """
+    global _async_engine, _async_session_factory
+    if _async_engine is None:
+        with _async_engine_lock:
+            if _async_engine is None:
+                async_engine = create_async_engine(
+                    to_async_url(DATABASE_URL),
+                    poolclass=InstrumentedAsyncQueuePool,
+                    pool_logging_name="async",
+                    **POOL_SETTINGS.engine_kwargs(is_async=True)
+                )
+                configure_engine(async_engine.sync_engine, POOL_SETTINGS)
+                instrument_engine(async_engine.sync_engine, "async")
+                _async_session_factory = async_sessionmaker(
+                    bind=async_engine,
+                    autoflush=False,
+                    expire_on_commit=False
+                )
+                _async_engine = async_engine
+    return _async_engine
+
+
+def get_async_session_factory() -> async_sessionmaker:
+    """
+    Get the session factory bound to the async engine.
+    
+    Returns:
+        async_sessionmaker producing AsyncSession objects
+    """
+    get_async_engine()
+    return _async_session_factory
+
+
+async def dispose_async_engine() -> None:
+    """Close the pooled connections of the async engine, if it was created."""
+    if _async_engine is not None:
+        await _async_engine.dispose()
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve ``async_engine`` and ``AsyncSessionLocal`` lazily for existing importers."""
+    if name == "async_engine":
+        return get_async_engine()
+    if name == "AsyncSessionLocal":
+        return get_async_session_factory()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency to get an async database session.
+
+    Yields:
+        Async database session
+    """
+    async with get_async_session_factory()() as db:
+        yield db
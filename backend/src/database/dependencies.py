@@ -0,0 +1,14 @@
+"""
+Request-scoped database session dependencies for API routes.
+"""
+from src.database.async_session import get_async_db
+from src.database.replicas import get_async_read_db, get_read_db
+from src.database.session import USE_ASYNC_DB, get_db
+
+# Database session dependency selected by the USE_ASYNC_DB switch:
+# yields an AsyncSession in async mode and a blocking Session otherwise
+get_request_db = get_async_db if USE_ASYNC_DB else get_db
+
+# Same, for read-only routes: the session is on a healthy read replica
+# (DATABASE_READ_REPLICA_URLS) or on the primary when none is usable
+get_request_read_db = get_async_read_db if USE_ASYNC_DB else get_read_db
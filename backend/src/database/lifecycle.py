@@ -0,0 +1,113 @@
+"""
+Engine start-up and shutdown hooks for the FastAPI lifespan.
+
+Engines are created here rather than at import time. Warm-up opens pooled
+connections before the first request, so requests right after a deploy do
+not pay TCP, TLS and authentication setup.
+"""
+from typing import List
+import asyncio
+import logging
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import text
+
+from src.database.async_session import dispose_async_engine, get_async_engine
+from src.database.replicas import replica_router
+from src.database.session import POOL_SETTINGS, USE_ASYNC_DB, dispose_engine, get_engine
+
+logger = logging.getLogger(__name__)
+
+
+def warm_up_sync_pool(connections: int) -> int:
+    """
+    Open connections on the sync engine and return them to its pool.
+    
+    All connections are held at once, so the pool has to open each one.
+    
+    Args:
+        connections: Number of connections to open
+        
+    Returns:
+        Number of connections opened
+    """
+    engine = get_engine()
+    held: List = []
+    try:
+        for _ in range(connections):
+            connection = engine.connect()
+            held.append(connection)
+            connection.execute(text("SELECT 1"))
+    finally:
+        for connection in held:
+            connection.close()
+    return len(held)
+
+
+async def warm_up_async_pool(connections: int) -> int:
+    """
+    Open connections on the async engine concurrently and return them to its pool.
+    
+    Args:
+        connections: Number of connections to open
+        
+    Returns:
+        Number of connections opened
+    """
+    async_engine = get_async_engine()
+    results = await asyncio.gather(
+        *(async_engine.connect() for _ in range(connections)),
+        return_exceptions=True
+    )
+    held = [result for result in results if not isinstance(result, BaseException)]
+    try:
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        await asyncio.gather(*(connection.execute(text("SELECT 1")) for connection in held))
+    finally:
+        await asyncio.gather(*(connection.close() for connection in held))
+    return len(held)
+
+
+async def warm_up_pools() -> None:
+    """
+    Create the engine serving API reads and pre-open DB_POOL_WARMUP_CONNECTIONS on it.
+    
+    Failures are logged, not raised: the app still starts and connects
+    lazily if the database is unavailable at boot.
+    """
+    # Build the engine here rather than on the first request
+    if USE_ASYNC_DB:
+        get_async_engine()
+    else:
+        get_engine()
+
+    # Learn which read replicas are usable before the first read is routed
+    if replica_router.replicas:
+        if USE_ASYNC_DB:
+            await replica_router.check_async()
+        else:
+            await run_in_threadpool(replica_router.check)
+        logger.info(f"Read replicas: {replica_router.status()}")
+
+    connections = POOL_SETTINGS.warmup_connections
+    if connections <= 0:
+        return
+
+    try:
+        if USE_ASYNC_DB:
+            opened = await warm_up_async_pool(connections)
+        else:
+            opened = await run_in_threadpool(warm_up_sync_pool, connections)
+        logger.info(f"Warmed up {opened} database connections ({'async' if USE_ASYNC_DB else 'sync'} engine)")
+    except Exception as e:
+        logger.warning(f"Database pool warm-up failed, connecting lazily: {str(e)}")
+
+
+async def dispose_engines() -> None:
+    """Close every pooled connection of the engines that were created, on shutdown."""
+    await dispose_async_engine()
+    dispose_engine()
+    await replica_router.dispose_async()
+    replica_router.dispose()
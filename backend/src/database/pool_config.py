@@ -0,0 +1,179 @@
+"""
+Connection pool configuration shared by the sync and async engines.
+
+Pool sizes can be set directly or derived from a per-host connection
+budget split across worker processes. Liveness checks on checkout can be
+the SQLAlchemy pre-ping (one extra round trip per checkout), a ping only
+for connections idle longer than a threshold, or off. PgBouncer mode
+disables server-side prepared statements so the app is safe behind
+transaction pooling.
+"""
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+import logging
+import os
+import time
+import uuid
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+PRE_PING_MODES = ("always", "idle", "off")
+
+
+def _env_int(name: str, default: Optional[int] = None, minimum: Optional[int] = None) -> Optional[int]:
+    value = os.getenv(name)
+    if value in (None, ""):
+        return default
+    number = int(value)
+    if minimum is not None and number < minimum:
+        raise ValueError(f"{name} must be at least {minimum}, got {number}")
+    return number
+
+
+def env_flag(name: str, default: str = "false") -> bool:
+    """
+    Read a boolean environment variable.
+    
+    Args:
+        name: Variable name
+        default: Value used when the variable is unset
+        
+    Returns:
+        True for 1, true or yes (any case)
+    """
+    return os.getenv(name, default).lower() in ("1", "true", "yes")
+
+
+@dataclass(frozen=True)
+class PoolSettings:
+    """Resolved pool parameters for one engine in one worker process."""
+
+    pool_size: int = 10
+    max_overflow: int = 20
+    pool_timeout: float = 30.0
+    pool_recycle: int = 1800
+    pre_ping: str = "always"
+    ping_idle_seconds: float = 30.0
+    warmup_connections: int = 0
+    pgbouncer: bool = False
+
+    @classmethod
+    def from_env(cls) -> "PoolSettings":
+        """
+        Read pool settings from the environment.
+        
+        DB_MAX_CONNECTIONS is the connection budget of one engine across all
+        WEB_CONCURRENCY workers of a host; when set, each worker gets an
+        equal share, split between pool_size and max_overflow.
+        
+        Returns:
+            PoolSettings for this worker
+            
+        Raises:
+            ValueError: If a setting is out of range, e.g. DB_POOL_SIZE below 1
+        """
+        pool_size = _env_int("DB_POOL_SIZE", 10, minimum=1)
+        max_overflow = _env_int("DB_MAX_OVERFLOW", 20, minimum=0)
+
+        budget = _env_int("DB_MAX_CONNECTIONS", minimum=1)
+        if budget is not None:
+            workers = max(1, _env_int("WEB_CONCURRENCY") or 1)
+            per_worker = max(1, budget // workers)
+            pool_size = min(pool_size, per_worker)
+            max_overflow = min(max_overflow, per_worker - pool_size)
+
+        pre_ping = os.getenv("DB_POOL_PRE_PING", "always").lower()
+        if pre_ping not in PRE_PING_MODES:
+            raise ValueError(f"DB_POOL_PRE_PING must be one of: {', '.join(PRE_PING_MODES)}")
+
+        warmup = _env_int("DB_POOL_WARMUP_CONNECTIONS", minimum=0)
+
+        return cls(
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_timeout=float(os.getenv("DB_POOL_TIMEOUT", "30")),
+            # -1 disables recycling
+            pool_recycle=_env_int("DB_POOL_RECYCLE", 1800, minimum=-1),
+            pre_ping=pre_ping,
+            ping_idle_seconds=float(os.getenv("DB_POOL_PING_IDLE_SECONDS", "30")),
+            warmup_connections=min(pool_size, pool_size if warmup is None else warmup),
+            pgbouncer=env_flag("DB_PGBOUNCER")
+        )
+
+    def engine_kwargs(self, is_async: bool = False) -> Dict[str, Any]:
+        """
+        Keyword arguments for create_engine / create_async_engine.
+        
+        Args:
+            is_async: Whether the engine uses asyncpg
+            
+        Returns:
+            Pool and connect arguments
+        """
+        kwargs: Dict[str, Any] = {
+            "pool_size": self.pool_size,
+            "max_overflow": self.max_overflow,
+            "pool_timeout": self.pool_timeout,
+            "pool_recycle": self.pool_recycle,
+            "pool_pre_ping": self.pre_ping == "always"
+        }
+
+        if self.pgbouncer and is_async:
+            # Transaction pooling hands each transaction to any server connection,
+            # so named prepared statements from asyncpg's caches would collide
+            kwargs["connect_args"] = {
+                "statement_cache_size": 0,
+                "prepared_statement_cache_size": 0,
+                "prepared_statement_name_func": lambda: f"__asyncpg_{uuid.uuid4()}__"
+            }
+
+        return kwargs
+
+
+def install_idle_ping(engine: Engine, idle_seconds: float) -> None:
+    """
+    Ping pooled connections on checkout only if they sat idle too long.
+    
+    Replaces pool_pre_ping's round trip on every checkout: busy connections
+    are handed out directly, idle ones are checked and silently replaced
+    if the server closed them. pool_recycle still bounds their total age.
+    
+    Args:
+        engine: Sync engine (for an AsyncEngine pass async_engine.sync_engine)
+        idle_seconds: Idle time after which a connection is pinged
+    """
+    dialect = engine.dialect
+
+    @event.listens_for(engine.pool, "checkin")
+    def _mark_idle(dbapi_connection, connection_record):
+        connection_record.info["idle_since"] = time.monotonic()
+
+    @event.listens_for(engine.pool, "checkout")
+    def _ping_if_idle(dbapi_connection, connection_record, connection_proxy):
+        idle_since = connection_record.info.get("idle_since")
+        if idle_since is None or time.monotonic() - idle_since < idle_seconds:
+            return
+        try:
+            alive = dialect.do_ping(dbapi_connection)
+        except Exception as e:
+            if not dialect.is_disconnect(e, dbapi_connection, None):
+                raise
+            alive = False
+        if not alive:
+            # The pool discards this connection and checks out another one
+            raise exc.DisconnectionError("Idle connection failed ping")
+
+
+def configure_engine(engine: Engine, settings: PoolSettings) -> None:
+    """
+    Apply the checkout liveness strategy that create_engine cannot express.
+    
+    Args:
+        engine: Sync engine (for an AsyncEngine pass async_engine.sync_engine)
+        settings: Settings the engine was created with
+    """
+    if settings.pre_ping == "idle":
+        install_idle_ping(engine, settings.ping_idle_seconds)
@@ -0,0 +1,390 @@
+"""
+Read-replica routing for dashboard reads.
+
+DATABASE_READ_REPLICA_URLS lists streaming replicas of DATABASE_URL. Read
+sessions (get_read_db / get_async_read_db) are handed out round-robin
+across the replicas that passed their last health check; writes and
+ingestion keep using the primary engine. A replica is skipped when it
+cannot be reached, is not in recovery (it was promoted, or is not a
+standby at all) or replays more than DB_REPLICA_MAX_LAG_SECONDS behind the
+primary. With no usable replica, reads fall back to the primary.
+
+Health is re-checked at most every DB_REPLICA_CHECK_INTERVAL_SECONDS, by
+the first read session asked for after the interval; other callers keep
+routing on the previous result meanwhile. A disconnect seen by a replica
+engine takes it out of rotation until the next check.
+"""
+from dataclasses import dataclass
+from typing import Any, AsyncGenerator, Dict, Generator, List, Optional, Tuple
+import asyncio
+import itertools
+import logging
+import os
+import threading
+import time
+
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from src.database.async_session import get_async_session_factory, to_async_url
+from src.database.pool_config import PoolSettings, configure_engine
+from src.database.session import POOL_SETTINGS, SETTINGS, get_session_factory
+from src.observability.db import InstrumentedAsyncQueuePool, InstrumentedQueuePool, instrument_engine
+from src.observability.metrics import DB_READ_SESSIONS, DB_REPLICA_HEALTHY, DB_REPLICA_LAG
+
+logger = logging.getLogger(__name__)
+
+# Connect timeout for replica connections, so an unreachable replica fails its check quickly
+DB_REPLICA_CONNECT_TIMEOUT_SECONDS = float(os.getenv("DB_REPLICA_CONNECT_TIMEOUT_SECONDS", "2"))
+
+# Replay lag of a standby; 0 when it has replayed everything it received,
+# so an idle primary does not look like a lagging replica
+REPLICA_STATUS_SQL = text(
+    """
+    SELECT
+        pg_is_in_recovery(),
+        CASE
+            WHEN NOT pg_is_in_recovery() THEN 0
+            WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+            ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+        END
+    """
+)
+
+
+@dataclass
+class ReplicaStatus:
+    """Outcome of a replica's last health check."""
+    healthy: bool = False
+    lag_seconds: Optional[float] = None
+    error: Optional[str] = None
+    checked_at: Optional[float] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Summary suitable for logging or JSON output."""
+        return {
+            "healthy": self.healthy,
+            "lag_seconds": None if self.lag_seconds is None else round(self.lag_seconds, 3),
+            "error": self.error
+        }
+
+
+class Replica:
+    """One read replica: its lazily created engines and last known status."""
+
+    def __init__(self, name: str, url: str, pool_settings: PoolSettings):
+        """Initialize the replica.
+
+        Args:
+            name: Label used for metrics and logs (the URL may hold a password)
+            url: Sync PostgreSQL URL of the replica
+            pool_settings: Pool settings shared with the primary engines
+        """
+        self.name = name
+        self.url = url
+        self.pool_settings = pool_settings
+        self.status = ReplicaStatus()
+        self._engine: Optional[Engine] = None
+        self._session_factory: Optional[sessionmaker] = None
+        self._async_engine: Optional[AsyncEngine] = None
+        self._async_session_factory: Optional[async_sessionmaker] = None
+        self._lock = threading.Lock()
+
+    def _watch_disconnects(self, engine: Engine) -> None:
+        @event.listens_for(engine, "handle_error")
+        def _handle_error(context):
+            if context.is_disconnect and self.status.healthy:
+                logger.warning(f"Read replica {self.name} disconnected; routing reads elsewhere until the next check")
+                self.mark(False, self.status.lag_seconds, "disconnected")
+
+    def engine(self) -> Engine:
+        """
+        Get the replica's sync engine, creating it on the first call.
+
+        Returns:
+            SQLAlchemy engine for this replica
+        """
+        if self._engine is None:
+            with self._lock:
+                if self._engine is None:
+                    kwargs = self.pool_settings.engine_kwargs()
+                    kwargs["connect_args"] = {
+                        **kwargs.get("connect_args", {}),
+                        "connect_timeout": max(1, int(DB_REPLICA_CONNECT_TIMEOUT_SECONDS))
+                    }
+                    engine = create_engine(
+                        self.url,
+                        poolclass=InstrumentedQueuePool,
+                        pool_logging_name=self.name,
+                        **kwargs
+                    )
+                    configure_engine(engine, self.pool_settings)
+                    instrument_engine(engine, self.name)
+                    self._watch_disconnects(engine)
+                    self._session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+                    self._engine = engine
+        return self._engine
+
+    def session_factory(self) -> sessionmaker:
+        """
+        Get the session factory bound to the replica's sync engine.
+
+        Returns:
+            sessionmaker producing Session objects
+        """
+        self.engine()
+        return self._session_factory
+
+    def async_engine(self) -> AsyncEngine:
+        """
+        Get the replica's async engine, creating it on the first call.
+
+        Returns:
+            SQLAlchemy async engine for this replica
+        """
+        if self._async_engine is None:
+            with self._lock:
+                if self._async_engine is None:
+                    kwargs = self.pool_settings.engine_kwargs(is_async=True)
+                    kwargs["connect_args"] = {
+                        **kwargs.get("connect_args", {}),
+                        "timeout": DB_REPLICA_CONNECT_TIMEOUT_SECONDS
+                    }
+                    async_engine = create_async_engine(
+                        to_async_url(self.url),
+                        poolclass=InstrumentedAsyncQueuePool,
+                        pool_logging_name=f"{self.name}_async",
+                        **kwargs
+                    )
+                    configure_engine(async_engine.sync_engine, self.pool_settings)
+                    instrument_engine(async_engine.sync_engine, f"{self.name}_async")
+                    self._watch_disconnects(async_engine.sync_engine)
+                    self._async_session_factory = async_sessionmaker(
+                        bind=async_engine,
+                        autoflush=False,
+                        expire_on_commit=False
+                    )
+                    self._async_engine = async_engine
+        return self._async_engine
+
+    def async_session_factory(self) -> async_sessionmaker:
+        """
+        Get the session factory bound to the replica's async engine.
+
+        Returns:
+            async_sessionmaker producing AsyncSession objects
+        """
+        self.async_engine()
+        return self._async_session_factory
+
+    def mark(self, healthy: bool, lag_seconds: Optional[float], error: Optional[str] = None) -> None:
+        """
+        Record a health check result.
+
+        Args:
+            healthy: Whether the replica may serve reads
+            lag_seconds: Measured replay lag, if the replica answered
+            error: Why the replica is unhealthy
+        """
+        self.status = ReplicaStatus(
+            healthy=healthy,
+            lag_seconds=lag_seconds,
+            error=error,
+            checked_at=time.monotonic()
+        )
+        DB_REPLICA_HEALTHY.labels(self.name).set(1 if healthy else 0)
+        if lag_seconds is not None:
+            DB_REPLICA_LAG.labels(self.name).set(lag_seconds)
+
+    def dispose(self) -> None:
+        """Close the pooled connections of the sync engine, if it was created."""
+        if self._engine is not None:
+            self._engine.dispose()
+
+    async def dispose_async(self) -> None:
+        """Close the pooled connections of the async engine, if it was created."""
+        if self._async_engine is not None:
+            await self._async_engine.dispose()
+
+
+class ReplicaRouter:
+    """Round-robin read routing across healthy replicas, falling back to the primary."""
+
+    def __init__(self, urls: Tuple[str, ...], max_lag_seconds: float, check_interval_seconds: float,
+                 pool_settings: PoolSettings = POOL_SETTINGS):
+        """Initialize the router.
+
+        Args:
+            urls: Sync PostgreSQL URLs of the replicas
+            max_lag_seconds: Replicas lagging more than this serve no reads
+            check_interval_seconds: Minimum time between health checks
+            pool_settings: Pool settings for the replica engines
+        """
+        self.replicas: List[Replica] = [
+            Replica(f"replica{number}", url, pool_settings) for number, url in enumerate(urls)
+        ]
+        self.max_lag_seconds = max_lag_seconds
+        self.check_interval_seconds = check_interval_seconds
+        self._turn = itertools.count()
+        self._checked_at: Optional[float] = None
+        self._check_lock = threading.Lock()
+        self._async_check_running = False
+
+    def _check_due(self) -> bool:
+        return bool(self.replicas) and (
+            self._checked_at is None
+            or time.monotonic() - self._checked_at >= self.check_interval_seconds
+        )
+
+    def _record(self, replica: Replica, in_recovery: bool, lag_seconds: float) -> None:
+        lag_seconds = float(lag_seconds)
+        if not in_recovery:
+            replica.mark(False, lag_seconds, "not in recovery")
+        elif lag_seconds > self.max_lag_seconds:
+            replica.mark(False, lag_seconds, f"lag {lag_seconds:.1f}s exceeds {self.max_lag_seconds:g}s")
+        else:
+            replica.mark(True, lag_seconds)
+
+    def _record_failure(self, replica: Replica, error: Exception) -> None:
+        if replica.status.healthy or replica.status.checked_at is None:
+            logger.warning(f"Read replica {replica.name} failed its health check: {str(error)}")
+        replica.mark(False, None, type(error).__name__)
+
+    def check(self) -> None:
+        """Check every replica through its sync engine."""
+        for replica in self.replicas:
+            try:
+                with replica.engine().connect() as connection:
+                    in_recovery, lag_seconds = connection.execute(REPLICA_STATUS_SQL).one()
+                self._record(replica, in_recovery, lag_seconds)
+            except Exception as e:
+                self._record_failure(replica, e)
+        self._checked_at = time.monotonic()
+
+    async def _check_one_async(self, replica: Replica) -> None:
+        try:
+            async with replica.async_engine().connect() as connection:
+                result = await asyncio.wait_for(
+                    connection.execute(REPLICA_STATUS_SQL), DB_REPLICA_CONNECT_TIMEOUT_SECONDS
+                )
+                in_recovery, lag_seconds = result.one()
+            self._record(replica, in_recovery, lag_seconds)
+        except Exception as e:
+            self._record_failure(replica, e)
+
+    async def check_async(self) -> None:
+        """Check every replica concurrently through its async engine."""
+        await asyncio.gather(*(self._check_one_async(replica) for replica in self.replicas))
+        self._checked_at = time.monotonic()
+
+    def _next_healthy(self) -> Optional[Replica]:
+        healthy = [replica for replica in self.replicas if replica.status.healthy]
+        if not healthy:
+            return None
+        return healthy[next(self._turn) % len(healthy)]
+
+    def choose(self) -> Optional[Replica]:
+        """
+        Pick the replica for the next sync read session, re-checking health when due.
+
+        Returns:
+            A healthy replica, or None to read from the primary
+        """
+        if self._check_due() and self._check_lock.acquire(blocking=False):
+            try:
+                if self._check_due():
+                    self.check()
+            finally:
+                self._check_lock.release()
+        return self._next_healthy()
+
+    async def choose_async(self) -> Optional[Replica]:
+        """
+        Pick the replica for the next async read session, re-checking health when due.
+
+        Returns:
+            A healthy replica, or None to read from the primary
+        """
+        if self._check_due() and not self._async_check_running:
+            self._async_check_running = True
+            try:
+                await self.check_async()
+            finally:
+                self._async_check_running = False
+        return self._next_healthy()
+
+    def status(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Last known status of every replica.
+
+        Returns:
+            Replica name -> healthy / lag_seconds / error
+        """
+        return {replica.name: replica.status.to_dict() for replica in self.replicas}
+
+    def dispose(self) -> None:
+        """Close the pooled connections of every replica's sync engine."""
+        for replica in self.replicas:
+            replica.dispose()
+
+    async def dispose_async(self) -> None:
+        """Close the pooled connections of every replica's async engine."""
+        await asyncio.gather(*(replica.dispose_async() for replica in self.replicas))
+
+
+replica_router = ReplicaRouter(
+    SETTINGS.read_replica_urls,
+    SETTINGS.replica_max_lag_seconds,
+    SETTINGS.replica_check_interval_seconds
+)
+
+
+def get_read_session_factory() -> sessionmaker:
+    """
+    Get the session factory for the next sync read: a healthy replica or the primary.
+
+    Returns:
+        sessionmaker producing Session objects
+    """
+    replica = replica_router.choose()
+    DB_READ_SESSIONS.labels(replica.name if replica else "primary").inc()
+    return replica.session_factory() if replica else get_session_factory()
+
+
+async def get_async_read_session_factory() -> async_sessionmaker:
+    """
+    Get the session factory for the next async read: a healthy replica or the primary.
+
+    Returns:
+        async_sessionmaker producing AsyncSession objects
+    """
+    replica = await replica_router.choose_async()
+    DB_READ_SESSIONS.labels(replica.name if replica else "primary").inc()
+    return replica.async_session_factory() if replica else get_async_session_factory()
+
+
+def get_read_db() -> Generator[Session, None, None]:
+    """
+    Dependency to get a database session for read-only queries.
+
+    Yields:
+        Session on a healthy read replica, or on the primary when none is usable
+    """
+    db = get_read_session_factory()()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+async def get_async_read_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency to get an async database session for read-only queries.
+
+    Yields:
+        AsyncSession on a healthy read replica, or on the primary when none is usable
+    """
+    async with (await get_async_read_session_factory())() as db:
+        yield db
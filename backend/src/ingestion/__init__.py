@@ -0,0 +1,17 @@
+from .recommendation_ingestion import (
+    RecommendationIngestor,
+    IngestionResult,
+    read_ndjson,
+    read_csv
+)
+from .partition_swap import PlatformPartitionSwapper, PartitionSwapResult, PLATFORM_PARTITIONS
+
+__all__ = [
+    "RecommendationIngestor",
+    "IngestionResult",
+    "read_ndjson",
+    "read_csv",
+    "PlatformPartitionSwapper",
+    "PartitionSwapResult",
+    "PLATFORM_PARTITIONS"
+]
@@ -0,0 +1,57 @@
+"""
+Command line entry point for bulk recommendation ingestion.
+
+Usage:
+    python -m src.ingestion.cli recommendations.ndjson --batch-size 50000 --workers 4
+    python -m src.ingestion.cli recommendations.csv --format csv
+    cat recommendations.ndjson | python -m src.ingestion.cli -
+    python -m src.ingestion.cli aws.ndjson --replace-platform AWS
+"""
+import argparse
+import json
+import logging
+import sys
+
+from src.database.session import engine
+from src.ingestion.partition_swap import PLATFORM_PARTITIONS, PlatformPartitionSwapper
+from src.ingestion.recommendation_ingestion import RecommendationIngestor, read_csv, read_ndjson
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Bulk load recommendations into aws_recommendation_consolidate")
+    parser.add_argument("path", help="Input file, or '-' for stdin")
+    parser.add_argument("--format", choices=["ndjson", "csv"], default=None,
+                        help="Input format (default: from file extension, else ndjson)")
+    parser.add_argument("--batch-size", type=int, default=50000, help="Records per COPY/upsert transaction")
+    parser.add_argument("--workers", type=int, default=4, help="Batches loaded in parallel")
+    parser.add_argument("--replace-platform", choices=sorted(PLATFORM_PARTITIONS), default=None,
+                        help="Replace every recommendation of this platform by a partition swap instead of upserting")
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    )
+
+    input_format = args.format or ("csv" if args.path.endswith(".csv") else "ndjson")
+    reader = read_csv if input_format == "csv" else read_ndjson
+    stream = sys.stdin if args.path == "-" else open(args.path, newline="", encoding="utf-8")
+
+    try:
+        if args.replace_platform:
+            swapper = PlatformPartitionSwapper(engine, batch_size=args.batch_size)
+            result = swapper.reload(args.replace_platform, reader(stream))
+        else:
+            ingestor = RecommendationIngestor(engine, batch_size=args.batch_size, workers=args.workers)
+            result = ingestor.ingest(reader(stream))
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+        engine.dispose()
+
+    print(json.dumps(result.to_dict(), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
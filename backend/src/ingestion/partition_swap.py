@@ -0,0 +1,280 @@
+"""
+Per-platform reloads of aws_recommendation_consolidate by partition swap.
+
+The table is LIST-partitioned on type (migration 0009). Replacing all of a
+platform's recommendations is done off to the side and swapped in:
+
+1. Records are COPYed into a temporary staging table, deduplicated on the
+   natural key (last occurrence wins) and written to a new standalone table
+   shaped like the partition. Rows matching an existing recommendation keep
+   its id and created_at. The parent's indexes are built on it afterwards,
+   with a CHECK constraint proving every row belongs to the partition.
+2. One short transaction detaches the current partition, attaches the new
+   table in its place (no validation scan, the indexes are adopted as-is),
+   writes the platform's summary row and bumps the data version. Partition
+   DDL does not fire the table's triggers, so both are done here.
+3. The old partition is dropped after commit.
+
+Readers keep using the old partition until step 2 commits; the swap holds
+its locks for milliseconds instead of a mass DELETE + INSERT holding row
+locks and bloating the table.
+"""
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List
+import itertools
+import logging
+import re
+import time
+
+from sqlalchemy.engine import Engine
+
+from src.dashboard.overview.service.data_version_service import invalidate_data_version
+from src.dashboard.overview.service.top_recommendation_cache import invalidate_top_recommendations
+from src.ingestion.recommendation_ingestion import (
+    COPY_STAGING_SQL,
+    CREATE_STAGING_SQL,
+    INGEST_COLUMNS,
+    NATURAL_KEY,
+    RecommendationIngestor
+)
+
+logger = logging.getLogger(__name__)
+
+TABLE = "aws_recommendation_consolidate"
+
+# Partition per platform type; kept in sync with migration 0009
+PLATFORM_PARTITIONS: Dict[str, str] = {
+    "AWS": f"{TABLE}_aws",
+    "Google Cloud": f"{TABLE}_google_cloud",
+    "Databricks": f"{TABLE}_databricks",
+    "Snowflakes": f"{TABLE}_snowflakes"
+}
+
+# "CREATE [UNIQUE] INDEX name ON ONLY public.table USING ..." from pg_get_indexdef
+_INDEX_DEFINITION = re.compile(r"^CREATE (UNIQUE )?INDEX \S+ ON (?:ONLY )?\S+ (USING .*)$")
+
+_PARENT_INDEXES_SQL = f"""
+SELECT pg_get_indexdef(indexrelid), indisprimary
+FROM pg_index
+WHERE indrelid = '{TABLE}'::regclass
+ORDER BY indexrelid
+"""
+
+_SUMMARY_UPSERT_SQL = """
+INSERT INTO recommendation_platform_summary
+    (type, recommendation_count, potential_count, total_potential, updated_at)
+VALUES (%(type)s, %(count)s, %(potential_count)s, %(total_potential)s, now())
+ON CONFLICT (type) DO UPDATE SET
+    recommendation_count = EXCLUDED.recommendation_count,
+    potential_count = EXCLUDED.potential_count,
+    total_potential = EXCLUDED.total_potential,
+    updated_at = EXCLUDED.updated_at
+"""
+
+_BUMP_VERSION_SQL = (
+    "UPDATE recommendation_data_version SET version = version + 1, updated_at = now() WHERE id = 1"
+)
+
+
+@dataclass
+class PartitionSwapResult:
+    """Outcome of a platform reload."""
+    platform: str
+    rows_read: int = 0
+    rows_loaded: int = 0
+    load_seconds: float = 0.0
+    swap_seconds: float = 0.0
+
+    def to_dict(self) -> Dict:
+        """Summary suitable for logging or JSON output."""
+        return {
+            "platform": self.platform,
+            "rows_read": self.rows_read,
+            "rows_loaded": self.rows_loaded,
+            "rows_deduplicated": self.rows_read - self.rows_loaded,
+            "load_seconds": round(self.load_seconds, 3),
+            "swap_seconds": round(self.swap_seconds, 3)
+        }
+
+
+class PlatformPartitionSwapper:
+    """Replaces one platform's recommendations by swapping its partition."""
+
+    def __init__(self, engine: Engine, batch_size: int = 50000, lock_timeout_ms: int = 5000):
+        """Initialize the swapper.
+
+        Args:
+            engine: SQLAlchemy engine (psycopg2) used for raw COPY connections
+            batch_size: Records per COPY round trip
+            lock_timeout_ms: Longest the swap waits for its locks before failing
+        """
+        self.engine = engine
+        self.batch_size = batch_size
+        self.lock_timeout_ms = lock_timeout_ms
+
+    @staticmethod
+    def _platform_records(records: Iterable[Dict], platform: str) -> Iterator[Dict]:
+        """Fill in a missing type and reject records of another platform."""
+        for record in records:
+            record_type = record.get("type")
+            if record_type is None:
+                record = dict(record, type=platform)
+            elif record_type != platform:
+                raise ValueError(f"Record of type {record_type!r} in a reload of {platform!r}")
+            yield record
+
+    @staticmethod
+    def _copy_index_definitions(cursor, table: str) -> None:
+        """Build every index of the parent table on a standalone table."""
+        cursor.execute(_PARENT_INDEXES_SQL)
+        for number, (definition, is_primary) in enumerate(cursor.fetchall()):
+            if is_primary:
+                cursor.execute(f"ALTER TABLE {table} ADD PRIMARY KEY (id, type)")
+                continue
+            match = _INDEX_DEFINITION.match(definition)
+            if match is None:
+                raise RuntimeError(f"Unexpected index definition: {definition}")
+            unique, rest = match.groups()
+            cursor.execute(f"CREATE {unique or ''}INDEX {table}_i{number} ON {table} {rest}")
+
+    def _load(self, platform: str, partition: str, table: str, records: Iterable[Dict], result: PartitionSwapResult) -> Dict:
+        """
+        Load records into a new table shaped like the partition.
+
+        Returns:
+            The platform's summary row computed from the new table
+        """
+        connection = self.engine.raw_connection()
+        try:
+            cursor = connection.cursor()
+            cursor.execute(CREATE_STAGING_SQL)
+            line = 0
+            iterator = iter(records)
+            while True:
+                batch: List[Dict] = list(itertools.islice(iterator, self.batch_size))
+                if not batch:
+                    break
+                cursor.copy_expert(COPY_STAGING_SQL, RecommendationIngestor._to_csv(batch, line))
+                line += len(batch)
+            result.rows_read = line
+
+            cursor.execute(f"CREATE TABLE {table} (LIKE {TABLE} INCLUDING DEFAULTS INCLUDING GENERATED)")
+            cursor.execute(f"ALTER TABLE {table} ADD CONSTRAINT {table}_type CHECK (type = %s)", (platform,))
+
+            # Last occurrence of a key wins; ids and created_at of existing recommendations are kept
+            key_match = " AND ".join(
+                f"current.{column} = staged.{column}" if column == "type"
+                else f"COALESCE(current.{column}, '') = COALESCE(staged.{column}, '')"
+                for column in ("type", "account", "resource_id", "recommendation")
+            )
+            columns = ", ".join(INGEST_COLUMNS)
+            cursor.execute(
+                f"""
+                INSERT INTO {table} (id, {columns}, created_at, updated_at)
+                SELECT
+                    COALESCE(current.id, nextval(pg_get_serial_sequence('{TABLE}', 'id'))),
+                    {", ".join(f"staged.{column}" for column in INGEST_COLUMNS)},
+                    COALESCE(current.created_at, now()),
+                    now()
+                FROM (
+                    SELECT DISTINCT ON ({NATURAL_KEY}) *
+                    FROM recommendation_staging
+                    ORDER BY {NATURAL_KEY}, _line DESC
+                ) staged
+                LEFT JOIN {partition} current ON {key_match}
+                """
+            )
+            result.rows_loaded = cursor.rowcount
+
+            self._copy_index_definitions(cursor, table)
+            cursor.execute(f"ANALYZE {table}")
+            cursor.execute(
+                f"SELECT count(*), count(potential), COALESCE(sum(potential), 0) FROM {table}"
+            )
+            count, potential_count, total_potential = cursor.fetchone()
+            connection.commit()
+        except Exception:
+            connection.rollback()
+            raise
+        finally:
+            connection.close()
+
+        return {
+            "type": platform,
+            "count": count,
+            "potential_count": potential_count,
+            "total_potential": total_potential
+        }
+
+    def _swap(self, platform: str, partition: str, table: str, retired: str, summary: Dict) -> None:
+        """Detach the current partition and attach the loaded table, in one transaction."""
+        connection = self.engine.raw_connection()
+        try:
+            cursor = connection.cursor()
+            cursor.execute(f"SET LOCAL lock_timeout = {int(self.lock_timeout_ms)}")
+            cursor.execute(f"ALTER TABLE {TABLE} DETACH PARTITION {partition}")
+            cursor.execute(f"ALTER TABLE {partition} RENAME TO {retired}")
+            cursor.execute(f"ALTER TABLE {table} RENAME TO {partition}")
+            cursor.execute(f"ALTER TABLE {TABLE} ATTACH PARTITION {partition} FOR VALUES IN (%s)", (platform,))
+            cursor.execute(f"ALTER TABLE {partition} DROP CONSTRAINT {table}_type")
+            if summary["count"]:
+                cursor.execute(_SUMMARY_UPSERT_SQL, summary)
+            else:
+                cursor.execute("DELETE FROM recommendation_platform_summary WHERE type = %s", (platform,))
+            cursor.execute(_BUMP_VERSION_SQL)
+            connection.commit()
+        except Exception:
+            connection.rollback()
+            raise
+        finally:
+            connection.close()
+
+    def _drop_table(self, table: str) -> None:
+        connection = self.engine.raw_connection()
+        try:
+            connection.cursor().execute(f"DROP TABLE IF EXISTS {table}")
+            connection.commit()
+        finally:
+            connection.close()
+
+    def reload(self, platform: str, records: Iterable[Dict]) -> PartitionSwapResult:
+        """
+        Replace every recommendation of a platform with the given records.
+
+        Args:
+            platform: Platform type as stored in the type column (e.g. 'AWS')
+            records: Dictionaries keyed by INGEST_COLUMNS names; a missing type
+                is filled in, any other type is rejected
+
+        Returns:
+            PartitionSwapResult with row counts and load / swap durations
+
+        Raises:
+            ValueError: If the platform has no partition or a record belongs to another platform
+        """
+        partition = PLATFORM_PARTITIONS.get(platform)
+        if partition is None:
+            raise ValueError(f"No partition for platform {platform!r}")
+
+        token = format(time.time_ns(), "x")[-8:]
+        table, retired = f"{partition}_{token}", f"{partition}_retired_{token}"
+        result = PartitionSwapResult(platform=platform)
+
+        started = time.perf_counter()
+        try:
+            summary = self._load(platform, partition, table, self._platform_records(records, platform), result)
+            result.load_seconds = time.perf_counter() - started
+
+            started = time.perf_counter()
+            self._swap(platform, partition, table, retired, summary)
+            result.swap_seconds = time.perf_counter() - started
+        except Exception:
+            self._drop_table(table)
+            raise
+
+        self._drop_table(retired)
+        invalidate_data_version()
+        invalidate_top_recommendations(platform)
+
+        logger.info(f"Partition swap finished: {result.to_dict()}")
+        return result
@@ -0,0 +1,268 @@
+"""
+Bulk ingestion of recommendations into aws_recommendation_consolidate.
+
+Each batch is streamed into a temporary staging table with COPY and then
+merged into the target with a single INSERT ... ON CONFLICT upsert on the
+natural key (type, account, resource_id, recommendation). Batches run in
+parallel on separate pooled connections.
+"""
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List, Set
+import csv
+import io
+import itertools
+import json
+import logging
+import threading
+import time
+
+from sqlalchemy.engine import Engine
+
+from src.dashboard.overview.service.data_version_service import invalidate_data_version
+from src.dashboard.overview.service.top_recommendation_cache import invalidate_top_recommendations
+
+logger = logging.getLogger(__name__)
+
+# Columns accepted from collectors, in COPY order
+INGEST_COLUMNS = [
+    "type", "account", "region", "resource_name", "resource_id", "service", "sub_service",
+    "recommendation", "description", "potential", "actual_cost", "target_cost",
+    "current_configuration", "expected_configuration", "justifications", "tags_json",
+    "actionable", "risk_level", "impact"
+]
+
+# Natural key of a recommendation; must match the uq_rec_natural_key index expressions.
+# type is NOT NULL (the partition key, migration 0009), so staging rows load NULL as ''
+NATURAL_KEY = (
+    "type, COALESCE(account, ''), "
+    "COALESCE(resource_id, ''), COALESCE(recommendation, '')"
+)
+
+_COLUMN_LIST = ", ".join(INGEST_COLUMNS)
+_STAGING_SELECT_LIST = ", ".join(
+    "COALESCE(type, '') AS type" if column == "type" else column for column in INGEST_COLUMNS
+)
+_STAGING_KEY = NATURAL_KEY.replace("type,", "COALESCE(type, ''),", 1)
+_UPDATE_COLUMNS = [column for column in INGEST_COLUMNS if column not in ("type", "account", "resource_id", "recommendation")]
+
+CREATE_STAGING_SQL = f"""
+CREATE TEMP TABLE recommendation_staging ON COMMIT DROP AS
+SELECT {_COLUMN_LIST}, 0::bigint AS _line
+FROM aws_recommendation_consolidate
+WITH NO DATA
+"""
+
+COPY_STAGING_SQL = (
+    f"COPY recommendation_staging ({_COLUMN_LIST}, _line) FROM STDIN WITH (FORMAT csv)"
+)
+
+# Last occurrence of a key within a batch wins; unchanged rows are not rewritten
+UPSERT_SQL = f"""
+WITH upserted AS (
+    INSERT INTO aws_recommendation_consolidate AS target ({_COLUMN_LIST}, created_at, updated_at)
+    SELECT DISTINCT ON ({_STAGING_KEY}) {_STAGING_SELECT_LIST}, now(), now()
+    FROM recommendation_staging
+    ORDER BY {_STAGING_KEY}, _line DESC
+    ON CONFLICT ({NATURAL_KEY}) DO UPDATE SET
+        {", ".join(f"{column} = EXCLUDED.{column}" for column in _UPDATE_COLUMNS)},
+        updated_at = now()
+    WHERE ({", ".join(f"target.{column}" for column in _UPDATE_COLUMNS)})
+        IS DISTINCT FROM ({", ".join(f"EXCLUDED.{column}" for column in _UPDATE_COLUMNS)})
+    RETURNING (xmax = 0) AS inserted
+)
+SELECT
+    count(*) FILTER (WHERE inserted),
+    count(*) FILTER (WHERE NOT inserted)
+FROM upserted
+"""
+
+# Postgres SQLSTATEs worth retrying a batch for (deadlock, serialization failure)
+_RETRYABLE_PGCODES = {"40P01", "40001"}
+
+
+@dataclass
+class IngestionResult:
+    """Outcome of an ingestion run."""
+    rows_read: int = 0
+    rows_inserted: int = 0
+    rows_updated: int = 0
+    batches: int = 0
+    seconds: float = 0.0
+    platforms: Set[str] = field(default_factory=set)
+
+    @property
+    def rows_unchanged(self) -> int:
+        """Rows that matched an existing recommendation with identical values."""
+        return self.rows_read - self.rows_inserted - self.rows_updated
+
+    @property
+    def rows_per_second(self) -> float:
+        """Read throughput of the run."""
+        return self.rows_read / self.seconds if self.seconds else 0.0
+
+    def to_dict(self) -> Dict:
+        """Summary suitable for logging or JSON output."""
+        return {
+            "rows_read": self.rows_read,
+            "rows_inserted": self.rows_inserted,
+            "rows_updated": self.rows_updated,
+            "rows_unchanged": self.rows_unchanged,
+            "batches": self.batches,
+            "seconds": round(self.seconds, 3),
+            "rows_per_second": round(self.rows_per_second, 1),
+            "platforms": sorted(self.platforms)
+        }
+
+
+def _csv_value(value):
+    if isinstance(value, (dict, list)):
+        return json.dumps(value)
+    return value
+
+
+class RecommendationIngestor:
+    """Loads recommendation records in parallel COPY + upsert batches."""
+
+    def __init__(
+        self,
+        engine: Engine,
+        batch_size: int = 50000,
+        workers: int = 4,
+        max_retries: int = 3
+    ):
+        """Initialize the ingestor.
+        
+        Args:
+            engine: SQLAlchemy engine (psycopg2) used for raw COPY connections
+            batch_size: Records per COPY/upsert transaction
+            workers: Batches loaded concurrently, each on its own connection
+            max_retries: Attempts per batch on deadlock or serialization failure
+        """
+        self.engine = engine
+        self.batch_size = batch_size
+        self.workers = workers
+        self.max_retries = max_retries
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _to_csv(batch: List[Dict], first_line: int) -> io.StringIO:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for offset, record in enumerate(batch):
+            writer.writerow([_csv_value(record.get(column)) for column in INGEST_COLUMNS] + [first_line + offset])
+        buffer.seek(0)
+        return buffer
+
+    def _load_batch(self, batch: List[Dict], first_line: int) -> tuple:
+        """
+        COPY one batch into staging and upsert it, in a single transaction.
+        
+        Returns:
+            (inserted, updated) row counts
+        """
+        for attempt in range(1, self.max_retries + 1):
+            connection = self.engine.raw_connection()
+            try:
+                cursor = connection.cursor()
+                cursor.execute(CREATE_STAGING_SQL)
+                cursor.copy_expert(COPY_STAGING_SQL, self._to_csv(batch, first_line))
+                cursor.execute(UPSERT_SQL)
+                inserted, updated = cursor.fetchone()
+                connection.commit()
+                return inserted, updated
+            except Exception as e:
+                connection.rollback()
+                if getattr(e, "pgcode", None) in _RETRYABLE_PGCODES and attempt < self.max_retries:
+                    logger.warning(f"Retrying ingestion batch at line {first_line} after {e.pgcode} (attempt {attempt})")
+                    time.sleep(0.1 * attempt)
+                    continue
+                raise
+            finally:
+                connection.close()
+
+    def ingest(self, records: Iterable[Dict]) -> IngestionResult:
+        """
+        Load records into aws_recommendation_consolidate.
+        
+        Records are read lazily; at most 2 * workers batches are held in
+        memory at once. The cached data version and the cached top
+        recommendations of every platform touched are dropped once all
+        batches have committed.
+        
+        Args:
+            records: Dictionaries keyed by INGEST_COLUMNS names (missing keys load as NULL)
+            
+        Returns:
+            IngestionResult with row counts and throughput
+        """
+        result = IngestionResult()
+        started = time.perf_counter()
+        iterator = iter(records)
+        line = 0
+        pending: Set[Future] = set()
+
+        def collect(done: Iterable[Future]) -> None:
+            for future in done:
+                inserted, updated = future.result()
+                result.rows_inserted += inserted
+                result.rows_updated += updated
+
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="ingest") as executor:
+            while True:
+                batch = list(itertools.islice(iterator, self.batch_size))
+                if not batch:
+                    break
+                result.rows_read += len(batch)
+                result.batches += 1
+                result.platforms.update(record.get("type") for record in batch if record.get("type"))
+
+                pending.add(executor.submit(self._load_batch, batch, line))
+                line += len(batch)
+
+                if len(pending) >= self.workers * 2:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    collect(done)
+
+            collect(wait(pending).done)
+
+        result.seconds = time.perf_counter() - started
+
+        invalidate_data_version()
+        for platform in result.platforms:
+            invalidate_top_recommendations(platform)
+
+        logger.info(f"Ingestion finished: {result.to_dict()}")
+        return result
+
+
+def read_ndjson(stream: io.TextIOBase) -> Iterator[Dict]:
+    """
+    Read records from newline-delimited JSON.
+    
+    Args:
+        stream: Text stream with one JSON object per line
+        
+    Yields:
+        Record dictionaries
+    """
+    for line in stream:
+        line = line.strip()
+        if line:
+            yield json.loads(line)
+
+
+def read_csv(stream: io.TextIOBase) -> Iterator[Dict]:
+    """
+    Read records from CSV with a header row of column names.
+    
+    Empty fields are loaded as NULL; tags_json must hold a JSON document.
+    
+    Args:
+        stream: Text stream with a header row
+        
+    Yields:
+        Record dictionaries
+    """
+    for row in csv.DictReader(stream):
+        yield {key: (value if value != "" else None) for key, value in row.items()}
@@ -0,0 +1,11 @@
+from .metrics import render_metrics
+from .middleware import MetricsMiddleware
+from .db import InstrumentedAsyncQueuePool, InstrumentedQueuePool, instrument_engine
+
+__all__ = [
+    "render_metrics",
+    "MetricsMiddleware",
+    "InstrumentedQueuePool",
+    "InstrumentedAsyncQueuePool",
+    "instrument_engine"
+]
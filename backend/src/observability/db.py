@@ -0,0 +1,159 @@
+"""
+SQLAlchemy instrumentation: per-statement timing and row counts, slow
+query logging, and pool checkout wait / occupancy.
+"""
+from functools import lru_cache
+from typing import Tuple
+import logging
+import os
+import re
+import time
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from src.observability.db_health import pool_checkout_wait, record_outcome
+from src.observability.metrics import (
+    DB_POOL_CAPACITY,
+    DB_POOL_CHECKED_OUT,
+    DB_POOL_CHECKOUT_TIMEOUTS,
+    DB_POOL_CHECKOUT_WAIT,
+    DB_POOL_OPEN,
+    DB_QUERY_DURATION,
+    DB_QUERY_ERRORS,
+    DB_QUERY_ROWS,
+    DB_SLOW_QUERIES
+)
+
+logger = logging.getLogger(__name__)
+
+# Statements slower than this are logged with their SQL; 0 disables the log
+DB_SLOW_QUERY_MS = float(os.getenv("DB_SLOW_QUERY_MS", "500"))
+
+_TABLE_PATTERN = re.compile(r"\b(?:FROM|INTO|UPDATE|JOIN)\s+\"?([A-Za-z_][\w.]*)", re.IGNORECASE)
+
+
+@lru_cache(maxsize=2048)
+def statement_labels(statement: str) -> Tuple[str, str]:
+    """
+    Derive low-cardinality (operation, table) labels from SQL text.
+    
+    Args:
+        statement: SQL as sent to the driver
+        
+    Returns:
+        Leading keyword (SELECT, INSERT, ...) and the first table referenced
+    """
+    words = statement.lstrip(" (\n\t").split(None, 1)
+    operation = words[0].upper() if words else "UNKNOWN"
+    match = _TABLE_PATTERN.search(statement)
+    return operation, match.group(1).lower() if match else "-"
+
+
+class _CheckoutTimingMixin:
+    """
+    Time _do_get, where a checkout waits for a free connection or opens one.
+    
+    The 'engine' label is the pool's logging name (create_engine's
+    pool_logging_name), which survives pool re-creation on dispose().
+    """
+
+    def _do_get(self):
+        name = getattr(self, "_orig_logging_name", None) or "default"
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            DB_POOL_CHECKOUT_TIMEOUTS.labels(name).inc()
+            record_outcome(False)
+            raise
+        finally:
+            # QueuePool retries by calling _do_get again after rare overflow races;
+            # those nested attempts are recorded as extra samples
+            waited = time.perf_counter() - started
+            DB_POOL_CHECKOUT_WAIT.labels(name).observe(waited)
+            pool_checkout_wait.observe(waited)
+
+
+class InstrumentedQueuePool(_CheckoutTimingMixin, QueuePool):
+    """QueuePool recording checkout wait time."""
+
+
+class InstrumentedAsyncQueuePool(_CheckoutTimingMixin, AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool recording checkout wait time."""
+
+
+# Pool loggers are named after the pool class, outside the "sqlalchemy" logger
+# tree that SQLAlchemy quiets to WARN by default; keep them equally quiet
+for _pool_class in (InstrumentedQueuePool, InstrumentedAsyncQueuePool):
+    _pool_logger = logging.getLogger(f"{_pool_class.__module__}.{_pool_class.__name__}")
+    if _pool_logger.level == logging.NOTSET:
+        _pool_logger.setLevel(logging.WARNING)
+
+
+def instrument_engine(engine: Engine, name: str) -> None:
+    """
+    Attach statement and pool metrics to an engine.
+    
+    Args:
+        engine: Sync engine (for an AsyncEngine pass async_engine.sync_engine)
+        name: Value of the 'engine' label, e.g. 'sync' or 'async'; create the
+            engine with the same pool_logging_name so checkout waits match
+    """
+    pool = engine.pool
+    if isinstance(pool, QueuePool):
+        DB_POOL_CAPACITY.labels(name).set(pool.size() + max(pool._max_overflow, 0))
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["query_started"].pop()
+        operation, table = statement_labels(statement)
+        DB_QUERY_DURATION.labels(name, operation, table).observe(elapsed)
+        record_outcome(True)
+
+        rowcount = getattr(cursor, "rowcount", -1)
+        if rowcount is not None and rowcount > 0:
+            DB_QUERY_ROWS.labels(name, operation, table).inc(rowcount)
+
+        if DB_SLOW_QUERY_MS and elapsed * 1000 >= DB_SLOW_QUERY_MS:
+            DB_SLOW_QUERIES.labels(name, operation, table).inc()
+            logger.warning(f"Slow query ({elapsed * 1000:.1f} ms, engine={name}): {statement}")
+
+    @event.listens_for(engine, "handle_error")
+    def _handle_error(context):
+        started = context.connection.info.get("query_started") if context.connection is not None else None
+        if started:
+            started.pop()
+        operation, table = statement_labels(context.statement or "")
+        DB_QUERY_ERRORS.labels(name, operation, table).inc()
+        # Only failures of the database itself (unreachable, timed out, shutting
+        # down) count towards the circuit breaker, not errors in a statement
+        if context.is_disconnect or isinstance(
+            context.sqlalchemy_exception, (exc.OperationalError, exc.InterfaceError)
+        ):
+            record_outcome(False)
+
+    @event.listens_for(pool, "connect")
+    def _connect(dbapi_connection, connection_record):
+        DB_POOL_OPEN.labels(name).inc()
+
+    @event.listens_for(pool, "close")
+    def _close(dbapi_connection, connection_record):
+        DB_POOL_OPEN.labels(name).dec()
+
+    @event.listens_for(pool, "close_detached")
+    def _close_detached(dbapi_connection):
+        DB_POOL_OPEN.labels(name).dec()
+
+    @event.listens_for(pool, "checkout")
+    def _checkout(dbapi_connection, connection_record, connection_proxy):
+        DB_POOL_CHECKED_OUT.labels(name).inc()
+
+    @event.listens_for(pool, "checkin")
+    def _checkin(dbapi_connection, connection_record):
+        DB_POOL_CHECKED_OUT.labels(name).dec()
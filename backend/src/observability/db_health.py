@@ -0,0 +1,202 @@
+"""
+Live database health signals for admission control.
+
+The engine instrumentation (src.observability.db) feeds two trackers:
+
+- pool_checkout_wait: a time-decayed average of pool checkout waits, which
+  rises as soon as requests start queueing for connections and decays back
+  to zero once no one waits;
+- db_outcomes: per-second counts of successful and failed statements
+  (connection errors, timeouts, pool exhaustion) over the last minute.
+
+Outcomes are also counted per request while a RequestOutcomes tracker is
+active (track_request_outcomes), so the admission middleware can tell
+whether a circuit breaker probe actually reached the database.
+"""
+from contextvars import ContextVar
+from typing import Callable, List, Optional, Tuple
+import math
+import threading
+import time
+
+# Half-life of the pool checkout wait average
+POOL_WAIT_HALF_LIFE_SECONDS = 2.0
+
+# Seconds of statement outcomes kept by db_outcomes
+OUTCOME_HISTORY_SECONDS = 60
+
+
+class DecayingAverage:
+    """
+    Average of recent samples, weighted by age rather than by sample count.
+
+    Samples lose half their weight every half-life. While fewer than one
+    sample's worth of weight remains, the missing weight counts as zeros,
+    so the average falls back to 0 once samples stop arriving.
+    """
+
+    def __init__(self, half_life_seconds: float, clock: Callable[[], float] = time.monotonic):
+        """Initialize the average.
+
+        Args:
+            half_life_seconds: Time after which a sample counts half as much
+            clock: Monotonic time source (overridable for testing)
+        """
+        self._decay_rate = math.log(2) / half_life_seconds
+        self._clock = clock
+        self._total = 0.0
+        self._weight = 0.0
+        self._updated_at = clock()
+        self._lock = threading.Lock()
+
+    def _decay(self) -> None:
+        now = self._clock()
+        factor = math.exp(-self._decay_rate * (now - self._updated_at))
+        self._total *= factor
+        self._weight *= factor
+        self._updated_at = now
+
+    def observe(self, sample: float) -> None:
+        """
+        Add a sample.
+
+        Args:
+            sample: Measured value, e.g. a checkout wait in seconds
+        """
+        with self._lock:
+            self._decay()
+            self._total += sample
+            self._weight += 1.0
+
+    def value(self) -> float:
+        """
+        Current average, decayed to now.
+
+        Returns:
+            The average; tends to 0 while no samples arrive
+        """
+        with self._lock:
+            self._decay()
+            return self._total / max(self._weight, 1.0)
+
+
+class OutcomeWindow:
+    """Per-second success / failure counts over a rolling window."""
+
+    def __init__(self, history_seconds: int, clock: Callable[[], float] = time.monotonic):
+        """Initialize the window.
+
+        Args:
+            history_seconds: Seconds of history kept
+            clock: Monotonic time source (overridable for testing)
+        """
+        self._size = history_seconds
+        self._clock = clock
+        # Slot -> [second, successes, failures]
+        self._buckets: List[List[int]] = [[-1, 0, 0] for _ in range(history_seconds)]
+        self._lock = threading.Lock()
+
+    def record(self, ok: bool) -> None:
+        """
+        Count one outcome in the current second.
+
+        Args:
+            ok: Whether the statement succeeded
+        """
+        second = int(self._clock())
+        with self._lock:
+            bucket = self._buckets[second % self._size]
+            if bucket[0] != second:
+                bucket[0], bucket[1], bucket[2] = second, 0, 0
+            bucket[1 if ok else 2] += 1
+
+    def counts(self, window_seconds: int, since: Optional[float] = None) -> Tuple[int, int]:
+        """
+        Sum the outcomes of the last window_seconds.
+
+        Args:
+            window_seconds: Seconds to sum, up to the history kept
+            since: Ignore outcomes before this clock value (from the next whole second)
+
+        Returns:
+            (successes, failures)
+        """
+        now = int(self._clock())
+        first = now - min(window_seconds, self._size) + 1
+        if since is not None:
+            first = max(first, math.ceil(since))
+        successes = failures = 0
+        with self._lock:
+            for second, ok_count, failed_count in self._buckets:
+                if first <= second <= now:
+                    successes += ok_count
+                    failures += failed_count
+        return successes, failures
+
+
+class RequestOutcomes:
+    """Database outcomes recorded while serving one request."""
+
+    def __init__(self):
+        """Initialize with no outcomes."""
+        self.successes = 0
+        self.failures = 0
+
+    def result(self) -> Optional[bool]:
+        """
+        Whether the request's database use succeeded.
+
+        Returns:
+            True if a statement succeeded and none failed, False if any
+            failed, None if the request did not use the database
+        """
+        if self.failures:
+            return False
+        return True if self.successes else None
+
+
+# Tracker of the request being served; sync routes run in a threadpool with a
+# copy of the context, which still refers to the same RequestOutcomes object
+_request_outcomes: ContextVar[Optional[RequestOutcomes]] = ContextVar("request_db_outcomes", default=None)
+
+
+def track_request_outcomes() -> Tuple[RequestOutcomes, object]:
+    """
+    Start counting database outcomes for the current request.
+
+    Returns:
+        (the tracker, a token to pass to stop_tracking_request_outcomes)
+    """
+    tracker = RequestOutcomes()
+    return tracker, _request_outcomes.set(tracker)
+
+
+def stop_tracking_request_outcomes(token: object) -> None:
+    """
+    Stop counting outcomes for the request started with track_request_outcomes.
+
+    Args:
+        token: Token returned by track_request_outcomes
+    """
+    _request_outcomes.reset(token)
+
+
+def record_outcome(ok: bool) -> None:
+    """
+    Count a database outcome in db_outcomes and for the current request, if tracked.
+
+    Args:
+        ok: Whether the statement or checkout succeeded
+    """
+    db_outcomes.record(ok)
+    tracker = _request_outcomes.get()
+    if tracker is not None:
+        if ok:
+            tracker.successes += 1
+        else:
+            tracker.failures += 1
+
+
+pool_checkout_wait = DecayingAverage(POOL_WAIT_HALF_LIFE_SECONDS)
+
+db_outcomes = OutcomeWindow(OUTCOME_HISTORY_SECONDS)
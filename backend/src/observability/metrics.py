@@ -0,0 +1,140 @@
+"""
+Prometheus metric definitions shared by the HTTP middleware and the
+database instrumentation.
+
+Set PROMETHEUS_MULTIPROC_DIR when running several worker processes so
+/metrics aggregates every worker (see render_metrics).
+"""
+from typing import Tuple
+import os
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    REGISTRY,
+    generate_latest
+)
+
+# Request and query latencies span sub-millisecond cache hits to multi-second exports
+LATENCY_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0
+)
+
+HTTP_REQUESTS = Counter(
+    "prism_http_requests_total",
+    "HTTP requests by route template, method and status code",
+    ["method", "route", "status"]
+)
+HTTP_REQUEST_DURATION = Histogram(
+    "prism_http_request_duration_seconds",
+    "HTTP request latency by route template and method (until the response body is sent)",
+    ["method", "route"],
+    buckets=LATENCY_BUCKETS
+)
+HTTP_REQUESTS_IN_PROGRESS = Gauge(
+    "prism_http_requests_in_progress",
+    "HTTP requests currently being handled",
+    ["method"],
+    multiprocess_mode="livesum"
+)
+
+DB_QUERY_DURATION = Histogram(
+    "prism_db_query_duration_seconds",
+    "Database statement execution time by operation and main table",
+    ["engine", "operation", "table"],
+    buckets=LATENCY_BUCKETS
+)
+DB_QUERY_ROWS = Counter(
+    "prism_db_query_rows_total",
+    "Rows returned or affected by database statements, where the driver reports them",
+    ["engine", "operation", "table"]
+)
+DB_QUERY_ERRORS = Counter(
+    "prism_db_query_errors_total",
+    "Database statements that raised an error",
+    ["engine", "operation", "table"]
+)
+DB_SLOW_QUERIES = Counter(
+    "prism_db_slow_queries_total",
+    "Database statements slower than DB_SLOW_QUERY_MS",
+    ["engine", "operation", "table"]
+)
+
+DB_POOL_CHECKOUT_WAIT = Histogram(
+    "prism_db_pool_checkout_wait_seconds",
+    "Time spent waiting for a pooled connection (including opening a new one)",
+    ["engine"],
+    buckets=LATENCY_BUCKETS
+)
+DB_POOL_CHECKOUT_TIMEOUTS = Counter(
+    "prism_db_pool_checkout_timeouts_total",
+    "Checkouts that gave up after pool_timeout because the pool was exhausted",
+    ["engine"]
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    "prism_db_pool_connections_checked_out",
+    "Pooled connections currently checked out",
+    ["engine"],
+    multiprocess_mode="livesum"
+)
+DB_POOL_OPEN = Gauge(
+    "prism_db_pool_connections_open",
+    "DBAPI connections currently open (idle in the pool or checked out)",
+    ["engine"],
+    multiprocess_mode="livesum"
+)
+DB_POOL_CAPACITY = Gauge(
+    "prism_db_pool_capacity",
+    "Maximum connections of the pool (pool_size + max_overflow)",
+    ["engine"],
+    multiprocess_mode="livesum"
+)
+
+DB_REPLICA_LAG = Gauge(
+    "prism_db_replica_lag_seconds",
+    "Replay lag of a read replica at its last health check",
+    ["replica"],
+    multiprocess_mode="max"
+)
+DB_REPLICA_HEALTHY = Gauge(
+    "prism_db_replica_healthy",
+    "1 if the replica passed its last health check and lag threshold, else 0",
+    ["replica"],
+    multiprocess_mode="min"
+)
+DB_READ_SESSIONS = Counter(
+    "prism_db_read_sessions_total",
+    "Read sessions opened, by the engine serving them ('primary' or a replica)",
+    ["target"]
+)
+
+ADMISSION_REJECTIONS = Counter(
+    "prism_admission_rejections_total",
+    "Requests turned away before reaching a route, by reason",
+    ["reason"]
+)
+DB_CIRCUIT_BREAKER_STATE = Gauge(
+    "prism_db_circuit_breaker_state",
+    "Database circuit breaker state: 0 closed, 1 half-open, 2 open",
+    multiprocess_mode="max"
+)
+
+
+def render_metrics() -> Tuple[bytes, str]:
+    """
+    Render every metric in the Prometheus text format.
+    
+    Returns:
+        (body, content type) for the /metrics response
+    """
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess
+
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
@@ -0,0 +1,72 @@
+"""
+ASGI middleware recording per-route request latency and status counts.
+"""
+from typing import Callable, Dict
+import time
+
+from starlette.routing import Match
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.observability.metrics import (
+    HTTP_REQUEST_DURATION,
+    HTTP_REQUESTS,
+    HTTP_REQUESTS_IN_PROGRESS
+)
+
+# Label for paths that match no route, so unknown URLs cannot explode cardinality
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware (works with streaming responses, unlike BaseHTTPMiddleware)."""
+
+    def __init__(self, app: ASGIApp):
+        """Wrap an ASGI app.
+        
+        Args:
+            app: Next ASGI application in the stack
+        """
+        self.app = app
+        self._route_templates: Dict[Callable, str] = {}
+
+    def _route_label(self, scope: Scope) -> str:
+        """Resolve the route template (e.g. '/api/v1/.../list') of a handled request."""
+        endpoint = scope.get("endpoint")
+        if endpoint is None:
+            return UNMATCHED_ROUTE
+
+        template = self._route_templates.get(endpoint)
+        if template is None:
+            template = UNMATCHED_ROUTE
+            for route in scope["app"].routes:
+                match, _ = route.matches(scope)
+                if match == Match.FULL and getattr(route, "endpoint", None) is endpoint:
+                    template = route.path
+                    break
+            self._route_templates[endpoint] = template
+        return template
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+        started = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        in_progress = HTTP_REQUESTS_IN_PROGRESS.labels(method)
+        in_progress.inc()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            in_progress.dec()
+            route = self._route_label(scope)
+            HTTP_REQUEST_DURATION.labels(method, route).observe(time.perf_counter() - started)
+            HTTP_REQUESTS.labels(method, route, str(status_code)).inc()
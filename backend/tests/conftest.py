@@ -0,0 +1,29 @@
+"""
+Shared fixtures for the DB-free unit tests.
+"""
+import pytest
+
+
+class FakeClock:
+    """Manually advanced time source for components taking a clock argument."""
+
+    def __init__(self, start: float = 1000.0):
+        """Initialize the clock at a fixed time.
+
+        Args:
+            start: Initial time in seconds
+        """
+        self.now = start
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        """Move time forward."""
+        self.now += seconds
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    """A fake clock starting at t=1000s."""
+    return FakeClock()
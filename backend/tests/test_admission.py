@@ -0,0 +1,188 @@
+"""
+Tests for the database circuit breaker and the per-client token bucket limiter.
+"""
+import pytest
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from src.admission.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+from src.admission.load_shedding import AdmissionController
+from src.admission.middleware import AdmissionMiddleware
+from src.admission.rate_limit import TokenBucketLimiter
+from src.observability.db_health import OutcomeWindow, record_outcome
+
+
+@pytest.fixture
+def outcomes(clock) -> OutcomeWindow:
+    return OutcomeWindow(history_seconds=60, clock=clock)
+
+
+@pytest.fixture
+def breaker(outcomes, clock) -> CircuitBreaker:
+    return CircuitBreaker(
+        outcomes,
+        error_rate=0.5,
+        min_calls=10,
+        window_seconds=10,
+        open_seconds=15,
+        clock=clock
+    )
+
+
+def _record(outcomes: OutcomeWindow, successes: int, failures: int) -> None:
+    for _ in range(successes):
+        outcomes.record(True)
+    for _ in range(failures):
+        outcomes.record(False)
+
+
+def _trip(breaker: CircuitBreaker, outcomes: OutcomeWindow) -> None:
+    _record(outcomes, 0, 10)
+    assert not breaker.allow().allowed
+    assert breaker.state == OPEN
+
+
+def test_breaker_stays_closed_below_min_calls_or_error_rate(breaker, outcomes):
+    _record(outcomes, 0, 9)
+    assert breaker.allow().allowed
+
+    _record(outcomes, 11, 0)
+    assert breaker.allow() == (True, False, 0.0)
+    assert breaker.state == CLOSED
+
+
+def test_breaker_opens_at_error_rate(breaker, outcomes, clock):
+    _record(outcomes, 5, 5)
+
+    decision = breaker.allow()
+
+    assert not decision.allowed
+    assert decision.retry_after_seconds == pytest.approx(15)
+    assert breaker.state == OPEN
+    clock.advance(10)
+    assert breaker.allow().retry_after_seconds == pytest.approx(5)
+
+
+def test_breaker_lets_one_probe_through_when_half_open(breaker, outcomes, clock):
+    _trip(breaker, outcomes)
+    clock.advance(15)
+
+    probe = breaker.allow()
+
+    assert probe.allowed and probe.probe
+    assert breaker.state == HALF_OPEN
+    # Only one probe at a time
+    assert not breaker.allow().allowed
+
+
+def test_successful_probe_closes_and_forgets_old_failures(breaker, outcomes, clock):
+    _trip(breaker, outcomes)
+    clock.advance(15)
+    breaker.allow()
+
+    breaker.probe_finished(True)
+
+    assert breaker.state == CLOSED
+    # The failures that opened the breaker are still in the window but ignored
+    assert breaker.allow().allowed
+
+
+def test_failed_probe_reopens(breaker, outcomes, clock):
+    _trip(breaker, outcomes)
+    clock.advance(15)
+    breaker.allow()
+
+    breaker.probe_finished(False)
+
+    assert breaker.state == OPEN
+    assert breaker.allow().retry_after_seconds == pytest.approx(15)
+
+
+def test_probe_without_database_use_keeps_breaker_half_open(breaker, outcomes, clock):
+    _trip(breaker, outcomes)
+    clock.advance(15)
+    breaker.allow()
+
+    breaker.probe_finished(None)
+
+    assert breaker.state == HALF_OPEN
+    # The probe slot is free for the next request
+    assert breaker.allow().probe
+
+
+@pytest.fixture
+def probing_client(breaker, outcomes, clock):
+    def statement(request):
+        record_outcome(request.path_params["ok"] == "ok")
+        return PlainTextResponse("")
+
+    def cached(request):
+        return PlainTextResponse("")
+
+    app = Starlette(routes=[Route("/api/db/{ok}", statement), Route("/api/cached", cached)])
+    controller = AdmissionController(0, 0, breaker)
+    app.add_middleware(AdmissionMiddleware, path_prefixes=["/api"], controller=controller)
+    _trip(breaker, outcomes)
+    clock.advance(15)
+    return TestClient(app)
+
+
+def test_probe_served_without_database_does_not_close_breaker(breaker, probing_client):
+    assert probing_client.get("/api/cached").status_code == 200
+    assert breaker.state == HALF_OPEN
+
+    # Sync routes run in a threadpool; their statements still count for the probe
+    assert probing_client.get("/api/db/ok").status_code == 200
+    assert breaker.state == CLOSED
+
+
+def test_probe_with_failed_statement_reopens_breaker(breaker, probing_client):
+    probing_client.get("/api/db/failed")
+
+    assert breaker.state == OPEN
+
+
+def test_breaker_with_zero_error_rate_is_disabled(outcomes, clock):
+    breaker = CircuitBreaker(outcomes, 0, 1, 10, 15, clock=clock)
+    _record(outcomes, 0, 100)
+    assert breaker.allow().allowed
+    assert breaker.state == CLOSED
+
+
+def test_token_bucket_allows_burst_then_waits_for_refill(clock):
+    limiter = TokenBucketLimiter(rate_per_second=2, burst=3, max_clients=10, clock=clock)
+
+    assert [limiter.acquire("a") for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert limiter.acquire("a") == pytest.approx(0.5)
+    # Other clients have their own bucket
+    assert limiter.acquire("b") == 0.0
+
+    clock.advance(0.5)
+    assert limiter.acquire("a") == 0.0
+    assert limiter.acquire("a") == pytest.approx(0.5)
+
+
+def test_token_bucket_refill_is_capped_at_burst(clock):
+    limiter = TokenBucketLimiter(rate_per_second=1, burst=2, max_clients=10, clock=clock)
+    limiter.acquire("a")
+
+    clock.advance(3600)
+
+    assert [limiter.acquire("a") for _ in range(3)] == [0.0, 0.0, pytest.approx(1.0)]
+
+
+def test_token_bucket_drops_least_recently_seen_client(clock):
+    limiter = TokenBucketLimiter(rate_per_second=1, burst=1, max_clients=2, clock=clock)
+    limiter.acquire("a")
+    limiter.acquire("b")
+    limiter.acquire("c")
+
+    # "a" was dropped, so it starts again with a full bucket
+    assert limiter.acquire("a") == 0.0
+    assert limiter.acquire("c") > 0
+
+
+def test_token_bucket_with_zero_rate_is_disabled():
+    assert not TokenBucketLimiter(rate_per_second=0, burst=1, max_clients=10).enabled
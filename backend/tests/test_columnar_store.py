@@ -0,0 +1,85 @@
+"""
+Tests for the columnar top-N of the in-memory recommendation store against a brute-force sort.
+"""
+from decimal import Decimal
+import random
+
+import pytest
+
+from src.dashboard.overview.dao.top_recommendation_dao_mock import ColumnarRecommendationStore
+
+PLATFORMS = ("AWS", "Databricks", "Snowflakes")
+ROWS = 3000
+
+
+@pytest.fixture(scope="module")
+def records():
+    rng = random.Random(7)
+    records = []
+    for recommendation_id in rng.sample(range(1, 10 * ROWS), ROWS):
+        # Few distinct values so ties on potential are common; NULL and
+        # non-positive potentials are never returned
+        potential = rng.choice([None, -5.0, 0.0, *(float(value) for value in range(1, 40))])
+        records.append({
+            "id": recommendation_id,
+            "type": rng.choice(PLATFORMS),
+            "risk_level": rng.choice(("Low", "Medium", "High")),
+            "potential": potential
+        })
+    return records
+
+
+@pytest.fixture(scope="module")
+def store(records):
+    return ColumnarRecommendationStore.from_records(records)
+
+
+def _brute_force(records, platform_type=None, limit=10, after=None, risk_levels=None):
+    rows = [
+        record for record in records
+        if record["potential"] is not None and record["potential"] > 0
+        and (platform_type is None or record["type"] == platform_type)
+        and (risk_levels is None or record["risk_level"] in risk_levels)
+    ]
+    if after is not None:
+        after_potential, after_id = float(after[0]), after[1]
+        rows = [
+            record for record in rows
+            if (record["potential"], record["id"]) < (after_potential, after_id)
+        ]
+    rows.sort(key=lambda record: (record["potential"], record["id"]), reverse=True)
+    return [record["id"] for record in rows[:limit]]
+
+
+def _top_ids(store, *args, **kwargs):
+    return store.ids[store.top_positions(*args, **kwargs)].tolist()
+
+
+@pytest.mark.parametrize("platform_type", [None, *PLATFORMS, "Unknown"])
+@pytest.mark.parametrize("limit", [0, 1, 6, 100, ROWS])
+def test_top_positions_match_brute_force(store, records, platform_type, limit):
+    assert _top_ids(store, platform_type, limit) == _brute_force(records, platform_type, limit)
+
+
+def test_keyset_pages_match_brute_force(store, records):
+    expected = _brute_force(records, "AWS", limit=ROWS)
+    by_id = {record["id"]: record for record in records}
+
+    pages, after = [], None
+    while True:
+        page = _top_ids(store, "AWS", 50, after=after)
+        if not page:
+            break
+        pages.extend(page)
+        last = by_id[page[-1]]
+        after = (Decimal(str(last["potential"])), last["id"])
+
+    assert pages == expected
+
+
+def test_top_positions_with_filter_mask_match_brute_force(store, records):
+    mask = store.filter_mask({"risk_level": ["High", "Medium"]})
+
+    assert _top_ids(store, "Databricks", 25, mask=mask) == _brute_force(
+        records, "Databricks", 25, risk_levels={"High", "Medium"}
+    )
@@ -0,0 +1,99 @@
+"""
+Tests for ETag helpers and the 304 path of a conditional endpoint.
+"""
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.database.dependencies import get_request_read_db
+from src.dashboard.overview.api import recommendation_list_api
+from src.dashboard.overview.api.conditional import CACHE_CONTROL, build_etag, etag_matches
+from src.dashboard.overview.schemas.recommendation_list_schema import (
+    RecommendationListPage,
+    RecommendationListResponse,
+    RecommendationListSuccessResponse
+)
+
+DATA_VERSION = 42
+
+
+def test_etag_depends_on_version_and_parameters():
+    etag = build_etag(DATA_VERSION, "recommendation-list", "aws", 50, None)
+
+    assert etag.startswith(f'"{DATA_VERSION}-') and etag.endswith('"')
+    assert etag == build_etag(DATA_VERSION, "recommendation-list", "aws", 50, None)
+    assert etag != build_etag(DATA_VERSION + 1, "recommendation-list", "aws", 50, None)
+    assert etag != build_etag(DATA_VERSION, "recommendation-list", "aws", 25, None)
+
+
+@pytest.mark.parametrize("if_none_match, expected", [
+    (None, False),
+    ("", False),
+    ('"42-abc"', True),
+    ('W/"42-abc"', True),
+    ('"41-abc", "42-abc"', True),
+    ("*", True),
+    ('"41-abc"', False),
+    ("42-abc", False)
+])
+def test_etag_matches(if_none_match, expected):
+    assert etag_matches(if_none_match, '"42-abc"') is expected
+
+
+class _FakeListService:
+    """Stands in for RecommendationListService; counts the pages it builds."""
+
+    calls = 0
+
+    def __init__(self, db):
+        pass
+
+    def list_recommendations(self, platform, limit=50, cursor=None):
+        _FakeListService.calls += 1
+        return RecommendationListResponse(
+            success_response=RecommendationListSuccessResponse(data=RecommendationListPage())
+        )
+
+
+@pytest.fixture
+def client(monkeypatch):
+    async def read_data_version(db):
+        return DATA_VERSION
+
+    monkeypatch.setattr(recommendation_list_api, "USE_ASYNC_DB", False)
+    monkeypatch.setattr(recommendation_list_api, "read_data_version", read_data_version)
+    monkeypatch.setattr(recommendation_list_api, "RecommendationListService", _FakeListService)
+    _FakeListService.calls = 0
+
+    app = FastAPI()
+    app.include_router(recommendation_list_api.router)
+    app.dependency_overrides[get_request_read_db] = lambda: None
+    return TestClient(app)
+
+
+def test_matching_if_none_match_returns_304_without_querying(client):
+    first = client.post("/recommendations/list", json={"platform": "aws"})
+    assert first.status_code == 200
+    assert first.headers["Cache-Control"] == CACHE_CONTROL
+    etag = first.headers["ETag"]
+
+    second = client.post("/recommendations/list", json={"platform": "aws"}, headers={"If-None-Match": etag})
+
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers["ETag"] == etag
+    assert _FakeListService.calls == 1
+
+
+def test_etag_of_other_parameters_does_not_match(client):
+    etag = client.post("/recommendations/list", json={"platform": "aws"}).headers["ETag"]
+
+    response = client.post(
+        "/recommendations/list",
+        json={"platform": "databricks"},
+        headers={"If-None-Match": etag}
+    )
+
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert _FakeListService.calls == 2
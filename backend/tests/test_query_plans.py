@@ -0,0 +1,102 @@
+"""
+EXPLAIN checks for the top recommendation DAO queries.
+
+The projected top-N query and a deep keyset listing page must be served by
+the partial (potential DESC, id DESC) indexes from migration 0003 without a
+Sort or Seq Scan node, for every platform. On the partitioned table
+(migration 0009) indexes are matched through their parent partitioned
+index, and a platform-filtered plan must be pruned to one partition.
+
+Needs a database migrated with ``alembic upgrade head``; skipped unless
+DATABASE_URL is set and reachable. Sequential scans are disabled so the
+result does not depend on how many rows the table holds.
+"""
+from decimal import Decimal
+from typing import Dict, Iterator, List
+import json
+import os
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import OperationalError
+
+from src.config import load_environment
+from src.dashboard.overview.dao.top_recommendation_dao import (
+    TOP_RECOMMENDATION_COLUMNS,
+    TopRecommendationDAO
+)
+
+PLATFORMS = ["all_platform", "aws", "google_cloud", "databricks", "snowflakes"]
+EXPECTED_INDEXES = {"idx_rec_type_potential_id", "idx_rec_potential_id"}
+INDEX_NODES = {"Index Only Scan", "Index Scan"}
+
+STATEMENTS = {
+    "top_n": lambda platform: TopRecommendationDAO._top_recommendations_statement(
+        platform, 6, TOP_RECOMMENDATION_COLUMNS
+    ),
+    "keyset_page": lambda platform: TopRecommendationDAO._list_recommendations_statement(
+        platform, 51, (Decimal("100.0000"), 1000000)
+    )
+}
+
+
+@pytest.fixture(scope="module")
+def connection():
+    load_environment()
+    if not os.getenv("DATABASE_URL"):
+        pytest.skip("DATABASE_URL is not set")
+
+    from src.database.session import dispose_engine, get_engine
+
+    try:
+        connection = get_engine().connect()
+    except OperationalError as e:
+        dispose_engine()
+        pytest.skip(f"Database unreachable: {e.orig}")
+
+    try:
+        with connection.begin():
+            connection.exec_driver_sql("SET LOCAL enable_seqscan = off")
+            yield connection
+    finally:
+        connection.close()
+        dispose_engine()
+
+
+def _walk(plan: Dict) -> Iterator[Dict]:
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from _walk(child)
+
+
+def _explain(connection, statement) -> List[Dict]:
+    sql = str(statement.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+    plan = connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {sql}").scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return list(_walk(plan[0]["Plan"]))
+
+
+def _root_index(connection, index_name: str) -> str:
+    """Name of the partitioned index a partition's index belongs to (itself otherwise)."""
+    return connection.exec_driver_sql(
+        "SELECT COALESCE(pg_partition_root(%(name)s::regclass), %(name)s::regclass)::text",
+        {"name": index_name}
+    ).scalar()
+
+
+@pytest.mark.parametrize("name", list(STATEMENTS))
+@pytest.mark.parametrize("platform", PLATFORMS)
+def test_plan_uses_top_n_index(connection, platform, name):
+    nodes = _explain(connection, STATEMENTS[name](platform))
+
+    scanned = {
+        _root_index(connection, node["Index Name"])
+        for node in nodes if node["Node Type"] in INDEX_NODES
+    }
+    assert scanned & EXPECTED_INDEXES, f"no scan on {sorted(EXPECTED_INDEXES)}: {sorted(scanned)}"
+    assert not [node["Node Type"] for node in nodes if node["Node Type"] in ("Sort", "Seq Scan")]
+
+    if platform != "all_platform":
+        relations = {node["Relation Name"] for node in nodes if "Relation Name" in node}
+        assert len(relations) == 1, f"not pruned to one partition: {sorted(relations)}"
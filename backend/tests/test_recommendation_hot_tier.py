@@ -0,0 +1,150 @@
+"""
+Tests for the read-through hot tier in front of the database.
+"""
+import threading
+
+import pytest
+
+from src.dashboard.overview.dao.recommendation_hot_tier import RecommendationHotTier
+
+RECORDS = [
+    {"id": 1, "type": "AWS", "description": "Right-size", "recommendation": "Right-size", "potential": 10.0},
+    {"id": 2, "type": "AWS", "description": "Delete volume", "recommendation": "Delete", "potential": 30.0},
+    {"id": 3, "type": "Databricks", "description": "Auto-terminate", "recommendation": "Terminate", "potential": 20.0}
+]
+
+
+class _Result:
+    def __init__(self, version):
+        self.version = version
+
+    def scalar_one(self):
+        return self.version
+
+
+class FakeDatabase:
+    """Session factory answering the data version lookup and the full table load."""
+
+    def __init__(self, version: int):
+        self.version = version
+        self.loads = 0
+        self.fail = False
+        self.release = threading.Event()
+        self.release.set()
+
+    def __call__(self):
+        return self
+
+    def connection(self, execution_options=None):
+        assert execution_options == {"isolation_level": "REPEATABLE READ"}
+
+    def execute(self, statement):
+        if "recommendation_data_version" in str(statement):
+            return _Result(self.version)
+        self.release.wait(5)
+        if self.fail:
+            raise RuntimeError("connection refused")
+        self.loads += 1
+        return list(RECORDS)
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def database():
+    return FakeDatabase(version=5)
+
+
+@pytest.fixture
+def hot_tier(database, clock):
+    return RecommendationHotTier(True, retry_seconds=30, session_factory=database, clock=clock)
+
+
+def _wait_for_reload(hot_tier):
+    thread = hot_tier._loading
+    if thread is not None:
+        thread.join(5)
+
+
+def test_first_request_uses_the_database_and_loads_in_background(hot_tier, database):
+    assert hot_tier.dao_for(5) is None
+    _wait_for_reload(hot_tier)
+
+    dao = hot_tier.dao_for(5)
+
+    assert dao is not None
+    rows = dao.get_top_recommendation_rows("aws", 6)
+    assert [row.description for row in rows] == ["Delete volume", "Right-size"]
+    assert hot_tier.stats()["data_version"] == 5
+    assert database.loads == 1
+
+
+def test_request_never_waits_for_a_running_reload(hot_tier, database):
+    database.release.clear()
+
+    assert hot_tier.dao_for(5) is None
+    assert hot_tier.dao_for(5) is None
+    assert hot_tier.stats()["loading"]
+
+    database.release.set()
+    _wait_for_reload(hot_tier)
+    assert database.loads == 1
+
+
+def test_newer_version_triggers_reload_and_older_one_does_not(hot_tier, database):
+    hot_tier.dao_for(5)
+    _wait_for_reload(hot_tier)
+
+    # A request on a lagging replica reads an older version: database, no reload
+    assert hot_tier.dao_for(4) is None
+    assert hot_tier.stats()["loading"] is False
+
+    database.version = 6
+    assert hot_tier.dao_for(6) is None
+    _wait_for_reload(hot_tier)
+    assert hot_tier.dao_for(6) is not None
+    assert hot_tier.dao_for(5) is None
+    assert database.loads == 2
+
+
+def test_failed_reload_is_retried_after_a_pause(hot_tier, database, clock):
+    database.fail = True
+    hot_tier.dao_for(5)
+    _wait_for_reload(hot_tier)
+    assert hot_tier.stats()["failures"] == 1
+
+    hot_tier.dao_for(5)
+    assert hot_tier.stats()["loading"] is False
+
+    database.fail = False
+    clock.advance(30)
+    hot_tier.dao_for(5)
+    _wait_for_reload(hot_tier)
+    assert hot_tier.dao_for(5) is not None
+
+
+def test_disabled_hot_tier_never_loads(database):
+    hot_tier = RecommendationHotTier(False, session_factory=database)
+
+    assert hot_tier.dao_for(5) is None
+    assert hot_tier.stats()["loading"] is False
+    assert database.loads == 0
+
+
+def test_service_reads_from_hot_tier_holding_the_version(monkeypatch, hot_tier):
+    from src.dashboard.overview.service import top_recommendation_service
+
+    class FailingDAO:
+        def get_top_recommendation_rows(self, platform, limit):
+            raise AssertionError("database queried")
+
+    hot_tier.dao_for(5)
+    _wait_for_reload(hot_tier)
+    monkeypatch.setattr(top_recommendation_service, "recommendation_hot_tier", hot_tier)
+    service = top_recommendation_service.TopRecommendationService(None)
+    service.dao = FailingDAO()
+
+    payload = service._fetch_payload((5, "databricks", 6))
+
+    assert payload.items == ({"platform_name": "Databricks", "description": "Auto-terminate", "value": "Save $20.00"},)
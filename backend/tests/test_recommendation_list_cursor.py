@@ -0,0 +1,27 @@
+"""
+Tests for the keyset cursor of the recommendation listing.
+"""
+from decimal import Decimal
+
+import pytest
+
+from src.dashboard.overview.service.recommendation_list_service import (
+    InvalidCursorError,
+    decode_cursor,
+    encode_cursor
+)
+
+
+def test_cursor_round_trip_keeps_exact_decimal():
+    potential = Decimal("12345678901234.5678")
+    cursor = encode_cursor(potential, 42)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == (potential, 42)
+
+
+@pytest.mark.parametrize("cursor", ["", "not base64!", "e30", "eyJwIjoieCIsImkiOjF9"])
+def test_malformed_cursor_is_rejected(cursor):
+    # "e30" is {} and the last one carries a non-numeric potential
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor)
@@ -0,0 +1,32 @@
+"""
+Tests for the keyset cursor of the recommendation search.
+"""
+from decimal import Decimal
+
+import pytest
+
+from src.dashboard.overview.service.recommendation_list_service import InvalidCursorError, encode_cursor
+from src.dashboard.overview.service.recommendation_search_service import (
+    decode_search_cursor,
+    encode_search_cursor
+)
+
+
+def test_cursor_round_trip():
+    cursor = encode_search_cursor(0.6079, 7, "idle instance", "aws")
+    assert decode_search_cursor(cursor, "idle instance", "aws") == (0.6079, 7)
+
+
+@pytest.mark.parametrize("query_text, platform", [
+    ("idle volume", "aws"),
+    ("idle instance", "databricks")
+])
+def test_cursor_from_another_search_is_rejected(query_text, platform):
+    cursor = encode_search_cursor(0.6079, 7, "idle instance", "aws")
+    with pytest.raises(InvalidCursorError, match="different search"):
+        decode_search_cursor(cursor, query_text, platform)
+
+
+def test_listing_cursor_is_not_a_search_cursor():
+    with pytest.raises(InvalidCursorError, match="Invalid pagination cursor"):
+        decode_search_cursor(encode_cursor(Decimal("1.5"), 1), "idle", "aws")
@@ -0,0 +1,65 @@
+"""
+Tests for the host-wide file cache: expiry, miss coalescing and lock file sweeping.
+"""
+import fcntl
+import os
+
+import pytest
+
+from src.cache.shared_file_cache import SharedFileCache
+
+
+@pytest.fixture
+def cache(tmp_path, clock):
+    return SharedFileCache(str(tmp_path), ttl_seconds=10, clock=clock)
+
+
+def _suffixes(cache):
+    return sorted(os.path.splitext(name)[1] for name in os.listdir(cache.directory))
+
+
+def test_get_or_load_computes_once_then_serves_until_expiry(cache, clock):
+    loads = []
+
+    def load():
+        loads.append(1)
+        return b"payload"
+
+    assert cache.get_or_load("key", load) == b"payload"
+    assert cache.get_or_load("key", load) == b"payload"
+    assert len(loads) == 1
+
+    clock.advance(10)
+    assert cache.get("key") is None
+
+
+def test_sweep_removes_expired_entries_and_their_lock_files(cache, clock):
+    for version in range(3):
+        cache.get_or_load(f"{version}:aws", lambda: b"payload")
+    assert _suffixes(cache) == [".entry"] * 3 + [".lock"] * 3
+
+    clock.advance(10)
+
+    assert cache.sweep() == 6
+    assert os.listdir(cache.directory) == []
+
+
+def test_sweep_keeps_lock_files_of_live_or_held_entries(cache, clock):
+    cache.get_or_load("live", lambda: b"payload")
+    with open(cache._path("loading", ".lock"), "a+b") as held:
+        fcntl.flock(held.fileno(), fcntl.LOCK_EX)
+
+        assert cache.sweep() == 0
+        assert cache.clear() == 1
+
+    assert _suffixes(cache) == [".lock"]
+
+
+def test_lock_file_swept_while_waiting_is_replaced(cache):
+    path = cache._path("key", ".lock")
+    with open(path, "a+b") as stale:
+        os.unlink(path)
+
+        assert cache.get_or_load("key", lambda: b"payload") == b"payload"
+        assert not cache._is_current(stale, path)
+    assert os.path.exists(path)
@@ -0,0 +1,115 @@
+"""
+Tests for sync and async single-flight request coalescing.
+"""
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.cache.single_flight import AsyncSingleFlight, SingleFlight
+
+CALLERS = 8
+
+
+def _run_concurrently(flight: SingleFlight, fn):
+    """Call flight.do from CALLERS threads while the leader is blocked in fn."""
+    with ThreadPoolExecutor(max_workers=CALLERS) as pool:
+        futures = [pool.submit(flight.do, "key", fn) for _ in range(CALLERS)]
+        # Every follower has joined once the coalesced count reaches CALLERS - 1
+        while flight.stats()["coalesced"] < CALLERS - 1:
+            threading.Event().wait(0.001)
+        return futures
+
+
+def test_concurrent_callers_share_one_execution():
+    flight = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def load():
+        calls.append(1)
+        release.wait(5)
+        return "value"
+
+    futures = _run_concurrently(flight, load)
+    release.set()
+
+    assert [future.result() for future in futures] == ["value"] * CALLERS
+    assert len(calls) == 1
+    assert flight.stats() == {"executions": 1, "coalesced": CALLERS - 1, "in_flight": 0}
+
+
+def test_error_propagates_to_every_caller():
+    flight = SingleFlight()
+    release = threading.Event()
+
+    def load():
+        release.wait(5)
+        raise RuntimeError("database down")
+
+    futures = _run_concurrently(flight, load)
+    release.set()
+
+    for future in futures:
+        with pytest.raises(RuntimeError, match="database down"):
+            future.result()
+    assert flight.stats()["in_flight"] == 0
+
+
+def test_sequential_calls_are_not_coalesced():
+    flight = SingleFlight()
+    assert flight.do("key", lambda: 1) == 1
+    assert flight.do("key", lambda: 2) == 2
+    assert flight.stats()["executions"] == 2
+
+
+@pytest.mark.asyncio
+async def test_async_concurrent_callers_share_one_execution():
+    flight = AsyncSingleFlight()
+    calls = []
+
+    async def load():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "value"
+
+    results = await asyncio.gather(*(flight.do("key", load) for _ in range(CALLERS)))
+
+    assert results == ["value"] * CALLERS
+    assert len(calls) == 1
+    assert flight.stats() == {"executions": 1, "coalesced": CALLERS - 1, "in_flight": 0}
+
+
+@pytest.mark.asyncio
+async def test_async_error_propagates_to_every_caller():
+    flight = AsyncSingleFlight()
+
+    async def load():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("database down")
+
+    results = await asyncio.gather(
+        *(flight.do("key", load) for _ in range(CALLERS)),
+        return_exceptions=True
+    )
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert flight.stats()["executions"] == 1
+
+
+@pytest.mark.asyncio
+async def test_async_cancelled_caller_does_not_cancel_the_shared_call():
+    flight = AsyncSingleFlight()
+
+    async def load():
+        await asyncio.sleep(0.01)
+        return "value"
+
+    leader = asyncio.ensure_future(flight.do("key", load))
+    follower = asyncio.ensure_future(flight.do("key", load))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    assert await follower == "value"
+    assert flight.stats()["executions"] == 1
@@ -0,0 +1,68 @@
+"""
+Tests for the verified JWT claims cache and revocation list.
+"""
+from src.auth.token_cache import VerifiedTokenCache, token_digest
+
+TOKEN = token_digest("header.payload.signature")
+
+
+def test_entry_lives_at_most_max_ttl(clock):
+    cache = VerifiedTokenCache(max_entries=10, max_ttl_seconds=300, clock=clock)
+    cache.put(TOKEN, {"sub": "user", "exp": clock() + 3600})
+
+    clock.advance(299)
+    assert cache.get(TOKEN)["sub"] == "user"
+    clock.advance(1)
+    assert cache.get(TOKEN) is None
+
+
+def test_entry_never_outlives_token_exp(clock):
+    cache = VerifiedTokenCache(max_entries=10, max_ttl_seconds=300, clock=clock)
+    cache.put(TOKEN, {"sub": "user", "exp": clock() + 60})
+
+    clock.advance(59)
+    assert cache.get(TOKEN) is not None
+    clock.advance(1)
+    assert cache.get(TOKEN) is None
+
+
+def test_expired_token_is_not_cached(clock):
+    cache = VerifiedTokenCache(max_entries=10, max_ttl_seconds=300, clock=clock)
+    cache.put(TOKEN, {"sub": "user", "exp": clock() - 1})
+
+    assert cache.get(TOKEN) is None
+    assert cache.stats()["size"] == 0
+
+
+def test_token_digest_hides_the_raw_token():
+    digest = token_digest("header.payload.signature")
+    assert len(digest) == 32
+    assert b"payload" not in digest
+
+
+def test_revocation_drops_cached_claims_until_exp(clock):
+    cache = VerifiedTokenCache(max_entries=10, max_ttl_seconds=300, clock=clock)
+    expires_at = clock() + 120
+    cache.put(TOKEN, {"sub": "user", "exp": expires_at})
+
+    cache.revoke(TOKEN, expires_at=expires_at)
+
+    assert cache.get(TOKEN) is None
+    assert cache.is_revoked(TOKEN)
+    assert cache.stats()["revoked_rejections"] == 1
+
+    # Past exp the token is rejected anyway, so the revocation is forgotten
+    clock.advance(120)
+    assert not cache.is_revoked(TOKEN)
+    assert cache.stats()["revoked"] == 0
+
+
+def test_revocation_without_exp_is_kept_and_survives_clear(clock):
+    cache = VerifiedTokenCache(max_entries=10, max_ttl_seconds=300, clock=clock)
+    cache.revoke(TOKEN)
+
+    cache.clear()
+    clock.advance(10 ** 9)
+
+    assert cache.is_revoked(TOKEN)
+    assert not cache.is_revoked(token_digest("other.token.value"))
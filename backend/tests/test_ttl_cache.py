@@ -0,0 +1,62 @@
+"""
+Tests for the in-process TTL / LRU cache.
+"""
+from src.cache.ttl_cache import TTLCache
+
+
+def test_entry_expires_after_ttl(clock):
+    cache = TTLCache(max_entries=10, ttl_seconds=5, clock=clock)
+    cache.set("a", 1)
+
+    clock.advance(4.9)
+    assert cache.get("a") == 1
+
+    clock.advance(0.1)
+    assert cache.get("a") is None
+    assert cache.stats()["expirations"] == 1
+    assert cache.stats()["size"] == 0
+
+
+def test_per_entry_ttl_overrides_default(clock):
+    cache = TTLCache(max_entries=10, ttl_seconds=60, clock=clock)
+    cache.set("short", 1, ttl_seconds=1)
+    cache.set("long", 2)
+
+    clock.advance(2)
+    assert cache.get("short") is None
+    assert cache.get("long") == 2
+
+
+def test_least_recently_used_entry_is_evicted(clock):
+    cache = TTLCache(max_entries=2, ttl_seconds=60, clock=clock)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    # Reading "a" makes "b" the least recently used
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats()["evictions"] == 1
+
+
+def test_disabled_cache_stores_nothing(clock):
+    for cache in (TTLCache(0, 60, clock=clock), TTLCache(10, 0, clock=clock)):
+        cache.set("a", 1)
+        assert not cache.enabled
+        assert cache.get("a", "missing") == "missing"
+
+
+def test_invalidate_where_and_clear(clock):
+    cache = TTLCache(max_entries=10, ttl_seconds=60, clock=clock)
+    for version in (1, 2):
+        for platform in ("aws", "databricks"):
+            cache.set((version, platform), platform)
+
+    assert cache.invalidate_where(lambda key: key[0] == 1) == 2
+    assert cache.get((1, "aws")) is None
+    assert cache.invalidate((2, "aws"))
+    assert not cache.invalidate((2, "aws"))
+    assert cache.clear() == 1
+    assert cache.stats()["invalidations"] == 4